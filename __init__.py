@@ -1,8 +1,29 @@
 """The archicad package from Graphisoft
 """
 
-from .handlers import handle_dependencies
-from .connection import ACConnection
-from .releases import Commands, Types, Utilities
+import importlib
 
 __all__ = ['ACConnection', 'handle_dependencies', 'Commands', 'Types', 'Utilities']
+
+# the exported names are imported on first access, so that importing a submodule does not load the connection and every release,
+# and typing is not imported here for the same reason
+_LAZY_ATTRIBUTES = {
+    'ACConnection': '.connection',
+    'handle_dependencies': '.handlers',
+    'Commands': '.releases',
+    'Types': '.releases',
+    'Utilities': '.releases',
+}
+
+
+def __getattr__(name: str):
+    moduleName = _LAZY_ATTRIBUTES.get(name)
+    if moduleName is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(moduleName, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,421 @@
+"""Graphisoft
+"""
+
+import itertools
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from archicad import identifiers, metadata
+from archicad.acbasetype import _ACBaseType, _ConstructUnion, _get_constructor, is_class, is_union
+
+
+_trust_responses = False
+
+
+def set_trust_responses(enabled: bool):
+    """Switches the trusted construction of the command results on or off for every connection.
+
+    Trusted construction skips the type checks and the validators of the fields, because the responses of Archicad
+    already conform to the schema. Objects built by the user are always validated.
+    """
+    global _trust_responses
+    _trust_responses = enabled
+
+
+def trust_responses(override: Optional[bool] = None) -> bool:
+    """Returns whether the command results are constructed without validation.
+
+    Args:
+        override (:obj:`bool`, optional): The setting of a connection. None follows the global setting.
+
+    """
+    return _trust_responses if override is None else override
+
+
+_builders: Dict[Any, Callable[[Any], Any]] = {}
+
+
+def trusted_builder(typ: Any) -> Callable[[Any], Any]:
+    """Returns a callable which constructs an object of the type from its JSON representation without validation.
+
+    Union types are resolved by the fields present in the JSON object and by the values of their tag fields,
+    e.g. the ``type`` and ``status`` of property values. Values which fit none of the members are passed to the
+    validating constructor, so they raise the same errors as in strict mode.
+    """
+    builder = _builders.get(typ)
+    if builder is None:
+        # recursive types refer to themselves through this entry until they are compiled
+        _builders[typ] = lambda value: _builders[typ](value)
+        builder = _builders[typ] = _compile(typ)
+    return builder
+
+
+def trusted_list_builder(item_type: Any) -> Callable[[list], list]:
+    """Returns a callable which constructs a list of objects of the type without validation."""
+    return trusted_builder(List[item_type])
+
+
+def _compile(typ: Any) -> Callable[[Any], Any]:
+    kind = metadata.type_kind(typ)
+    if kind == metadata.LIST:
+        item = trusted_builder(typ.__args__[0])
+        return lambda value: [item(v) for v in value]
+    if kind == metadata.UNION:
+        return _compile_union(typ, typ.__args__)
+    if kind == metadata.UNION_CLASS:
+        return _compile_union(typ, typ.constructor.optional_types)
+    if kind == metadata.CLASS:
+        if typ in identifiers.GUID_IDENTIFIER_TYPES:
+            return identifiers.interning_builder(typ, _compile_class(typ))
+        return _compile_class(typ)
+    if kind == metadata.UUID_:
+        return lambda value: UUID(value) if isinstance(value, str) else value
+    if kind == metadata.FLOAT:
+        return lambda value: float(value) if type(value) is int else value
+    return lambda value: value
+
+
+def _compile_class(typ: type) -> Callable[[Any], Any]:
+    required: List[Tuple[str, Optional[Callable[[Any], Any]]]] = []
+    optional: List[Tuple[str, Optional[Callable[[Any], Any]], Any]] = []
+    for field in metadata.fields_of(typ):
+        builder = None if field.kind in (metadata.UNTYPED, metadata.SCALAR) else trusted_builder(field.type)
+        if field.required:
+            required.append((field.name, builder))
+        else:
+            optional.append((field.name, builder, field.default))
+    new = object.__new__
+    setattr_ = object.__setattr__
+    strict = _get_constructor(typ)
+
+    def build(value):
+        if type(value) is not dict:
+            return strict(value)
+        obj = new(typ)
+        try:
+            for name, builder in required:
+                v = value[name]
+                setattr_(obj, name, v if builder is None or v is None else builder(v))
+        except KeyError:
+            return strict(value)
+        for name, builder, default in optional:
+            v = value.get(name, default)
+            setattr_(obj, name, v if builder is None or v is None else builder(v))
+        return obj
+    return build
+
+
+def _union_members(members: Tuple[Any, ...]) -> List[Any]:
+    leaves = []
+    for member in members:
+        if metadata.type_kind(member) == metadata.UNION_CLASS:
+            leaves.extend(_union_members(member.constructor.optional_types))
+        else:
+            leaves.append(member)
+    return leaves
+
+
+class _UnionMember:
+    """A class member of a union type with the fields a JSON object of the member may and must have."""
+
+    __slots__ = ('type', 'required', 'allowed', 'tags', '_trusted', '_strict')
+
+    def __init__(self, typ: type):
+        fields = metadata.fields_of(typ)
+        self.type = typ
+        self.required = frozenset(field.name for field in fields if field.required)
+        self.allowed = frozenset(field.name for field in fields)
+        self.tags: Dict[str, Optional[Tuple[Any, ...]]] = {}
+        for field in fields:
+            if field.kind in (metadata.SCALAR, metadata.FLOAT):
+                values = field.allowed_values
+                if values is not None and not field.required:
+                    values += (None,)
+                self.tags[field.name] = values
+        self._trusted: Optional[Callable[[Any], Any]] = None
+        self._strict: Optional[Callable[[Any], Any]] = None
+
+    def fits(self, value: dict) -> bool:
+        keys = value.keys()
+        return self.required <= keys and keys <= self.allowed
+
+    def build_trusted(self, value: dict) -> Any:
+        if self._trusted is None:
+            self._trusted = trusted_builder(self.type)
+        return self._trusted(value)
+
+    def build_strict(self, value: dict) -> Any:
+        if self._strict is None:
+            self._strict = strict_builder(self.type)
+        return self._strict(value)
+
+
+class UnionDispatcher:
+    """Selects the member of a union type for a JSON object by the values of its tag fields instead of trying every member.
+
+    The tag fields are the fields restricted to a set of values by ``value_set`` in the field table of any member,
+    e.g. the ``type`` and ``status`` of property values. The table maps every combination of tag values to the
+    members accepting it, which are told apart by the keys of the object, e.g. ``error`` for the error items. The
+    table is built the first time the union is constructed.
+
+    A dispatcher replaces the ``constructor`` of the union classes, so it is a drop-in for :obj:`_ConstructUnion`:
+    it keeps the ``optional_types`` of the union and falls back to trial construction for anything but keyword arguments.
+
+    Args:
+        union_type (:obj:`type`): An :obj:`_ACUnionType` subclass or a :obj:`typing.Union`.
+
+    """
+
+    __slots__ = ('optional_types', '_trial', '_tag_fields', '_table', '_untagged')
+
+    def __init__(self, union_type: Any):
+        if is_union(union_type):
+            self.optional_types: tuple = union_type.__args__
+            self._trial: Callable[..., Any] = _ConstructUnion(union_type)
+        else:
+            self.optional_types = union_type.constructor.optional_types
+            self._trial = union_type.constructor
+        self._tag_fields: Tuple[str, ...] = ()
+        self._table: Optional[Dict[Tuple[Any, ...], List[_UnionMember]]] = None
+        self._untagged: List[_UnionMember] = []
+
+    def _build_table(self):
+        members = [_UnionMember(leaf) for leaf in _union_members(self.optional_types) if metadata.type_kind(leaf) == metadata.CLASS]
+        tagFields: List[str] = []
+        for member in members:
+            tagFields += [name for name, values in member.tags.items() if values is not None and name not in tagFields]
+        table: Dict[Tuple[Any, ...], List[_UnionMember]] = {}
+        untagged = []
+        for member in members:
+            options = []
+            for name in tagFields:
+                if name not in member.allowed:
+                    options.append((None,))
+                elif member.tags.get(name) is None:
+                    break
+                else:
+                    options.append(member.tags[name])
+            else:
+                for key in itertools.product(*options):
+                    table.setdefault(key, []).append(member)
+                continue
+            untagged.append(member)
+        for key in table:
+            table[key] += untagged
+        self._tag_fields = tuple(tagFields)
+        self._untagged = untagged
+        self._table = table
+
+    def candidates(self, value: dict) -> List[_UnionMember]:
+        """Returns the members which may accept the JSON object, in the order of the union."""
+        if self._table is None:
+            self._build_table()
+        try:
+            return self._table.get(tuple(value.get(name) for name in self._tag_fields), self._untagged)
+        except TypeError:
+            return self._untagged
+
+    def build_trusted(self, value: dict) -> Any:
+        """Constructs the first fitting member from the JSON object without validation."""
+        for member in self.candidates(value):
+            if member.fits(value):
+                return member.build_trusted(value)
+        return self._trial(**value)
+
+    def build_strict(self, value: dict) -> Any:
+        """Constructs the fitting member from the JSON object which passes validation, like the trial construction.
+
+        Raises:
+            TypeError: When no member accepts the object.
+            AssertionError: When more than one member accepts the object.
+        """
+        results = []
+        for member in self.candidates(value):
+            if member.fits(value):
+                try:
+                    results.append(member.build_strict(value))
+                except (TypeError, ValueError):
+                    pass
+        if not results:
+            return self._trial(**value)
+        assert len(results) == 1
+        return results[0]
+
+    def __call__(self, *args, **kwargs) -> Any:
+        if args or not kwargs:
+            return self._trial(*args, **kwargs)
+        return self.build_strict({k: v for k, v in kwargs.items() if v is not None})
+
+
+def _dispatcher(typ: Any) -> UnionDispatcher:
+    if metadata.type_kind(typ) == metadata.UNION_CLASS and isinstance(typ.constructor, UnionDispatcher):
+        return typ.constructor
+    return UnionDispatcher(typ)
+
+
+def _compile_union(typ: Any, members: Tuple[Any, ...]) -> Callable[[Any], Any]:
+    dispatcher = _dispatcher(typ)
+    leaves = _union_members(members)
+    builtins = tuple(leaf for leaf in leaves if metadata.type_kind(leaf) not in (metadata.CLASS, metadata.LIST))
+    # List[X] is not the runtime type of the lists, so they are built by the list member, e.g. of Optional[List[X]]
+    lists = [leaf for leaf in leaves if metadata.type_kind(leaf) == metadata.LIST]
+    strict = _get_constructor(typ)
+    build_list = trusted_builder(lists[0]) if len(lists) == 1 else strict
+
+    def build(value):
+        if type(value) is dict:
+            return dispatcher.build_trusted(value)
+        if type(value) is list:
+            return build_list(value)
+        if type(value) in builtins or isinstance(value, _ACBaseType):
+            return value
+        return strict(value)
+    return build
+
+
+_strict_builders: Dict[Any, Callable[[Any], Any]] = {}
+
+
+def strict_builder(typ: Any) -> Callable[[Any], Any]:
+    """Returns a callable which constructs an object of the type from its JSON representation like the constructor of the type.
+
+    The returned callable validates the values and raises the same errors as the constructor, but the conversion of
+    each field is generated once per type from its declared type instead of being looked up for every value.
+    """
+    builder = _strict_builders.get(typ)
+    if builder is None:
+        _strict_builders[typ] = lambda value: _strict_builders[typ](value)
+        builder = _strict_builders[typ] = _compile_strict(typ)
+    return builder
+
+
+def strict_list_builder(item_type: Any) -> Callable[[list], list]:
+    """Returns a callable which constructs a list of objects of the type like :obj:`_ListBuilder`."""
+    return strict_builder(List[item_type])
+
+
+def _compile_strict(typ: Any) -> Callable[[Any], Any]:
+    kind = metadata.type_kind(typ)
+    if kind == metadata.LIST:
+        item = strict_builder(typ.__args__[0])
+
+        def build_list(value):
+            assert isinstance(value, list)
+            return [item(v) for v in value]
+        return build_list
+    if kind == metadata.UNION:
+        return _compile_strict_trial(tuple(strict_builder(arg) for arg in typ.__args__))
+    if kind == metadata.UNION_CLASS:
+        return _compile_strict_union(typ)
+    if kind == metadata.CLASS:
+        if typ in identifiers.GUID_IDENTIFIER_TYPES:
+            return identifiers.interning_builder(typ, _compile_strict_class(typ))
+        return _compile_strict_class(typ)
+    return _get_constructor(typ)
+
+
+def _compile_strict_trial(constructors: Tuple[Callable[..., Any], ...]) -> Callable[..., Any]:
+    def build(*args, **kwargs):
+        results = []
+        for constructor in constructors:
+            try:
+                results.append(constructor(*args, **kwargs))
+            except Exception:
+                pass
+        if not results:
+            raise TypeError("This initialization is not applicable for this union type")
+        assert len(results) == 1
+        return results[0]
+    return build
+
+
+def _compile_strict_union(typ: type) -> Callable[[Any], Any]:
+    dispatcher = _dispatcher(typ)
+    strict = _get_constructor(typ)
+
+    def build(value):
+        if type(value) is dict:
+            return dispatcher.build_strict({k: v for k, v in value.items() if v is not None})
+        return strict(value)
+    return build
+
+
+def _field_conversion(field: metadata.FieldMetadata, namespace: Dict[str, Any]) -> List[str]:
+    """Returns the lines converting the value ``v`` of a field like :obj:`_ACBaseType.__setattr__` does."""
+    name, fieldType, kind = field.name, field.type, field.kind
+    key = f'_{name}'
+    error = f'raise TypeError(f"{name} cannot be initialized with {{type(v)}}")'
+    if kind == metadata.UNTYPED:
+        return []
+    if kind == metadata.FLOAT:
+        return ['if type(v) is int:', '    v = float(v)', 'elif not isinstance(v, float):', f'    {error}']
+    if kind == metadata.UUID_:
+        return ['if isinstance(v, str):', '    v = UUID(v)', 'elif not isinstance(v, UUID):', f'    {error}']
+    if kind == metadata.LIST:
+        namespace[f'build{key}'] = strict_builder(fieldType)
+        return ['if isinstance(v, list):', f'    v = build{key}(v)', 'else:', f'    {error}']
+    if kind == metadata.UNION:
+        namespace[f'types{key}'] = fieldType.__args__
+        namespace[f'build{key}'] = strict_builder(fieldType)
+        return [f'if type(v) not in types{key}:', f'    v = build{key}(v)']
+    if kind == metadata.UNION_CLASS:
+        namespace[f'types{key}'] = fieldType.constructor.optional_types
+        namespace[f'build{key}'] = strict_builder(fieldType)
+        return [f'if type(v) not in types{key}:',
+                '    if isinstance(v, dict):', f'        v = build{key}(v)', '    else:', f'        {error}']
+    if kind == metadata.CLASS:
+        namespace[f'type{key}'] = fieldType
+        namespace[f'build{key}'] = strict_builder(fieldType)
+        return [f'if not isinstance(v, type{key}):',
+                '    if isinstance(v, dict):', f'        v = build{key}(v)', '    else:', f'        {error}']
+    namespace[f'type{key}'] = fieldType
+    return [f'if not isinstance(v, type{key}):', f'    {error}']
+
+
+def _compile_strict_class(typ: type) -> Callable[[Any], Any]:
+    fields = metadata.fields_of(typ)
+    namespace: Dict[str, Any] = {'UUID': UUID, 'cls': typ, 'new': object.__new__, 'setattr_': object.__setattr__,
+                                 'strict': _get_constructor(typ), 'allowed': frozenset(field.name for field in fields)}
+    lines = ['def build(value):',
+             '    if type(value) is not dict or not value.keys() <= allowed:',
+             '        return strict(value)',
+             '    obj = new(cls)']
+    for field in fields:
+        name = field.name
+        if field.required:
+            lines += [f'    if {name!r} not in value:', '        return strict(value)', f'    v = value[{name!r}]']
+        else:
+            namespace[f'default_{name}'] = field.default
+            lines.append(f'    v = value.get({name!r}, default_{name})')
+        if field.validators:
+            lines.append('    raw = v')
+        lines += ['    ' + line for line in _field_conversion(field, namespace)]
+        if field.validators:
+            namespace[f'validators_{name}'] = field.validators
+            lines += [f'    if v is not None and not all(validator(v) for validator in validators_{name}):',
+                      f'        raise ValueError(f"{{raw}} is not allowed for {name}")']
+        lines.append(f'    setattr_(obj, {name!r}, v)')
+    lines.append('    return obj')
+    exec(compile('\n'.join(lines), f'<from_dict of {typ.__name__}>', 'exec'), namespace)
+    return namespace['build']
+
+
+def _from_dict(cls, value: Dict[str, Any]) -> Any:
+    """Constructs an object of the type from its JSON representation, validating the values like the constructor."""
+    return strict_builder(cls)(value)
+
+
+def install_builders(namespace: Dict[str, Any]):
+    """Adds the ``from_dict`` class method to the types defined in a module and replaces the constructors of the union types by :obj:`UnionDispatcher`.
+
+    Args:
+        namespace (:obj:`dict`): The globals of the module defining the types.
+
+    """
+    moduleName = namespace['__name__']
+    for obj in list(namespace.values()):
+        kind = metadata.type_kind(obj) if is_class(obj) and obj.__module__ == moduleName else None
+        if kind in (metadata.CLASS, metadata.UNION_CLASS):
+            obj.from_dict = classmethod(_from_dict)
+            if kind == metadata.UNION_CLASS and not isinstance(obj.constructor, UnionDispatcher):
+                obj.constructor = UnionDispatcher(obj)
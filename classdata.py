@@ -0,0 +1,913 @@
+"""The fields of the types and of the command parameters of a release, declared with plain literals.
+
+Generated by ``python -m archicad.metadata`` from the add_field calls of the generated modules, do not edit.
+"""
+
+
+TYPES = (
+    ('AddOnCommandId', (
+        ('commandNamespace', 'str', ('min_length', 1)),
+        ('commandName', 'str', ('min_length', 1)),
+    )),
+    ('AddOnCommandIdArrayItem', (
+        ('addOnCommandId', 'AddOnCommandId'),
+    )),
+    ('AttributeId', (
+        ('guid', 'UUID'),
+    )),
+    ('AttributeFolderId', (
+        ('guid', 'UUID'),
+    )),
+    ('AttributeIdWrapperItem', (
+        ('attributeId', 'AttributeId'),
+    )),
+    ('AttributeFolder', (
+        ('attributeType', 'str', ('value_set', ('BuildingMaterial', 'Composite', 'Fill', 'Layer', 'LayerCombination', 'Line', 'PenTable', 'Profile', 'Surface', 'ZoneCategory'))),
+        ('path', ('Optional', ('List', 'str'))),
+        ('attributeFolderId', ('Optional', 'AttributeFolderId')),
+    )),
+    ('AttributeFolderContent', (
+        ('subfolders', ('List', 'AttributeFolder')),
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('AttributeHeader', (
+        ('attributeId', 'AttributeId'),
+        ('name', 'str'),
+    )),
+    ('LayerAttribute', (
+        ('attributeId', 'AttributeId'),
+        ('name', 'str'),
+        ('intersectionGroupNr', 'int'),
+        ('isLocked', 'bool'),
+        ('isHidden', 'bool'),
+        ('isWireframe', 'bool'),
+    )),
+    ('FillAttribute', (
+        ('attributeId', 'AttributeId'),
+        ('name', 'str'),
+        ('subType', 'str', ('value_set', ('Vector', 'Symbol', 'Solid', 'Empty', 'LinearGradient', 'RadialGradient', 'Image'))),
+        ('pattern', 'int'),
+        ('appearanceType', 'str', ('value_set', ('ScaleWithPlan', 'ScaleIndependent'))),
+    )),
+    ('ProfileModifier', (
+        ('name', 'str'),
+        ('value', 'float'),
+    )),
+    ('ProfileModifierListItem', (
+        ('profileModifier', 'ProfileModifier'),
+    )),
+    ('ProfileAttribute', (
+        ('attributeId', 'AttributeId'),
+        ('name', 'str'),
+        ('useWith', ('List', 'str'), ('listitem_validator', ('value_set', ('Wall', 'Column', 'Beam', 'Window', 'Door', 'Object', 'Lamp', 'Slab', 'Roof', 'Mesh', 'Zone', 'CurtainWall', 'Shell', 'Skylight', 'Morph', 'Stair', 'Railing', 'Opening')))),
+        ('width', 'float'),
+        ('height', 'float'),
+        ('minimumWidth', 'float'),
+        ('minimumHeight', 'float'),
+        ('widthStretchable', 'bool'),
+        ('heightStretchable', 'bool'),
+        ('hasCoreSkin', 'bool'),
+        ('profileModifiers', ('List', 'ProfileModifierListItem')),
+    )),
+    ('Texture', (
+        ('name', 'str'),
+    )),
+    ('DashItem', (
+        ('dash', 'float'),
+        ('gap', 'float'),
+    )),
+    ('LayerCombinationAttribute', (
+        ('attributeId', 'AttributeId'),
+        ('name', 'str'),
+        ('layerAttributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('ClassificationSystemId', (
+        ('guid', 'UUID'),
+    )),
+    ('ClassificationSystemIdArrayItem', (
+        ('classificationSystemId', 'ClassificationSystemId'),
+    )),
+    ('ClassificationItemId', (
+        ('guid', 'UUID'),
+    )),
+    ('ClassificationItemIdArrayItem', (
+        ('classificationItemId', 'ClassificationItemId'),
+    )),
+    ('ClassificationId', (
+        ('classificationSystemId', 'ClassificationSystemId'),
+        ('classificationItemId', ('Optional', 'ClassificationItemId')),
+    )),
+    ('ClassificationItemDetails', (
+        ('classificationItemId', 'ClassificationItemId'),
+        ('id', 'str'),
+        ('name', 'str'),
+        ('description', 'str'),
+    )),
+    ('ClassificationSystem', (
+        ('classificationSystemId', 'ClassificationSystemId'),
+        ('name', 'str'),
+        ('description', 'str'),
+        ('source', 'str'),
+        ('version', 'str'),
+        ('date', 'str', ('matches', '^[0-9]{4}-[0-9]{2}-[0-9]{2}$')),
+    )),
+    ('Point2D', (
+        ('x', 'float'),
+        ('y', 'float'),
+    )),
+    ('NavigatorItemId', (
+        ('guid', 'UUID'),
+    )),
+    ('PublisherSetId', (
+        ('name', 'str'),
+        ('type', 'str', ('value_set', ('PublisherSets',))),
+    )),
+    ('OtherNavigatorTreeId', (
+        ('type', 'str', ('value_set', ('ProjectMap', 'ViewMap', 'MyViewMap', 'LayoutBook'))),
+    )),
+    ('GeneralNavigatorItemData', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('prefix', 'str'),
+        ('name', 'str'),
+    )),
+    ('NavigatorItemIdAndType', (
+        ('navigatorItemType', 'str', ('value_set', ('UndefinedItem', 'ProjectMapRootItem', 'StoryItem', 'SectionItem', 'ElevationItem', 'InteriorElevationItem', 'WorksheetItem', 'DetailItem', 'DocumentFrom3DItem', 'Perspective3DItem', 'Axonometry3DItem', 'CameraSetItem', 'CameraItem', 'ScheduleItem', 'ProjectIndexItem', 'TextListItem', 'GraphicListItem', 'InfoItem', 'HelpItem', 'FolderItem', 'LayoutBookRootItem', 'SubsetItem', 'LayoutItem', 'DrawingItem', 'MasterFolderItem', 'MasterLayoutItem'))),
+        ('navigatorItemId', 'NavigatorItemId'),
+    )),
+    ('DetailNavigatorItem', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('prefix', 'str'),
+        ('name', 'str'),
+    )),
+    ('Document3DNavigatorItem', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('prefix', 'str'),
+        ('name', 'str'),
+    )),
+    ('ElevationNavigatorItem', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('prefix', 'str'),
+        ('name', 'str'),
+    )),
+    ('InteriorElevationNavigatorItem', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('prefix', 'str'),
+        ('name', 'str'),
+    )),
+    ('SectionNavigatorItem', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('prefix', 'str'),
+        ('name', 'str'),
+    )),
+    ('StoryNavigatorItem', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('prefix', 'str'),
+        ('name', 'str'),
+        ('floorLevel', 'float'),
+        ('floorNumber', 'float'),
+    )),
+    ('WorksheetNavigatorItem', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('prefix', 'str'),
+        ('name', 'str'),
+    )),
+    ('UserDefinedPropertyUserId', (
+        ('localizedName', ('List', 'str'), ('min_items', 2), ('max_items', 2)),
+        ('type', 'str', ('value_set', ('UserDefined',))),
+    )),
+    ('BuiltInPropertyUserId', (
+        ('nonLocalizedName', 'str'),
+        ('type', 'str', ('value_set', ('BuiltIn',))),
+    )),
+    ('PropertyId', (
+        ('guid', 'UUID'),
+    )),
+    ('PropertyIdArrayItem', (
+        ('propertyId', 'PropertyId'),
+    )),
+    ('PropertyGroupId', (
+        ('guid', 'UUID'),
+    )),
+    ('PropertyGroupIdArrayItem', (
+        ('propertyGroupId', 'PropertyGroupId'),
+    )),
+    ('PropertyGroup', (
+        ('propertyGroupId', 'PropertyGroupId'),
+        ('name', 'str'),
+    )),
+    ('NormalNumberPropertyValue', (
+        ('value', 'float'),
+        ('type', 'str', ('value_set', ('number',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalIntegerPropertyValue', (
+        ('value', 'int'),
+        ('type', 'str', ('value_set', ('integer',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalStringPropertyValue', (
+        ('value', 'str'),
+        ('type', 'str', ('value_set', ('string',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalBooleanPropertyValue', (
+        ('value', 'bool'),
+        ('type', 'str', ('value_set', ('boolean',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalLengthPropertyValue', (
+        ('value', 'float'),
+        ('type', 'str', ('value_set', ('length',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalAreaPropertyValue', (
+        ('value', 'float'),
+        ('type', 'str', ('value_set', ('area',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalVolumePropertyValue', (
+        ('value', 'float'),
+        ('type', 'str', ('value_set', ('volume',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalAnglePropertyValue', (
+        ('value', 'float'),
+        ('type', 'str', ('value_set', ('angle',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalNumberListPropertyValue', (
+        ('value', ('List', 'float')),
+        ('type', 'str', ('value_set', ('numberList',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalIntegerListPropertyValue', (
+        ('value', ('List', 'int')),
+        ('type', 'str', ('value_set', ('integerList',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalStringListPropertyValue', (
+        ('value', ('List', 'str')),
+        ('type', 'str', ('value_set', ('stringList',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalBooleanListPropertyValue', (
+        ('value', ('List', 'bool')),
+        ('type', 'str', ('value_set', ('booleanList',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalLengthListPropertyValue', (
+        ('value', ('List', 'float')),
+        ('type', 'str', ('value_set', ('lengthList',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalAreaListPropertyValue', (
+        ('value', ('List', 'float')),
+        ('type', 'str', ('value_set', ('areaList',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalVolumeListPropertyValue', (
+        ('value', ('List', 'float')),
+        ('type', 'str', ('value_set', ('volumeList',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalAngleListPropertyValue', (
+        ('value', ('List', 'float')),
+        ('type', 'str', ('value_set', ('angleList',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('UserUndefinedPropertyValue', (
+        ('type', 'str', ('value_set', ('number', 'integer', 'string', 'boolean', 'length', 'area', 'volume', 'angle', 'numberList', 'integerList', 'stringList', 'booleanList', 'lengthList', 'areaList', 'volumeList', 'angleList', 'singleEnum', 'multiEnum'))),
+        ('status', 'str', ('value_set', ('userUndefined',))),
+    )),
+    ('NotAvailablePropertyValue', (
+        ('type', 'str', ('value_set', ('number', 'integer', 'string', 'boolean', 'length', 'area', 'volume', 'angle', 'numberList', 'integerList', 'stringList', 'booleanList', 'lengthList', 'areaList', 'volumeList', 'angleList', 'singleEnum', 'multiEnum'))),
+        ('status', 'str', ('value_set', ('notAvailable',))),
+    )),
+    ('NotEvaluatedPropertyValue', (
+        ('type', 'str', ('value_set', ('number', 'integer', 'string', 'boolean', 'length', 'area', 'volume', 'angle', 'numberList', 'integerList', 'stringList', 'booleanList', 'lengthList', 'areaList', 'volumeList', 'angleList', 'singleEnum', 'multiEnum'))),
+        ('status', 'str', ('value_set', ('notEvaluated',))),
+    )),
+    ('DisplayValueEnumId', (
+        ('displayValue', 'str'),
+        ('type', 'str', ('value_set', ('displayValue',))),
+    )),
+    ('NonLocalizedValueEnumId', (
+        ('nonLocalizedValue', 'str'),
+        ('type', 'str', ('value_set', ('nonLocalizedValue',))),
+    )),
+    ('PossibleEnumValue', (
+        ('enumValueId', 'EnumValueId'),
+        ('displayValue', 'str'),
+        ('nonLocalizedValue', ('Optional', 'str')),
+    )),
+    ('PossibleEnumValuesArrayItem', (
+        ('enumValue', 'PossibleEnumValue'),
+    )),
+    ('Error', (
+        ('code', 'int'),
+        ('message', 'str'),
+    )),
+    ('ErrorItem', (
+        ('error', 'Error'),
+    )),
+    ('SuccessfulExecutionResult', (
+        ('success', 'bool'),
+    )),
+    ('FailedExecutionResult', (
+        ('success', 'bool'),
+        ('error', 'Error'),
+    )),
+    ('ElementId', (
+        ('guid', 'UUID'),
+    )),
+    ('ElementIdArrayItem', (
+        ('elementId', 'ElementId'),
+    )),
+    ('TypeOfElement', (
+        ('elementId', 'ElementId'),
+        ('elementType', 'str', ('value_set', ('Wall', 'Column', 'Beam', 'Window', 'Door', 'Object', 'Lamp', 'Slab', 'Roof', 'Mesh', 'Zone', 'CurtainWall', 'Shell', 'Skylight', 'Morph', 'Stair', 'Railing', 'Opening'))),
+    )),
+    ('ElementsWrapper', (
+        ('elements', ('List', 'ElementIdArrayItem')),
+    )),
+    ('Image', (
+        ('content', 'str'),
+    )),
+    ('FolderParameters', (
+        ('name', 'str'),
+    )),
+    ('BoundingBox2D', (
+        ('xMin', 'float'),
+        ('yMin', 'float'),
+        ('xMax', 'float'),
+        ('yMax', 'float'),
+    )),
+    ('BoundingBox3D', (
+        ('xMin', 'float'),
+        ('yMin', 'float'),
+        ('zMin', 'float'),
+        ('xMax', 'float'),
+        ('yMax', 'float'),
+        ('zMax', 'float'),
+    )),
+    ('RGBColor', (
+        ('red', 'float', ('maximum', 1, False)),
+        ('green', 'float', ('maximum', 1, False)),
+        ('blue', 'float', ('maximum', 1, False)),
+    )),
+    ('Subset', (
+        ('name', 'str', ('min_length', 1)),
+        ('includeToIDSequence', 'bool'),
+        ('customNumbering', 'bool'),
+        ('continueNumbering', 'bool'),
+        ('useUpperPrefix', 'bool'),
+        ('addOwnPrefix', 'bool'),
+        ('customNumber', 'str'),
+        ('autoNumber', 'str'),
+        ('numberingStyle', 'str', ('value_set', ('Undefined', 'abc', 'ABC', '1', '01', '001', '0001', 'noID'))),
+        ('startAt', 'int'),
+        ('ownPrefix', 'str'),
+    )),
+    ('LayoutParameters', (
+        ('horizontalSize', 'float'),
+        ('verticalSize', 'float'),
+        ('leftMargin', 'float'),
+        ('topMargin', 'float'),
+        ('rightMargin', 'float'),
+        ('bottomMargin', 'float'),
+        ('customLayoutNumber', 'str'),
+        ('customLayoutNumbering', 'bool'),
+        ('doNotIncludeInNumbering', 'bool'),
+        ('displayMasterLayoutBelow', 'bool'),
+        ('layoutPageNumber', 'int'),
+        ('actPageIndex', 'int'),
+        ('currentRevisionId', 'str'),
+        ('currentFinalRevisionId', 'str'),
+        ('hasIssuedRevision', 'bool'),
+        ('hasActualRevision', 'bool'),
+    )),
+    ('ComponentId', (
+        ('guid', 'UUID'),
+    )),
+    ('ElementComponentId', (
+        ('elementId', 'ElementId'),
+        ('componentId', 'ComponentId'),
+    )),
+    ('ElementComponentIdArrayItem', (
+        ('elementComponentId', 'ElementComponentId'),
+    )),
+    ('ElementComponentsWrapper', (
+        ('elementComponents', ('List', 'ElementComponentIdArrayItem')),
+    )),
+    ('LayerAttributeWrapper', (
+        ('layerAttribute', 'LayerAttribute'),
+    )),
+    ('FillAttributeWrapper', (
+        ('fillAttribute', 'FillAttribute'),
+    )),
+    ('ProfileAttributeWrapper', (
+        ('profileAttribute', 'ProfileAttribute'),
+    )),
+    ('DashItemWrapper', (
+        ('dashItem', 'DashItem'),
+    )),
+    ('LayerCombinationAttributeWrapper', (
+        ('layerCombinationAttribute', 'LayerCombinationAttribute'),
+    )),
+    ('ClassificationIdWrapper', (
+        ('classificationId', 'ClassificationId'),
+    )),
+    ('ClassificationItemDetailsWrapper', (
+        ('classificationItem', 'ClassificationItemDetails'),
+    )),
+    ('ClassificationSystemWrapper', (
+        ('classificationSystem', 'ClassificationSystem'),
+    )),
+    ('NavigatorItemIdWrapper', (
+        ('navigatorItemId', 'NavigatorItemId'),
+    )),
+    ('NavigatorItemIdAndTypeWrapper', (
+        ('navigatorItemIdAndType', 'NavigatorItemIdAndType'),
+    )),
+    ('DetailNavigatorItemWrapper', (
+        ('detailNavigatorItem', 'DetailNavigatorItem'),
+    )),
+    ('Document3DNavigatorItemWrapper', (
+        ('document3DNavigatorItem', 'Document3DNavigatorItem'),
+    )),
+    ('ElevationNavigatorItemWrapper', (
+        ('elevationNavigatorItem', 'ElevationNavigatorItem'),
+    )),
+    ('InteriorElevationNavigatorItemWrapper', (
+        ('interiorElevationNavigatorItem', 'InteriorElevationNavigatorItem'),
+    )),
+    ('SectionNavigatorItemWrapper', (
+        ('sectionNavigatorItem', 'SectionNavigatorItem'),
+    )),
+    ('StoryNavigatorItemWrapper', (
+        ('storyNavigatorItem', 'StoryNavigatorItem'),
+    )),
+    ('WorksheetNavigatorItemWrapper', (
+        ('worksheetNavigatorItem', 'WorksheetNavigatorItem'),
+    )),
+    ('PropertyGroupWrapper', (
+        ('propertyGroup', 'PropertyGroup'),
+    )),
+    ('EnumValueIdWrapper', (
+        ('enumValueId', 'EnumValueId'),
+    )),
+    ('TypeOfElementWrapper', (
+        ('typeOfElement', 'TypeOfElement'),
+    )),
+    ('ImageWrapper', (
+        ('image', 'Image'),
+    )),
+    ('BoundingBox2DWrapper', (
+        ('boundingBox2D', 'BoundingBox2D'),
+    )),
+    ('BoundingBox3DWrapper', (
+        ('boundingBox3D', 'BoundingBox3D'),
+    )),
+    ('SurfaceAttribute', (
+        ('attributeId', 'AttributeId'),
+        ('name', 'str'),
+        ('materialType', 'str', ('value_set', ('General', 'Simple', 'Matte', 'Metal', 'Plastic', 'Glass', 'Glowing', 'Constant'))),
+        ('ambientReflection', 'int', ('maximum', 100, False)),
+        ('diffuseReflection', 'int', ('maximum', 100, False)),
+        ('specularReflection', 'int', ('maximum', 100, False)),
+        ('transparencyAttenuation', 'int', ('maximum', 400, False)),
+        ('emissionAttenuation', 'int', ('maximum', 65535, False)),
+        ('surfaceColor', 'RGBColor'),
+        ('specularColor', 'RGBColor'),
+        ('emissionColor', 'RGBColor'),
+        ('fillId', 'AttributeIdOrError'),
+        ('transparency', 'int', ('maximum', 100, False)),
+        ('shine', 'int', ('maximum', 10000, False)),
+        ('texture', ('Optional', 'Texture')),
+    )),
+    ('CompositeLine', (
+        ('lineId', 'AttributeIdOrError'),
+        ('linePenIndex', ('Optional', 'int'), ('maximum', 255, False)),
+    )),
+    ('CompositeLineListItem', (
+        ('compositeLine', 'CompositeLine'),
+    )),
+    ('CompositeSkin', (
+        ('buildingMaterialId', 'AttributeIdOrError'),
+        ('thickness', 'float'),
+        ('isCore', 'bool'),
+        ('isFinish', 'bool'),
+        ('framePenIndex', ('Optional', 'int'), ('maximum', 255, False)),
+    )),
+    ('CompositeSkinListItem', (
+        ('compositeSkin', 'CompositeSkin'),
+    )),
+    ('CompositeAttribute', (
+        ('attributeId', 'AttributeId'),
+        ('name', 'str'),
+        ('totalThickness', 'float'),
+        ('compositeSkins', ('List', 'CompositeSkinListItem')),
+        ('compositeLines', ('List', 'CompositeLineListItem')),
+        ('useWith', ('List', 'str'), ('listitem_validator', ('value_set', ('Wall', 'Column', 'Beam', 'Window', 'Door', 'Object', 'Lamp', 'Slab', 'Roof', 'Mesh', 'Zone', 'CurtainWall', 'Shell', 'Skylight', 'Morph', 'Stair', 'Railing', 'Opening')))),
+    )),
+    ('Pen', (
+        ('name', 'str', ('min_length', 1)),
+        ('index', 'int', ('maximum', 255, False)),
+        ('color', 'RGBColor'),
+        ('weight', 'float'),
+        ('description', 'str'),
+    )),
+    ('PenArrayItem', (
+        ('pen', 'Pen'),
+    )),
+    ('LineItem', (
+        ('lineItemType', 'str', ('value_set', ('IllegalItemType', 'SeparatorItemType', 'CenterDotItemType', 'CenterLineItemType', 'DotItemType', 'RightAngleItemType', 'ParallelItemType', 'LineItemType', 'CircItemType', 'ArcItemType'))),
+        ('centerOffset', 'float'),
+        ('length', 'float'),
+        ('begPosition', 'Point2D'),
+        ('endPosition', 'Point2D'),
+        ('radius', 'float'),
+        ('begAngle', 'float'),
+        ('endAngle', 'float'),
+    )),
+    ('ZoneCategoryAttribute', (
+        ('attributeId', 'AttributeId'),
+        ('name', 'str'),
+        ('categoryCode', 'str'),
+        ('stampName', 'str'),
+        ('stampMainGuid', 'UUID'),
+        ('stampRevisionGuid', 'UUID'),
+        ('color', 'RGBColor'),
+    )),
+    ('BuildingMaterialAttribute', (
+        ('attributeId', 'AttributeId'),
+        ('name', 'str'),
+        ('id', 'str'),
+        ('connectionPriority', 'int'),
+        ('cutFillId', 'AttributeIdOrError'),
+        ('cutFillPenIndex', 'int', ('maximum', 255, False)),
+        ('cutSurfaceId', 'AttributeIdOrError'),
+    )),
+    ('ClassificationItemAvailability', (
+        ('classificationItemId', 'ClassificationItemId'),
+        ('availableProperties', ('List', 'PropertyIdArrayItem')),
+    )),
+    ('PropertyDefinitionAvailability', (
+        ('propertyId', 'PropertyId'),
+        ('availableClassifications', ('List', 'ClassificationItemIdArrayItem')),
+    )),
+    ('ElementClassification', (
+        ('elementId', 'ElementId'),
+        ('classificationId', 'ClassificationId'),
+    )),
+    ('BuiltInContainerNavigatorItem', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('prefix', 'str'),
+        ('name', 'str'),
+        ('contentIds', ('List', 'NavigatorItemIdWrapper')),
+    )),
+    ('NormalSingleEnumPropertyValue', (
+        ('value', 'EnumValueId'),
+        ('type', 'str', ('value_set', ('singleEnum',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('NormalMultiEnumPropertyValue', (
+        ('value', ('List', 'EnumValueIdWrapper')),
+        ('type', 'str', ('value_set', ('multiEnum',))),
+        ('status', 'str', ('value_set', ('normal',))),
+    )),
+    ('PropertyIdsOfElement', (
+        ('elementId', 'ElementId'),
+        ('propertyIds', ('List', 'PropertyIdArrayItem')),
+    )),
+    ('SurfaceAttributeWrapper', (
+        ('surfaceAttribute', 'SurfaceAttribute'),
+    )),
+    ('CompositeAttributeWrapper', (
+        ('compositeAttribute', 'CompositeAttribute'),
+    )),
+    ('LineItemWrapper', (
+        ('lineItem', 'LineItem'),
+    )),
+    ('ZoneCategoryAttributeWrapper', (
+        ('zoneCategoryAttribute', 'ZoneCategoryAttribute'),
+    )),
+    ('BuildingMaterialAttributeWrapper', (
+        ('buildingMaterialAttribute', 'BuildingMaterialAttribute'),
+    )),
+    ('ClassificationItemAvailabilityWrapper', (
+        ('classificationItemAvailability', 'ClassificationItemAvailability'),
+    )),
+    ('PropertyDefinitionAvailabilityWrapper', (
+        ('propertyDefinitionAvailability', 'PropertyDefinitionAvailability'),
+    )),
+    ('ClassificationIdsOrErrorsWrapper', (
+        ('classificationIds', ('List', 'ClassificationIdOrError')),
+    )),
+    ('BuiltInContainerNavigatorItemWrapper', (
+        ('builtInContainerNavigatorItem', 'BuiltInContainerNavigatorItem'),
+    )),
+    ('PropertyIdsOfElementWrapper', (
+        ('propertyIdsOfElement', 'PropertyIdsOfElement'),
+    )),
+    ('PenTableAttribute', (
+        ('attributeId', 'AttributeId'),
+        ('name', 'str'),
+        ('pens', ('List', 'PenArrayItem')),
+    )),
+    ('LineAttribute', (
+        ('attributeId', 'AttributeId'),
+        ('name', 'str'),
+        ('appearanceType', 'str', ('value_set', ('ScaleWithPlan', 'ScaleIndependent'))),
+        ('displayScale', 'float'),
+        ('period', 'float'),
+        ('height', 'float'),
+        ('lineType', 'str', ('value_set', ('SolidLine', 'DashedLine', 'SymbolLine'))),
+        ('lineItems', ('Optional', ('List', 'DashOrLineItem'))),
+    )),
+    ('PenTableAttributeWrapper', (
+        ('penTableAttribute', 'PenTableAttribute'),
+    )),
+    ('LineAttributeWrapper', (
+        ('lineAttribute', 'LineAttribute'),
+    )),
+    ('ClassificationItemInTree', (
+        ('classificationItemId', 'ClassificationItemId'),
+        ('id', 'str'),
+        ('name', 'str'),
+        ('description', 'str'),
+        ('children', ('Optional', ('List', 'ClassificationItemArrayItem'))),
+    )),
+    ('ClassificationItemArrayItem', (
+        ('classificationItem', 'ClassificationItemInTree'),
+    )),
+    ('NavigatorItem', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('prefix', 'str'),
+        ('name', 'str'),
+        ('type', 'str', ('value_set', ('UndefinedItem', 'ProjectMapRootItem', 'StoryItem', 'SectionItem', 'ElevationItem', 'InteriorElevationItem', 'WorksheetItem', 'DetailItem', 'DocumentFrom3DItem', 'Perspective3DItem', 'Axonometry3DItem', 'CameraSetItem', 'CameraItem', 'ScheduleItem', 'ProjectIndexItem', 'TextListItem', 'GraphicListItem', 'InfoItem', 'HelpItem', 'FolderItem', 'LayoutBookRootItem', 'SubsetItem', 'LayoutItem', 'DrawingItem', 'MasterFolderItem', 'MasterLayoutItem'))),
+        ('sourceNavigatorItemId', ('Optional', 'NavigatorItemId')),
+        ('children', ('Optional', ('List', 'NavigatorItemArrayItem'))),
+    )),
+    ('NavigatorItemArrayItem', (
+        ('navigatorItem', 'NavigatorItem'),
+    )),
+    ('NavigatorTree', (
+        ('rootItem', 'NavigatorItem'),
+    )),
+    ('PropertyDefinition', (
+        ('group', 'PropertyGroup'),
+        ('name', 'str'),
+        ('description', 'str'),
+        ('isEditable', 'bool'),
+        ('type', 'str'),
+        ('propertyId', ('Optional', 'PropertyId')),
+        ('possibleEnumValues', ('Optional', ('List', 'PossibleEnumValuesArrayItem'))),
+        ('defaultValue', ('Optional', 'PropertyDefaultValue')),
+    )),
+    ('PropertyDefinitionWrapper', (
+        ('propertyDefinition', 'PropertyDefinition'),
+    )),
+    ('ElementPropertyValue', (
+        ('elementId', 'ElementId'),
+        ('propertyId', 'PropertyId'),
+        ('propertyValue', 'NormalOrUserUndefinedPropertyValue'),
+    )),
+    ('PropertyBasicDefaultValue', (
+        ('basicDefaultValue', 'PropertyValue'),
+    )),
+    ('PropertyValueWrapper', (
+        ('propertyValue', 'PropertyValue'),
+    )),
+    ('PropertyValuesWrapper', (
+        ('propertyValues', ('List', 'PropertyValueOrErrorItem')),
+    )),
+)
+
+
+COMMANDS = (
+    ('_CloneProjectMapItemToViewMap_parameters', (
+        ('projectMapNavigatorItemId', 'NavigatorItemId'),
+        ('parentNavigatorItemId', 'NavigatorItemId'),
+    )),
+    ('_CreateAttributeFolders_parameters', (
+        ('attributeFolders', ('List', 'AttributeFolder')),
+    )),
+    ('_CreateLayout_parameters', (
+        ('layoutName', 'str', ('min_length', 1)),
+        ('layoutParameters', 'LayoutParameters'),
+        ('masterNavigatorItemId', 'NavigatorItemId'),
+        ('parentNavigatorItemId', 'NavigatorItemId'),
+    )),
+    ('_CreateLayoutSubset_parameters', (
+        ('subsetParameters', 'Subset'),
+        ('parentNavigatorItemId', 'NavigatorItemId'),
+    )),
+    ('_CreateViewMapFolder_parameters', (
+        ('folderParameters', 'FolderParameters'),
+        ('parentNavigatorItemId', ('Optional', 'NavigatorItemId')),
+        ('previousNavigatorItemId', ('Optional', 'NavigatorItemId')),
+    )),
+    ('_DeleteAttributeFolders_parameters', (
+        ('attributeFolders', ('List', 'AttributeFolder')),
+    )),
+    ('_DeleteAttributes_parameters', (
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('_DeleteNavigatorItems_parameters', (
+        ('navigatorItemIds', ('List', 'NavigatorItemIdWrapper')),
+    )),
+    ('_ExecuteAddOnCommand_parameters', (
+        ('addOnCommandId', 'AddOnCommandId'),
+        ('addOnCommandParameters', ('Optional', 'AddOnCommandParameters')),
+    )),
+    ('_Get2DBoundingBoxes_parameters', (
+        ('elements', ('List', 'ElementIdArrayItem')),
+    )),
+    ('_Get3DBoundingBoxes_parameters', (
+        ('elements', ('List', 'ElementIdArrayItem')),
+    )),
+    ('_GetAllClassificationsInSystem_parameters', (
+        ('classificationSystemId', 'ClassificationSystemId'),
+    )),
+    ('_GetAllPropertyGroupIds_parameters', (
+        ('propertyType', ('Optional', 'str'), ('value_set', ('UserDefined', 'BuiltIn'))),
+    )),
+    ('_GetAllPropertyIds_parameters', (
+        ('propertyType', ('Optional', 'str'), ('value_set', ('UserDefined', 'BuiltIn'))),
+    )),
+    ('_GetAllPropertyIdsOfElements_parameters', (
+        ('elements', ('List', 'ElementIdArrayItem')),
+        ('propertyType', ('Optional', 'str'), ('value_set', ('UserDefined', 'BuiltIn'))),
+    )),
+    ('_GetAttributeFolder_parameters', (
+        ('attributeFolder', 'AttributeFolder'),
+    )),
+    ('_GetAttributeFolderContent_parameters', (
+        ('attributeFolder', 'AttributeFolder'),
+    )),
+    ('_GetAttributesByType_parameters', (
+        ('attributeType', 'str', ('value_set', ('BuildingMaterial', 'Composite', 'Fill', 'Layer', 'LayerCombination', 'Line', 'PenTable', 'Profile', 'Surface', 'ZoneCategory'))),
+    )),
+    ('_GetBuildingMaterialAttributes_parameters', (
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('_GetBuiltInContainerNavigatorItems_parameters', (
+        ('navigatorItemIds', ('List', 'NavigatorItemIdWrapper')),
+    )),
+    ('_GetClassificationItemAvailability_parameters', (
+        ('classificationItemIds', ('List', 'ClassificationItemIdArrayItem')),
+    )),
+    ('_GetClassificationsOfElements_parameters', (
+        ('elements', ('List', 'ElementIdArrayItem')),
+        ('classificationSystemIds', ('List', 'ClassificationSystemIdArrayItem')),
+    )),
+    ('_GetClassificationSystems_parameters', (
+        ('classificationSystemIds', ('List', 'ClassificationSystemIdArrayItem')),
+    )),
+    ('_GetComponentsOfElements_parameters', (
+        ('elements', ('List', 'ElementIdArrayItem')),
+    )),
+    ('_GetCompositeAttributes_parameters', (
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('_GetDetailNavigatorItems_parameters', (
+        ('navigatorItemIds', ('List', 'NavigatorItemIdWrapper')),
+    )),
+    ('_GetDetailsOfClassificationItems_parameters', (
+        ('classificationItemIds', ('List', 'ClassificationItemIdArrayItem')),
+    )),
+    ('_GetDetailsOfProperties_parameters', (
+        ('properties', ('List', 'PropertyIdArrayItem')),
+    )),
+    ('_GetDocument3DNavigatorItems_parameters', (
+        ('navigatorItemIds', ('List', 'NavigatorItemIdWrapper')),
+    )),
+    ('_GetElementsByClassification_parameters', (
+        ('classificationItemId', 'ClassificationItemId'),
+    )),
+    ('_GetElementsByType_parameters', (
+        ('elementType', 'str', ('value_set', ('Wall', 'Column', 'Beam', 'Window', 'Door', 'Object', 'Lamp', 'Slab', 'Roof', 'Mesh', 'Zone', 'CurtainWall', 'Shell', 'Skylight', 'Morph', 'Stair', 'Railing', 'Opening'))),
+    )),
+    ('_GetElementsRelatedToZones_parameters', (
+        ('zones', ('List', 'ElementIdArrayItem')),
+        ('elementTypes', ('Optional', ('List', 'str')), ('listitem_validator', ('value_set', ('Wall', 'Column', 'Beam', 'Window', 'Door', 'Object', 'Lamp', 'Slab', 'Roof', 'Mesh', 'Zone', 'CurtainWall', 'Shell', 'Skylight', 'Morph', 'Stair', 'Railing', 'Opening')))),
+    )),
+    ('_GetElevationNavigatorItems_parameters', (
+        ('navigatorItemIds', ('List', 'NavigatorItemIdWrapper')),
+    )),
+    ('_GetFillAttributes_parameters', (
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('_GetInteriorElevationNavigatorItems_parameters', (
+        ('navigatorItemIds', ('List', 'NavigatorItemIdWrapper')),
+    )),
+    ('_GetLayerAttributes_parameters', (
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('_GetLayerCombinationAttributes_parameters', (
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('_GetLayoutSettings_parameters', (
+        ('layoutNavigatorItemId', 'NavigatorItemId'),
+    )),
+    ('_GetLineAttributes_parameters', (
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('_GetNavigatorItemsType_parameters', (
+        ('navigatorItemIds', ('List', 'NavigatorItemIdWrapper')),
+    )),
+    ('_GetNavigatorItemTree_parameters', (
+        ('navigatorTreeId', 'NavigatorTreeId'),
+    )),
+    ('_GetPenTableAttributes_parameters', (
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('_GetProfileAttributePreview_parameters', (
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+        ('imageWidth', 'int'),
+        ('imageHeight', 'int'),
+        ('backgroundColor', ('Optional', 'RGBColor')),
+    )),
+    ('_GetProfileAttributes_parameters', (
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('_GetPropertyDefinitionAvailability_parameters', (
+        ('propertyIds', ('List', 'PropertyIdArrayItem')),
+    )),
+    ('_GetPropertyGroups_parameters', (
+        ('propertyGroupIds', ('List', 'PropertyGroupIdArrayItem')),
+    )),
+    ('_GetPropertyIds_parameters', (
+        ('properties', ('List', 'PropertyUserId')),
+    )),
+    ('_GetPropertyValuesOfElementComponents_parameters', (
+        ('elementComponents', ('List', 'ElementComponentIdArrayItem')),
+        ('properties', ('List', 'PropertyIdArrayItem')),
+    )),
+    ('_GetPropertyValuesOfElements_parameters', (
+        ('elements', ('List', 'ElementIdArrayItem')),
+        ('properties', ('List', 'PropertyIdArrayItem')),
+    )),
+    ('_GetSectionNavigatorItems_parameters', (
+        ('navigatorItemIds', ('List', 'NavigatorItemIdWrapper')),
+    )),
+    ('_GetSelectedElements_parameters', (
+        ('onlyEditable', ('Optional', 'bool')),
+    )),
+    ('_GetStoryNavigatorItems_parameters', (
+        ('navigatorItemIds', ('List', 'NavigatorItemIdWrapper')),
+    )),
+    ('_GetSurfaceAttributes_parameters', (
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('_GetTypesOfElements_parameters', (
+        ('elements', ('List', 'ElementIdArrayItem')),
+    )),
+    ('_GetWorksheetNavigatorItems_parameters', (
+        ('navigatorItemIds', ('List', 'NavigatorItemIdWrapper')),
+    )),
+    ('_GetZoneCategoryAttributes_parameters', (
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+    )),
+    ('_IsAddOnCommandAvailable_parameters', (
+        ('addOnCommandId', 'AddOnCommandId'),
+    )),
+    ('_MoveAttributesAndFolders_parameters', (
+        ('folders', ('List', 'AttributeFolder')),
+        ('attributeIds', ('List', 'AttributeIdWrapperItem')),
+        ('targetFolder', 'AttributeFolder'),
+    )),
+    ('_MoveNavigatorItem_parameters', (
+        ('navigatorItemIdToMove', 'NavigatorItemId'),
+        ('parentNavigatorItemId', 'NavigatorItemId'),
+        ('previousNavigatorItemId', ('Optional', 'NavigatorItemId')),
+    )),
+    ('_RenameAttributeFolder_parameters', (
+        ('attributeFolder', 'AttributeFolder'),
+        ('newName', 'str', ('min_length', 1)),
+    )),
+    ('_RenameNavigatorItem_parameters1', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('newName', 'str'),
+    )),
+    ('_RenameNavigatorItem_parameters2', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('newId', 'str'),
+    )),
+    ('_RenameNavigatorItem_parameters3', (
+        ('navigatorItemId', 'NavigatorItemId'),
+        ('newName', 'str'),
+        ('newId', 'str'),
+    )),
+    ('_SetClassificationsOfElements_parameters', (
+        ('elementClassifications', ('List', 'ElementClassification')),
+    )),
+    ('_SetLayoutSettings_parameters', (
+        ('layoutParameters', 'LayoutParameters'),
+        ('layoutNavigatorItemId', 'NavigatorItemId'),
+    )),
+    ('_SetPropertyValuesOfElements_parameters', (
+        ('elementPropertyValues', ('List', 'ElementPropertyValue')),
+    )),
+)
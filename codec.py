@@ -0,0 +1,112 @@
+"""Graphisoft
+"""
+
+import abc
+import json
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class JSONCodec(abc.ABC):
+    """The interface of the JSON encoders and decoders of the request and response bodies.
+
+    Attributes:
+        name (:obj:`str`): The name the codec is registered with.
+
+    """
+
+    name = ''
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes the object as UTF-8 encoded JSON."""
+
+    @abc.abstractmethod
+    def loads(self, data: BytesLike) -> Any:
+        """Decodes UTF-8 encoded JSON."""
+
+
+class StdlibJSONCodec(JSONCodec):
+    """The codec of the ``json`` module of the standard library. The response bodies are decoded into a string before parsing."""
+
+    name = 'json'
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode('UTF-8')
+
+    def loads(self, data: BytesLike) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """The codec of the ``orjson`` package. It encodes straight to bytes and parses the response bodies without copying them into a string."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('The orjson package is not installed')
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: BytesLike) -> Any:
+        return orjson.loads(data)
+
+
+_codec_classes: Dict[str, type] = {StdlibJSONCodec.name: StdlibJSONCodec, OrjsonCodec.name: OrjsonCodec}
+_codec: Optional[JSONCodec] = None
+
+
+def available_codecs() -> Dict[str, type]:
+    """Returns the codec classes whose dependencies are installed, keyed by name."""
+    return {name: cls for name, cls in _codec_classes.items() if cls is not OrjsonCodec or orjson is not None}
+
+
+def register_codec(cls: type):
+    """Makes a codec class selectable by its name in :obj:`set_codec`."""
+    _codec_classes[cls.name] = cls
+
+
+def _default_codec() -> JSONCodec:
+    return OrjsonCodec() if orjson is not None else StdlibJSONCodec()
+
+
+def get_codec() -> JSONCodec:
+    """Returns the codec used by the commands. Defaults to the fastest installed one."""
+    global _codec
+    if _codec is None:
+        _codec = _default_codec()
+    return _codec
+
+
+def set_codec(codec: Union[JSONCodec, str, None]):
+    """Selects the codec used by the commands by instance or by name. None restores the default.
+
+    Raises:
+        KeyError: When no codec is registered with the given name.
+        ImportError: When the package of the codec is not installed.
+    """
+    global _codec
+    if isinstance(codec, str):
+        codec = _codec_classes[codec]()
+    _codec = codec
+
+
+def dumps(obj: Any) -> bytes:
+    """Encodes the object with the selected codec."""
+    return get_codec().dumps(obj)
+
+
+def loads(data: BytesLike) -> Any:
+    """Decodes the data with the selected codec."""
+    return get_codec().loads(data)
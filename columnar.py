@@ -0,0 +1,188 @@
+"""Graphisoft
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+STATUS_NORMAL = 0
+STATUS_USER_UNDEFINED = 1
+STATUS_NOT_AVAILABLE = 2
+STATUS_NOT_EVALUATED = 3
+STATUS_ERROR = 4
+
+_STATUS_CODES = {
+    'normal': STATUS_NORMAL,
+    'userUndefined': STATUS_USER_UNDEFINED,
+    'notAvailable': STATUS_NOT_AVAILABLE,
+    'notEvaluated': STATUS_NOT_EVALUATED,
+}
+
+_TYPECODES = {
+    'number': 'd',
+    'length': 'd',
+    'area': 'd',
+    'volume': 'd',
+    'angle': 'd',
+    'integer': 'q',
+    'boolean': 'b',
+}
+
+
+class PropertyColumn:
+    """The values of one property for a list of elements.
+
+    The value of a cell whose status is not :obj:`STATUS_NORMAL` is 0 in typed columns and None otherwise.
+
+    Attributes:
+        property (:obj:`Any`): The property identifier the column belongs to.
+        type (:obj:`str`): The type of the property values, or None if the column has no normal value.
+        values (:obj:`array.array` or :obj:`list`): The values. Number, length, area, volume and angle values are stored in an ``array('d')``,
+            integers in an ``array('q')`` and booleans in an ``array('b')``. Other values are kept as their JSON representation in a list.
+        status (:obj:`array.array`): The status codes of the cells in an ``array('b')``, one of the ``STATUS_*`` constants.
+
+    """
+
+    __slots__ = ('property', 'type', 'values', 'status')
+
+    def __init__(self, property: Any):
+        self.property = property
+        self.type: Optional[str] = None
+        self.values = []
+        self.status = array('b')
+
+    def _set_type(self, type: str):
+        self.type = type
+        typecode = _TYPECODES.get(type)
+        if typecode is not None:
+            self.values = array(typecode, bytes(array(typecode).itemsize * len(self.values)))
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    @property
+    def valid(self) -> array:
+        """The validity mask of the cells in an ``array('b')``: 1 for normal values, 0 otherwise."""
+        return array('b', (status == STATUS_NORMAL for status in self.status))
+
+    def to_numpy(self) -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+        """Returns the values and the status codes as NumPy arrays. Typed columns share their memory with the arrays.
+
+        Raises:
+            ImportError: When NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError('NumPy is required to convert property columns to NumPy arrays')
+        if isinstance(self.values, array):
+            values = numpy.frombuffer(self.values, dtype=numpy.dtype(self.values.typecode))
+        else:
+            values = numpy.array(self.values, dtype=object)
+        return values, numpy.frombuffer(self.status, dtype=numpy.int8)
+
+
+class PropertyColumnsBuilder:
+    """Builds property columns from the raw JSON results of the ``API.GetPropertyValuesOfElements`` command.
+
+    Args:
+        properties (:obj:`list`): The property identifiers the values are requested for.
+
+    """
+
+    def __init__(self, properties: Iterable[Any]):
+        self.columns: List[PropertyColumn] = [PropertyColumn(property) for property in properties]
+
+    def extend(self, propertyValuesForElements: List[Dict[str, Any]]):
+        """Appends the property values of the elements to the columns.
+
+        Raises:
+            ValueError: When an element has a different number of property values than the number of columns.
+        """
+        columns = self.columns
+        for item in propertyValuesForElements:
+            propertyValues = item.get('propertyValues')
+            if propertyValues is None:
+                for column in columns:
+                    column.values.append(0 if isinstance(column.values, array) else None)
+                    column.status.append(STATUS_ERROR)
+                continue
+            if len(propertyValues) != len(columns):
+                raise ValueError(f'Expected {len(columns)} property values for an element, got {len(propertyValues)}')
+            for column, cell in zip(columns, propertyValues):
+                propertyValue = cell.get('propertyValue')
+                status = STATUS_ERROR if propertyValue is None else _STATUS_CODES.get(propertyValue['status'], STATUS_ERROR)
+                if status == STATUS_NORMAL:
+                    if column.type is None:
+                        column._set_type(propertyValue['type'])
+                    column.values.append(propertyValue['value'])
+                else:
+                    column.values.append(0 if isinstance(column.values, array) else None)
+                column.status.append(status)
+
+
+BOUNDING_BOX_2D_KEYS = ('xMin', 'yMin', 'xMax', 'yMax')
+BOUNDING_BOX_3D_KEYS = ('xMin', 'yMin', 'zMin', 'xMax', 'yMax', 'zMax')
+
+
+class BoundingBoxArray:
+    """Bounding boxes of a list of elements stored in flat arrays.
+
+    The coordinates of the boxes whose element returned an error are NaN.
+
+    Attributes:
+        keys (:obj:`tuple` of :obj:`str`): The names of the coordinates of a box in the order they are stored.
+        values (:obj:`array.array`): The coordinates of the boxes one after the other in an ``array('d')``.
+        errors (:obj:`array.array`): The error mask of the boxes in an ``array('b')``: 1 where the element returned an error, 0 otherwise.
+        errorItems (:obj:`dict`): The errors returned for the elements keyed by the index of the element.
+
+    """
+
+    __slots__ = ('keys', 'values', 'errors', 'errorItems')
+
+    def __init__(self, keys: Tuple[str, ...]):
+        self.keys = keys
+        self.values = array('d')
+        self.errors = array('b')
+        self.errorItems: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    def extend(self, boundingBoxes: List[Dict[str, Any]], boxKey: str):
+        """Appends the boxes of the raw JSON result items stored under ``boxKey``."""
+        keys = self.keys
+        nan = (float('nan'),) * len(keys)
+        values = self.values
+        errors = self.errors
+        for item in boundingBoxes:
+            box = item.get(boxKey)
+            if box is None:
+                self.errorItems[len(errors)] = item.get('error')
+                values.extend(nan)
+                errors.append(1)
+            else:
+                values.extend([box[key] for key in keys])
+                errors.append(0)
+
+    def __getitem__(self, index: int) -> Optional[Tuple[float, ...]]:
+        """Returns the coordinates of a box, or None if its element returned an error."""
+        index = range(len(self))[index]
+        if self.errors[index]:
+            return None
+        width = len(self.keys)
+        return tuple(self.values[index * width:(index + 1) * width])
+
+    def to_numpy(self) -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+        """Returns the boxes as an (N, 4) or (N, 6) float64 array sharing its memory with :obj:`values`, and the error mask as a boolean array.
+
+        Raises:
+            ImportError: When NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError('NumPy is required to convert bounding boxes to NumPy arrays')
+        values = numpy.frombuffer(self.values, dtype=numpy.float64).reshape(len(self), len(self.keys))
+        return values, numpy.frombuffer(self.errors, dtype=numpy.int8).astype(bool)
@@ -1,11 +1,16 @@
 """Graphisoft
 """
-from typing import Dict, Any, List, Tuple, Optional, Union
-from urllib.request import Request, urlopen
-import json
-from archicad.acbasetype import _ACBaseType, _ConstructUnion, _ListBuilder
-from archicad.validators import value_set, matches, min_length, max_length, multiple_of, minimum, maximum, listitem_validator, min_items, max_items, unique_items
-
+from typing import Dict, Any, List, Tuple, Optional, Union, Callable, Iterator, AsyncIterator, Deque
+from urllib.request import Request
+from collections import deque
+import contextvars
+import functools
+import inspect
+import time
+from archicad import builders, codec, metadata, serializers, transport, columnar, instrumentation
+from archicad.acbasetype import _ACBaseType, _ConstructUnion
+
+from . import b3000classdata
 from .b3000types import BoundingBox2DOrError, CompositeAttributeOrError, PropertyIdArrayItem, InteriorElevationNavigatorItemOrError, PenTableAttributeOrError, ElementComponentIdArrayItem, AttributeIdOrError, ElementPropertyValue, AttributeFolder, AddOnCommandParameters, ClassificationItemArrayItem, NavigatorItemId, ClassificationItemIdArrayItem, ElementClassificationOrError, FillAttributeOrError, ClassificationSystemId, FolderParameters, PropertyUserId, Subset, BuildingMaterialAttributeOrError, AttributeIdWrapperItem, DetailNavigatorItemOrError, WorksheetNavigatorItemOrError, PropertyIdsOfElementOrError, ClassificationItemOrError, PropertyIdOrError, ElementClassification, LayerAttributeOrError, ClassificationItemId, ImageOrError, ProfileAttributeOrError, ClassificationSystem, PropertyDefinitionAvailabilityOrError, PropertyValuesOrError, AddOnCommandResponse, NavigatorItemIdWrapper, ClassificationSystemOrError, NavigatorItemIdAndTypeOrError, NavigatorTree, LayoutParameters, BoundingBox3DOrError, TypeOfElementOrError, AddOnCommandId, ZoneCategoryAttributeOrError, PropertyDefinitionOrError, BuiltInContainerNavigatorItemOrError, ElevationNavigatorItemOrError, ClassificationSystemIdArrayItem, RGBColor, StoryNavigatorItemOrError, ClassificationItemAvailabilityOrError, ExecutionResult, LineAttributeOrError, LayerCombinationAttributeOrError, PropertyGroupIdArrayItem, PropertyGroupOrError, Document3DNavigatorItemOrError, ElementIdArrayItem, SectionNavigatorItemOrError, AttributeFolderContent, NavigatorTreeId, ElementsOrError, SurfaceAttributeOrError, ElementComponentsOrError
 
 
@@ -13,20 +18,643 @@ class UnsucceededCommandCall(Exception):
     pass
 
 
-def post_command(req: Request, jsonStr: str) -> Dict[str, Any]:
-    response = urlopen(req, jsonStr.encode("UTF-8"))
-    result = response.read()
-    return json.loads(result)
+def post_command(req: Request, body: Union[bytes, str]) -> Dict[str, Any]:
+    if isinstance(body, str):
+        body = body.encode("UTF-8")
+    metrics = instrumentation.current()
+    if metrics is not None:
+        return _post_command_measured(req, body, metrics)
+    return codec.loads(transport.post(req, body))
 
 
-class Commands:
-    """Collection of the Archicad JSON interface commands
+def _post_command_measured(req: Request, body: bytes, metrics: instrumentation.CommandMetrics) -> Dict[str, Any]:
+    metrics.serialized_since_start()
+    start = time.perf_counter()
+    result = transport.post(req, body)
+    received = time.perf_counter()
+    decoded = codec.loads(result)
+    metrics.add_exchange(instrumentation.command_name(body), len(body), len(result), received - start, time.perf_counter() - received)
+    return decoded
+
+
+async def async_post_command(req: Request, pool: transport.AsyncHTTPConnectionPool, body: Union[bytes, str]) -> Dict[str, Any]:
+    if isinstance(body, str):
+        body = body.encode("UTF-8")
+    metrics = instrumentation.current()
+    if metrics is not None:
+        return await _async_post_command_measured(req, pool, body, metrics)
+    return codec.loads(await pool.post(body, dict(req.header_items())))
+
+
+async def _async_post_command_measured(req: Request, pool: transport.AsyncHTTPConnectionPool, body: bytes, metrics: instrumentation.CommandMetrics) -> Dict[str, Any]:
+    metrics.serialized_since_start()
+    start = time.perf_counter()
+    result = await pool.post(body, dict(req.header_items()))
+    received = time.perf_counter()
+    decoded = codec.loads(result)
+    metrics.add_exchange(instrumentation.command_name(body), len(body), len(result), received - start, time.perf_counter() - received)
+    return decoded
+
+
+def _response_list_builder(itemType: Any, trustResponses: Optional[bool]) -> Callable[[list], list]:
+    if builders.trust_responses(trustResponses):
+        return builders.trusted_list_builder(itemType)
+    return builders.strict_list_builder(itemType)
+
+
+def _build_response(typ: Any, value: Dict[str, Any], trustResponses: Optional[bool]) -> Any:
+    if builders.trust_responses(trustResponses):
+        return builders.trusted_builder(typ)(value)
+    return typ.from_dict(value)
+
+
+_ITER_CHUNK_SIZE = 1000
+
+
+def _chunks(items: list, chunkSize: Optional[int]) -> List[list]:
+    if not chunkSize or len(items) <= chunkSize:
+        return [items]
+    return [items[i:i + chunkSize] for i in range(0, len(items), chunkSize)]
+
+
+def _post_command_in_chunks(req: Request, items: list, chunkSize: Optional[int], maxParallelChunks: int, createBody: Callable[[list], bytes]) -> Iterator[Dict[str, Any]]:
+    """Posts the command for each chunk of the items and yields the results in the order of the chunks.
+
+    At most maxParallelChunks chunks are posted or waiting to be consumed at the same time.
     """
-    def __init__(self, req: Request):
-        assert req is not None
-        self.__req = req
+    metrics = instrumentation.current()
+    if metrics is not None:
+        metrics.stop_serialize_timer()
+
+    def post_chunk(chunk: list) -> Dict[str, Any]:
+        if metrics is None:
+            result = post_command(req, createBody(chunk))
+        else:
+            start = time.perf_counter()
+            body = createBody(chunk)
+            metrics.add_serialize_time(time.perf_counter() - start)
+            result = post_command(req, body)
+        if not result["succeeded"]:
+            raise UnsucceededCommandCall(result)
+        return result
+
+    chunks = _chunks(items, chunkSize)
+    if maxParallelChunks > 1 and len(chunks) > 1:
+        # imported on first use, which keeps them out of the import of the commands
+        from concurrent.futures import Future, ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(maxParallelChunks, len(chunks))) as executor:
+            pending: Deque[Future] = deque()
+            for chunk in chunks:
+                if len(pending) == maxParallelChunks:
+                    yield pending.popleft().result()
+                if metrics is None:
+                    pending.append(executor.submit(post_chunk, chunk))
+                else:
+                    pending.append(executor.submit(contextvars.copy_context().run, post_chunk, chunk))
+            while pending:
+                yield pending.popleft().result()
+    else:
+        yield from map(post_chunk, chunks)
+
+
+async def _async_post_command_in_chunks(req: Request, pool: transport.AsyncHTTPConnectionPool, items: list, chunkSize: Optional[int], maxParallelChunks: int, createBody: Callable[[list], bytes]) -> AsyncIterator[Dict[str, Any]]:
+    """Posts the command for each chunk of the items and yields the results in the order of the chunks.
+
+    At most maxParallelChunks chunks are posted or waiting to be consumed at the same time.
+    """
+    metrics = instrumentation.current()
+    if metrics is not None:
+        metrics.stop_serialize_timer()
+
+    async def post_chunk(chunk: list) -> Dict[str, Any]:
+        if metrics is None:
+            result = await async_post_command(req, pool, createBody(chunk))
+        else:
+            start = time.perf_counter()
+            body = createBody(chunk)
+            metrics.add_serialize_time(time.perf_counter() - start)
+            result = await async_post_command(req, pool, body)
+        if not result["succeeded"]:
+            raise UnsucceededCommandCall(result)
+        return result
+
+    chunks = _chunks(items, chunkSize)
+    if maxParallelChunks > 1 and len(chunks) > 1:
+        import asyncio
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            for chunk in chunks:
+                if len(pending) == maxParallelChunks:
+                    yield await pending.popleft()
+                pending.append(asyncio.ensure_future(post_chunk(chunk)))
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
+    else:
+        for chunk in chunks:
+            yield await post_chunk(chunk)
+
+
+async def _blocking_iterator(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """Wraps a blocking iterator into an asynchronous one for the commands run by :obj:`Commands`."""
+    try:
+        for item in iterator:
+            yield item
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+
+
+def _run_blocking(awaitable: Any) -> Any:
+    """Runs a command coroutine to completion in the calling thread.
+
+    The requests of :obj:`Commands` block instead of suspending, so its commands finish on the first step.
+    """
+    try:
+        awaitable.send(None)
+    except StopIteration as stop:
+        return stop.value
+    awaitable.close()
+    raise RuntimeError('A command of Commands awaited an asynchronous operation')
+
+
+def _iterate_blocking(generator: AsyncIterator[Any]) -> Iterator[Any]:
+    """Iterates over an asynchronous command generator in the calling thread, like :obj:`_run_blocking`."""
+    try:
+        while True:
+            try:
+                item = _run_blocking(generator.__anext__())
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        _run_blocking(generator.aclose())
+
+
+def _blocking_command(command: Callable) -> Callable:
+    if inspect.isasyncgenfunction(command):
+        @functools.wraps(command)
+        def iterate(self, *args, **kwargs):
+            return (yield from _iterate_blocking(command(self, *args, **kwargs)))
+        signature = inspect.signature(command)
+        iterate.__signature__ = signature.replace(return_annotation=Iterator[signature.return_annotation.__args__[0]])
+        return iterate
+
+    @functools.wraps(command)
+    def run(self, *args, **kwargs):
+        return _run_blocking(command(self, *args, **kwargs))
+    return run
+
+
+def _blocking_commands(cls: type) -> type:
+    """Adds a blocking method to the class for each command of :obj:`_Commands`."""
+    for name, command in vars(_Commands).items():
+        if not name.startswith('_'):
+            setattr(cls, name, _blocking_command(command))
+    return cls
+
+
+class _CloneProjectMapItemToViewMap_parameters(_ACBaseType):
+    __slots__ = ("projectMapNavigatorItemId", "parentNavigatorItemId", )
+    def __init__(self, projectMapNavigatorItemId: NavigatorItemId, parentNavigatorItemId: NavigatorItemId):
+        self.projectMapNavigatorItemId: NavigatorItemId = projectMapNavigatorItemId
+        self.parentNavigatorItemId: NavigatorItemId = parentNavigatorItemId
+
+
+class _CreateAttributeFolders_parameters(_ACBaseType):
+    __slots__ = ("attributeFolders", )
+    def __init__(self, attributeFolders: List[AttributeFolder]):
+        self.attributeFolders: List[AttributeFolder] = attributeFolders
+
+
+class _CreateLayout_parameters(_ACBaseType):
+    __slots__ = ("layoutName", "layoutParameters", "masterNavigatorItemId", "parentNavigatorItemId", )
+    def __init__(self, layoutName: str, layoutParameters: LayoutParameters, masterNavigatorItemId: NavigatorItemId, parentNavigatorItemId: NavigatorItemId):
+        self.layoutName: str = layoutName
+        self.layoutParameters: LayoutParameters = layoutParameters
+        self.masterNavigatorItemId: NavigatorItemId = masterNavigatorItemId
+        self.parentNavigatorItemId: NavigatorItemId = parentNavigatorItemId
+
+
+class _CreateLayoutSubset_parameters(_ACBaseType):
+    __slots__ = ("subsetParameters", "parentNavigatorItemId", )
+    def __init__(self, subsetParameters: Subset, parentNavigatorItemId: NavigatorItemId):
+        self.subsetParameters: Subset = subsetParameters
+        self.parentNavigatorItemId: NavigatorItemId = parentNavigatorItemId
+
+
+class _CreateViewMapFolder_parameters(_ACBaseType):
+    __slots__ = ("folderParameters", "parentNavigatorItemId", "previousNavigatorItemId", )
+    def __init__(self, folderParameters: FolderParameters, parentNavigatorItemId: Optional[NavigatorItemId] = None, previousNavigatorItemId: Optional[NavigatorItemId] = None):
+        self.folderParameters: FolderParameters = folderParameters
+        self.parentNavigatorItemId: Optional[NavigatorItemId] = parentNavigatorItemId
+        self.previousNavigatorItemId: Optional[NavigatorItemId] = previousNavigatorItemId
+
+
+class _DeleteAttributeFolders_parameters(_ACBaseType):
+    __slots__ = ("attributeFolders", )
+    def __init__(self, attributeFolders: List[AttributeFolder]):
+        self.attributeFolders: List[AttributeFolder] = attributeFolders
+
+
+class _DeleteAttributes_parameters(_ACBaseType):
+    __slots__ = ("attributeIds", )
+    def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+
+
+class _DeleteNavigatorItems_parameters(_ACBaseType):
+    __slots__ = ("navigatorItemIds", )
+    def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
+        self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
+
+
+class _ExecuteAddOnCommand_parameters(_ACBaseType):
+    __slots__ = ("addOnCommandId", "addOnCommandParameters", )
+    def __init__(self, addOnCommandId: AddOnCommandId, addOnCommandParameters: Optional[AddOnCommandParameters] = None):
+        self.addOnCommandId: AddOnCommandId = addOnCommandId
+        self.addOnCommandParameters: Optional[AddOnCommandParameters] = addOnCommandParameters
+
+
+class _Get2DBoundingBoxes_parameters(_ACBaseType):
+    __slots__ = ("elements", )
+    def __init__(self, elements: List[ElementIdArrayItem]):
+        self.elements: List[ElementIdArrayItem] = elements
+
+
+class _Get3DBoundingBoxes_parameters(_ACBaseType):
+    __slots__ = ("elements", )
+    def __init__(self, elements: List[ElementIdArrayItem]):
+        self.elements: List[ElementIdArrayItem] = elements
+
+
+class _GetAllClassificationsInSystem_parameters(_ACBaseType):
+    __slots__ = ("classificationSystemId", )
+    def __init__(self, classificationSystemId: ClassificationSystemId):
+        self.classificationSystemId: ClassificationSystemId = classificationSystemId
+
+
+class _GetAllPropertyGroupIds_parameters(_ACBaseType):
+    __slots__ = ("propertyType", )
+    def __init__(self, propertyType: Optional[str] = None):
+        self.propertyType: Optional[str] = propertyType
+
+
+class _GetAllPropertyIds_parameters(_ACBaseType):
+    __slots__ = ("propertyType", )
+    def __init__(self, propertyType: Optional[str] = None):
+        self.propertyType: Optional[str] = propertyType
+
+
+class _GetAllPropertyIdsOfElements_parameters(_ACBaseType):
+    __slots__ = ("elements", "propertyType", )
+    def __init__(self, elements: List[ElementIdArrayItem], propertyType: Optional[str] = None):
+        self.elements: List[ElementIdArrayItem] = elements
+        self.propertyType: Optional[str] = propertyType
+
+
+class _GetAttributeFolder_parameters(_ACBaseType):
+    __slots__ = ("attributeFolder", )
+    def __init__(self, attributeFolder: AttributeFolder):
+        self.attributeFolder: AttributeFolder = attributeFolder
+
+
+class _GetAttributeFolderContent_parameters(_ACBaseType):
+    __slots__ = ("attributeFolder", )
+    def __init__(self, attributeFolder: AttributeFolder):
+        self.attributeFolder: AttributeFolder = attributeFolder
+
+
+class _GetAttributesByType_parameters(_ACBaseType):
+    __slots__ = ("attributeType", )
+    def __init__(self, attributeType: str):
+        self.attributeType: str = attributeType
+
+
+class _GetBuildingMaterialAttributes_parameters(_ACBaseType):
+    __slots__ = ("attributeIds", )
+    def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+
+
+class _GetBuiltInContainerNavigatorItems_parameters(_ACBaseType):
+    __slots__ = ("navigatorItemIds", )
+    def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
+        self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
+
+
+class _GetClassificationItemAvailability_parameters(_ACBaseType):
+    __slots__ = ("classificationItemIds", )
+    def __init__(self, classificationItemIds: List[ClassificationItemIdArrayItem]):
+        self.classificationItemIds: List[ClassificationItemIdArrayItem] = classificationItemIds
+
+
+class _GetClassificationsOfElements_parameters(_ACBaseType):
+    __slots__ = ("elements", "classificationSystemIds", )
+    def __init__(self, elements: List[ElementIdArrayItem], classificationSystemIds: List[ClassificationSystemIdArrayItem]):
+        self.elements: List[ElementIdArrayItem] = elements
+        self.classificationSystemIds: List[ClassificationSystemIdArrayItem] = classificationSystemIds
+
+
+class _GetClassificationSystems_parameters(_ACBaseType):
+    __slots__ = ("classificationSystemIds", )
+    def __init__(self, classificationSystemIds: List[ClassificationSystemIdArrayItem]):
+        self.classificationSystemIds: List[ClassificationSystemIdArrayItem] = classificationSystemIds
+
+
+class _GetComponentsOfElements_parameters(_ACBaseType):
+    __slots__ = ("elements", )
+    def __init__(self, elements: List[ElementIdArrayItem]):
+        self.elements: List[ElementIdArrayItem] = elements
+
+
+class _GetCompositeAttributes_parameters(_ACBaseType):
+    __slots__ = ("attributeIds", )
+    def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+
+
+class _GetDetailNavigatorItems_parameters(_ACBaseType):
+    __slots__ = ("navigatorItemIds", )
+    def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
+        self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
+
+
+class _GetDetailsOfClassificationItems_parameters(_ACBaseType):
+    __slots__ = ("classificationItemIds", )
+    def __init__(self, classificationItemIds: List[ClassificationItemIdArrayItem]):
+        self.classificationItemIds: List[ClassificationItemIdArrayItem] = classificationItemIds
+
+
+class _GetDetailsOfProperties_parameters(_ACBaseType):
+    __slots__ = ("properties", )
+    def __init__(self, properties: List[PropertyIdArrayItem]):
+        self.properties: List[PropertyIdArrayItem] = properties
+
+
+class _GetDocument3DNavigatorItems_parameters(_ACBaseType):
+    __slots__ = ("navigatorItemIds", )
+    def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
+        self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
+
+
+class _GetElementsByClassification_parameters(_ACBaseType):
+    __slots__ = ("classificationItemId", )
+    def __init__(self, classificationItemId: ClassificationItemId):
+        self.classificationItemId: ClassificationItemId = classificationItemId
+
+
+class _GetElementsByType_parameters(_ACBaseType):
+    __slots__ = ("elementType", )
+    def __init__(self, elementType: str):
+        self.elementType: str = elementType
+
+
+class _GetElementsRelatedToZones_parameters(_ACBaseType):
+    __slots__ = ("zones", "elementTypes", )
+    def __init__(self, zones: List[ElementIdArrayItem], elementTypes: Optional[List[str]] = None):
+        self.zones: List[ElementIdArrayItem] = zones
+        self.elementTypes: Optional[List[str]] = elementTypes
+
+
+class _GetElevationNavigatorItems_parameters(_ACBaseType):
+    __slots__ = ("navigatorItemIds", )
+    def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
+        self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
+
+
+class _GetFillAttributes_parameters(_ACBaseType):
+    __slots__ = ("attributeIds", )
+    def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+
+
+class _GetInteriorElevationNavigatorItems_parameters(_ACBaseType):
+    __slots__ = ("navigatorItemIds", )
+    def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
+        self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
+
+
+class _GetLayerAttributes_parameters(_ACBaseType):
+    __slots__ = ("attributeIds", )
+    def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+
+
+class _GetLayerCombinationAttributes_parameters(_ACBaseType):
+    __slots__ = ("attributeIds", )
+    def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+
+
+class _GetLayoutSettings_parameters(_ACBaseType):
+    __slots__ = ("layoutNavigatorItemId", )
+    def __init__(self, layoutNavigatorItemId: NavigatorItemId):
+        self.layoutNavigatorItemId: NavigatorItemId = layoutNavigatorItemId
+
+
+class _GetLineAttributes_parameters(_ACBaseType):
+    __slots__ = ("attributeIds", )
+    def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+
+
+class _GetNavigatorItemsType_parameters(_ACBaseType):
+    __slots__ = ("navigatorItemIds", )
+    def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
+        self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
+
+
+class _GetNavigatorItemTree_parameters(_ACBaseType):
+    __slots__ = ("navigatorTreeId", )
+    def __init__(self, navigatorTreeId: NavigatorTreeId):
+        self.navigatorTreeId: NavigatorTreeId = navigatorTreeId
+
+
+class _GetPenTableAttributes_parameters(_ACBaseType):
+    __slots__ = ("attributeIds", )
+    def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+
 
-    def CloneProjectMapItemToViewMap(self, projectMapNavigatorItemId: NavigatorItemId, parentNavigatorItemId: NavigatorItemId) -> NavigatorItemId:
+class _GetProfileAttributePreview_parameters(_ACBaseType):
+    __slots__ = ("attributeIds", "imageWidth", "imageHeight", "backgroundColor", )
+    def __init__(self, attributeIds: List[AttributeIdWrapperItem], imageWidth: int, imageHeight: int, backgroundColor: Optional[RGBColor] = None):
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+        self.imageWidth: int = imageWidth
+        self.imageHeight: int = imageHeight
+        self.backgroundColor: Optional[RGBColor] = backgroundColor
+
+
+class _GetProfileAttributes_parameters(_ACBaseType):
+    __slots__ = ("attributeIds", )
+    def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+
+
+class _GetPropertyDefinitionAvailability_parameters(_ACBaseType):
+    __slots__ = ("propertyIds", )
+    def __init__(self, propertyIds: List[PropertyIdArrayItem]):
+        self.propertyIds: List[PropertyIdArrayItem] = propertyIds
+
+
+class _GetPropertyGroups_parameters(_ACBaseType):
+    __slots__ = ("propertyGroupIds", )
+    def __init__(self, propertyGroupIds: List[PropertyGroupIdArrayItem]):
+        self.propertyGroupIds: List[PropertyGroupIdArrayItem] = propertyGroupIds
+
+
+class _GetPropertyIds_parameters(_ACBaseType):
+    __slots__ = ("properties", )
+    def __init__(self, properties: List[PropertyUserId]):
+        self.properties: List[PropertyUserId] = properties
+
+
+class _GetPropertyValuesOfElementComponents_parameters(_ACBaseType):
+    __slots__ = ("elementComponents", "properties", )
+    def __init__(self, elementComponents: List[ElementComponentIdArrayItem], properties: List[PropertyIdArrayItem]):
+        self.elementComponents: List[ElementComponentIdArrayItem] = elementComponents
+        self.properties: List[PropertyIdArrayItem] = properties
+
+
+class _GetPropertyValuesOfElements_parameters(_ACBaseType):
+    __slots__ = ("elements", "properties", )
+    def __init__(self, elements: List[ElementIdArrayItem], properties: List[PropertyIdArrayItem]):
+        self.elements: List[ElementIdArrayItem] = elements
+        self.properties: List[PropertyIdArrayItem] = properties
+
+
+class _GetSectionNavigatorItems_parameters(_ACBaseType):
+    __slots__ = ("navigatorItemIds", )
+    def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
+        self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
+
+
+class _GetSelectedElements_parameters(_ACBaseType):
+    __slots__ = ("onlyEditable", )
+    def __init__(self, onlyEditable: Optional[bool] = None):
+        self.onlyEditable: Optional[bool] = onlyEditable
+
+
+class _GetStoryNavigatorItems_parameters(_ACBaseType):
+    __slots__ = ("navigatorItemIds", )
+    def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
+        self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
+
+
+class _GetSurfaceAttributes_parameters(_ACBaseType):
+    __slots__ = ("attributeIds", )
+    def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+
+
+class _GetTypesOfElements_parameters(_ACBaseType):
+    __slots__ = ("elements", )
+    def __init__(self, elements: List[ElementIdArrayItem]):
+        self.elements: List[ElementIdArrayItem] = elements
+
+
+class _GetWorksheetNavigatorItems_parameters(_ACBaseType):
+    __slots__ = ("navigatorItemIds", )
+    def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
+        self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
+
+
+class _GetZoneCategoryAttributes_parameters(_ACBaseType):
+    __slots__ = ("attributeIds", )
+    def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+
+
+class _IsAddOnCommandAvailable_parameters(_ACBaseType):
+    __slots__ = ("addOnCommandId", )
+    def __init__(self, addOnCommandId: AddOnCommandId):
+        self.addOnCommandId: AddOnCommandId = addOnCommandId
+
+
+class _MoveAttributesAndFolders_parameters(_ACBaseType):
+    __slots__ = ("folders", "attributeIds", "targetFolder", )
+    def __init__(self, folders: List[AttributeFolder], attributeIds: List[AttributeIdWrapperItem], targetFolder: AttributeFolder):
+        self.folders: List[AttributeFolder] = folders
+        self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
+        self.targetFolder: AttributeFolder = targetFolder
+
+
+class _MoveNavigatorItem_parameters(_ACBaseType):
+    __slots__ = ("navigatorItemIdToMove", "parentNavigatorItemId", "previousNavigatorItemId", )
+    def __init__(self, navigatorItemIdToMove: NavigatorItemId, parentNavigatorItemId: NavigatorItemId, previousNavigatorItemId: Optional[NavigatorItemId] = None):
+        self.navigatorItemIdToMove: NavigatorItemId = navigatorItemIdToMove
+        self.parentNavigatorItemId: NavigatorItemId = parentNavigatorItemId
+        self.previousNavigatorItemId: Optional[NavigatorItemId] = previousNavigatorItemId
+
+
+class _RenameAttributeFolder_parameters(_ACBaseType):
+    __slots__ = ("attributeFolder", "newName", )
+    def __init__(self, attributeFolder: AttributeFolder, newName: str):
+        self.attributeFolder: AttributeFolder = attributeFolder
+        self.newName: str = newName
+
+
+class _RenameNavigatorItem_parameters1(_ACBaseType):
+    __slots__ = ("navigatorItemId", "newName", )
+    def __init__(self, navigatorItemId: NavigatorItemId, newName: str):
+        self.navigatorItemId: NavigatorItemId = navigatorItemId
+        self.newName: str = newName
+
+
+class _RenameNavigatorItem_parameters2(_ACBaseType):
+    __slots__ = ("navigatorItemId", "newId", )
+    def __init__(self, navigatorItemId: NavigatorItemId, newId: str):
+        self.navigatorItemId: NavigatorItemId = navigatorItemId
+        self.newId: str = newId
+
+
+class _RenameNavigatorItem_parameters3(_ACBaseType):
+    __slots__ = ("navigatorItemId", "newName", "newId", )
+    def __init__(self, navigatorItemId: NavigatorItemId, newName: str, newId: str):
+        self.navigatorItemId: NavigatorItemId = navigatorItemId
+        self.newName: str = newName
+        self.newId: str = newId
+
+
+_RenameNavigatorItem_parametersConstructUnion = _ConstructUnion(Union[_RenameNavigatorItem_parameters1, _RenameNavigatorItem_parameters2, _RenameNavigatorItem_parameters3])
+
+
+class _SetClassificationsOfElements_parameters(_ACBaseType):
+    __slots__ = ("elementClassifications", )
+    def __init__(self, elementClassifications: List[ElementClassification]):
+        self.elementClassifications: List[ElementClassification] = elementClassifications
+
+
+class _SetLayoutSettings_parameters(_ACBaseType):
+    __slots__ = ("layoutParameters", "layoutNavigatorItemId", )
+    def __init__(self, layoutParameters: LayoutParameters, layoutNavigatorItemId: NavigatorItemId):
+        self.layoutParameters: LayoutParameters = layoutParameters
+        self.layoutNavigatorItemId: NavigatorItemId = layoutNavigatorItemId
+
+
+class _SetPropertyValuesOfElements_parameters(_ACBaseType):
+    __slots__ = ("elementPropertyValues", )
+    def __init__(self, elementPropertyValues: List[ElementPropertyValue]):
+        self.elementPropertyValues: List[ElementPropertyValue] = elementPropertyValues
+
+
+metadata.install_classinfo(globals(), b3000classdata.COMMANDS)
+serializers.install_serializers(globals())
+
+
+class _Commands:
+    """The commands of the Archicad JSON interface, defined once for :obj:`Commands` and :obj:`AsyncCommands`.
+
+    Every command is a coroutine which posts its requests through ``_post`` and ``_post_in_chunks``. AsyncCommands awaits
+    them on its connection pool, while Commands runs them to completion in the calling thread, as its requests block.
+    """
+
+    @instrumentation.instrumented
+    async def CloneProjectMapItemToViewMap(self, projectMapNavigatorItemId: NavigatorItemId, parentNavigatorItemId: NavigatorItemId) -> NavigatorItemId:
         """Clones a project map item to the view map.
 
         Args:
@@ -37,21 +665,12 @@ class Commands:
             :obj:`NavigatorItemId`: The identifier of a navigator item.
 
         """
-        class CloneProjectMapItemToViewMap_parameters(_ACBaseType):
-            __slots__ = ("projectMapNavigatorItemId", "parentNavigatorItemId", )
-            def __init__(self, projectMapNavigatorItemId: NavigatorItemId, parentNavigatorItemId: NavigatorItemId):
-                self.projectMapNavigatorItemId: NavigatorItemId = projectMapNavigatorItemId
-                self.parentNavigatorItemId: NavigatorItemId = parentNavigatorItemId
 
-        CloneProjectMapItemToViewMap_parameters.get_classinfo().add_field('projectMapNavigatorItemId', NavigatorItemId)
-        CloneProjectMapItemToViewMap_parameters.get_classinfo().add_field('parentNavigatorItemId', NavigatorItemId)
+        result = await self._post(codec.dumps({"command": "API.CloneProjectMapItemToViewMap", "parameters": _CloneProjectMapItemToViewMap_parameters(projectMapNavigatorItemId, parentNavigatorItemId).to_dict()}))
+        return _build_response(NavigatorItemId, result["result"]["createdNavigatorItemId"], self.trustResponses)
 
-        result = post_command(self.__req, json.dumps({"command": "API.CloneProjectMapItemToViewMap", "parameters": CloneProjectMapItemToViewMap_parameters(projectMapNavigatorItemId, parentNavigatorItemId).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        return NavigatorItemId(**result["result"]["createdNavigatorItemId"])
-
-    def CreateAttributeFolders(self, attributeFolders: List[AttributeFolder]) -> List[ExecutionResult]:
+    @instrumentation.instrumented
+    async def CreateAttributeFolders(self, attributeFolders: List[AttributeFolder]) -> List[ExecutionResult]:
         """Creates attribute folders. To create a folder, its full path has to be provided. The command will create all folders along the path, if they do not exist.
 
         Args:
@@ -61,20 +680,13 @@ class Commands:
             :obj:`list` of :obj:`ExecutionResult`: A list of execution results.
 
         """
-        class CreateAttributeFolders_parameters(_ACBaseType):
-            __slots__ = ("attributeFolders", )
-            def __init__(self, attributeFolders: List[AttributeFolder]):
-                self.attributeFolders: List[AttributeFolder] = attributeFolders
-
-        CreateAttributeFolders_parameters.get_classinfo().add_field('attributeFolders', List[AttributeFolder])
 
-        result = post_command(self.__req, json.dumps({"command": "API.CreateAttributeFolders", "parameters": CreateAttributeFolders_parameters(attributeFolders).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        executionResultsListBuilder = _ListBuilder(ExecutionResult)
+        result = await self._post(codec.dumps({"command": "API.CreateAttributeFolders", "parameters": _CreateAttributeFolders_parameters(attributeFolders).to_dict()}))
+        executionResultsListBuilder = _response_list_builder(ExecutionResult, self.trustResponses)
         return executionResultsListBuilder(result["result"]["executionResults"])
 
-    def CreateLayout(self, layoutName: str, layoutParameters: LayoutParameters, masterNavigatorItemId: NavigatorItemId, parentNavigatorItemId: NavigatorItemId) -> NavigatorItemId:
+    @instrumentation.instrumented
+    async def CreateLayout(self, layoutName: str, layoutParameters: LayoutParameters, masterNavigatorItemId: NavigatorItemId, parentNavigatorItemId: NavigatorItemId) -> NavigatorItemId:
         """Creates a new layout.
 
         Args:
@@ -87,25 +699,12 @@ class Commands:
             :obj:`NavigatorItemId`: The identifier of a navigator item.
 
         """
-        class CreateLayout_parameters(_ACBaseType):
-            __slots__ = ("layoutName", "layoutParameters", "masterNavigatorItemId", "parentNavigatorItemId", )
-            def __init__(self, layoutName: str, layoutParameters: LayoutParameters, masterNavigatorItemId: NavigatorItemId, parentNavigatorItemId: NavigatorItemId):
-                self.layoutName: str = layoutName
-                self.layoutParameters: LayoutParameters = layoutParameters
-                self.masterNavigatorItemId: NavigatorItemId = masterNavigatorItemId
-                self.parentNavigatorItemId: NavigatorItemId = parentNavigatorItemId
 
-        CreateLayout_parameters.get_classinfo().add_field('layoutName', str, min_length(1))
-        CreateLayout_parameters.get_classinfo().add_field('layoutParameters', LayoutParameters)
-        CreateLayout_parameters.get_classinfo().add_field('masterNavigatorItemId', NavigatorItemId)
-        CreateLayout_parameters.get_classinfo().add_field('parentNavigatorItemId', NavigatorItemId)
-
-        result = post_command(self.__req, json.dumps({"command": "API.CreateLayout", "parameters": CreateLayout_parameters(layoutName, layoutParameters, masterNavigatorItemId, parentNavigatorItemId).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        return NavigatorItemId(**result["result"]["createdNavigatorItemId"])
+        result = await self._post(codec.dumps({"command": "API.CreateLayout", "parameters": _CreateLayout_parameters(layoutName, layoutParameters, masterNavigatorItemId, parentNavigatorItemId).to_dict()}))
+        return _build_response(NavigatorItemId, result["result"]["createdNavigatorItemId"], self.trustResponses)
 
-    def CreateLayoutSubset(self, subsetParameters: Subset, parentNavigatorItemId: NavigatorItemId) -> NavigatorItemId:
+    @instrumentation.instrumented
+    async def CreateLayoutSubset(self, subsetParameters: Subset, parentNavigatorItemId: NavigatorItemId) -> NavigatorItemId:
         """Creates a new layout subset.
 
         Args:
@@ -116,21 +715,12 @@ class Commands:
             :obj:`NavigatorItemId`: The identifier of a navigator item.
 
         """
-        class CreateLayoutSubset_parameters(_ACBaseType):
-            __slots__ = ("subsetParameters", "parentNavigatorItemId", )
-            def __init__(self, subsetParameters: Subset, parentNavigatorItemId: NavigatorItemId):
-                self.subsetParameters: Subset = subsetParameters
-                self.parentNavigatorItemId: NavigatorItemId = parentNavigatorItemId
 
-        CreateLayoutSubset_parameters.get_classinfo().add_field('subsetParameters', Subset)
-        CreateLayoutSubset_parameters.get_classinfo().add_field('parentNavigatorItemId', NavigatorItemId)
+        result = await self._post(codec.dumps({"command": "API.CreateLayoutSubset", "parameters": _CreateLayoutSubset_parameters(subsetParameters, parentNavigatorItemId).to_dict()}))
+        return _build_response(NavigatorItemId, result["result"]["createdSubsetId"], self.trustResponses)
 
-        result = post_command(self.__req, json.dumps({"command": "API.CreateLayoutSubset", "parameters": CreateLayoutSubset_parameters(subsetParameters, parentNavigatorItemId).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        return NavigatorItemId(**result["result"]["createdSubsetId"])
-
-    def CreateViewMapFolder(self, folderParameters: FolderParameters, parentNavigatorItemId: Optional[NavigatorItemId] = None, previousNavigatorItemId: Optional[NavigatorItemId] = None) -> NavigatorItemId:
+    @instrumentation.instrumented
+    async def CreateViewMapFolder(self, folderParameters: FolderParameters, parentNavigatorItemId: Optional[NavigatorItemId] = None, previousNavigatorItemId: Optional[NavigatorItemId] = None) -> NavigatorItemId:
         """Creates a view folder item at the given position in the navigator tree.
 
         Args:
@@ -142,23 +732,12 @@ class Commands:
             :obj:`NavigatorItemId`: The identifier of a navigator item.
 
         """
-        class CreateViewMapFolder_parameters(_ACBaseType):
-            __slots__ = ("folderParameters", "parentNavigatorItemId", "previousNavigatorItemId", )
-            def __init__(self, folderParameters: FolderParameters, parentNavigatorItemId: Optional[NavigatorItemId] = None, previousNavigatorItemId: Optional[NavigatorItemId] = None):
-                self.folderParameters: FolderParameters = folderParameters
-                self.parentNavigatorItemId: Optional[NavigatorItemId] = parentNavigatorItemId
-                self.previousNavigatorItemId: Optional[NavigatorItemId] = previousNavigatorItemId
 
-        CreateViewMapFolder_parameters.get_classinfo().add_field('folderParameters', FolderParameters)
-        CreateViewMapFolder_parameters.get_classinfo().add_field('parentNavigatorItemId', Optional[NavigatorItemId])
-        CreateViewMapFolder_parameters.get_classinfo().add_field('previousNavigatorItemId', Optional[NavigatorItemId])
+        result = await self._post(codec.dumps({"command": "API.CreateViewMapFolder", "parameters": _CreateViewMapFolder_parameters(folderParameters, parentNavigatorItemId, previousNavigatorItemId).to_dict()}))
+        return _build_response(NavigatorItemId, result["result"]["createdFolderNavigatorItemId"], self.trustResponses)
 
-        result = post_command(self.__req, json.dumps({"command": "API.CreateViewMapFolder", "parameters": CreateViewMapFolder_parameters(folderParameters, parentNavigatorItemId, previousNavigatorItemId).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        return NavigatorItemId(**result["result"]["createdFolderNavigatorItemId"])
-
-    def DeleteAttributeFolders(self, attributeFolders: List[AttributeFolder]) -> List[ExecutionResult]:
+    @instrumentation.instrumented
+    async def DeleteAttributeFolders(self, attributeFolders: List[AttributeFolder]) -> List[ExecutionResult]:
         """Deletes attribute folders and all the deletable attributes and folders it contains. To delete a folder, its full path has to be provided.
 
         Args:
@@ -168,20 +747,13 @@ class Commands:
             :obj:`list` of :obj:`ExecutionResult`: A list of execution results.
 
         """
-        class DeleteAttributeFolders_parameters(_ACBaseType):
-            __slots__ = ("attributeFolders", )
-            def __init__(self, attributeFolders: List[AttributeFolder]):
-                self.attributeFolders: List[AttributeFolder] = attributeFolders
-
-        DeleteAttributeFolders_parameters.get_classinfo().add_field('attributeFolders', List[AttributeFolder])
 
-        result = post_command(self.__req, json.dumps({"command": "API.DeleteAttributeFolders", "parameters": DeleteAttributeFolders_parameters(attributeFolders).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        executionResultsListBuilder = _ListBuilder(ExecutionResult)
+        result = await self._post(codec.dumps({"command": "API.DeleteAttributeFolders", "parameters": _DeleteAttributeFolders_parameters(attributeFolders).to_dict()}))
+        executionResultsListBuilder = _response_list_builder(ExecutionResult, self.trustResponses)
         return executionResultsListBuilder(result["result"]["executionResults"])
 
-    def DeleteAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[ExecutionResult]:
+    @instrumentation.instrumented
+    async def DeleteAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[ExecutionResult]:
         """Deletes attributes.
 
         Args:
@@ -191,20 +763,13 @@ class Commands:
             :obj:`list` of :obj:`ExecutionResult`: A list of execution results.
 
         """
-        class DeleteAttributes_parameters(_ACBaseType):
-            __slots__ = ("attributeIds", )
-            def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
 
-        DeleteAttributes_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
-
-        result = post_command(self.__req, json.dumps({"command": "API.DeleteAttributes", "parameters": DeleteAttributes_parameters(attributeIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        executionResultsListBuilder = _ListBuilder(ExecutionResult)
+        result = await self._post(codec.dumps({"command": "API.DeleteAttributes", "parameters": _DeleteAttributes_parameters(attributeIds).to_dict()}))
+        executionResultsListBuilder = _response_list_builder(ExecutionResult, self.trustResponses)
         return executionResultsListBuilder(result["result"]["executionResults"])
 
-    def DeleteNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[ExecutionResult]:
+    @instrumentation.instrumented
+    async def DeleteNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[ExecutionResult]:
         """Deletes items from navigator tree.
 
         Args:
@@ -214,20 +779,13 @@ class Commands:
             :obj:`list` of :obj:`ExecutionResult`: A list of execution results.
 
         """
-        class DeleteNavigatorItems_parameters(_ACBaseType):
-            __slots__ = ("navigatorItemIds", )
-            def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
-                self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
-
-        DeleteNavigatorItems_parameters.get_classinfo().add_field('navigatorItemIds', List[NavigatorItemIdWrapper])
 
-        result = post_command(self.__req, json.dumps({"command": "API.DeleteNavigatorItems", "parameters": DeleteNavigatorItems_parameters(navigatorItemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        executionResultsListBuilder = _ListBuilder(ExecutionResult)
+        result = await self._post(codec.dumps({"command": "API.DeleteNavigatorItems", "parameters": _DeleteNavigatorItems_parameters(navigatorItemIds).to_dict()}))
+        executionResultsListBuilder = _response_list_builder(ExecutionResult, self.trustResponses)
         return executionResultsListBuilder(result["result"]["executionResults"])
 
-    def ExecuteAddOnCommand(self, addOnCommandId: AddOnCommandId, addOnCommandParameters: Optional[AddOnCommandParameters] = None) -> AddOnCommandResponse:
+    @instrumentation.instrumented
+    async def ExecuteAddOnCommand(self, addOnCommandId: AddOnCommandId, addOnCommandParameters: Optional[AddOnCommandParameters] = None) -> AddOnCommandResponse:
         """Executes a command registered in an Add-On.
 
         Args:
@@ -238,21 +796,29 @@ class Commands:
             :obj:`AddOnCommandResponse`: The response returned by an Add-On command.
 
         """
-        class ExecuteAddOnCommand_parameters(_ACBaseType):
-            __slots__ = ("addOnCommandId", "addOnCommandParameters", )
-            def __init__(self, addOnCommandId: AddOnCommandId, addOnCommandParameters: Optional[AddOnCommandParameters] = None):
-                self.addOnCommandId: AddOnCommandId = addOnCommandId
-                self.addOnCommandParameters: Optional[AddOnCommandParameters] = addOnCommandParameters
-
-        ExecuteAddOnCommand_parameters.get_classinfo().add_field('addOnCommandId', AddOnCommandId)
-        ExecuteAddOnCommand_parameters.get_classinfo().add_field('addOnCommandParameters', Optional[AddOnCommandParameters])
 
-        result = post_command(self.__req, json.dumps({"command": "API.ExecuteAddOnCommand", "parameters": ExecuteAddOnCommand_parameters(addOnCommandId, addOnCommandParameters).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
+        result = await self._post(codec.dumps({"command": "API.ExecuteAddOnCommand", "parameters": _ExecuteAddOnCommand_parameters(addOnCommandId, addOnCommandParameters).to_dict()}))
         return result["result"]["addOnCommandResponse"]
 
-    def Get2DBoundingBoxes(self, elements: List[ElementIdArrayItem]) -> List[BoundingBox2DOrError]:
+    @instrumentation.instrumented
+    async def Get2DBoundingBoxArray(self, elements: List[ElementIdArrayItem]) -> columnar.BoundingBoxArray:
+        """Get the 2D bounding box of elements as an array. The boxes are stored directly from the JSON results, without creating an object for each element.
+
+        Args:
+            elements (:obj:`list` of :obj:`ElementIdArrayItem`): A list of elements.
+
+        Returns:
+            :obj:`columnar.BoundingBoxArray`: The 4 coordinates of each box in the order of the elements, with an error mask. Use its ``to_numpy`` method to get an (N, 4) array.
+
+        """
+
+        boundingBoxes2D = columnar.BoundingBoxArray(columnar.BOUNDING_BOX_2D_KEYS)
+        async for result in self._post_in_chunks(elements, self.chunkSize, lambda chunk: codec.dumps({"command": "API.Get2DBoundingBoxes", "parameters": _Get2DBoundingBoxes_parameters(chunk).to_dict()})):
+            boundingBoxes2D.extend(result["result"]["boundingBoxes2D"], "boundingBox2D")
+        return boundingBoxes2D
+
+    @instrumentation.instrumented
+    async def Get2DBoundingBoxes(self, elements: List[ElementIdArrayItem]) -> List[BoundingBox2DOrError]:
         """Get the 2D bounding box of elements identified by their GUIDs. The bounding box is calculated from the global origin on the floor plan view. The output is the array of the bounding boxes respective to the input GUIDs. Only works for elements detailed in <i>Element Information</i>.
 
         Args:
@@ -262,20 +828,32 @@ class Commands:
             :obj:`list` of :obj:`BoundingBox2DOrError`: A list of 2D bounding boxes.
 
         """
-        class Get2DBoundingBoxes_parameters(_ACBaseType):
-            __slots__ = ("elements", )
-            def __init__(self, elements: List[ElementIdArrayItem]):
-                self.elements: List[ElementIdArrayItem] = elements
 
-        Get2DBoundingBoxes_parameters.get_classinfo().add_field('elements', List[ElementIdArrayItem])
+        boundingBoxes2DListBuilder = _response_list_builder(BoundingBox2DOrError, self.trustResponses)
+        boundingBoxes2D = []
+        async for result in self._post_in_chunks(elements, self.chunkSize, lambda chunk: codec.dumps({"command": "API.Get2DBoundingBoxes", "parameters": _Get2DBoundingBoxes_parameters(chunk).to_dict()})):
+            boundingBoxes2D.extend(boundingBoxes2DListBuilder(result["result"]["boundingBoxes2D"]))
+        return boundingBoxes2D
 
-        result = post_command(self.__req, json.dumps({"command": "API.Get2DBoundingBoxes", "parameters": Get2DBoundingBoxes_parameters(elements).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        boundingBoxes2DListBuilder = _ListBuilder(BoundingBox2DOrError)
-        return boundingBoxes2DListBuilder(result["result"]["boundingBoxes2D"])
+    @instrumentation.instrumented
+    async def Get3DBoundingBoxArray(self, elements: List[ElementIdArrayItem]) -> columnar.BoundingBoxArray:
+        """Get the 3D bounding box of elements as an array. The boxes are stored directly from the JSON results, without creating an object for each element.
+
+        Args:
+            elements (:obj:`list` of :obj:`ElementIdArrayItem`): A list of elements.
+
+        Returns:
+            :obj:`columnar.BoundingBoxArray`: The 6 coordinates of each box in the order of the elements, with an error mask. Use its ``to_numpy`` method to get an (N, 6) array.
+
+        """
+
+        boundingBoxes3D = columnar.BoundingBoxArray(columnar.BOUNDING_BOX_3D_KEYS)
+        async for result in self._post_in_chunks(elements, self.chunkSize, lambda chunk: codec.dumps({"command": "API.Get3DBoundingBoxes", "parameters": _Get3DBoundingBoxes_parameters(chunk).to_dict()})):
+            boundingBoxes3D.extend(result["result"]["boundingBoxes3D"], "boundingBox3D")
+        return boundingBoxes3D
 
-    def Get3DBoundingBoxes(self, elements: List[ElementIdArrayItem]) -> List[BoundingBox3DOrError]:
+    @instrumentation.instrumented
+    async def Get3DBoundingBoxes(self, elements: List[ElementIdArrayItem]) -> List[BoundingBox3DOrError]:
         """Get the 3D bounding box of elements identified by their GUIDs. The bounding box is calculated from the global origin in the 3D view. The output is the array of the bounding boxes respective to the input GUIDs. Only works for elements detailed in <i>Element Information</i>.
 
         Args:
@@ -285,20 +863,15 @@ class Commands:
             :obj:`list` of :obj:`BoundingBox3DOrError`: A list of 3D bounding boxes.
 
         """
-        class Get3DBoundingBoxes_parameters(_ACBaseType):
-            __slots__ = ("elements", )
-            def __init__(self, elements: List[ElementIdArrayItem]):
-                self.elements: List[ElementIdArrayItem] = elements
 
-        Get3DBoundingBoxes_parameters.get_classinfo().add_field('elements', List[ElementIdArrayItem])
+        boundingBoxes3DListBuilder = _response_list_builder(BoundingBox3DOrError, self.trustResponses)
+        boundingBoxes3D = []
+        async for result in self._post_in_chunks(elements, self.chunkSize, lambda chunk: codec.dumps({"command": "API.Get3DBoundingBoxes", "parameters": _Get3DBoundingBoxes_parameters(chunk).to_dict()})):
+            boundingBoxes3D.extend(boundingBoxes3DListBuilder(result["result"]["boundingBoxes3D"]))
+        return boundingBoxes3D
 
-        result = post_command(self.__req, json.dumps({"command": "API.Get3DBoundingBoxes", "parameters": Get3DBoundingBoxes_parameters(elements).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        boundingBoxes3DListBuilder = _ListBuilder(BoundingBox3DOrError)
-        return boundingBoxes3DListBuilder(result["result"]["boundingBoxes3D"])
-
-    def GetActivePenTables(self) -> Tuple[AttributeIdOrError, AttributeIdOrError]:
+    @instrumentation.instrumented
+    async def GetActivePenTables(self) -> Tuple[AttributeIdOrError, AttributeIdOrError]:
         """Returns the model view and layout book pen table identifiers.
 
         Returns:
@@ -307,12 +880,11 @@ class Commands:
 
         """
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetActivePenTables"}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        return AttributeIdOrError(**result["result"]["modelViewPenTableId"]), AttributeIdOrError(**result["result"]["layoutBookPenTableId"])
+        result = await self._post(codec.dumps({"command": "API.GetActivePenTables"}))
+        return _build_response(AttributeIdOrError, result["result"]["modelViewPenTableId"], self.trustResponses), _build_response(AttributeIdOrError, result["result"]["layoutBookPenTableId"], self.trustResponses)
 
-    def GetAllClassificationsInSystem(self, classificationSystemId: ClassificationSystemId) -> List[ClassificationItemArrayItem]:
+    @instrumentation.instrumented
+    async def GetAllClassificationsInSystem(self, classificationSystemId: ClassificationSystemId) -> List[ClassificationItemArrayItem]:
         """Returns the tree of classifications in the given classification system.
 
         Args:
@@ -322,20 +894,13 @@ class Commands:
             :obj:`list` of :obj:`ClassificationItemArrayItem`: A list of classification items.
 
         """
-        class GetAllClassificationsInSystem_parameters(_ACBaseType):
-            __slots__ = ("classificationSystemId", )
-            def __init__(self, classificationSystemId: ClassificationSystemId):
-                self.classificationSystemId: ClassificationSystemId = classificationSystemId
 
-        GetAllClassificationsInSystem_parameters.get_classinfo().add_field('classificationSystemId', ClassificationSystemId)
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetAllClassificationsInSystem", "parameters": GetAllClassificationsInSystem_parameters(classificationSystemId).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        classificationItemsListBuilder = _ListBuilder(ClassificationItemArrayItem)
+        result = await self._post(codec.dumps({"command": "API.GetAllClassificationsInSystem", "parameters": _GetAllClassificationsInSystem_parameters(classificationSystemId).to_dict()}))
+        classificationItemsListBuilder = _response_list_builder(ClassificationItemArrayItem, self.trustResponses)
         return classificationItemsListBuilder(result["result"]["classificationItems"])
 
-    def GetAllClassificationSystems(self) -> List[ClassificationSystem]:
+    @instrumentation.instrumented
+    async def GetAllClassificationSystems(self) -> List[ClassificationSystem]:
         """Returns the list of available classification systems.
 
         Returns:
@@ -343,13 +908,12 @@ class Commands:
 
         """
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetAllClassificationSystems"}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        classificationSystemsListBuilder = _ListBuilder(ClassificationSystem)
+        result = await self._post(codec.dumps({"command": "API.GetAllClassificationSystems"}))
+        classificationSystemsListBuilder = _response_list_builder(ClassificationSystem, self.trustResponses)
         return classificationSystemsListBuilder(result["result"]["classificationSystems"])
 
-    def GetAllElements(self) -> List[ElementIdArrayItem]:
+    @instrumentation.instrumented
+    async def GetAllElements(self) -> List[ElementIdArrayItem]:
         """Returns the identifier of every element in the current plan.
 
         Returns:
@@ -357,13 +921,12 @@ class Commands:
 
         """
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetAllElements"}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        elementsListBuilder = _ListBuilder(ElementIdArrayItem)
+        result = await self._post(codec.dumps({"command": "API.GetAllElements"}))
+        elementsListBuilder = _response_list_builder(ElementIdArrayItem, self.trustResponses)
         return elementsListBuilder(result["result"]["elements"])
 
-    def GetAllPropertyGroupIds(self, propertyType: Optional[str] = None) -> List[PropertyGroupIdArrayItem]:
+    @instrumentation.instrumented
+    async def GetAllPropertyGroupIds(self, propertyType: Optional[str] = None) -> List[PropertyGroupIdArrayItem]:
         """Returns the identifier of every property group in the current plan. The optional propertyType parameter can be used to filter the results based on the type of the property group (Built-in or User Defined).
 
         Args:
@@ -373,20 +936,13 @@ class Commands:
             :obj:`list` of :obj:`PropertyGroupIdArrayItem`: A list of property group identifiers.
 
         """
-        class GetAllPropertyGroupIds_parameters(_ACBaseType):
-            __slots__ = ("propertyType", )
-            def __init__(self, propertyType: Optional[str] = None):
-                self.propertyType: Optional[str] = propertyType
 
-        GetAllPropertyGroupIds_parameters.get_classinfo().add_field('propertyType', Optional[str], value_set(['UserDefined', 'BuiltIn']))
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetAllPropertyGroupIds", "parameters": GetAllPropertyGroupIds_parameters(propertyType).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        propertyGroupIdsListBuilder = _ListBuilder(PropertyGroupIdArrayItem)
+        result = await self._post(codec.dumps({"command": "API.GetAllPropertyGroupIds", "parameters": _GetAllPropertyGroupIds_parameters(propertyType).to_dict()}))
+        propertyGroupIdsListBuilder = _response_list_builder(PropertyGroupIdArrayItem, self.trustResponses)
         return propertyGroupIdsListBuilder(result["result"]["propertyGroupIds"])
 
-    def GetAllPropertyIds(self, propertyType: Optional[str] = None) -> List[PropertyIdArrayItem]:
+    @instrumentation.instrumented
+    async def GetAllPropertyIds(self, propertyType: Optional[str] = None) -> List[PropertyIdArrayItem]:
         """Returns the identifier of every property in the current plan. The optional propertyType parameter can be used to filter the results based on the type of the property (Built-in or User Defined).
 
         Args:
@@ -396,20 +952,13 @@ class Commands:
             :obj:`list` of :obj:`PropertyIdArrayItem`: A list of property identifiers.
 
         """
-        class GetAllPropertyIds_parameters(_ACBaseType):
-            __slots__ = ("propertyType", )
-            def __init__(self, propertyType: Optional[str] = None):
-                self.propertyType: Optional[str] = propertyType
-
-        GetAllPropertyIds_parameters.get_classinfo().add_field('propertyType', Optional[str], value_set(['UserDefined', 'BuiltIn']))
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetAllPropertyIds", "parameters": GetAllPropertyIds_parameters(propertyType).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        propertyIdsListBuilder = _ListBuilder(PropertyIdArrayItem)
+        result = await self._post(codec.dumps({"command": "API.GetAllPropertyIds", "parameters": _GetAllPropertyIds_parameters(propertyType).to_dict()}))
+        propertyIdsListBuilder = _response_list_builder(PropertyIdArrayItem, self.trustResponses)
         return propertyIdsListBuilder(result["result"]["propertyIds"])
 
-    def GetAllPropertyIdsOfElements(self, elements: List[ElementIdArrayItem], propertyType: Optional[str] = None) -> List[PropertyIdsOfElementOrError]:
+    @instrumentation.instrumented
+    async def GetAllPropertyIdsOfElements(self, elements: List[ElementIdArrayItem], propertyType: Optional[str] = None) -> List[PropertyIdsOfElementOrError]:
         """Returns all property identifiers of the given elements. The optional propertyType parameter can be used to filter the results based on the type of the property (Built-in or User Defined).
 
         Args:
@@ -420,22 +969,13 @@ class Commands:
             :obj:`list` of :obj:`PropertyIdsOfElementOrError`: A list of property identifiers of elements or errors.
 
         """
-        class GetAllPropertyIdsOfElements_parameters(_ACBaseType):
-            __slots__ = ("elements", "propertyType", )
-            def __init__(self, elements: List[ElementIdArrayItem], propertyType: Optional[str] = None):
-                self.elements: List[ElementIdArrayItem] = elements
-                self.propertyType: Optional[str] = propertyType
 
-        GetAllPropertyIdsOfElements_parameters.get_classinfo().add_field('elements', List[ElementIdArrayItem])
-        GetAllPropertyIdsOfElements_parameters.get_classinfo().add_field('propertyType', Optional[str], value_set(['UserDefined', 'BuiltIn']))
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetAllPropertyIdsOfElements", "parameters": GetAllPropertyIdsOfElements_parameters(elements, propertyType).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        propertyIdsOfElementsListBuilder = _ListBuilder(PropertyIdsOfElementOrError)
+        result = await self._post(codec.dumps({"command": "API.GetAllPropertyIdsOfElements", "parameters": _GetAllPropertyIdsOfElements_parameters(elements, propertyType).to_dict()}))
+        propertyIdsOfElementsListBuilder = _response_list_builder(PropertyIdsOfElementOrError, self.trustResponses)
         return propertyIdsOfElementsListBuilder(result["result"]["propertyIdsOfElements"])
 
-    def GetAllPropertyNames(self) -> List[PropertyUserId]:
+    @instrumentation.instrumented
+    async def GetAllPropertyNames(self) -> List[PropertyUserId]:
         """Returns the human-readable names of available Property definitions for debug and development purposes.
 
         Returns:
@@ -443,13 +983,12 @@ class Commands:
 
         """
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetAllPropertyNames"}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        propertiesListBuilder = _ListBuilder(PropertyUserId)
+        result = await self._post(codec.dumps({"command": "API.GetAllPropertyNames"}))
+        propertiesListBuilder = _response_list_builder(PropertyUserId, self.trustResponses)
         return propertiesListBuilder(result["result"]["properties"])
 
-    def GetAttributeFolder(self, attributeFolder: AttributeFolder) -> AttributeFolder:
+    @instrumentation.instrumented
+    async def GetAttributeFolder(self, attributeFolder: AttributeFolder) -> AttributeFolder:
         """Get an attribute folder's path and guid. To get an attribute folder guid, it's full path has to be provided and to get full path, it's guid has to be provided.
 
         Args:
@@ -459,19 +998,12 @@ class Commands:
             :obj:`AttributeFolder`: Identifies an attribute folder. The path of the root folder is repesented by empty array.
 
         """
-        class GetAttributeFolder_parameters(_ACBaseType):
-            __slots__ = ("attributeFolder", )
-            def __init__(self, attributeFolder: AttributeFolder):
-                self.attributeFolder: AttributeFolder = attributeFolder
 
-        GetAttributeFolder_parameters.get_classinfo().add_field('attributeFolder', AttributeFolder)
+        result = await self._post(codec.dumps({"command": "API.GetAttributeFolder", "parameters": _GetAttributeFolder_parameters(attributeFolder).to_dict()}))
+        return _build_response(AttributeFolder, result["result"]["attributeFolder"], self.trustResponses)
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetAttributeFolder", "parameters": GetAttributeFolder_parameters(attributeFolder).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        return AttributeFolder(**result["result"]["attributeFolder"])
-
-    def GetAttributeFolderContent(self, attributeFolder: AttributeFolder) -> AttributeFolderContent:
+    @instrumentation.instrumented
+    async def GetAttributeFolderContent(self, attributeFolder: AttributeFolder) -> AttributeFolderContent:
         """Get attribute folder's content, subfolders and attributes. To get an attribute folder's content, it's full path or guid has to be provided.
 
         Args:
@@ -481,19 +1013,12 @@ class Commands:
             :obj:`AttributeFolderContent`: An attribute folder content. Contains subfolders and attributes.
 
         """
-        class GetAttributeFolderContent_parameters(_ACBaseType):
-            __slots__ = ("attributeFolder", )
-            def __init__(self, attributeFolder: AttributeFolder):
-                self.attributeFolder: AttributeFolder = attributeFolder
 
-        GetAttributeFolderContent_parameters.get_classinfo().add_field('attributeFolder', AttributeFolder)
+        result = await self._post(codec.dumps({"command": "API.GetAttributeFolderContent", "parameters": _GetAttributeFolderContent_parameters(attributeFolder).to_dict()}))
+        return _build_response(AttributeFolderContent, result["result"]["attributeFolderContent"], self.trustResponses)
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetAttributeFolderContent", "parameters": GetAttributeFolderContent_parameters(attributeFolder).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        return AttributeFolderContent(**result["result"]["attributeFolderContent"])
-
-    def GetAttributesByType(self, attributeType: str) -> List[AttributeIdWrapperItem]:
+    @instrumentation.instrumented
+    async def GetAttributesByType(self, attributeType: str) -> List[AttributeIdWrapperItem]:
         """Returns the identifier of every attribute of the given type.
 
         Args:
@@ -503,20 +1028,13 @@ class Commands:
             :obj:`list` of :obj:`AttributeIdWrapperItem`: A list of attribute identifiers.
 
         """
-        class GetAttributesByType_parameters(_ACBaseType):
-            __slots__ = ("attributeType", )
-            def __init__(self, attributeType: str):
-                self.attributeType: str = attributeType
 
-        GetAttributesByType_parameters.get_classinfo().add_field('attributeType', str, value_set(['BuildingMaterial', 'Composite', 'Fill', 'Layer', 'LayerCombination', 'Line', 'PenTable', 'Profile', 'Surface', 'ZoneCategory']))
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetAttributesByType", "parameters": GetAttributesByType_parameters(attributeType).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        attributeIdsListBuilder = _ListBuilder(AttributeIdWrapperItem)
+        result = await self._post(codec.dumps({"command": "API.GetAttributesByType", "parameters": _GetAttributesByType_parameters(attributeType).to_dict()}))
+        attributeIdsListBuilder = _response_list_builder(AttributeIdWrapperItem, self.trustResponses)
         return attributeIdsListBuilder(result["result"]["attributeIds"])
 
-    def GetBuildingMaterialAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[BuildingMaterialAttributeOrError]:
+    @instrumentation.instrumented
+    async def GetBuildingMaterialAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[BuildingMaterialAttributeOrError]:
         """Returns the detailed building material attributes identified by their GUIDs.
 
         Args:
@@ -526,20 +1044,13 @@ class Commands:
             :obj:`list` of :obj:`BuildingMaterialAttributeOrError`: A list of building material attributes and potential errors.
 
         """
-        class GetBuildingMaterialAttributes_parameters(_ACBaseType):
-            __slots__ = ("attributeIds", )
-            def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
-
-        GetBuildingMaterialAttributes_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetBuildingMaterialAttributes", "parameters": GetBuildingMaterialAttributes_parameters(attributeIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        attributesListBuilder = _ListBuilder(BuildingMaterialAttributeOrError)
+        result = await self._post(codec.dumps({"command": "API.GetBuildingMaterialAttributes", "parameters": _GetBuildingMaterialAttributes_parameters(attributeIds).to_dict()}))
+        attributesListBuilder = _response_list_builder(BuildingMaterialAttributeOrError, self.trustResponses)
         return attributesListBuilder(result["result"]["attributes"])
 
-    def GetBuiltInContainerNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[BuiltInContainerNavigatorItemOrError]:
+    @instrumentation.instrumented
+    async def GetBuiltInContainerNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[BuiltInContainerNavigatorItemOrError]:
         """Returns the details of the built-in container navigator items identified by their Ids.
 
         Args:
@@ -549,20 +1060,13 @@ class Commands:
             :obj:`list` of :obj:`BuiltInContainerNavigatorItemOrError`: A list of built-in container navigator items.
 
         """
-        class GetBuiltInContainerNavigatorItems_parameters(_ACBaseType):
-            __slots__ = ("navigatorItemIds", )
-            def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
-                self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
-
-        GetBuiltInContainerNavigatorItems_parameters.get_classinfo().add_field('navigatorItemIds', List[NavigatorItemIdWrapper])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetBuiltInContainerNavigatorItems", "parameters": GetBuiltInContainerNavigatorItems_parameters(navigatorItemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        navigatorItemsListBuilder = _ListBuilder(BuiltInContainerNavigatorItemOrError)
+        result = await self._post(codec.dumps({"command": "API.GetBuiltInContainerNavigatorItems", "parameters": _GetBuiltInContainerNavigatorItems_parameters(navigatorItemIds).to_dict()}))
+        navigatorItemsListBuilder = _response_list_builder(BuiltInContainerNavigatorItemOrError, self.trustResponses)
         return navigatorItemsListBuilder(result["result"]["navigatorItems"])
 
-    def GetClassificationItemAvailability(self, classificationItemIds: List[ClassificationItemIdArrayItem]) -> List[ClassificationItemAvailabilityOrError]:
+    @instrumentation.instrumented
+    async def GetClassificationItemAvailability(self, classificationItemIds: List[ClassificationItemIdArrayItem]) -> List[ClassificationItemAvailabilityOrError]:
         """Returns the ids of property definitions available for a given classification item.
 
         Args:
@@ -572,20 +1076,13 @@ class Commands:
             :obj:`list` of :obj:`ClassificationItemAvailabilityOrError`: A list of classification item avalabilities.
 
         """
-        class GetClassificationItemAvailability_parameters(_ACBaseType):
-            __slots__ = ("classificationItemIds", )
-            def __init__(self, classificationItemIds: List[ClassificationItemIdArrayItem]):
-                self.classificationItemIds: List[ClassificationItemIdArrayItem] = classificationItemIds
 
-        GetClassificationItemAvailability_parameters.get_classinfo().add_field('classificationItemIds', List[ClassificationItemIdArrayItem])
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetClassificationItemAvailability", "parameters": GetClassificationItemAvailability_parameters(classificationItemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        classificationItemAvailabilityListListBuilder = _ListBuilder(ClassificationItemAvailabilityOrError)
+        result = await self._post(codec.dumps({"command": "API.GetClassificationItemAvailability", "parameters": _GetClassificationItemAvailability_parameters(classificationItemIds).to_dict()}))
+        classificationItemAvailabilityListListBuilder = _response_list_builder(ClassificationItemAvailabilityOrError, self.trustResponses)
         return classificationItemAvailabilityListListBuilder(result["result"]["classificationItemAvailabilityList"])
 
-    def GetClassificationsOfElements(self, elements: List[ElementIdArrayItem], classificationSystemIds: List[ClassificationSystemIdArrayItem]) -> List[ElementClassificationOrError]:
+    @instrumentation.instrumented
+    async def GetClassificationsOfElements(self, elements: List[ElementIdArrayItem], classificationSystemIds: List[ClassificationSystemIdArrayItem]) -> List[ElementClassificationOrError]:
         """Returns the classification of the given elements in the given classification systems.
 
         Args:
@@ -596,22 +1093,15 @@ class Commands:
             :obj:`list` of :obj:`ElementClassificationOrError`: A list of element classification identifiers or errors.
 
         """
-        class GetClassificationsOfElements_parameters(_ACBaseType):
-            __slots__ = ("elements", "classificationSystemIds", )
-            def __init__(self, elements: List[ElementIdArrayItem], classificationSystemIds: List[ClassificationSystemIdArrayItem]):
-                self.elements: List[ElementIdArrayItem] = elements
-                self.classificationSystemIds: List[ClassificationSystemIdArrayItem] = classificationSystemIds
 
-        GetClassificationsOfElements_parameters.get_classinfo().add_field('elements', List[ElementIdArrayItem])
-        GetClassificationsOfElements_parameters.get_classinfo().add_field('classificationSystemIds', List[ClassificationSystemIdArrayItem])
+        elementClassificationsListBuilder = _response_list_builder(ElementClassificationOrError, self.trustResponses)
+        elementClassifications = []
+        async for result in self._post_in_chunks(elements, self.chunkSize, lambda chunk: codec.dumps({"command": "API.GetClassificationsOfElements", "parameters": _GetClassificationsOfElements_parameters(chunk, classificationSystemIds).to_dict()})):
+            elementClassifications.extend(elementClassificationsListBuilder(result["result"]["elementClassifications"]))
+        return elementClassifications
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetClassificationsOfElements", "parameters": GetClassificationsOfElements_parameters(elements, classificationSystemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        elementClassificationsListBuilder = _ListBuilder(ElementClassificationOrError)
-        return elementClassificationsListBuilder(result["result"]["elementClassifications"])
-
-    def GetClassificationSystemIds(self) -> List[ClassificationSystemIdArrayItem]:
+    @instrumentation.instrumented
+    async def GetClassificationSystemIds(self) -> List[ClassificationSystemIdArrayItem]:
         """Returns the list of available classification systems.
 
         Returns:
@@ -619,13 +1109,12 @@ class Commands:
 
         """
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetClassificationSystemIds"}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        classificationSystemIdsListBuilder = _ListBuilder(ClassificationSystemIdArrayItem)
+        result = await self._post(codec.dumps({"command": "API.GetClassificationSystemIds"}))
+        classificationSystemIdsListBuilder = _response_list_builder(ClassificationSystemIdArrayItem, self.trustResponses)
         return classificationSystemIdsListBuilder(result["result"]["classificationSystemIds"])
 
-    def GetClassificationSystems(self, classificationSystemIds: List[ClassificationSystemIdArrayItem]) -> List[ClassificationSystemOrError]:
+    @instrumentation.instrumented
+    async def GetClassificationSystems(self, classificationSystemIds: List[ClassificationSystemIdArrayItem]) -> List[ClassificationSystemOrError]:
         """Returns the details of classification systems identified by their GUIDs.
 
         Args:
@@ -635,20 +1124,13 @@ class Commands:
             :obj:`list` of :obj:`ClassificationSystemOrError`: A list of classification systems or errors.
 
         """
-        class GetClassificationSystems_parameters(_ACBaseType):
-            __slots__ = ("classificationSystemIds", )
-            def __init__(self, classificationSystemIds: List[ClassificationSystemIdArrayItem]):
-                self.classificationSystemIds: List[ClassificationSystemIdArrayItem] = classificationSystemIds
-
-        GetClassificationSystems_parameters.get_classinfo().add_field('classificationSystemIds', List[ClassificationSystemIdArrayItem])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetClassificationSystems", "parameters": GetClassificationSystems_parameters(classificationSystemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        classificationSystemsListBuilder = _ListBuilder(ClassificationSystemOrError)
+        result = await self._post(codec.dumps({"command": "API.GetClassificationSystems", "parameters": _GetClassificationSystems_parameters(classificationSystemIds).to_dict()}))
+        classificationSystemsListBuilder = _response_list_builder(ClassificationSystemOrError, self.trustResponses)
         return classificationSystemsListBuilder(result["result"]["classificationSystems"])
 
-    def GetComponentsOfElements(self, elements: List[ElementIdArrayItem]) -> List[ElementComponentsOrError]:
+    @instrumentation.instrumented
+    async def GetComponentsOfElements(self, elements: List[ElementIdArrayItem]) -> List[ElementComponentsOrError]:
         """Returns the identifier of every component for a list of elements. The order of the returned list is the same as the given elements.
 
         Args:
@@ -658,20 +1140,13 @@ class Commands:
             :obj:`list` of :obj:`ElementComponentsOrError`: Array of component list or error.
 
         """
-        class GetComponentsOfElements_parameters(_ACBaseType):
-            __slots__ = ("elements", )
-            def __init__(self, elements: List[ElementIdArrayItem]):
-                self.elements: List[ElementIdArrayItem] = elements
-
-        GetComponentsOfElements_parameters.get_classinfo().add_field('elements', List[ElementIdArrayItem])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetComponentsOfElements", "parameters": GetComponentsOfElements_parameters(elements).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        componentsOfElementsListBuilder = _ListBuilder(ElementComponentsOrError)
+        result = await self._post(codec.dumps({"command": "API.GetComponentsOfElements", "parameters": _GetComponentsOfElements_parameters(elements).to_dict()}))
+        componentsOfElementsListBuilder = _response_list_builder(ElementComponentsOrError, self.trustResponses)
         return componentsOfElementsListBuilder(result["result"]["componentsOfElements"])
 
-    def GetCompositeAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[CompositeAttributeOrError]:
+    @instrumentation.instrumented
+    async def GetCompositeAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[CompositeAttributeOrError]:
         """Returns the detailed composite attributes identified by their GUIDs.
 
         Args:
@@ -681,20 +1156,13 @@ class Commands:
             :obj:`list` of :obj:`CompositeAttributeOrError`: A list of the composite attributes and potential errors.
 
         """
-        class GetCompositeAttributes_parameters(_ACBaseType):
-            __slots__ = ("attributeIds", )
-            def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
 
-        GetCompositeAttributes_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetCompositeAttributes", "parameters": GetCompositeAttributes_parameters(attributeIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        attributesListBuilder = _ListBuilder(CompositeAttributeOrError)
+        result = await self._post(codec.dumps({"command": "API.GetCompositeAttributes", "parameters": _GetCompositeAttributes_parameters(attributeIds).to_dict()}))
+        attributesListBuilder = _response_list_builder(CompositeAttributeOrError, self.trustResponses)
         return attributesListBuilder(result["result"]["attributes"])
 
-    def GetDetailNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[DetailNavigatorItemOrError]:
+    @instrumentation.instrumented
+    async def GetDetailNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[DetailNavigatorItemOrError]:
         """Returns the details of the detail navigator items identified by their Ids.
 
         Args:
@@ -704,20 +1172,13 @@ class Commands:
             :obj:`list` of :obj:`DetailNavigatorItemOrError`: A list of detail navigator items.
 
         """
-        class GetDetailNavigatorItems_parameters(_ACBaseType):
-            __slots__ = ("navigatorItemIds", )
-            def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
-                self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
 
-        GetDetailNavigatorItems_parameters.get_classinfo().add_field('navigatorItemIds', List[NavigatorItemIdWrapper])
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetDetailNavigatorItems", "parameters": GetDetailNavigatorItems_parameters(navigatorItemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        navigatorItemsListBuilder = _ListBuilder(DetailNavigatorItemOrError)
+        result = await self._post(codec.dumps({"command": "API.GetDetailNavigatorItems", "parameters": _GetDetailNavigatorItems_parameters(navigatorItemIds).to_dict()}))
+        navigatorItemsListBuilder = _response_list_builder(DetailNavigatorItemOrError, self.trustResponses)
         return navigatorItemsListBuilder(result["result"]["navigatorItems"])
 
-    def GetDetailsOfClassificationItems(self, classificationItemIds: List[ClassificationItemIdArrayItem]) -> List[ClassificationItemOrError]:
+    @instrumentation.instrumented
+    async def GetDetailsOfClassificationItems(self, classificationItemIds: List[ClassificationItemIdArrayItem]) -> List[ClassificationItemOrError]:
         """Returns the details of classification items.
 
         Args:
@@ -727,20 +1188,13 @@ class Commands:
             :obj:`list` of :obj:`ClassificationItemOrError`: A list of classification items or errors.
 
         """
-        class GetDetailsOfClassificationItems_parameters(_ACBaseType):
-            __slots__ = ("classificationItemIds", )
-            def __init__(self, classificationItemIds: List[ClassificationItemIdArrayItem]):
-                self.classificationItemIds: List[ClassificationItemIdArrayItem] = classificationItemIds
-
-        GetDetailsOfClassificationItems_parameters.get_classinfo().add_field('classificationItemIds', List[ClassificationItemIdArrayItem])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetDetailsOfClassificationItems", "parameters": GetDetailsOfClassificationItems_parameters(classificationItemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        classificationItemsListBuilder = _ListBuilder(ClassificationItemOrError)
+        result = await self._post(codec.dumps({"command": "API.GetDetailsOfClassificationItems", "parameters": _GetDetailsOfClassificationItems_parameters(classificationItemIds).to_dict()}))
+        classificationItemsListBuilder = _response_list_builder(ClassificationItemOrError, self.trustResponses)
         return classificationItemsListBuilder(result["result"]["classificationItems"])
 
-    def GetDetailsOfProperties(self, properties: List[PropertyIdArrayItem]) -> List[PropertyDefinitionOrError]:
+    @instrumentation.instrumented
+    async def GetDetailsOfProperties(self, properties: List[PropertyIdArrayItem]) -> List[PropertyDefinitionOrError]:
         """Returns the details of property definitions.
 
         Args:
@@ -750,20 +1204,13 @@ class Commands:
             :obj:`list` of :obj:`PropertyDefinitionOrError`: A list of property definitions or errors.
 
         """
-        class GetDetailsOfProperties_parameters(_ACBaseType):
-            __slots__ = ("properties", )
-            def __init__(self, properties: List[PropertyIdArrayItem]):
-                self.properties: List[PropertyIdArrayItem] = properties
-
-        GetDetailsOfProperties_parameters.get_classinfo().add_field('properties', List[PropertyIdArrayItem])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetDetailsOfProperties", "parameters": GetDetailsOfProperties_parameters(properties).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        propertyDefinitionsListBuilder = _ListBuilder(PropertyDefinitionOrError)
+        result = await self._post(codec.dumps({"command": "API.GetDetailsOfProperties", "parameters": _GetDetailsOfProperties_parameters(properties).to_dict()}))
+        propertyDefinitionsListBuilder = _response_list_builder(PropertyDefinitionOrError, self.trustResponses)
         return propertyDefinitionsListBuilder(result["result"]["propertyDefinitions"])
 
-    def GetDocument3DNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[Document3DNavigatorItemOrError]:
+    @instrumentation.instrumented
+    async def GetDocument3DNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[Document3DNavigatorItemOrError]:
         """Returns the details of the 3D document navigator items identified by their Ids.
 
         Args:
@@ -773,20 +1220,13 @@ class Commands:
             :obj:`list` of :obj:`Document3DNavigatorItemOrError`: A list of 3D document navigator items.
 
         """
-        class GetDocument3DNavigatorItems_parameters(_ACBaseType):
-            __slots__ = ("navigatorItemIds", )
-            def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
-                self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
 
-        GetDocument3DNavigatorItems_parameters.get_classinfo().add_field('navigatorItemIds', List[NavigatorItemIdWrapper])
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetDocument3DNavigatorItems", "parameters": GetDocument3DNavigatorItems_parameters(navigatorItemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        navigatorItemsListBuilder = _ListBuilder(Document3DNavigatorItemOrError)
+        result = await self._post(codec.dumps({"command": "API.GetDocument3DNavigatorItems", "parameters": _GetDocument3DNavigatorItems_parameters(navigatorItemIds).to_dict()}))
+        navigatorItemsListBuilder = _response_list_builder(Document3DNavigatorItemOrError, self.trustResponses)
         return navigatorItemsListBuilder(result["result"]["navigatorItems"])
 
-    def GetElementsByClassification(self, classificationItemId: ClassificationItemId) -> List[ElementIdArrayItem]:
+    @instrumentation.instrumented
+    async def GetElementsByClassification(self, classificationItemId: ClassificationItemId) -> List[ElementIdArrayItem]:
         """Returns the identifier of every element with the given classification identifier.
 
         Args:
@@ -796,20 +1236,13 @@ class Commands:
             :obj:`list` of :obj:`ElementIdArrayItem`: A list of elements.
 
         """
-        class GetElementsByClassification_parameters(_ACBaseType):
-            __slots__ = ("classificationItemId", )
-            def __init__(self, classificationItemId: ClassificationItemId):
-                self.classificationItemId: ClassificationItemId = classificationItemId
-
-        GetElementsByClassification_parameters.get_classinfo().add_field('classificationItemId', ClassificationItemId)
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetElementsByClassification", "parameters": GetElementsByClassification_parameters(classificationItemId).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        elementsListBuilder = _ListBuilder(ElementIdArrayItem)
+        result = await self._post(codec.dumps({"command": "API.GetElementsByClassification", "parameters": _GetElementsByClassification_parameters(classificationItemId).to_dict()}))
+        elementsListBuilder = _response_list_builder(ElementIdArrayItem, self.trustResponses)
         return elementsListBuilder(result["result"]["elements"])
 
-    def GetElementsByType(self, elementType: str) -> List[ElementIdArrayItem]:
+    @instrumentation.instrumented
+    async def GetElementsByType(self, elementType: str) -> List[ElementIdArrayItem]:
         """Returns the identifier of every element of the given type on the plan.
 
         Args:
@@ -819,20 +1252,13 @@ class Commands:
             :obj:`list` of :obj:`ElementIdArrayItem`: A list of elements.
 
         """
-        class GetElementsByType_parameters(_ACBaseType):
-            __slots__ = ("elementType", )
-            def __init__(self, elementType: str):
-                self.elementType: str = elementType
-
-        GetElementsByType_parameters.get_classinfo().add_field('elementType', str, value_set(['Wall', 'Column', 'Beam', 'Window', 'Door', 'Object', 'Lamp', 'Slab', 'Roof', 'Mesh', 'Zone', 'CurtainWall', 'Shell', 'Skylight', 'Morph', 'Stair', 'Railing', 'Opening']))
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetElementsByType", "parameters": GetElementsByType_parameters(elementType).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        elementsListBuilder = _ListBuilder(ElementIdArrayItem)
+        result = await self._post(codec.dumps({"command": "API.GetElementsByType", "parameters": _GetElementsByType_parameters(elementType).to_dict()}))
+        elementsListBuilder = _response_list_builder(ElementIdArrayItem, self.trustResponses)
         return elementsListBuilder(result["result"]["elements"])
 
-    def GetElementsRelatedToZones(self, zones: List[ElementIdArrayItem], elementTypes: Optional[List[str]] = None) -> List[ElementsOrError]:
+    @instrumentation.instrumented
+    async def GetElementsRelatedToZones(self, zones: List[ElementIdArrayItem], elementTypes: Optional[List[str]] = None) -> List[ElementsOrError]:
         """Returns related elements of the given zones. The related elements will be grouped by type. If multiple zones was given, then the order of the returned list is that of the given zones.
 
         Args:
@@ -843,22 +1269,13 @@ class Commands:
             :obj:`list` of :obj:`ElementsOrError`: A list of ElementsOrError items.
 
         """
-        class GetElementsRelatedToZones_parameters(_ACBaseType):
-            __slots__ = ("zones", "elementTypes", )
-            def __init__(self, zones: List[ElementIdArrayItem], elementTypes: Optional[List[str]] = None):
-                self.zones: List[ElementIdArrayItem] = zones
-                self.elementTypes: Optional[List[str]] = elementTypes
 
-        GetElementsRelatedToZones_parameters.get_classinfo().add_field('zones', List[ElementIdArrayItem])
-        GetElementsRelatedToZones_parameters.get_classinfo().add_field('elementTypes', Optional[List[str]], listitem_validator(value_set(['Wall', 'Column', 'Beam', 'Window', 'Door', 'Object', 'Lamp', 'Slab', 'Roof', 'Mesh', 'Zone', 'CurtainWall', 'Shell', 'Skylight', 'Morph', 'Stair', 'Railing', 'Opening'])))
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetElementsRelatedToZones", "parameters": GetElementsRelatedToZones_parameters(zones, elementTypes).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        elementsRelatedToZonesListBuilder = _ListBuilder(ElementsOrError)
+        result = await self._post(codec.dumps({"command": "API.GetElementsRelatedToZones", "parameters": _GetElementsRelatedToZones_parameters(zones, elementTypes).to_dict()}))
+        elementsRelatedToZonesListBuilder = _response_list_builder(ElementsOrError, self.trustResponses)
         return elementsRelatedToZonesListBuilder(result["result"]["elementsRelatedToZones"])
 
-    def GetElevationNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[ElevationNavigatorItemOrError]:
+    @instrumentation.instrumented
+    async def GetElevationNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[ElevationNavigatorItemOrError]:
         """Returns the detailed elevation navigator items identified by their Ids.
 
         Args:
@@ -868,20 +1285,13 @@ class Commands:
             :obj:`list` of :obj:`ElevationNavigatorItemOrError`: A list of elevation navigator items.
 
         """
-        class GetElevationNavigatorItems_parameters(_ACBaseType):
-            __slots__ = ("navigatorItemIds", )
-            def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
-                self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
-
-        GetElevationNavigatorItems_parameters.get_classinfo().add_field('navigatorItemIds', List[NavigatorItemIdWrapper])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetElevationNavigatorItems", "parameters": GetElevationNavigatorItems_parameters(navigatorItemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        navigatorItemsListBuilder = _ListBuilder(ElevationNavigatorItemOrError)
+        result = await self._post(codec.dumps({"command": "API.GetElevationNavigatorItems", "parameters": _GetElevationNavigatorItems_parameters(navigatorItemIds).to_dict()}))
+        navigatorItemsListBuilder = _response_list_builder(ElevationNavigatorItemOrError, self.trustResponses)
         return navigatorItemsListBuilder(result["result"]["navigatorItems"])
 
-    def GetFillAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[FillAttributeOrError]:
+    @instrumentation.instrumented
+    async def GetFillAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[FillAttributeOrError]:
         """Returns the detailed fill attributes identified by their GUIDs.
 
         Args:
@@ -891,20 +1301,13 @@ class Commands:
             :obj:`list` of :obj:`FillAttributeOrError`: A list of fill attributes and potential errors.
 
         """
-        class GetFillAttributes_parameters(_ACBaseType):
-            __slots__ = ("attributeIds", )
-            def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
 
-        GetFillAttributes_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetFillAttributes", "parameters": GetFillAttributes_parameters(attributeIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        attributesListBuilder = _ListBuilder(FillAttributeOrError)
+        result = await self._post(codec.dumps({"command": "API.GetFillAttributes", "parameters": _GetFillAttributes_parameters(attributeIds).to_dict()}))
+        attributesListBuilder = _response_list_builder(FillAttributeOrError, self.trustResponses)
         return attributesListBuilder(result["result"]["attributes"])
 
-    def GetInteriorElevationNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[InteriorElevationNavigatorItemOrError]:
+    @instrumentation.instrumented
+    async def GetInteriorElevationNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[InteriorElevationNavigatorItemOrError]:
         """Returns the details of the interior elevation navigator items identified by their Ids.
 
         Args:
@@ -914,20 +1317,13 @@ class Commands:
             :obj:`list` of :obj:`InteriorElevationNavigatorItemOrError`: A list of interior elevation navigator items.
 
         """
-        class GetInteriorElevationNavigatorItems_parameters(_ACBaseType):
-            __slots__ = ("navigatorItemIds", )
-            def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
-                self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
-
-        GetInteriorElevationNavigatorItems_parameters.get_classinfo().add_field('navigatorItemIds', List[NavigatorItemIdWrapper])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetInteriorElevationNavigatorItems", "parameters": GetInteriorElevationNavigatorItems_parameters(navigatorItemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        navigatorItemsListBuilder = _ListBuilder(InteriorElevationNavigatorItemOrError)
+        result = await self._post(codec.dumps({"command": "API.GetInteriorElevationNavigatorItems", "parameters": _GetInteriorElevationNavigatorItems_parameters(navigatorItemIds).to_dict()}))
+        navigatorItemsListBuilder = _response_list_builder(InteriorElevationNavigatorItemOrError, self.trustResponses)
         return navigatorItemsListBuilder(result["result"]["navigatorItems"])
 
-    def GetLayerAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[LayerAttributeOrError]:
+    @instrumentation.instrumented
+    async def GetLayerAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[LayerAttributeOrError]:
         """Returns the detailed layer attributes identified by their GUIDs.
 
         Args:
@@ -937,20 +1333,13 @@ class Commands:
             :obj:`list` of :obj:`LayerAttributeOrError`: A list of layer attributes and potential errors.
 
         """
-        class GetLayerAttributes_parameters(_ACBaseType):
-            __slots__ = ("attributeIds", )
-            def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
-
-        GetLayerAttributes_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetLayerAttributes", "parameters": GetLayerAttributes_parameters(attributeIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        attributesListBuilder = _ListBuilder(LayerAttributeOrError)
+        result = await self._post(codec.dumps({"command": "API.GetLayerAttributes", "parameters": _GetLayerAttributes_parameters(attributeIds).to_dict()}))
+        attributesListBuilder = _response_list_builder(LayerAttributeOrError, self.trustResponses)
         return attributesListBuilder(result["result"]["attributes"])
 
-    def GetLayerCombinationAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[LayerCombinationAttributeOrError]:
+    @instrumentation.instrumented
+    async def GetLayerCombinationAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[LayerCombinationAttributeOrError]:
         """Returns the detailed layer combination attributes identified by their GUIDs.
 
         Args:
@@ -960,20 +1349,13 @@ class Commands:
             :obj:`list` of :obj:`LayerCombinationAttributeOrError`: A list of layer combination attributes and potential errors.
 
         """
-        class GetLayerCombinationAttributes_parameters(_ACBaseType):
-            __slots__ = ("attributeIds", )
-            def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
 
-        GetLayerCombinationAttributes_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetLayerCombinationAttributes", "parameters": GetLayerCombinationAttributes_parameters(attributeIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        attributesListBuilder = _ListBuilder(LayerCombinationAttributeOrError)
+        result = await self._post(codec.dumps({"command": "API.GetLayerCombinationAttributes", "parameters": _GetLayerCombinationAttributes_parameters(attributeIds).to_dict()}))
+        attributesListBuilder = _response_list_builder(LayerCombinationAttributeOrError, self.trustResponses)
         return attributesListBuilder(result["result"]["attributes"])
 
-    def GetLayoutSettings(self, layoutNavigatorItemId: NavigatorItemId) -> LayoutParameters:
+    @instrumentation.instrumented
+    async def GetLayoutSettings(self, layoutNavigatorItemId: NavigatorItemId) -> LayoutParameters:
         """Returns the parameters (settings) of the given layout.
 
         Args:
@@ -983,19 +1365,12 @@ class Commands:
             :obj:`LayoutParameters`: The parameters of the layout.
 
         """
-        class GetLayoutSettings_parameters(_ACBaseType):
-            __slots__ = ("layoutNavigatorItemId", )
-            def __init__(self, layoutNavigatorItemId: NavigatorItemId):
-                self.layoutNavigatorItemId: NavigatorItemId = layoutNavigatorItemId
 
-        GetLayoutSettings_parameters.get_classinfo().add_field('layoutNavigatorItemId', NavigatorItemId)
+        result = await self._post(codec.dumps({"command": "API.GetLayoutSettings", "parameters": _GetLayoutSettings_parameters(layoutNavigatorItemId).to_dict()}))
+        return _build_response(LayoutParameters, result["result"]["layoutParameters"], self.trustResponses)
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetLayoutSettings", "parameters": GetLayoutSettings_parameters(layoutNavigatorItemId).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        return LayoutParameters(**result["result"]["layoutParameters"])
-
-    def GetLineAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[LineAttributeOrError]:
+    @instrumentation.instrumented
+    async def GetLineAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[LineAttributeOrError]:
         """Returns the detailed line attributes identified by their GUIDs.
 
         Args:
@@ -1005,20 +1380,13 @@ class Commands:
             :obj:`list` of :obj:`LineAttributeOrError`: A list of line attributes and potential errors.
 
         """
-        class GetLineAttributes_parameters(_ACBaseType):
-            __slots__ = ("attributeIds", )
-            def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
-
-        GetLineAttributes_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetLineAttributes", "parameters": GetLineAttributes_parameters(attributeIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        attributesListBuilder = _ListBuilder(LineAttributeOrError)
+        result = await self._post(codec.dumps({"command": "API.GetLineAttributes", "parameters": _GetLineAttributes_parameters(attributeIds).to_dict()}))
+        attributesListBuilder = _response_list_builder(LineAttributeOrError, self.trustResponses)
         return attributesListBuilder(result["result"]["attributes"])
 
-    def GetNavigatorItemsType(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[NavigatorItemIdAndTypeOrError]:
+    @instrumentation.instrumented
+    async def GetNavigatorItemsType(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[NavigatorItemIdAndTypeOrError]:
         """Returns all navigator item types based on the navigator item identifiers given. An error is returned for each identifier that is not found.
 
         Args:
@@ -1028,20 +1396,13 @@ class Commands:
             :obj:`list` of :obj:`NavigatorItemIdAndTypeOrError`: A list of objects that consist of a navigator item identifier and a type.
 
         """
-        class GetNavigatorItemsType_parameters(_ACBaseType):
-            __slots__ = ("navigatorItemIds", )
-            def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
-                self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
-
-        GetNavigatorItemsType_parameters.get_classinfo().add_field('navigatorItemIds', List[NavigatorItemIdWrapper])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetNavigatorItemsType", "parameters": GetNavigatorItemsType_parameters(navigatorItemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        navigatorItemIdAndTypeListListBuilder = _ListBuilder(NavigatorItemIdAndTypeOrError)
+        result = await self._post(codec.dumps({"command": "API.GetNavigatorItemsType", "parameters": _GetNavigatorItemsType_parameters(navigatorItemIds).to_dict()}))
+        navigatorItemIdAndTypeListListBuilder = _response_list_builder(NavigatorItemIdAndTypeOrError, self.trustResponses)
         return navigatorItemIdAndTypeListListBuilder(result["result"]["navigatorItemIdAndTypeList"])
 
-    def GetNavigatorItemTree(self, navigatorTreeId: NavigatorTreeId) -> NavigatorTree:
+    @instrumentation.instrumented
+    async def GetNavigatorItemTree(self, navigatorTreeId: NavigatorTreeId) -> NavigatorTree:
         """Returns the tree of navigator items.
 
         Args:
@@ -1051,19 +1412,12 @@ class Commands:
             :obj:`NavigatorTree`: A tree of navigator items.
 
         """
-        class GetNavigatorItemTree_parameters(_ACBaseType):
-            __slots__ = ("navigatorTreeId", )
-            def __init__(self, navigatorTreeId: NavigatorTreeId):
-                self.navigatorTreeId: NavigatorTreeId = navigatorTreeId
 
-        GetNavigatorItemTree_parameters.get_classinfo().add_field('navigatorTreeId', NavigatorTreeId)
+        result = await self._post(codec.dumps({"command": "API.GetNavigatorItemTree", "parameters": _GetNavigatorItemTree_parameters(navigatorTreeId).to_dict()}))
+        return _build_response(NavigatorTree, result["result"]["navigatorTree"], self.trustResponses)
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetNavigatorItemTree", "parameters": GetNavigatorItemTree_parameters(navigatorTreeId).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        return NavigatorTree(**result["result"]["navigatorTree"])
-
-    def GetPenTableAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[PenTableAttributeOrError]:
+    @instrumentation.instrumented
+    async def GetPenTableAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[PenTableAttributeOrError]:
         """Returns the detailed pen table attributes (including their pens) identified by their GUIDs.
 
         Args:
@@ -1073,20 +1427,13 @@ class Commands:
             :obj:`list` of :obj:`PenTableAttributeOrError`: A list of pen table attributes and potential errors.
 
         """
-        class GetPenTableAttributes_parameters(_ACBaseType):
-            __slots__ = ("attributeIds", )
-            def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
-
-        GetPenTableAttributes_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetPenTableAttributes", "parameters": GetPenTableAttributes_parameters(attributeIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        attributesListBuilder = _ListBuilder(PenTableAttributeOrError)
+        result = await self._post(codec.dumps({"command": "API.GetPenTableAttributes", "parameters": _GetPenTableAttributes_parameters(attributeIds).to_dict()}))
+        attributesListBuilder = _response_list_builder(PenTableAttributeOrError, self.trustResponses)
         return attributesListBuilder(result["result"]["attributes"])
 
-    def GetProductInfo(self) -> Tuple[int, int, str]:
+    @instrumentation.instrumented
+    async def GetProductInfo(self) -> Tuple[int, int, str]:
         """Accesses the version information from the running Archicad.
 
         Returns:
@@ -1096,12 +1443,11 @@ class Commands:
 
         """
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetProductInfo"}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
+        result = await self._post(codec.dumps({"command": "API.GetProductInfo"}))
         return result["result"]["version"], result["result"]["buildNumber"], result["result"]["languageCode"]
 
-    def GetProfileAttributePreview(self, attributeIds: List[AttributeIdWrapperItem], imageWidth: int, imageHeight: int, backgroundColor: Optional[RGBColor] = None) -> List[ImageOrError]:
+    @instrumentation.instrumented
+    async def GetProfileAttributePreview(self, attributeIds: List[AttributeIdWrapperItem], imageWidth: int, imageHeight: int, backgroundColor: Optional[RGBColor] = None) -> List[ImageOrError]:
         """Returns the preview image of each requested profile attribute in a base64 string format.
 
         Args:
@@ -1114,26 +1460,13 @@ class Commands:
             :obj:`list` of :obj:`ImageOrError`: A list of images and potential errors.
 
         """
-        class GetProfileAttributePreview_parameters(_ACBaseType):
-            __slots__ = ("attributeIds", "imageWidth", "imageHeight", "backgroundColor", )
-            def __init__(self, attributeIds: List[AttributeIdWrapperItem], imageWidth: int, imageHeight: int, backgroundColor: Optional[RGBColor] = None):
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
-                self.imageWidth: int = imageWidth
-                self.imageHeight: int = imageHeight
-                self.backgroundColor: Optional[RGBColor] = backgroundColor
-
-        GetProfileAttributePreview_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
-        GetProfileAttributePreview_parameters.get_classinfo().add_field('imageWidth', int)
-        GetProfileAttributePreview_parameters.get_classinfo().add_field('imageHeight', int)
-        GetProfileAttributePreview_parameters.get_classinfo().add_field('backgroundColor', Optional[RGBColor])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetProfileAttributePreview", "parameters": GetProfileAttributePreview_parameters(attributeIds, imageWidth, imageHeight, backgroundColor).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        previewImagesListBuilder = _ListBuilder(ImageOrError)
+        result = await self._post(codec.dumps({"command": "API.GetProfileAttributePreview", "parameters": _GetProfileAttributePreview_parameters(attributeIds, imageWidth, imageHeight, backgroundColor).to_dict()}))
+        previewImagesListBuilder = _response_list_builder(ImageOrError, self.trustResponses)
         return previewImagesListBuilder(result["result"]["previewImages"])
 
-    def GetProfileAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[ProfileAttributeOrError]:
+    @instrumentation.instrumented
+    async def GetProfileAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[ProfileAttributeOrError]:
         """Returns the detailed profile attributes identified by their GUIDs.
 
         Args:
@@ -1143,20 +1476,13 @@ class Commands:
             :obj:`list` of :obj:`ProfileAttributeOrError`: A list of the profile attributes and potential errors.
 
         """
-        class GetProfileAttributes_parameters(_ACBaseType):
-            __slots__ = ("attributeIds", )
-            def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
-
-        GetProfileAttributes_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetProfileAttributes", "parameters": GetProfileAttributes_parameters(attributeIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        attributesListBuilder = _ListBuilder(ProfileAttributeOrError)
+        result = await self._post(codec.dumps({"command": "API.GetProfileAttributes", "parameters": _GetProfileAttributes_parameters(attributeIds).to_dict()}))
+        attributesListBuilder = _response_list_builder(ProfileAttributeOrError, self.trustResponses)
         return attributesListBuilder(result["result"]["attributes"])
 
-    def GetPropertyDefinitionAvailability(self, propertyIds: List[PropertyIdArrayItem]) -> List[PropertyDefinitionAvailabilityOrError]:
+    @instrumentation.instrumented
+    async def GetPropertyDefinitionAvailability(self, propertyIds: List[PropertyIdArrayItem]) -> List[PropertyDefinitionAvailabilityOrError]:
         """Returns the ids of classification items a given property definition is available for.
 
         Args:
@@ -1166,20 +1492,13 @@ class Commands:
             :obj:`list` of :obj:`PropertyDefinitionAvailabilityOrError`: A list of classification item avalabilities.
 
         """
-        class GetPropertyDefinitionAvailability_parameters(_ACBaseType):
-            __slots__ = ("propertyIds", )
-            def __init__(self, propertyIds: List[PropertyIdArrayItem]):
-                self.propertyIds: List[PropertyIdArrayItem] = propertyIds
 
-        GetPropertyDefinitionAvailability_parameters.get_classinfo().add_field('propertyIds', List[PropertyIdArrayItem])
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetPropertyDefinitionAvailability", "parameters": GetPropertyDefinitionAvailability_parameters(propertyIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        propertyDefinitionAvailabilityListListBuilder = _ListBuilder(PropertyDefinitionAvailabilityOrError)
+        result = await self._post(codec.dumps({"command": "API.GetPropertyDefinitionAvailability", "parameters": _GetPropertyDefinitionAvailability_parameters(propertyIds).to_dict()}))
+        propertyDefinitionAvailabilityListListBuilder = _response_list_builder(PropertyDefinitionAvailabilityOrError, self.trustResponses)
         return propertyDefinitionAvailabilityListListBuilder(result["result"]["propertyDefinitionAvailabilityList"])
 
-    def GetPropertyGroups(self, propertyGroupIds: List[PropertyGroupIdArrayItem]) -> List[PropertyGroupOrError]:
+    @instrumentation.instrumented
+    async def GetPropertyGroups(self, propertyGroupIds: List[PropertyGroupIdArrayItem]) -> List[PropertyGroupOrError]:
         """Returns the details of property groups.
 
         Args:
@@ -1189,20 +1508,13 @@ class Commands:
             :obj:`list` of :obj:`PropertyGroupOrError`: A list of property groups or errors.
 
         """
-        class GetPropertyGroups_parameters(_ACBaseType):
-            __slots__ = ("propertyGroupIds", )
-            def __init__(self, propertyGroupIds: List[PropertyGroupIdArrayItem]):
-                self.propertyGroupIds: List[PropertyGroupIdArrayItem] = propertyGroupIds
-
-        GetPropertyGroups_parameters.get_classinfo().add_field('propertyGroupIds', List[PropertyGroupIdArrayItem])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetPropertyGroups", "parameters": GetPropertyGroups_parameters(propertyGroupIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        propertyGroupsListBuilder = _ListBuilder(PropertyGroupOrError)
+        result = await self._post(codec.dumps({"command": "API.GetPropertyGroups", "parameters": _GetPropertyGroups_parameters(propertyGroupIds).to_dict()}))
+        propertyGroupsListBuilder = _response_list_builder(PropertyGroupOrError, self.trustResponses)
         return propertyGroupsListBuilder(result["result"]["propertyGroups"])
 
-    def GetPropertyIds(self, properties: List[PropertyUserId]) -> List[PropertyIdOrError]:
+    @instrumentation.instrumented
+    async def GetPropertyIds(self, properties: List[PropertyUserId]) -> List[PropertyIdOrError]:
         """Returns the identifiers of property definitions for the requested property names.
 
         Args:
@@ -1212,20 +1524,13 @@ class Commands:
             :obj:`list` of :obj:`PropertyIdOrError`: A list of property identifiers or errors.
 
         """
-        class GetPropertyIds_parameters(_ACBaseType):
-            __slots__ = ("properties", )
-            def __init__(self, properties: List[PropertyUserId]):
-                self.properties: List[PropertyUserId] = properties
-
-        GetPropertyIds_parameters.get_classinfo().add_field('properties', List[PropertyUserId])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetPropertyIds", "parameters": GetPropertyIds_parameters(properties).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        propertiesListBuilder = _ListBuilder(PropertyIdOrError)
+        result = await self._post(codec.dumps({"command": "API.GetPropertyIds", "parameters": _GetPropertyIds_parameters(properties).to_dict()}))
+        propertiesListBuilder = _response_list_builder(PropertyIdOrError, self.trustResponses)
         return propertiesListBuilder(result["result"]["properties"])
 
-    def GetPropertyValuesOfElementComponents(self, elementComponents: List[ElementComponentIdArrayItem], properties: List[PropertyIdArrayItem]) -> List[PropertyValuesOrError]:
+    @instrumentation.instrumented
+    async def GetPropertyValuesOfElementComponents(self, elementComponents: List[ElementComponentIdArrayItem], properties: List[PropertyIdArrayItem]) -> List[PropertyValuesOrError]:
         """Returns the property values of the components for the given property.
 
         Args:
@@ -1236,22 +1541,33 @@ class Commands:
             :obj:`list` of :obj:`PropertyValuesOrError`: A list of property value lists.
 
         """
-        class GetPropertyValuesOfElementComponents_parameters(_ACBaseType):
-            __slots__ = ("elementComponents", "properties", )
-            def __init__(self, elementComponents: List[ElementComponentIdArrayItem], properties: List[PropertyIdArrayItem]):
-                self.elementComponents: List[ElementComponentIdArrayItem] = elementComponents
-                self.properties: List[PropertyIdArrayItem] = properties
 
-        GetPropertyValuesOfElementComponents_parameters.get_classinfo().add_field('elementComponents', List[ElementComponentIdArrayItem])
-        GetPropertyValuesOfElementComponents_parameters.get_classinfo().add_field('properties', List[PropertyIdArrayItem])
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetPropertyValuesOfElementComponents", "parameters": GetPropertyValuesOfElementComponents_parameters(elementComponents, properties).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        propertyValuesForElementComponentsListBuilder = _ListBuilder(PropertyValuesOrError)
+        result = await self._post(codec.dumps({"command": "API.GetPropertyValuesOfElementComponents", "parameters": _GetPropertyValuesOfElementComponents_parameters(elementComponents, properties).to_dict()}))
+        propertyValuesForElementComponentsListBuilder = _response_list_builder(PropertyValuesOrError, self.trustResponses)
         return propertyValuesForElementComponentsListBuilder(result["result"]["propertyValuesForElementComponents"])
 
-    def GetPropertyValuesOfElements(self, elements: List[ElementIdArrayItem], properties: List[PropertyIdArrayItem]) -> List[PropertyValuesOrError]:
+    @instrumentation.instrumented
+    async def GetPropertyValueColumnsOfElements(self, elements: List[ElementIdArrayItem], properties: List[PropertyIdArrayItem]) -> List[columnar.PropertyColumn]:
+        """Returns the property values of the elements for the given property as one column per property.
+
+        The columns are built directly from the JSON results, without creating a property value object for each element and property.
+
+        Args:
+            elements (:obj:`list` of :obj:`ElementIdArrayItem`): A list of elements.
+            properties (:obj:`list` of :obj:`PropertyIdArrayItem`): A list of property identifiers.
+
+        Returns:
+            :obj:`list` of :obj:`columnar.PropertyColumn`: The columns in the order of the properties, each holding the values in the order of the elements.
+
+        """
+
+        columnsBuilder = columnar.PropertyColumnsBuilder(properties)
+        async for result in self._post_in_chunks(elements, self.chunkSize, lambda chunk: codec.dumps({"command": "API.GetPropertyValuesOfElements", "parameters": _GetPropertyValuesOfElements_parameters(chunk, properties).to_dict()})):
+            columnsBuilder.extend(result["result"]["propertyValuesForElements"])
+        return columnsBuilder.columns
+
+    @instrumentation.instrumented
+    async def GetPropertyValuesOfElements(self, elements: List[ElementIdArrayItem], properties: List[PropertyIdArrayItem]) -> List[PropertyValuesOrError]:
         """Returns the property values of the elements for the given property.
 
         Args:
@@ -1262,22 +1578,15 @@ class Commands:
             :obj:`list` of :obj:`PropertyValuesOrError`: A list of property value lists.
 
         """
-        class GetPropertyValuesOfElements_parameters(_ACBaseType):
-            __slots__ = ("elements", "properties", )
-            def __init__(self, elements: List[ElementIdArrayItem], properties: List[PropertyIdArrayItem]):
-                self.elements: List[ElementIdArrayItem] = elements
-                self.properties: List[PropertyIdArrayItem] = properties
 
-        GetPropertyValuesOfElements_parameters.get_classinfo().add_field('elements', List[ElementIdArrayItem])
-        GetPropertyValuesOfElements_parameters.get_classinfo().add_field('properties', List[PropertyIdArrayItem])
+        propertyValuesForElementsListBuilder = _response_list_builder(PropertyValuesOrError, self.trustResponses)
+        propertyValuesForElements = []
+        async for result in self._post_in_chunks(elements, self.chunkSize, lambda chunk: codec.dumps({"command": "API.GetPropertyValuesOfElements", "parameters": _GetPropertyValuesOfElements_parameters(chunk, properties).to_dict()})):
+            propertyValuesForElements.extend(propertyValuesForElementsListBuilder(result["result"]["propertyValuesForElements"]))
+        return propertyValuesForElements
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetPropertyValuesOfElements", "parameters": GetPropertyValuesOfElements_parameters(elements, properties).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        propertyValuesForElementsListBuilder = _ListBuilder(PropertyValuesOrError)
-        return propertyValuesForElementsListBuilder(result["result"]["propertyValuesForElements"])
-
-    def GetPublisherSetNames(self) -> List[str]:
+    @instrumentation.instrumented
+    async def GetPublisherSetNames(self) -> List[str]:
         """Returns the names of available publisher sets.
 
         Returns:
@@ -1285,13 +1594,12 @@ class Commands:
 
         """
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetPublisherSetNames"}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        publisherSetNamesListBuilder = _ListBuilder(str)
+        result = await self._post(codec.dumps({"command": "API.GetPublisherSetNames"}))
+        publisherSetNamesListBuilder = _response_list_builder(str, self.trustResponses)
         return publisherSetNamesListBuilder(result["result"]["publisherSetNames"])
 
-    def GetSectionNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[SectionNavigatorItemOrError]:
+    @instrumentation.instrumented
+    async def GetSectionNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[SectionNavigatorItemOrError]:
         """Returns the details of the section navigator items identified by their Ids.
 
         Args:
@@ -1301,20 +1609,13 @@ class Commands:
             :obj:`list` of :obj:`SectionNavigatorItemOrError`: A list of section navigator items.
 
         """
-        class GetSectionNavigatorItems_parameters(_ACBaseType):
-            __slots__ = ("navigatorItemIds", )
-            def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
-                self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
-
-        GetSectionNavigatorItems_parameters.get_classinfo().add_field('navigatorItemIds', List[NavigatorItemIdWrapper])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetSectionNavigatorItems", "parameters": GetSectionNavigatorItems_parameters(navigatorItemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        navigatorItemsListBuilder = _ListBuilder(SectionNavigatorItemOrError)
+        result = await self._post(codec.dumps({"command": "API.GetSectionNavigatorItems", "parameters": _GetSectionNavigatorItems_parameters(navigatorItemIds).to_dict()}))
+        navigatorItemsListBuilder = _response_list_builder(SectionNavigatorItemOrError, self.trustResponses)
         return navigatorItemsListBuilder(result["result"]["navigatorItems"])
 
-    def GetSelectedElements(self, onlyEditable: Optional[bool] = None) -> List[ElementIdArrayItem]:
+    @instrumentation.instrumented
+    async def GetSelectedElements(self, onlyEditable: Optional[bool] = None) -> List[ElementIdArrayItem]:
         """Returns the identifiers of selected elements in the current plan.
 
         Args:
@@ -1324,20 +1625,13 @@ class Commands:
             :obj:`list` of :obj:`ElementIdArrayItem`: A list of elements.
 
         """
-        class GetSelectedElements_parameters(_ACBaseType):
-            __slots__ = ("onlyEditable", )
-            def __init__(self, onlyEditable: Optional[bool] = None):
-                self.onlyEditable: Optional[bool] = onlyEditable
 
-        GetSelectedElements_parameters.get_classinfo().add_field('onlyEditable', Optional[bool])
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetSelectedElements", "parameters": GetSelectedElements_parameters(onlyEditable).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        elementsListBuilder = _ListBuilder(ElementIdArrayItem)
+        result = await self._post(codec.dumps({"command": "API.GetSelectedElements", "parameters": _GetSelectedElements_parameters(onlyEditable).to_dict()}))
+        elementsListBuilder = _response_list_builder(ElementIdArrayItem, self.trustResponses)
         return elementsListBuilder(result["result"]["elements"])
 
-    def GetStoryNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[StoryNavigatorItemOrError]:
+    @instrumentation.instrumented
+    async def GetStoryNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[StoryNavigatorItemOrError]:
         """Returns the details of the story navigator items identified by their Ids.
 
         Args:
@@ -1347,20 +1641,13 @@ class Commands:
             :obj:`list` of :obj:`StoryNavigatorItemOrError`: A list of story navigator items.
 
         """
-        class GetStoryNavigatorItems_parameters(_ACBaseType):
-            __slots__ = ("navigatorItemIds", )
-            def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
-                self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
 
-        GetStoryNavigatorItems_parameters.get_classinfo().add_field('navigatorItemIds', List[NavigatorItemIdWrapper])
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetStoryNavigatorItems", "parameters": GetStoryNavigatorItems_parameters(navigatorItemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        navigatorItemsListBuilder = _ListBuilder(StoryNavigatorItemOrError)
+        result = await self._post(codec.dumps({"command": "API.GetStoryNavigatorItems", "parameters": _GetStoryNavigatorItems_parameters(navigatorItemIds).to_dict()}))
+        navigatorItemsListBuilder = _response_list_builder(StoryNavigatorItemOrError, self.trustResponses)
         return navigatorItemsListBuilder(result["result"]["navigatorItems"])
 
-    def GetSurfaceAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[SurfaceAttributeOrError]:
+    @instrumentation.instrumented
+    async def GetSurfaceAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[SurfaceAttributeOrError]:
         """Returns the detailed surface attributes identified by their GUIDs.
 
         Args:
@@ -1370,20 +1657,13 @@ class Commands:
             :obj:`list` of :obj:`SurfaceAttributeOrError`: A list of surface attributes and potential errors.
 
         """
-        class GetSurfaceAttributes_parameters(_ACBaseType):
-            __slots__ = ("attributeIds", )
-            def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
-
-        GetSurfaceAttributes_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetSurfaceAttributes", "parameters": GetSurfaceAttributes_parameters(attributeIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        attributesListBuilder = _ListBuilder(SurfaceAttributeOrError)
+        result = await self._post(codec.dumps({"command": "API.GetSurfaceAttributes", "parameters": _GetSurfaceAttributes_parameters(attributeIds).to_dict()}))
+        attributesListBuilder = _response_list_builder(SurfaceAttributeOrError, self.trustResponses)
         return attributesListBuilder(result["result"]["attributes"])
 
-    def GetTypesOfElements(self, elements: List[ElementIdArrayItem]) -> List[TypeOfElementOrError]:
+    @instrumentation.instrumented
+    async def GetTypesOfElements(self, elements: List[ElementIdArrayItem]) -> List[TypeOfElementOrError]:
         """Returns the types of the given elements.
 
         Args:
@@ -1393,20 +1673,15 @@ class Commands:
             :obj:`list` of :obj:`TypeOfElementOrError`: A list of element types or errors.
 
         """
-        class GetTypesOfElements_parameters(_ACBaseType):
-            __slots__ = ("elements", )
-            def __init__(self, elements: List[ElementIdArrayItem]):
-                self.elements: List[ElementIdArrayItem] = elements
 
-        GetTypesOfElements_parameters.get_classinfo().add_field('elements', List[ElementIdArrayItem])
+        typesOfElementsListBuilder = _response_list_builder(TypeOfElementOrError, self.trustResponses)
+        typesOfElements = []
+        async for result in self._post_in_chunks(elements, self.chunkSize, lambda chunk: codec.dumps({"command": "API.GetTypesOfElements", "parameters": _GetTypesOfElements_parameters(chunk).to_dict()})):
+            typesOfElements.extend(typesOfElementsListBuilder(result["result"]["typesOfElements"]))
+        return typesOfElements
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetTypesOfElements", "parameters": GetTypesOfElements_parameters(elements).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        typesOfElementsListBuilder = _ListBuilder(TypeOfElementOrError)
-        return typesOfElementsListBuilder(result["result"]["typesOfElements"])
-
-    def GetWorksheetNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[WorksheetNavigatorItemOrError]:
+    @instrumentation.instrumented
+    async def GetWorksheetNavigatorItems(self, navigatorItemIds: List[NavigatorItemIdWrapper]) -> List[WorksheetNavigatorItemOrError]:
         """Returns the details of the worksheet navigator items identified by their Ids.
 
         Args:
@@ -1416,20 +1691,13 @@ class Commands:
             :obj:`list` of :obj:`WorksheetNavigatorItemOrError`: A list of worksheet navigator items.
 
         """
-        class GetWorksheetNavigatorItems_parameters(_ACBaseType):
-            __slots__ = ("navigatorItemIds", )
-            def __init__(self, navigatorItemIds: List[NavigatorItemIdWrapper]):
-                self.navigatorItemIds: List[NavigatorItemIdWrapper] = navigatorItemIds
 
-        GetWorksheetNavigatorItems_parameters.get_classinfo().add_field('navigatorItemIds', List[NavigatorItemIdWrapper])
-
-        result = post_command(self.__req, json.dumps({"command": "API.GetWorksheetNavigatorItems", "parameters": GetWorksheetNavigatorItems_parameters(navigatorItemIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        navigatorItemsListBuilder = _ListBuilder(WorksheetNavigatorItemOrError)
+        result = await self._post(codec.dumps({"command": "API.GetWorksheetNavigatorItems", "parameters": _GetWorksheetNavigatorItems_parameters(navigatorItemIds).to_dict()}))
+        navigatorItemsListBuilder = _response_list_builder(WorksheetNavigatorItemOrError, self.trustResponses)
         return navigatorItemsListBuilder(result["result"]["navigatorItems"])
 
-    def GetZoneCategoryAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[ZoneCategoryAttributeOrError]:
+    @instrumentation.instrumented
+    async def GetZoneCategoryAttributes(self, attributeIds: List[AttributeIdWrapperItem]) -> List[ZoneCategoryAttributeOrError]:
         """Returns the detailed zone category attributes identified by their GUIDs.
 
         Args:
@@ -1439,20 +1707,13 @@ class Commands:
             :obj:`list` of :obj:`ZoneCategoryAttributeOrError`: A list of zone category attributes and potential errors.
 
         """
-        class GetZoneCategoryAttributes_parameters(_ACBaseType):
-            __slots__ = ("attributeIds", )
-            def __init__(self, attributeIds: List[AttributeIdWrapperItem]):
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
-
-        GetZoneCategoryAttributes_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
 
-        result = post_command(self.__req, json.dumps({"command": "API.GetZoneCategoryAttributes", "parameters": GetZoneCategoryAttributes_parameters(attributeIds).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        attributesListBuilder = _ListBuilder(ZoneCategoryAttributeOrError)
+        result = await self._post(codec.dumps({"command": "API.GetZoneCategoryAttributes", "parameters": _GetZoneCategoryAttributes_parameters(attributeIds).to_dict()}))
+        attributesListBuilder = _response_list_builder(ZoneCategoryAttributeOrError, self.trustResponses)
         return attributesListBuilder(result["result"]["attributes"])
 
-    def IsAddOnCommandAvailable(self, addOnCommandId: AddOnCommandId) -> bool:
+    @instrumentation.instrumented
+    async def IsAddOnCommandAvailable(self, addOnCommandId: AddOnCommandId) -> bool:
         """Checks if the command is available or not.
 
         Args:
@@ -1462,19 +1723,12 @@ class Commands:
             :obj:`bool`: Returns true if the command is available.
 
         """
-        class IsAddOnCommandAvailable_parameters(_ACBaseType):
-            __slots__ = ("addOnCommandId", )
-            def __init__(self, addOnCommandId: AddOnCommandId):
-                self.addOnCommandId: AddOnCommandId = addOnCommandId
-
-        IsAddOnCommandAvailable_parameters.get_classinfo().add_field('addOnCommandId', AddOnCommandId)
 
-        result = post_command(self.__req, json.dumps({"command": "API.IsAddOnCommandAvailable", "parameters": IsAddOnCommandAvailable_parameters(addOnCommandId).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
+        result = await self._post(codec.dumps({"command": "API.IsAddOnCommandAvailable", "parameters": _IsAddOnCommandAvailable_parameters(addOnCommandId).to_dict()}))
         return result["result"]["available"]
 
-    def IsAlive(self) -> bool:
+    @instrumentation.instrumented
+    async def IsAlive(self) -> bool:
         """Checks if the Archicad connection is alive.
 
         Returns:
@@ -1482,12 +1736,49 @@ class Commands:
 
         """
 
-        result = post_command(self.__req, json.dumps({"command": "API.IsAlive"}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
+        result = await self._post(codec.dumps({"command": "API.IsAlive"}))
         return result["result"]["isAlive"]
 
-    def MoveAttributesAndFolders(self, folders: List[AttributeFolder], attributeIds: List[AttributeIdWrapperItem], targetFolder: AttributeFolder):
+    @instrumentation.instrumented
+    async def IterAllElements(self, chunkSize: Optional[int] = None) -> AsyncIterator[ElementIdArrayItem]:
+        """Returns the identifier of every element in the current plan one by one. The elements are built chunk by chunk while iterating, instead of building the whole list at once. The response is still received and decoded as a whole, only the construction of the element objects is incremental.
+
+        Args:
+            chunkSize (:obj:`int`, optional): The number of elements built at once. Defaults to ``chunkSize`` of the object or 1000.
+
+        Returns:
+            :obj:`Iterator` of :obj:`ElementIdArrayItem`: The elements. An :obj:`AsyncIterator` in :obj:`AsyncCommands`.
+
+        """
+        chunkSize = chunkSize or self.chunkSize or _ITER_CHUNK_SIZE
+        result = await self._post(codec.dumps({"command": "API.GetAllElements"}))
+        elementsListBuilder = _response_list_builder(ElementIdArrayItem, self.trustResponses)
+        elements = result["result"]["elements"]
+        for i in range(0, len(elements), chunkSize):
+            for element in elementsListBuilder(elements[i:i + chunkSize]):
+                yield element
+
+    @instrumentation.instrumented
+    async def IterPropertyValuesOfElements(self, elements: List[ElementIdArrayItem], properties: List[PropertyIdArrayItem], chunkSize: Optional[int] = None) -> AsyncIterator[PropertyValuesOrError]:
+        """Returns the property values of the elements for the given property one by one. The elements are requested in chunks, the next chunk is requested when the results of the previous one are consumed, or earlier when ``maxParallelChunks`` is more than 1.
+
+        Args:
+            elements (:obj:`list` of :obj:`ElementIdArrayItem`): A list of elements.
+            properties (:obj:`list` of :obj:`PropertyIdArrayItem`): A list of property identifiers.
+            chunkSize (:obj:`int`, optional): The number of elements requested at once. Defaults to ``chunkSize`` of the object or 1000.
+
+        Returns:
+            :obj:`Iterator` of :obj:`PropertyValuesOrError`: The property value lists in the order of the elements. An :obj:`AsyncIterator` in :obj:`AsyncCommands`.
+
+        """
+        chunkSize = chunkSize or self.chunkSize or _ITER_CHUNK_SIZE
+        propertyValuesForElementsListBuilder = _response_list_builder(PropertyValuesOrError, self.trustResponses)
+        async for result in self._post_in_chunks(elements, chunkSize, lambda chunk: codec.dumps({"command": "API.GetPropertyValuesOfElements", "parameters": _GetPropertyValuesOfElements_parameters(chunk, properties).to_dict()})):
+            for propertyValues in propertyValuesForElementsListBuilder(result["result"]["propertyValuesForElements"]):
+                yield propertyValues
+
+    @instrumentation.instrumented
+    async def MoveAttributesAndFolders(self, folders: List[AttributeFolder], attributeIds: List[AttributeIdWrapperItem], targetFolder: AttributeFolder):
         """Moves attributes and attribute folders.
 
         Args:
@@ -1496,23 +1787,11 @@ class Commands:
             targetFolder (:obj:`AttributeFolder`): Identifies an attribute folder. The path of the root folder is repesented by empty array.
 
         """
-        class MoveAttributesAndFolders_parameters(_ACBaseType):
-            __slots__ = ("folders", "attributeIds", "targetFolder", )
-            def __init__(self, folders: List[AttributeFolder], attributeIds: List[AttributeIdWrapperItem], targetFolder: AttributeFolder):
-                self.folders: List[AttributeFolder] = folders
-                self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
-                self.targetFolder: AttributeFolder = targetFolder
-
-        MoveAttributesAndFolders_parameters.get_classinfo().add_field('folders', List[AttributeFolder])
-        MoveAttributesAndFolders_parameters.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
-        MoveAttributesAndFolders_parameters.get_classinfo().add_field('targetFolder', AttributeFolder)
 
-        result = post_command(self.__req, json.dumps({"command": "API.MoveAttributesAndFolders", "parameters": MoveAttributesAndFolders_parameters(folders, attributeIds, targetFolder).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
+        await self._post(codec.dumps({"command": "API.MoveAttributesAndFolders", "parameters": _MoveAttributesAndFolders_parameters(folders, attributeIds, targetFolder).to_dict()}))
 
-
-    def MoveNavigatorItem(self, navigatorItemIdToMove: NavigatorItemId, parentNavigatorItemId: NavigatorItemId, previousNavigatorItemId: Optional[NavigatorItemId] = None):
+    @instrumentation.instrumented
+    async def MoveNavigatorItem(self, navigatorItemIdToMove: NavigatorItemId, parentNavigatorItemId: NavigatorItemId, previousNavigatorItemId: Optional[NavigatorItemId] = None):
         """Moves the given navigator item under the <i>parentNavigatorItemId</i> in the navigator tree. If <i>previousNavigatorItemId</i> is not given then inserts it at the first place under the new parent. If it is given then inserts it after this navigator item.
 
         Args:
@@ -1521,23 +1800,11 @@ class Commands:
             previousNavigatorItemId (:obj:`NavigatorItemId`, optional): The identifier of a navigator item.
 
         """
-        class MoveNavigatorItem_parameters(_ACBaseType):
-            __slots__ = ("navigatorItemIdToMove", "parentNavigatorItemId", "previousNavigatorItemId", )
-            def __init__(self, navigatorItemIdToMove: NavigatorItemId, parentNavigatorItemId: NavigatorItemId, previousNavigatorItemId: Optional[NavigatorItemId] = None):
-                self.navigatorItemIdToMove: NavigatorItemId = navigatorItemIdToMove
-                self.parentNavigatorItemId: NavigatorItemId = parentNavigatorItemId
-                self.previousNavigatorItemId: Optional[NavigatorItemId] = previousNavigatorItemId
-
-        MoveNavigatorItem_parameters.get_classinfo().add_field('navigatorItemIdToMove', NavigatorItemId)
-        MoveNavigatorItem_parameters.get_classinfo().add_field('parentNavigatorItemId', NavigatorItemId)
-        MoveNavigatorItem_parameters.get_classinfo().add_field('previousNavigatorItemId', Optional[NavigatorItemId])
-
-        result = post_command(self.__req, json.dumps({"command": "API.MoveNavigatorItem", "parameters": MoveNavigatorItem_parameters(navigatorItemIdToMove, parentNavigatorItemId, previousNavigatorItemId).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
 
+        await self._post(codec.dumps({"command": "API.MoveNavigatorItem", "parameters": _MoveNavigatorItem_parameters(navigatorItemIdToMove, parentNavigatorItemId, previousNavigatorItemId).to_dict()}))
 
-    def RenameAttributeFolder(self, attributeFolder: AttributeFolder, newName: str):
+    @instrumentation.instrumented
+    async def RenameAttributeFolder(self, attributeFolder: AttributeFolder, newName: str):
         """Rename attribute folder.
 
         Args:
@@ -1545,21 +1812,11 @@ class Commands:
             newName (:obj:`str`): The requested new name of the attribute folder.
 
         """
-        class RenameAttributeFolder_parameters(_ACBaseType):
-            __slots__ = ("attributeFolder", "newName", )
-            def __init__(self, attributeFolder: AttributeFolder, newName: str):
-                self.attributeFolder: AttributeFolder = attributeFolder
-                self.newName: str = newName
 
-        RenameAttributeFolder_parameters.get_classinfo().add_field('attributeFolder', AttributeFolder)
-        RenameAttributeFolder_parameters.get_classinfo().add_field('newName', str, min_length(1))
+        await self._post(codec.dumps({"command": "API.RenameAttributeFolder", "parameters": _RenameAttributeFolder_parameters(attributeFolder, newName).to_dict()}))
 
-        result = post_command(self.__req, json.dumps({"command": "API.RenameAttributeFolder", "parameters": RenameAttributeFolder_parameters(attributeFolder, newName).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-
-
-    def RenameNavigatorItem(self, navigatorItemId: NavigatorItemId, newName: Optional[str] = None, newId: Optional[str] = None):
+    @instrumentation.instrumented
+    async def RenameNavigatorItem(self, navigatorItemId: NavigatorItemId, newName: Optional[str] = None, newId: Optional[str] = None):
         """Renames an existing navigator item by specifying either the name or the ID, or both.
 
         Args:
@@ -1568,44 +1825,13 @@ class Commands:
             newId (:obj:`str`, optional): New ID of the navigator item.
 
         """
-        class RenameNavigatorItem_parameters1(_ACBaseType):
-            __slots__ = ("navigatorItemId", "newName", )
-            def __init__(self, navigatorItemId: NavigatorItemId, newName: str):
-                self.navigatorItemId: NavigatorItemId = navigatorItemId
-                self.newName: str = newName
-
-        RenameNavigatorItem_parameters1.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-        RenameNavigatorItem_parameters1.get_classinfo().add_field('newName', str)
 
-        class RenameNavigatorItem_parameters2(_ACBaseType):
-            __slots__ = ("navigatorItemId", "newId", )
-            def __init__(self, navigatorItemId: NavigatorItemId, newId: str):
-                self.navigatorItemId: NavigatorItemId = navigatorItemId
-                self.newId: str = newId
+        paramatersObject = _RenameNavigatorItem_parametersConstructUnion(navigatorItemId=navigatorItemId, newName=newName, newId=newId)
 
-        RenameNavigatorItem_parameters2.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-        RenameNavigatorItem_parameters2.get_classinfo().add_field('newId', str)
+        await self._post(codec.dumps({"command": "API.RenameNavigatorItem", "parameters": paramatersObject.to_dict()}))
 
-        class RenameNavigatorItem_parameters3(_ACBaseType):
-            __slots__ = ("navigatorItemId", "newName", "newId", )
-            def __init__(self, navigatorItemId: NavigatorItemId, newName: str, newId: str):
-                self.navigatorItemId: NavigatorItemId = navigatorItemId
-                self.newName: str = newName
-                self.newId: str = newId
-
-        RenameNavigatorItem_parameters3.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-        RenameNavigatorItem_parameters3.get_classinfo().add_field('newName', str)
-        RenameNavigatorItem_parameters3.get_classinfo().add_field('newId', str)
-
-        parametersConstructUnion = _ConstructUnion(Union[RenameNavigatorItem_parameters1, RenameNavigatorItem_parameters2, RenameNavigatorItem_parameters3])
-        paramatersObject = parametersConstructUnion(navigatorItemId=navigatorItemId, newName=newName, newId=newId)
-
-        result = post_command(self.__req, json.dumps({"command": "API.RenameNavigatorItem", "parameters": paramatersObject.to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-
-
-    def SetClassificationsOfElements(self, elementClassifications: List[ElementClassification]) -> List[ExecutionResult]:
+    @instrumentation.instrumented
+    async def SetClassificationsOfElements(self, elementClassifications: List[ElementClassification]) -> List[ExecutionResult]:
         """Sets the classifications of elements. In order to set the classification of an element to unclassified, omit the classificationItemId field.
 
         Args:
@@ -1615,20 +1841,13 @@ class Commands:
             :obj:`list` of :obj:`ExecutionResult`: A list of execution results.
 
         """
-        class SetClassificationsOfElements_parameters(_ACBaseType):
-            __slots__ = ("elementClassifications", )
-            def __init__(self, elementClassifications: List[ElementClassification]):
-                self.elementClassifications: List[ElementClassification] = elementClassifications
 
-        SetClassificationsOfElements_parameters.get_classinfo().add_field('elementClassifications', List[ElementClassification])
-
-        result = post_command(self.__req, json.dumps({"command": "API.SetClassificationsOfElements", "parameters": SetClassificationsOfElements_parameters(elementClassifications).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
-        executionResultsListBuilder = _ListBuilder(ExecutionResult)
+        result = await self._post(codec.dumps({"command": "API.SetClassificationsOfElements", "parameters": _SetClassificationsOfElements_parameters(elementClassifications).to_dict()}))
+        executionResultsListBuilder = _response_list_builder(ExecutionResult, self.trustResponses)
         return executionResultsListBuilder(result["result"]["executionResults"])
 
-    def SetLayoutSettings(self, layoutParameters: LayoutParameters, layoutNavigatorItemId: NavigatorItemId):
+    @instrumentation.instrumented
+    async def SetLayoutSettings(self, layoutParameters: LayoutParameters, layoutNavigatorItemId: NavigatorItemId):
         """Sets the parameters (settings) of the given layout.
 
         Args:
@@ -1636,21 +1855,11 @@ class Commands:
             layoutNavigatorItemId (:obj:`NavigatorItemId`): The identifier of a navigator item.
 
         """
-        class SetLayoutSettings_parameters(_ACBaseType):
-            __slots__ = ("layoutParameters", "layoutNavigatorItemId", )
-            def __init__(self, layoutParameters: LayoutParameters, layoutNavigatorItemId: NavigatorItemId):
-                self.layoutParameters: LayoutParameters = layoutParameters
-                self.layoutNavigatorItemId: NavigatorItemId = layoutNavigatorItemId
-
-        SetLayoutSettings_parameters.get_classinfo().add_field('layoutParameters', LayoutParameters)
-        SetLayoutSettings_parameters.get_classinfo().add_field('layoutNavigatorItemId', NavigatorItemId)
-
-        result = post_command(self.__req, json.dumps({"command": "API.SetLayoutSettings", "parameters": SetLayoutSettings_parameters(layoutParameters, layoutNavigatorItemId).to_dict()}))
-        if not result["succeeded"]:
-            raise UnsucceededCommandCall(result)
 
+        await self._post(codec.dumps({"command": "API.SetLayoutSettings", "parameters": _SetLayoutSettings_parameters(layoutParameters, layoutNavigatorItemId).to_dict()}))
 
-    def SetPropertyValuesOfElements(self, elementPropertyValues: List[ElementPropertyValue]) -> List[ExecutionResult]:
+    @instrumentation.instrumented
+    async def SetPropertyValuesOfElements(self, elementPropertyValues: List[ElementPropertyValue]) -> List[ExecutionResult]:
         """Sets the property values of elements.
 
         Args:
@@ -1660,16 +1869,83 @@ class Commands:
             :obj:`list` of :obj:`ExecutionResult`: A list of execution results.
 
         """
-        class SetPropertyValuesOfElements_parameters(_ACBaseType):
-            __slots__ = ("elementPropertyValues", )
-            def __init__(self, elementPropertyValues: List[ElementPropertyValue]):
-                self.elementPropertyValues: List[ElementPropertyValue] = elementPropertyValues
 
-        SetPropertyValuesOfElements_parameters.get_classinfo().add_field('elementPropertyValues', List[ElementPropertyValue])
+        result = await self._post(codec.dumps({"command": "API.SetPropertyValuesOfElements", "parameters": _SetPropertyValuesOfElements_parameters(elementPropertyValues).to_dict()}))
+        executionResultsListBuilder = _response_list_builder(ExecutionResult, self.trustResponses)
+        return executionResultsListBuilder(result["result"]["executionResults"])
+
+
+@_blocking_commands
+class Commands:
+    """Collection of the Archicad JSON interface commands
+
+    The element lists of GetPropertyValuesOfElements, Get2DBoundingBoxes, Get3DBoundingBoxes, GetClassificationsOfElements
+    and GetTypesOfElements are sent in chunks when ``chunkSize`` is set. The results of the chunks are returned in the order
+    of the input elements.
+
+    Attributes:
+        chunkSize (:obj:`int`, optional): The maximum number of elements sent in one request. Defaults to None, which sends every element in one request.
+        maxParallelChunks (:obj:`int`): The maximum number of chunks in flight at the same time. Defaults to 1.
+        trustResponses (:obj:`bool`, optional): Whether the results are constructed without validating them against the schema.
+            Defaults to None, which follows :obj:`archicad.builders.set_trust_responses`.
 
-        result = post_command(self.__req, json.dumps({"command": "API.SetPropertyValuesOfElements", "parameters": SetPropertyValuesOfElements_parameters(elementPropertyValues).to_dict()}))
+    """
+    def __init__(self, req: Request, chunkSize: Optional[int] = None, maxParallelChunks: int = 1, trustResponses: Optional[bool] = None):
+        assert req is not None
+        self.__req = req
+        self.chunkSize: Optional[int] = chunkSize
+        self.maxParallelChunks: int = maxParallelChunks
+        self.trustResponses: Optional[bool] = trustResponses
+
+    async def _post(self, body: bytes) -> Dict[str, Any]:
+        result = post_command(self.__req, body)
         if not result["succeeded"]:
             raise UnsucceededCommandCall(result)
-        executionResultsListBuilder = _ListBuilder(ExecutionResult)
-        return executionResultsListBuilder(result["result"]["executionResults"])
+        return result
+
+    def _post_in_chunks(self, items: list, chunkSize: Optional[int], createBody: Callable[[list], bytes]) -> AsyncIterator[Dict[str, Any]]:
+        return _blocking_iterator(_post_command_in_chunks(self.__req, items, chunkSize, self.maxParallelChunks, createBody))
+
+
+class AsyncCommands(_Commands):
+    """Collection of the Archicad JSON interface commands for asyncio
+
+    Every command is a coroutine. The commands of an instance share a pool of persistent connections,
+    so several commands can be in flight at the same time, e.g. when they are awaited with :obj:`asyncio.gather`.
+    Instances created for different ports can be used concurrently from the same event loop.
+
+    The element lists of the bulk commands are sent in chunks when ``chunkSize`` is set, as in :obj:`Commands`.
+
+    Args:
+        req (:obj:`Request`): The request addressing the Archicad instance.
+        pool (:obj:`AsyncHTTPConnectionPool`, optional): The connection pool to use. By default a new pool is created for the address of the request.
+
+    Attributes:
+        chunkSize (:obj:`int`, optional): The maximum number of elements sent in one request. Defaults to None, which sends every element in one request.
+        maxParallelChunks (:obj:`int`): The maximum number of chunks in flight at the same time. Defaults to 1.
+        trustResponses (:obj:`bool`, optional): Whether the results are constructed without validating them against the schema.
+            Defaults to None, which follows :obj:`archicad.builders.set_trust_responses`.
+
+    """
+    def __init__(self, req: Request, pool: Optional[transport.AsyncHTTPConnectionPool] = None, chunkSize: Optional[int] = None, maxParallelChunks: int = 1, trustResponses: Optional[bool] = None):
+        assert req is not None
+        self.__req = req
+        self.__pool = pool if pool is not None else transport.AsyncHTTPConnectionPool.from_request(req)
+        self.chunkSize: Optional[int] = chunkSize
+        self.maxParallelChunks: int = maxParallelChunks
+        self.trustResponses: Optional[bool] = trustResponses
+
+    async def __aenter__(self) -> 'AsyncCommands':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.__pool.close()
+
+    async def _post(self, body: bytes) -> Dict[str, Any]:
+        result = await async_post_command(self.__req, self.__pool, body)
+        if not result["succeeded"]:
+            raise UnsucceededCommandCall(result)
+        return result
 
+    def _post_in_chunks(self, items: list, chunkSize: Optional[int], createBody: Callable[[list], bytes]) -> AsyncIterator[Dict[str, Any]]:
+        return _async_post_command_in_chunks(self.__req, self.__pool, items, chunkSize, self.maxParallelChunks, createBody)
@@ -0,0 +1,151 @@
+"""Graphisoft
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import UUID
+
+from archicad import metadata
+from archicad.acbasetype import is_class
+
+
+_interning = False
+
+
+def set_interning(enabled: bool):
+    """Switches the interning of the GUID identifiers constructed from command results on or off.
+
+    While interning is on, the identifiers with the same type and GUID built from the results share one instance,
+    which is kept in :obj:`interned` until it is cleared. Shared instances must not be modified.
+    """
+    global _interning
+    _interning = enabled
+
+
+def interning() -> bool:
+    """Returns whether the GUID identifiers constructed from command results are interned."""
+    return _interning
+
+
+class InternTable:
+    """The shared instances of the GUID identifiers, keyed by type and GUID."""
+
+    def __init__(self):
+        self._by_string: Dict[Tuple[type, str], Any] = {}
+        self._by_uuid: Dict[Tuple[type, UUID], Any] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._by_uuid)
+
+    def get(self, typ: type, guid: str) -> Optional[Any]:
+        """Returns the interned identifier of the type with the GUID as it appears in a JSON object, or None."""
+        return self._by_string.get((typ, guid))
+
+    def add(self, guid: str, identifier: Any) -> Any:
+        """Interns the identifier built from the GUID string and returns the instance to use.
+
+        An identifier whose GUID was interned with a different spelling, e.g. in lower case, is merged with it.
+        """
+        typ = type(identifier)
+        with self._lock:
+            identifier = self._by_uuid.setdefault((typ, identifier.guid), identifier)
+            self._by_string[(typ, guid)] = identifier
+        return identifier
+
+    def clear(self):
+        with self._lock:
+            self._by_string.clear()
+            self._by_uuid.clear()
+
+
+interned = InternTable()
+
+
+GUID_IDENTIFIER_TYPES: Tuple[type, ...] = ()
+
+
+def install_guid_identifiers(*types: type):
+    """Lets the instances of the identifier types holding only a GUID be interned."""
+    global GUID_IDENTIFIER_TYPES
+    GUID_IDENTIFIER_TYPES += types
+
+
+def _is_identifier(cls: type) -> bool:
+    return cls.__name__.endswith(('Id', 'IdArrayItem'))
+
+
+def compile_identity(cls: type) -> Tuple[Callable[[Any, Any], bool], Callable[[Any], int]]:
+    """Generates the ``__eq__`` and ``__hash__`` methods of a type comparing and hashing the values of its fields.
+
+    The generated methods read the fields directly instead of building the dict representation of the objects.
+    List fields are hashed as tuples. Objects of different types are never equal.
+    """
+    kinds = {field.name: field.kind for field in metadata.fields_of(cls)}
+    values = []
+    for name in cls.__slots__:
+        if kinds.get(name) == metadata.LIST:
+            values.append(f'(None if self.{name} is None else tuple(self.{name}))')
+        else:
+            values.append(f'self.{name}')
+    comparison = ' and '.join(f'self.{name} == other.{name}' for name in cls.__slots__) or 'True'
+    hashed = values[0] if len(values) == 1 else f'({", ".join(values)},)'
+    lines = ['def __eq__(self, other):',
+             '    if type(other) is not type(self):',
+             '        return NotImplemented',
+             f'    return {comparison}',
+             'def __hash__(self):',
+             f'    return hash({hashed})']
+    namespace: Dict[str, Any] = {}
+    exec(compile('\n'.join(lines), f'<identity of {cls.__name__}>', 'exec'), namespace)
+    eq, hash_ = namespace['__eq__'], namespace['__hash__']
+    eq.__qualname__ = f'{cls.__name__}.__eq__'
+    hash_.__qualname__ = f'{cls.__name__}.__hash__'
+    return eq, hash_
+
+
+def _install_identity(cls: type):
+    cls.__eq__, cls.__hash__ = compile_identity(cls)
+
+
+def _compiling_eq(self, other: Any) -> bool:
+    _install_identity(type(self))
+    return self == other
+
+
+def _compiling_hash(self) -> int:
+    _install_identity(type(self))
+    return hash(self)
+
+
+def install_identifiers(namespace: Dict[str, Any]):
+    """Makes the ``*Id`` and ``*IdArrayItem`` types defined in a module comparable and hashable by the values of their fields.
+
+    The methods of a type are generated the first time one of its objects is compared or hashed.
+    Identifiers used as dict keys or set items must not be modified.
+
+    Args:
+        namespace (:obj:`dict`): The globals of the module defining the types.
+
+    """
+    moduleName = namespace['__name__']
+    for obj in list(namespace.values()):
+        if is_class(obj) and obj.__module__ == moduleName and metadata.type_kind(obj) == metadata.CLASS and _is_identifier(obj):
+            obj.__eq__ = _compiling_eq
+            obj.__hash__ = _compiling_hash
+
+
+def interning_builder(typ: type, build: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wraps a builder of a GUID identifier type so that it returns the interned instances while interning is on."""
+    by_string = interned._by_string
+
+    def build_interned(value):
+        if _interning and type(value) is dict and len(value) == 1:
+            guid = value.get('guid')
+            if type(guid) is str:
+                identifier = by_string.get((typ, guid))
+                if identifier is None:
+                    identifier = interned.add(guid, build(value))
+                return identifier
+        return build(value)
+    return build_interned
@@ -0,0 +1,423 @@
+"""Graphisoft
+"""
+
+import abc
+import bisect
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class CommandMetrics:
+    """The measurements of one call of a command method.
+
+    The times are in seconds. The build time is the time spent in the method which is not spent serializing,
+    waiting for Archicad or decoding JSON, so it mostly measures the construction of the result objects.
+    When chunks are posted in parallel the phases overlap, so their sum can exceed the total time.
+
+    Attributes:
+        method (:obj:`str`): The name of the called method.
+        command (:obj:`str`): The name of the posted command, e.g. ``API.GetAllElements``.
+        serialize_time (:obj:`float`): The time of building the parameters and encoding the request as JSON.
+        round_trip_time (:obj:`float`): The time between sending the requests and receiving the responses.
+        decode_time (:obj:`float`): The time of decoding the JSON responses.
+        build_time (:obj:`float`): The remaining time of the method.
+        total_time (:obj:`float`): The time spent in the method.
+        request_bytes (:obj:`int`): The size of the request bodies.
+        response_bytes (:obj:`int`): The size of the response bodies.
+        requests (:obj:`int`): The number of posted requests.
+        succeeded (:obj:`bool`): False if the method raised an exception.
+
+    """
+
+    __slots__ = ('method', 'command', 'serialize_time', 'round_trip_time', 'decode_time', 'build_time', 'total_time',
+                 'request_bytes', 'response_bytes', 'requests', 'succeeded', '_mark', '_lock')
+
+    def __init__(self, method: str):
+        self.method = method
+        self.command: Optional[str] = None
+        self.serialize_time = 0.0
+        self.round_trip_time = 0.0
+        self.decode_time = 0.0
+        self.build_time = 0.0
+        self.total_time = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.requests = 0
+        self.succeeded = True
+        self._mark: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def add_serialize_time(self, seconds: float):
+        with self._lock:
+            self.serialize_time += seconds
+
+    def serialized_since_start(self):
+        """Counts the time from the start of the method as serialization when the first request of a method is posted."""
+        with self._lock:
+            if self._mark is not None:
+                self.serialize_time += time.perf_counter() - self._mark
+                self._mark = None
+
+    def stop_serialize_timer(self):
+        """Stops counting the time from the start of the method as serialization, for methods measuring it explicitly."""
+        with self._lock:
+            self._mark = None
+
+    def add_exchange(self, command: Optional[str], request_bytes: int, response_bytes: int, round_trip_time: float, decode_time: float):
+        with self._lock:
+            if self.command is None:
+                self.command = command
+            self.request_bytes += request_bytes
+            self.response_bytes += response_bytes
+            self.round_trip_time += round_trip_time
+            self.decode_time += decode_time
+            self.requests += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if not name.startswith('_')}
+
+
+class MetricsSink(abc.ABC):
+    """The interface of the receivers of command metrics. Sinks are called on the thread which called the command."""
+
+    @abc.abstractmethod
+    def record(self, metrics: CommandMetrics):
+        pass
+
+
+_sinks: List[MetricsSink] = []
+_current: contextvars.ContextVar = contextvars.ContextVar('archicad_command_metrics', default=None)
+
+
+def add_sink(sink: MetricsSink):
+    """Starts reporting the metrics of every command call to the sink."""
+    if sink not in _sinks:
+        _sinks.append(sink)
+
+
+def remove_sink(sink: MetricsSink):
+    """Stops reporting metrics to the sink."""
+    if sink in _sinks:
+        _sinks.remove(sink)
+
+
+def current() -> Optional[CommandMetrics]:
+    """Returns the metrics of the command call in progress, or None when no sink is registered."""
+    return _current.get()
+
+
+_COMMAND_NAME = re.compile(rb'\{\s*"command"\s*:\s*"([^"]*)"')
+
+
+def command_name(body: bytes) -> Optional[str]:
+    """Returns the command name of a request body encoded by the commands."""
+    match = _COMMAND_NAME.match(body, 0, 128)
+    return match.group(1).decode('UTF-8') if match else None
+
+
+def _start(method: str) -> Tuple[CommandMetrics, Any]:
+    metrics = CommandMetrics(method)
+    metrics._mark = time.perf_counter()
+    return metrics, _current.set(metrics)
+
+
+def _finish(metrics: CommandMetrics):
+    metrics.build_time = max(0.0, metrics.total_time - metrics.serialize_time - metrics.round_trip_time - metrics.decode_time)
+    for sink in list(_sinks):
+        try:
+            sink.record(metrics)
+        except Exception:
+            logging.getLogger(__name__).exception('Failed to record the metrics of %s', metrics.method)
+
+
+def instrumented(func: Callable) -> Callable:
+    """Decorates a command method to report its metrics to the registered sinks.
+
+    Works with plain and async methods and with generators. Generators are measured only while they run,
+    the time spent by the consumer between two items is not counted.
+    """
+    name = func.__name__
+
+    if inspect.isasyncgenfunction(func):
+        @functools.wraps(func)
+        async def async_generator_wrapper(*args, **kwargs):
+            if not _sinks:
+                async for item in func(*args, **kwargs):
+                    yield item
+                return
+            metrics = CommandMetrics(name)
+            metrics._mark = time.perf_counter()
+            generator = func(*args, **kwargs)
+            try:
+                while True:
+                    token = _current.set(metrics)
+                    start = time.perf_counter()
+                    try:
+                        item = await generator.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    except BaseException:
+                        metrics.succeeded = False
+                        raise
+                    finally:
+                        metrics.total_time += time.perf_counter() - start
+                        _current.reset(token)
+                    yield item
+            finally:
+                _finish(metrics)
+        return async_generator_wrapper
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def coroutine_wrapper(*args, **kwargs):
+            if not _sinks:
+                return await func(*args, **kwargs)
+            metrics, token = _start(name)
+            start = metrics._mark
+            try:
+                return await func(*args, **kwargs)
+            except BaseException:
+                metrics.succeeded = False
+                raise
+            finally:
+                metrics.total_time = time.perf_counter() - start
+                _current.reset(token)
+                _finish(metrics)
+        return coroutine_wrapper
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            if not _sinks:
+                yield from func(*args, **kwargs)
+                return
+            metrics = CommandMetrics(name)
+            metrics._mark = time.perf_counter()
+            generator = func(*args, **kwargs)
+            try:
+                while True:
+                    token = _current.set(metrics)
+                    start = time.perf_counter()
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        break
+                    except BaseException:
+                        metrics.succeeded = False
+                        raise
+                    finally:
+                        metrics.total_time += time.perf_counter() - start
+                        _current.reset(token)
+                    yield item
+            finally:
+                generator.close()
+                _finish(metrics)
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _sinks:
+            return func(*args, **kwargs)
+        metrics, token = _start(name)
+        start = metrics._mark
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            metrics.succeeded = False
+            raise
+        finally:
+            metrics.total_time = time.perf_counter() - start
+            _current.reset(token)
+            _finish(metrics)
+    return wrapper
+
+
+class LoggingSink(MetricsSink):
+    """Logs one line for every command call.
+
+    Args:
+        logger (:obj:`logging.Logger`, optional): The logger to use. Defaults to the logger of this module.
+        level (:obj:`int`, optional): The level of the log records. Defaults to ``logging.INFO``.
+
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def record(self, metrics: CommandMetrics):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, '%s (%s): total %.1f ms, serialize %.1f ms, round trip %.1f ms, decode %.1f ms, build %.1f ms, '
+                            'requests %d, sent %d B, received %d B%s',
+                            metrics.method, metrics.command, metrics.total_time * 1e3, metrics.serialize_time * 1e3,
+                            metrics.round_trip_time * 1e3, metrics.decode_time * 1e3, metrics.build_time * 1e3,
+                            metrics.requests, metrics.request_bytes, metrics.response_bytes, '' if metrics.succeeded else ', failed')
+
+
+DEFAULT_TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_SIZE_BUCKETS = (1e3, 1e4, 1e5, 1e6, 1e7, 1e8)
+
+TIME_PHASES = ('serialize_time', 'round_trip_time', 'decode_time', 'build_time', 'total_time')
+SIZE_PHASES = ('request_bytes', 'response_bytes')
+
+
+class Histogram:
+    """A cumulative histogram with fixed bucket bounds, in the style of Prometheus.
+
+    Attributes:
+        bounds (:obj:`tuple` of :obj:`float`): The upper bounds of the buckets, without the implicit +Inf bucket.
+        counts (:obj:`list` of :obj:`int`): The number of observations in each bucket, the last one is the +Inf bucket.
+        count (:obj:`int`): The number of observations.
+        sum (:obj:`float`): The sum of the observations.
+
+    """
+
+    __slots__ = ('bounds', 'counts', 'count', 'sum')
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> List[int]:
+        result, total = [], 0
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Returns the upper bound of the bucket containing the q-quantile, or +Inf."""
+        rank = q * self.count
+        for bound, cumulative in zip(self.bounds + (float('inf'),), self.cumulative_counts()):
+            if cumulative >= rank and cumulative > 0:
+                return bound
+        return float('inf')
+
+
+class HistogramSink(MetricsSink):
+    """Collects the metrics in memory into a histogram per command and phase.
+
+    Args:
+        time_buckets (:obj:`tuple` of :obj:`float`, optional): The bucket bounds of the times in seconds.
+        size_buckets (:obj:`tuple` of :obj:`float`, optional): The bucket bounds of the payload sizes in bytes.
+
+    """
+
+    def __init__(self, time_buckets: Sequence[float] = DEFAULT_TIME_BUCKETS, size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS):
+        self.time_buckets = tuple(time_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+        self.failures: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, metrics: CommandMetrics):
+        command = metrics.command or metrics.method
+        with self._lock:
+            for phase in TIME_PHASES + SIZE_PHASES:
+                histogram = self.histograms.get((command, phase))
+                if histogram is None:
+                    histogram = self.histograms[(command, phase)] = Histogram(self.time_buckets if phase in TIME_PHASES else self.size_buckets)
+                histogram.observe(getattr(metrics, phase))
+            if not metrics.succeeded:
+                self.failures[command] = self.failures.get(command, 0) + 1
+
+    def histogram(self, command: str, phase: str) -> Optional[Histogram]:
+        """Returns the histogram of a phase of a command, e.g. ``histogram('API.GetAllElements', 'round_trip_time')``."""
+        return self.histograms.get((command, phase))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Returns the number of calls and the mean of every phase per command."""
+        with self._lock:
+            result: Dict[str, Dict[str, float]] = {}
+            for (command, phase), histogram in self.histograms.items():
+                entry = result.setdefault(command, {'calls': histogram.count, 'failures': self.failures.get(command, 0)})
+                entry[phase] = histogram.sum / histogram.count if histogram.count else 0.0
+            return result
+
+    def clear(self):
+        with self._lock:
+            self.histograms.clear()
+            self.failures.clear()
+
+
+def _prometheus_float(value: float) -> str:
+    return '+Inf' if value == float('inf') else repr(float(value))
+
+
+def _prometheus_label(value: str) -> str:
+    """Escapes a label value as the Prometheus text format requires."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class PrometheusTextFileSink(HistogramSink):
+    """Collects histograms like :obj:`HistogramSink` and writes them to a file in the Prometheus text format,
+    e.g. for the textfile collector of the node exporter.
+
+    The file is replaced atomically, at most once per ``interval`` seconds, and when :obj:`write` is called.
+
+    Args:
+        path (:obj:`str`): The path of the file.
+        interval (:obj:`float`, optional): The minimum number of seconds between two writes. Defaults to 10.
+        prefix (:obj:`str`, optional): The prefix of the metric names. Defaults to ``archicad_command``.
+
+    """
+
+    def __init__(self, path: str, interval: float = 10.0, prefix: str = 'archicad_command', **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.interval = interval
+        self.prefix = prefix
+        self._last_write: Optional[float] = None
+        # serializes the interval check and the writes of the threads calling record
+        self._write_lock = threading.RLock()
+
+    def record(self, metrics: CommandMetrics):
+        super().record(metrics)
+        with self._write_lock:
+            now = time.monotonic()
+            if self._last_write is None or now - self._last_write >= self.interval:
+                self._last_write = now
+                self.write()
+
+    def render(self) -> str:
+        """Returns the collected histograms in the Prometheus text format."""
+        lines = []
+        with self._lock:
+            for phase in TIME_PHASES + SIZE_PHASES:
+                name = f'{self.prefix}_{phase[:-len("_time")]}_seconds' if phase in TIME_PHASES else f'{self.prefix}_{phase}'
+                lines.append(f'# TYPE {name} histogram')
+                for (command, histogramPhase), histogram in sorted(self.histograms.items()):
+                    if histogramPhase != phase:
+                        continue
+                    label = _prometheus_label(command)
+                    for bound, cumulative in zip(histogram.bounds + (float('inf'),), histogram.cumulative_counts()):
+                        lines.append(f'{name}_bucket{{command="{label}",le="{_prometheus_float(bound)}"}} {cumulative}')
+                    lines.append(f'{name}_sum{{command="{label}"}} {_prometheus_float(histogram.sum)}')
+                    lines.append(f'{name}_count{{command="{label}"}} {histogram.count}')
+            name = f'{self.prefix}_failures_total'
+            lines.append(f'# TYPE {name} counter')
+            for command, failures in sorted(self.failures.items()):
+                lines.append(f'{name}{{command="{_prometheus_label(command)}"}} {failures}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self):
+        """Writes the collected histograms to the file."""
+        with self._write_lock:
+            temporary = f'{self.path}.{os.getpid()}.tmp'
+            with open(temporary, 'w') as f:
+                f.write(self.render())
+            os.replace(temporary, self.path)
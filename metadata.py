@@ -0,0 +1,301 @@
+"""Graphisoft
+"""
+
+import ast
+import os
+import re
+import sys
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+from uuid import UUID
+
+from archicad import validators
+from archicad.acbasetype import _ACBaseType, _ClassInfo, _ACUnionType, is_class, is_generic_list, is_union
+
+
+# the kinds of the field types
+SCALAR = 'scalar'
+FLOAT = 'float'
+UUID_ = 'uuid'
+CLASS = 'class'
+UNION_CLASS = 'union_class'
+UNION = 'union'
+LIST = 'list'
+UNTYPED = 'untyped'
+OTHER = 'other'
+
+_SCALAR_TYPES = (str, int, bool)
+
+
+class Missing:
+    """The default of the required fields."""
+
+    def __repr__(self):
+        return 'MISSING'
+
+
+MISSING = Missing()
+
+
+class FieldMetadata(NamedTuple):
+    """The static description of a field of a type, in the order of the parameters of its constructor."""
+    name: str
+    type: Any
+    kind: str
+    required: bool
+    default: Any
+    validators: Tuple[Callable[[Any], bool], ...]
+    item_type: Any
+    item_kind: Optional[str]
+    allowed_values: Optional[Tuple[Any, ...]]
+
+
+_kinds: Dict[Any, str] = {}
+_fields: Dict[type, Tuple[FieldMetadata, ...]] = {}
+
+
+def type_kind(typ: Any) -> str:
+    """Returns the kind of a field type. The kind of a type is looked up once."""
+    kind = _kinds.get(typ)
+    if kind is None:
+        if typ is None:
+            return UNTYPED
+        if typ in _SCALAR_TYPES:
+            kind = SCALAR
+        elif typ is float:
+            kind = FLOAT
+        elif typ is UUID:
+            kind = UUID_
+        elif is_generic_list(typ):
+            kind = LIST
+        elif is_union(typ):
+            kind = UNION
+        # the lookup in __mro__ spares the issubclass check against the abstract base classes
+        elif is_class(typ) and _ACUnionType in typ.__mro__:
+            kind = UNION_CLASS
+        elif is_class(typ) and _ACBaseType in typ.__mro__:
+            kind = CLASS
+        else:
+            kind = OTHER
+        _kinds[typ] = kind
+    return kind
+
+
+def fields_of(cls: type) -> Tuple[FieldMetadata, ...]:
+    """Returns the fields of a type with their declared types, defaults and validators.
+
+    The table is computed from the constructor and the classinfo of the type the first time it is needed, and it
+    holds only tuples, so the compiled builders, serializers and identity methods read it instead of inspecting the
+    signature and the field types of the type again.
+    """
+    fields = _fields.get(cls)
+    if fields is None:
+        fields = _fields[cls] = _compute_fields(cls)
+    return fields
+
+
+def _compute_fields(cls: type) -> Tuple[FieldMetadata, ...]:
+    classinfo = cls.get_classinfo()
+    code = cls.__init__.__code__
+    names = code.co_varnames[1:code.co_argcount]
+    defaults = cls.__init__.__defaults__ or ()
+    firstOptional = len(names) - len(defaults)
+    allowedValues = classinfo.allowed_values if isinstance(classinfo, _DeclaredClassInfo) else {}
+    fields = []
+    for i, name in enumerate(names):
+        fieldType = None if name == 'addOnCommandParameters' else classinfo.fields.get(name)
+        kind = type_kind(fieldType)
+        itemType = fieldType.__args__[0] if kind == LIST else None
+        fields.append(FieldMetadata(name, fieldType, kind, i < firstOptional, MISSING if i < firstOptional else defaults[i - firstOptional],
+                                    classinfo.value_validators.get(name, ()), itemType, None if itemType is None else type_kind(itemType),
+                                    allowedValues.get(name)))
+    return tuple(fields)
+
+
+# The field tables of the releases declare the fields of the types with plain literals instead of add_field calls:
+# ('TypeName', (('fieldName', TYPE, VALIDATOR, ...), ...)), where TYPE is the name of a type or ('List' | 'Optional' | 'Union', TYPE, ...),
+# and VALIDATOR is the name of a function of archicad.validators followed by its arguments, e.g. ('maximum', 255, False).
+FieldSpec = Tuple[Any, ...]
+TableEntry = Tuple[str, Tuple[FieldSpec, ...]]
+
+_BUILTIN_TYPES = {'str': str, 'int': int, 'float': float, 'bool': bool, 'UUID': UUID}
+_GENERIC_TYPES = {'List': lambda args: List[args[0]], 'Optional': lambda args: Optional[args[0]], 'Union': lambda args: Union[args]}
+_VALIDATORS = ('value_set', 'matches', 'min_length', 'max_length', 'multiple_of', 'minimum', 'maximum',
+               'listitem_validator', 'min_items', 'max_items', 'unique_items')
+
+
+def resolve_type(spec: Any, namespace: Dict[str, Any]) -> Any:
+    """Returns the field type described by a type of a field table, looking up the type names in the namespace."""
+    if isinstance(spec, str):
+        return _BUILTIN_TYPES[spec] if spec in _BUILTIN_TYPES else namespace[spec]
+    return _GENERIC_TYPES[spec[0]](tuple(resolve_type(arg, namespace) for arg in spec[1:]))
+
+
+def resolve_validator(spec: Tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Returns the validator described by a validator of a field table."""
+    name, args = spec[0], spec[1:]
+    if name == 'listitem_validator':
+        args = tuple(resolve_validator(arg) for arg in args)
+    return getattr(validators, name)(*args)
+
+
+class _DeclaredClassInfo(_ClassInfo):
+    """The classinfo of a type declared in a field table. Its fields are resolved the first time they are used.
+
+    Besides the fields and validators of :obj:`_ClassInfo`, it records the values of the fields restricted by a
+    ``value_set`` validator in ``allowed_values``.
+    """
+
+    def __init__(self, declarations: Tuple[FieldSpec, ...], namespace: Dict[str, Any]):
+        self.instance_validators = ()
+        self._declarations = declarations
+        self._namespace = namespace
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in ('fields', 'value_validators', 'allowed_values'):
+            raise AttributeError(name)
+        classinfo = _ClassInfo()
+        allowedValues: Dict[str, Tuple[Any, ...]] = {}
+        for fieldName, typeSpec, *validatorSpecs in self._declarations:
+            classinfo.add_field(fieldName, resolve_type(typeSpec, self._namespace), *(resolve_validator(spec) for spec in validatorSpecs))
+            for spec in validatorSpecs:
+                if spec[0] == 'value_set':
+                    allowedValues[fieldName] = tuple(spec[1])
+        # the fields are assigned last, so a concurrent first use either resolves them again or finds all of them complete
+        self.allowed_values = allowedValues
+        self.value_validators = classinfo.value_validators
+        self.fields = classinfo.fields
+        return getattr(self, name)
+
+
+def install_classinfo(namespace: Dict[str, Any], table: Tuple[TableEntry, ...]):
+    """Declares the fields of the types defined in a module from its field table, like the ``add_field`` calls of the classinfo.
+
+    The field types and the validators of a type are resolved the first time its classinfo is used.
+
+    Args:
+        namespace (:obj:`dict`): The globals of the module defining the types.
+        table (:obj:`tuple`): The field table of the module.
+
+    """
+    for typeName, fields in table:
+        namespace[typeName]._class_info = _DeclaredClassInfo(fields, namespace)
+
+
+class TypeNamespace(type):
+    """The metaclass of the ``Types`` namespaces of the releases.
+
+    The names listed in the ``_names`` of a namespace are looked up in the module of the namespace the first time
+    they are accessed, so the namespace does not have to bind every type when the module is imported.
+    """
+
+    def __getattr__(cls, name: str) -> Any:
+        if name.startswith('__') or name not in cls.__dict__.get('_names', ()):
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        value = getattr(sys.modules[cls.__module__], name)
+        setattr(cls, name, value)
+        return value
+
+    def __dir__(cls) -> List[str]:
+        return sorted(set(super().__dir__()) | set(cls.__dict__.get('_names', ())))
+
+
+class LazyTypes(metaclass=TypeNamespace):
+    """The base of the ``Types`` namespaces of the releases, whose instances look up the types of their class."""
+
+    _names: Tuple[str, ...] = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(type(self), name)
+
+    def __dir__(self) -> List[str]:
+        return dir(type(self))
+
+
+def _literal_spec(node: ast.expr) -> Any:
+    if isinstance(node, ast.Call):
+        return (node.func.id,) + tuple(_literal_spec(arg) for arg in node.args)
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return tuple(_literal_spec(item) for item in node.elts)
+    return ast.literal_eval(node)
+
+
+def _type_spec(node: ast.expr) -> Any:
+    if isinstance(node, ast.Name):
+        return node.id
+    args = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+    return (node.value.id,) + tuple(_type_spec(arg) for arg in args)
+
+
+def extract_declarations(source: str) -> Tuple[Tuple[TableEntry, ...], str]:
+    """Moves the ``add_field`` calls of a generated module into a field table.
+
+    Returns:
+        :obj:`tuple`: The field table of the calls and the source of the module without them.
+    """
+    table: Dict[str, List[FieldSpec]] = {}
+    removed = set()
+    for statement in ast.parse(source).body:
+        call = statement.value if isinstance(statement, ast.Expr) else None
+        if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute) and call.func.attr == 'add_field'):
+            continue
+        typeName = call.func.value.func.value.id
+        name, fieldType, *fieldValidators = call.args
+        assert all(isinstance(v, ast.Call) and v.func.id in _VALIDATORS for v in fieldValidators), ast.dump(call)
+        table.setdefault(typeName, []).append((ast.literal_eval(name), _type_spec(fieldType)) + tuple(_literal_spec(v) for v in fieldValidators))
+        removed.update(range(statement.lineno - 1, statement.end_lineno))
+    newline = '\r\n' if '\r\n' in source else '\n'
+    lines = [line for i, line in enumerate(source.split(newline)) if i not in removed]
+    stripped = re.sub(f'({newline}){{4,}}', newline * 3, newline.join(lines))
+    return tuple((typeName, tuple(fields)) for typeName, fields in table.items()), stripped
+
+
+def render_table(tables: Dict[str, Tuple[TableEntry, ...]], newline: str = '\n') -> str:
+    """Returns the source of a field table module defining the given tables."""
+    lines = ['"""The fields of the types and of the command parameters of a release, declared with plain literals.',
+             '',
+             'Generated by ``python -m archicad.metadata`` from the add_field calls of the generated modules, do not edit.',
+             '"""']
+    for tableName, table in tables.items():
+        lines += ['', '', f'{tableName} = (']
+        for typeName, fields in table:
+            lines.append(f'    ({typeName!r}, (')
+            lines += [f'        {field!r},' for field in fields]
+            lines.append('    )),')
+        lines.append(')')
+    return newline.join(lines) + newline
+
+
+def _read_tables(path: str) -> Dict[str, Tuple[TableEntry, ...]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, newline='') as f:
+        module = ast.parse(f.read())
+    return {statement.targets[0].id: ast.literal_eval(statement.value) for statement in module.body if isinstance(statement, ast.Assign)}
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Moves the add_field calls of the generated modules of a release into its field table. '
+                                                 'The table of a module is named after the module, e.g. TYPES for b3000types.py, and it is kept '
+                                                 'as it is when the module has no add_field calls, so the table can be regenerated at any time.')
+    parser.add_argument('table', help='the path of the field table module, e.g. b3000classdata.py')
+    parser.add_argument('modules', nargs='+', help='the paths of the generated modules, e.g. b3000types.py b3000commands.py')
+    args = parser.parse_args()
+    tables = _read_tables(args.table)
+    newline = '\n'
+    for path in args.modules:
+        with open(path, newline='') as f:
+            source = f.read()
+        if '\r\n' in source:
+            newline = '\r\n'
+        table, stripped = extract_declarations(source)
+        if table:
+            tables[re.sub(r'^b\d+', '', os.path.splitext(os.path.basename(path))[0]).upper()] = table
+            with open(path, 'w', newline='') as f:
+                f.write(stripped)
+    with open(args.table, 'w', newline='') as f:
+        f.write(render_table(tables, newline))
+
+
+if __name__ == '__main__':
+    main()
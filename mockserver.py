@@ -0,0 +1,723 @@
+"""Graphisoft
+"""
+
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any, Dict, List, Optional, Tuple
+
+
+_ELEMENT = 1
+_PROPERTY = 2
+_PROPERTY_GROUP = 3
+_CLASSIFICATION_SYSTEM = 4
+_CLASSIFICATION_ITEM = 5
+_NAVIGATOR_ITEM = 6
+_ATTRIBUTE = 7
+_CREATED = 8
+
+ELEMENT_TYPES = ('Wall', 'Column', 'Beam', 'Slab', 'Window', 'Door', 'Object', 'Zone')
+PROPERTY_TYPES = ('length', 'area', 'volume', 'number', 'integer', 'boolean', 'string', 'singleEnum', 'multiEnum', 'angle')
+BUILT_IN_PROPERTY_NAMES = ('General_ElementID', 'General_Thickness', 'General_Height', 'General_Width', 'General_Length')
+ATTRIBUTE_TYPES = ('BuildingMaterial', 'Composite', 'Fill', 'Layer', 'LayerCombination', 'Line', 'PenTable', 'Profile', 'Surface', 'ZoneCategory')
+NAVIGATOR_TREE_TYPES = ('ProjectMap', 'ViewMap', 'MyViewMap', 'LayoutBook', 'PublisherSets')
+_NAVIGATOR_LEAF_TYPES = ('StoryItem', 'SectionItem', 'ElevationItem', 'WorksheetItem', 'DetailItem')
+_ENUM_VALUE_COUNT = 3
+
+
+def _guid(kind: int, index: int) -> str:
+    return str(uuid.UUID(int=(kind << 96) | index)).upper()
+
+
+def _index_of(guid: str, kind: int) -> Optional[int]:
+    try:
+        value = uuid.UUID(guid).int
+    except (ValueError, AttributeError, TypeError):
+        return None
+    return value & ((1 << 96) - 1) if value >> 96 == kind else None
+
+
+def _error(code: int, message: str) -> Dict[str, Any]:
+    return {'error': {'code': code, 'message': message}}
+
+
+class CommandError(Exception):
+    """Raised by the handlers of :obj:`SyntheticModel` to make the command call unsuccessful."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class SyntheticModel:
+    """A deterministic, generated Archicad model which answers the commands of the JSON interface.
+
+    Each command is answered by the method of the same name, called with the parameters of the command as keyword arguments.
+    The elements, properties, classifications, navigator trees and attributes are generated from their indices, so
+    models of any size can be created cheaply. Commands whose results are not modeled return error items, or fail
+    when they have no items.
+
+    Args:
+        element_count (:obj:`int`, optional): The number of elements. Defaults to 1000.
+        property_count (:obj:`int`, optional): The number of properties, including the built-in ones. Defaults to 30.
+        classification_system_count (:obj:`int`, optional): The number of classification systems. Defaults to 2.
+        classification_depth (:obj:`int`, optional): The depth of the classification trees. Defaults to 3.
+        classification_branching (:obj:`int`, optional): The number of children of the classification items. Defaults to 4.
+        navigator_depth (:obj:`int`, optional): The depth of the navigator trees. Defaults to 3.
+        navigator_branching (:obj:`int`, optional): The number of children of the navigator items. Defaults to 4.
+        attribute_count (:obj:`int`, optional): The number of attributes of each attribute type. Defaults to 10.
+        string_length (:obj:`int`, optional): The minimum length of string property values, to produce large payloads. Defaults to 0.
+
+    """
+
+    def __init__(self, element_count: int = 1000, property_count: int = 30,
+                 classification_system_count: int = 2, classification_depth: int = 3, classification_branching: int = 4,
+                 navigator_depth: int = 3, navigator_branching: int = 4, attribute_count: int = 10, string_length: int = 0):
+        self.element_count = element_count
+        self.property_count = property_count
+        self.classification_system_count = classification_system_count
+        self.classification_depth = classification_depth
+        self.classification_branching = classification_branching
+        self.navigator_depth = navigator_depth
+        self.navigator_branching = navigator_branching
+        self.attribute_count = attribute_count
+        self.string_length = string_length
+        self._property_values: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self._classifications: Dict[Tuple[int, int], Optional[int]] = {}
+        self._lock = threading.Lock()
+        self._created = 0
+
+        self._classification_items: Dict[int, Tuple[int, Dict[str, Any]]] = {}
+        self._classification_trees = [self._classification_tree(system) for system in range(classification_system_count)]
+        self._leaf_items = [[index for index, (s, item) in self._classification_items.items() if s == system and 'children' not in item]
+                            for system in range(classification_system_count)]
+        self._navigator_items: Dict[int, str] = {}
+        self._navigator_trees = {treeType: self._navigator_tree(t, treeType) for t, treeType in enumerate(NAVIGATOR_TREE_TYPES)}
+
+    # Generated content
+
+    def _element_type(self, element: int) -> str:
+        return ELEMENT_TYPES[element % len(ELEMENT_TYPES)]
+
+    def _element(self, element: int) -> Dict[str, Any]:
+        return {'elementId': {'guid': _guid(_ELEMENT, element)}}
+
+    def _element_index(self, item: Dict[str, Any]) -> Optional[int]:
+        index = _index_of(item.get('elementId', {}).get('guid'), _ELEMENT)
+        return index if index is not None and index < self.element_count else None
+
+    def _bounding_box(self, element: int) -> Tuple[float, float, float, float, float, float]:
+        x, y, z = (element % 100) * 2.0, (element // 100 % 100) * 2.0, (element // 10000) * 3.0
+        return x, y, z, x + 1.0 + element % 3 * 0.25, y + 1.0, z + 2.5
+
+    def _is_built_in(self, prop: int) -> bool:
+        return prop < min(len(BUILT_IN_PROPERTY_NAMES), self.property_count // 2)
+
+    def _property_type(self, prop: int) -> str:
+        if self._is_built_in(prop):
+            return 'string' if prop == 0 else 'length'
+        return PROPERTY_TYPES[prop % len(PROPERTY_TYPES)]
+
+    def _property_index(self, item: Dict[str, Any]) -> Optional[int]:
+        index = _index_of(item.get('propertyId', {}).get('guid'), _PROPERTY)
+        return index if index is not None and index < self.property_count else None
+
+    def _property_group(self, prop: int) -> int:
+        return 0 if self._is_built_in(prop) else 1 + prop % 3
+
+    def _property_group_name(self, group: int) -> str:
+        return 'General' if group == 0 else f'Group {group}'
+
+    def _enum_value_id(self, value: int) -> Dict[str, Any]:
+        return {'type': 'nonLocalizedValue', 'nonLocalizedValue': f'V{value}'}
+
+    def _property_definition(self, prop: int) -> Dict[str, Any]:
+        group = self._property_group(prop)
+        propertyType = self._property_type(prop)
+        definition = {
+            'propertyId': {'guid': _guid(_PROPERTY, prop)},
+            'group': {'propertyGroupId': {'guid': _guid(_PROPERTY_GROUP, group)}, 'name': self._property_group_name(group)},
+            'name': BUILT_IN_PROPERTY_NAMES[prop] if self._is_built_in(prop) else f'Property {prop}',
+            'description': '',
+            'isEditable': not self._is_built_in(prop),
+            'type': propertyType,
+        }
+        if propertyType in ('singleEnum', 'multiEnum'):
+            definition['possibleEnumValues'] = [{'enumValue': {'enumValueId': self._enum_value_id(value), 'displayValue': f'Value {value}', 'nonLocalizedValue': f'V{value}'}}
+                                                for value in range(_ENUM_VALUE_COUNT)]
+        return definition
+
+    def _property_value(self, element: int, prop: int) -> Dict[str, Any]:
+        override = self._property_values.get((element, prop))
+        if override is not None:
+            return override
+        propertyType = self._property_type(prop)
+        if (element + prop) % 29 == 0:
+            return {'type': propertyType, 'status': 'userUndefined'}
+        if (element * 7 + prop) % 31 == 0:
+            return {'type': propertyType, 'status': 'notAvailable'}
+        if propertyType in ('length', 'area', 'volume', 'number', 'angle'):
+            value = round((element % 50) * 0.1 + prop * 0.01, 6)
+        elif propertyType == 'integer':
+            value = element * prop % 1000
+        elif propertyType == 'boolean':
+            value = (element + prop) % 2 == 0
+        elif propertyType == 'string':
+            value = f'E{element}-P{prop}'.ljust(self.string_length, '_')
+        elif propertyType == 'singleEnum':
+            value = self._enum_value_id((element + prop) % _ENUM_VALUE_COUNT)
+        else:
+            value = [{'enumValueId': self._enum_value_id(v)} for v in range(1 + (element + prop) % _ENUM_VALUE_COUNT)]
+        return {'type': propertyType, 'status': 'normal', 'value': value}
+
+    def _classification_tree(self, system: int) -> List[Dict[str, Any]]:
+        def items(prefix: str, depth: int) -> List[Dict[str, Any]]:
+            result = []
+            for b in range(self.classification_branching):
+                index = len(self._classification_items)
+                code = f'{prefix}.{b + 1}' if prefix else f'{system + 1}.{b + 1}'
+                item = {'classificationItemId': {'guid': _guid(_CLASSIFICATION_ITEM, index)}, 'id': code, 'name': f'Item {code}', 'description': ''}
+                self._classification_items[index] = (system, item)
+                if depth > 1:
+                    item['children'] = [{'classificationItem': child} for child in items(code, depth - 1)]
+                result.append(item)
+            return result
+        return items('', self.classification_depth)
+
+    def _classification_item_index(self, item: Dict[str, Any]) -> Optional[int]:
+        index = _index_of(item.get('classificationItemId', {}).get('guid'), _CLASSIFICATION_ITEM)
+        return index if index in self._classification_items else None
+
+    def _classification_system(self, system: int) -> Dict[str, Any]:
+        return {'classificationSystemId': {'guid': _guid(_CLASSIFICATION_SYSTEM, system)}, 'name': f'System {system + 1}',
+                'description': '', 'source': '', 'version': '1.0', 'date': '2022-01-01'}
+
+    def _classification_system_index(self, item: Dict[str, Any]) -> Optional[int]:
+        index = _index_of(item.get('classificationSystemId', {}).get('guid'), _CLASSIFICATION_SYSTEM)
+        return index if index is not None and index < self.classification_system_count else None
+
+    def _classification_of(self, element: int, system: int) -> Optional[int]:
+        key = (element, system)
+        if key in self._classifications:
+            return self._classifications[key]
+        leaves = self._leaf_items[system]
+        return leaves[element % len(leaves)] if leaves else None
+
+    def _navigator_tree(self, t: int, treeType: str) -> Dict[str, Any]:
+        layoutBook = treeType == 'LayoutBook'
+
+        def item(path: str, depth: int) -> Dict[str, Any]:
+            index = len(self._navigator_items)
+            if not path:
+                itemType = 'LayoutBookRootItem' if layoutBook else 'ProjectMapRootItem'
+            elif depth > 1:
+                itemType = 'SubsetItem' if layoutBook else 'FolderItem'
+            else:
+                itemType = 'LayoutItem' if layoutBook else _NAVIGATOR_LEAF_TYPES[index % len(_NAVIGATOR_LEAF_TYPES)]
+            self._navigator_items[index] = itemType
+            result = {'navigatorItemId': {'guid': _guid(_NAVIGATOR_ITEM, index)}, 'prefix': path, 'name': f'{treeType} {path}'.strip(), 'type': itemType}
+            if depth > 0:
+                result['children'] = [{'navigatorItem': item(f'{path}{b + 1}.', depth - 1)} for b in range(self.navigator_branching)]
+            return result
+        return {'rootItem': item('', self.navigator_depth)}
+
+    def _attribute_type_of(self, item: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+        index = _index_of(item.get('attributeId', {}).get('guid'), _ATTRIBUTE)
+        if index is None or index >> 32 >= len(ATTRIBUTE_TYPES) or index & 0xFFFFFFFF >= self.attribute_count:
+            return None
+        return ATTRIBUTE_TYPES[index >> 32], index & 0xFFFFFFFF
+
+    def _new_guid(self) -> str:
+        with self._lock:
+            self._created += 1
+            return _guid(_CREATED, self._created)
+
+    @staticmethod
+    def _not_modeled(items: List[Any]) -> List[Dict[str, Any]]:
+        return [_error(-2130312312, 'Not modeled by the mock server') for _ in items]
+
+    @staticmethod
+    def _succeeded(items: List[Any]) -> List[Dict[str, Any]]:
+        return [{'success': True} for _ in items]
+
+    # Commands
+
+    def IsAlive(self) -> Dict[str, Any]:
+        return {'isAlive': True}
+
+    def GetProductInfo(self) -> Dict[str, Any]:
+        return {'version': 26, 'buildNumber': 3000, 'languageCode': 'INT'}
+
+    def IsAddOnCommandAvailable(self, addOnCommandId: Dict[str, Any]) -> Dict[str, Any]:
+        return {'available': False}
+
+    def ExecuteAddOnCommand(self, addOnCommandId: Dict[str, Any], addOnCommandParameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        raise CommandError(-2130313112, 'Add-on commands are not available on the mock server')
+
+    def GetAllElements(self) -> Dict[str, Any]:
+        return {'elements': [self._element(element) for element in range(self.element_count)]}
+
+    def GetSelectedElements(self, onlyEditable: Optional[bool] = None) -> Dict[str, Any]:
+        return {'elements': [self._element(element) for element in range(0, self.element_count, 10)]}
+
+    def GetElementsByType(self, elementType: str) -> Dict[str, Any]:
+        return {'elements': [self._element(element) for element in range(self.element_count) if self._element_type(element) == elementType]}
+
+    def GetTypesOfElements(self, elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+        result = []
+        for item in elements:
+            element = self._element_index(item)
+            result.append(_error(-2130313112, 'Element not found') if element is None else
+                          {'typeOfElement': {'elementId': item['elementId'], 'elementType': self._element_type(element)}})
+        return {'typesOfElements': result}
+
+    def GetElementsRelatedToZones(self, zones: List[Dict[str, Any]], elementTypes: Optional[List[str]] = None) -> Dict[str, Any]:
+        result = []
+        for item in zones:
+            zone = self._element_index(item)
+            if zone is None or self._element_type(zone) != 'Zone':
+                result.append(_error(-2130313112, 'Zone not found'))
+                continue
+            related = range(zone - len(ELEMENT_TYPES) + 1, zone)
+            result.append({'elements': [self._element(element) for element in related
+                                        if element >= 0 and (elementTypes is None or self._element_type(element) in elementTypes)]})
+        return {'elementsRelatedToZones': result}
+
+    def Get2DBoundingBoxes(self, elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+        result = []
+        for item in elements:
+            element = self._element_index(item)
+            if element is None:
+                result.append(_error(-2130313112, 'Element not found'))
+            else:
+                xMin, yMin, _, xMax, yMax, _ = self._bounding_box(element)
+                result.append({'boundingBox2D': {'xMin': xMin, 'yMin': yMin, 'xMax': xMax, 'yMax': yMax}})
+        return {'boundingBoxes2D': result}
+
+    def Get3DBoundingBoxes(self, elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+        result = []
+        for item in elements:
+            element = self._element_index(item)
+            if element is None:
+                result.append(_error(-2130313112, 'Element not found'))
+            else:
+                box = self._bounding_box(element)
+                result.append({'boundingBox3D': dict(zip(('xMin', 'yMin', 'zMin', 'xMax', 'yMax', 'zMax'), box))})
+        return {'boundingBoxes3D': result}
+
+    def GetComponentsOfElements(self, elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {'componentsOfElements': [{'elementComponents': []} if self._element_index(item) is not None else _error(-2130313112, 'Element not found')
+                                         for item in elements]}
+
+    def GetAllPropertyIds(self, propertyType: Optional[str] = None) -> Dict[str, Any]:
+        return {'propertyIds': [{'propertyId': {'guid': _guid(_PROPERTY, prop)}} for prop in range(self.property_count)
+                                if propertyType is None or (propertyType == 'BuiltIn') == self._is_built_in(prop)]}
+
+    def GetAllPropertyNames(self) -> Dict[str, Any]:
+        properties = []
+        for prop in range(self.property_count):
+            definition = self._property_definition(prop)
+            if self._is_built_in(prop):
+                properties.append({'type': 'BuiltIn', 'nonLocalizedName': definition['name']})
+            else:
+                properties.append({'type': 'UserDefined', 'localizedName': [definition['group']['name'], definition['name']]})
+        return {'properties': properties}
+
+    def GetPropertyIds(self, properties: List[Dict[str, Any]]) -> Dict[str, Any]:
+        names = {}
+        for prop in range(self.property_count):
+            definition = self._property_definition(prop)
+            key = definition['name'] if self._is_built_in(prop) else (definition['group']['name'], definition['name'])
+            names[key] = prop
+        result = []
+        for item in properties:
+            key = item.get('nonLocalizedName') if item.get('type') == 'BuiltIn' else tuple(item.get('localizedName', ()))
+            prop = names.get(key)
+            result.append(_error(-2130313112, 'Property not found') if prop is None else {'propertyId': {'guid': _guid(_PROPERTY, prop)}})
+        return {'properties': result}
+
+    def GetAllPropertyIdsOfElements(self, elements: List[Dict[str, Any]], propertyType: Optional[str] = None) -> Dict[str, Any]:
+        propertyIds = self.GetAllPropertyIds(propertyType)['propertyIds']
+        return {'propertyIdsOfElements': [{'propertyIdsOfElement': {'elementId': item['elementId'], 'propertyIds': propertyIds}}
+                                          if self._element_index(item) is not None else _error(-2130313112, 'Element not found')
+                                          for item in elements]}
+
+    def GetDetailsOfProperties(self, properties: List[Dict[str, Any]]) -> Dict[str, Any]:
+        result = []
+        for item in properties:
+            prop = self._property_index(item)
+            result.append(_error(-2130313112, 'Property not found') if prop is None else {'propertyDefinition': self._property_definition(prop)})
+        return {'propertyDefinitions': result}
+
+    def GetAllPropertyGroupIds(self, propertyType: Optional[str] = None) -> Dict[str, Any]:
+        groups = sorted({self._property_group(prop) for prop in range(self.property_count)
+                         if propertyType is None or (propertyType == 'BuiltIn') == self._is_built_in(prop)})
+        return {'propertyGroupIds': [{'propertyGroupId': {'guid': _guid(_PROPERTY_GROUP, group)}} for group in groups]}
+
+    def GetPropertyGroups(self, propertyGroupIds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        result = []
+        for item in propertyGroupIds:
+            group = _index_of(item.get('propertyGroupId', {}).get('guid'), _PROPERTY_GROUP)
+            result.append(_error(-2130313112, 'Property group not found') if group is None or group > 3 else
+                          {'propertyGroup': {'propertyGroupId': item['propertyGroupId'], 'name': self._property_group_name(group)}})
+        return {'propertyGroups': result}
+
+    def GetPropertyValuesOfElements(self, elements: List[Dict[str, Any]], properties: List[Dict[str, Any]]) -> Dict[str, Any]:
+        props = [self._property_index(item) for item in properties]
+        result = []
+        for item in elements:
+            element = self._element_index(item)
+            if element is None:
+                result.append(_error(-2130313112, 'Element not found'))
+                continue
+            result.append({'propertyValues': [_error(-2130313112, 'Property not found') if prop is None else {'propertyValue': self._property_value(element, prop)}
+                                              for prop in props]})
+        return {'propertyValuesForElements': result}
+
+    def GetPropertyValuesOfElementComponents(self, elementComponents: List[Dict[str, Any]], properties: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {'propertyValuesForElementComponents': self._not_modeled(elementComponents)}
+
+    def SetPropertyValuesOfElements(self, elementPropertyValues: List[Dict[str, Any]]) -> Dict[str, Any]:
+        result = []
+        for item in elementPropertyValues:
+            element, prop = self._element_index(item), self._property_index(item)
+            if element is None or prop is None or self._is_built_in(prop):
+                result.append({'success': False, 'error': {'code': -2130313112, 'message': 'Property value cannot be set'}})
+            else:
+                with self._lock:
+                    self._property_values[(element, prop)] = item['propertyValue']
+                result.append({'success': True})
+        return {'executionResults': result}
+
+    def GetPropertyDefinitionAvailability(self, propertyIds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        result = []
+        for item in propertyIds:
+            prop = self._property_index(item)
+            if prop is None:
+                result.append(_error(-2130313112, 'Property not found'))
+                continue
+            available = [] if self._is_built_in(prop) else [{'classificationItemId': tree['classificationItemId']} for tree in self._classification_trees[0]] if self._classification_trees else []
+            result.append({'propertyDefinitionAvailability': {'propertyId': item['propertyId'], 'availableClassifications': available}})
+        return {'propertyDefinitionAvailabilityList': result}
+
+    def GetClassificationItemAvailability(self, classificationItemIds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        available = [{'propertyId': {'guid': _guid(_PROPERTY, prop)}} for prop in range(self.property_count) if not self._is_built_in(prop)]
+        return {'classificationItemAvailabilityList': [{'classificationItemAvailability': {'classificationItemId': item['classificationItemId'], 'availableProperties': available}}
+                                                       if self._classification_item_index(item) is not None else _error(-2130313112, 'Classification item not found')
+                                                       for item in classificationItemIds]}
+
+    def GetAllClassificationSystems(self) -> Dict[str, Any]:
+        return {'classificationSystems': [self._classification_system(system) for system in range(self.classification_system_count)]}
+
+    def GetClassificationSystemIds(self) -> Dict[str, Any]:
+        return {'classificationSystemIds': [{'classificationSystemId': {'guid': _guid(_CLASSIFICATION_SYSTEM, system)}} for system in range(self.classification_system_count)]}
+
+    def GetClassificationSystems(self, classificationSystemIds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        result = []
+        for item in classificationSystemIds:
+            system = self._classification_system_index(item)
+            result.append(_error(-2130313112, 'Classification system not found') if system is None else {'classificationSystem': self._classification_system(system)})
+        return {'classificationSystems': result}
+
+    def GetAllClassificationsInSystem(self, classificationSystemId: Dict[str, Any]) -> Dict[str, Any]:
+        system = self._classification_system_index({'classificationSystemId': classificationSystemId})
+        if system is None:
+            raise CommandError(-2130313112, 'Classification system not found')
+        return {'classificationItems': [{'classificationItem': item} for item in self._classification_trees[system]]}
+
+    def GetDetailsOfClassificationItems(self, classificationItemIds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        result = []
+        for item in classificationItemIds:
+            index = self._classification_item_index(item)
+            if index is None:
+                result.append(_error(-2130313112, 'Classification item not found'))
+            else:
+                details = self._classification_items[index][1]
+                result.append({'classificationItem': {key: details[key] for key in ('classificationItemId', 'id', 'name', 'description')}})
+        return {'classificationItems': result}
+
+    def GetClassificationsOfElements(self, elements: List[Dict[str, Any]], classificationSystemIds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        systems = [self._classification_system_index(item) for item in classificationSystemIds]
+        result = []
+        for item in elements:
+            element = self._element_index(item)
+            if element is None:
+                result.append(_error(-2130313112, 'Element not found'))
+                continue
+            classificationIds = []
+            for systemId, system in zip(classificationSystemIds, systems):
+                if system is None:
+                    classificationIds.append(_error(-2130313112, 'Classification system not found'))
+                    continue
+                classificationId = {'classificationSystemId': systemId['classificationSystemId']}
+                index = self._classification_of(element, system)
+                if index is not None:
+                    classificationId['classificationItemId'] = {'guid': _guid(_CLASSIFICATION_ITEM, index)}
+                classificationIds.append({'classificationId': classificationId})
+            result.append({'classificationIds': classificationIds})
+        return {'elementClassifications': result}
+
+    def GetElementsByClassification(self, classificationItemId: Dict[str, Any]) -> Dict[str, Any]:
+        index = self._classification_item_index({'classificationItemId': classificationItemId})
+        if index is None:
+            raise CommandError(-2130313112, 'Classification item not found')
+        system = self._classification_items[index][0]
+        return {'elements': [self._element(element) for element in range(self.element_count) if self._classification_of(element, system) == index]}
+
+    def SetClassificationsOfElements(self, elementClassifications: List[Dict[str, Any]]) -> Dict[str, Any]:
+        result = []
+        for item in elementClassifications:
+            element = self._element_index(item)
+            system = self._classification_system_index(item.get('classificationId', {}))
+            if element is None or system is None:
+                result.append({'success': False, 'error': {'code': -2130313112, 'message': 'Element or classification system not found'}})
+                continue
+            classificationItemId = item['classificationId'].get('classificationItemId')
+            with self._lock:
+                self._classifications[(element, system)] = None if classificationItemId is None else self._classification_item_index({'classificationItemId': classificationItemId})
+            result.append({'success': True})
+        return {'executionResults': result}
+
+    def GetNavigatorItemTree(self, navigatorTreeId: Dict[str, Any]) -> Dict[str, Any]:
+        tree = self._navigator_trees.get(navigatorTreeId.get('type'))
+        if tree is None:
+            raise CommandError(-2130313112, 'Navigator tree not found')
+        return {'navigatorTree': tree}
+
+    def GetNavigatorItemsType(self, navigatorItemIds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        result = []
+        for item in navigatorItemIds:
+            index = _index_of(item.get('navigatorItemId', {}).get('guid'), _NAVIGATOR_ITEM)
+            itemType = self._navigator_items.get(index)
+            result.append(_error(-2130313112, 'Navigator item not found') if itemType is None else
+                          {'navigatorItemIdAndType': {'navigatorItemId': item['navigatorItemId'], 'navigatorItemType': itemType}})
+        return {'navigatorItemIdAndTypeList': result}
+
+    def GetBuiltInContainerNavigatorItems(self, navigatorItemIds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {'navigatorItems': self._not_modeled(navigatorItemIds)}
+
+    GetDetailNavigatorItems = GetBuiltInContainerNavigatorItems
+    GetDocument3DNavigatorItems = GetBuiltInContainerNavigatorItems
+    GetElevationNavigatorItems = GetBuiltInContainerNavigatorItems
+    GetInteriorElevationNavigatorItems = GetBuiltInContainerNavigatorItems
+    GetSectionNavigatorItems = GetBuiltInContainerNavigatorItems
+    GetStoryNavigatorItems = GetBuiltInContainerNavigatorItems
+    GetWorksheetNavigatorItems = GetBuiltInContainerNavigatorItems
+
+    def GetPublisherSetNames(self) -> Dict[str, Any]:
+        return {'publisherSetNames': ['Publisher Set 1']}
+
+    def CloneProjectMapItemToViewMap(self, projectMapNavigatorItemId: Dict[str, Any], parentNavigatorItemId: Dict[str, Any]) -> Dict[str, Any]:
+        return {'createdNavigatorItemId': {'guid': self._new_guid()}}
+
+    def CreateLayout(self, layoutName: str, layoutParameters: Dict[str, Any], masterNavigatorItemId: Dict[str, Any], parentNavigatorItemId: Dict[str, Any]) -> Dict[str, Any]:
+        return {'createdNavigatorItemId': {'guid': self._new_guid()}}
+
+    def CreateLayoutSubset(self, subsetParameters: Dict[str, Any], parentNavigatorItemId: Dict[str, Any]) -> Dict[str, Any]:
+        return {'createdSubsetId': {'guid': self._new_guid()}}
+
+    def CreateViewMapFolder(self, folderParameters: Dict[str, Any], parentNavigatorItemId: Optional[Dict[str, Any]] = None, previousNavigatorItemId: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {'createdFolderNavigatorItemId': {'guid': self._new_guid()}}
+
+    def DeleteNavigatorItems(self, navigatorItemIds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {'executionResults': self._succeeded(navigatorItemIds)}
+
+    def MoveNavigatorItem(self, navigatorItemIdToMove: Dict[str, Any], parentNavigatorItemId: Dict[str, Any], previousNavigatorItemId: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {}
+
+    def RenameNavigatorItem(self, navigatorItemId: Dict[str, Any], newName: Optional[str] = None, newId: Optional[str] = None) -> Dict[str, Any]:
+        return {}
+
+    def GetLayoutSettings(self, layoutNavigatorItemId: Dict[str, Any]) -> Dict[str, Any]:
+        raise CommandError(-2130313112, 'Layouts are not modeled by the mock server')
+
+    def SetLayoutSettings(self, layoutParameters: Dict[str, Any], layoutNavigatorItemId: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    def GetAttributesByType(self, attributeType: str) -> Dict[str, Any]:
+        if attributeType not in ATTRIBUTE_TYPES:
+            raise CommandError(-2130313112, 'Unknown attribute type')
+        t = ATTRIBUTE_TYPES.index(attributeType)
+        return {'attributeIds': [{'attributeId': {'guid': _guid(_ATTRIBUTE, t << 32 | i)}} for i in range(self.attribute_count)]}
+
+    def GetLayerAttributes(self, attributeIds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        result = []
+        for item in attributeIds:
+            attribute = self._attribute_type_of(item)
+            if attribute is None or attribute[0] != 'Layer':
+                result.append(_error(-2130313112, 'Layer not found'))
+            else:
+                result.append({'layerAttribute': {'attributeId': item['attributeId'], 'name': f'Layer {attribute[1]}', 'intersectionGroupNr': 1,
+                                                  'isLocked': False, 'isHidden': attribute[1] % 5 == 4, 'isWireframe': False}})
+        return {'attributes': result}
+
+    def GetActivePenTables(self) -> Dict[str, Any]:
+        penTable = {'attributeId': {'guid': _guid(_ATTRIBUTE, ATTRIBUTE_TYPES.index('PenTable') << 32)}}
+        return {'modelViewPenTableId': penTable, 'layoutBookPenTableId': penTable}
+
+    def GetBuildingMaterialAttributes(self, attributeIds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {'attributes': self._not_modeled(attributeIds)}
+
+    GetCompositeAttributes = GetBuildingMaterialAttributes
+    GetFillAttributes = GetBuildingMaterialAttributes
+    GetLayerCombinationAttributes = GetBuildingMaterialAttributes
+    GetLineAttributes = GetBuildingMaterialAttributes
+    GetPenTableAttributes = GetBuildingMaterialAttributes
+    GetProfileAttributes = GetBuildingMaterialAttributes
+    GetSurfaceAttributes = GetBuildingMaterialAttributes
+    GetZoneCategoryAttributes = GetBuildingMaterialAttributes
+
+    def GetProfileAttributePreview(self, attributeIds: List[Dict[str, Any]], imageWidth: int, imageHeight: int, backgroundColor: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {'previewImages': self._not_modeled(attributeIds)}
+
+    def DeleteAttributes(self, attributeIds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {'executionResults': self._succeeded(attributeIds)}
+
+    def CreateAttributeFolders(self, attributeFolders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {'executionResults': self._succeeded(attributeFolders)}
+
+    def DeleteAttributeFolders(self, attributeFolders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {'executionResults': self._succeeded(attributeFolders)}
+
+    def GetAttributeFolder(self, attributeFolder: Dict[str, Any]) -> Dict[str, Any]:
+        raise CommandError(-2130313112, 'Attribute folders are not modeled by the mock server')
+
+    def GetAttributeFolderContent(self, attributeFolder: Dict[str, Any]) -> Dict[str, Any]:
+        raise CommandError(-2130313112, 'Attribute folders are not modeled by the mock server')
+
+    def MoveAttributesAndFolders(self, folders: List[Dict[str, Any]], attributeIds: List[Dict[str, Any]], targetFolder: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    def RenameAttributeFolder(self, attributeFolder: Dict[str, Any], newName: str) -> Dict[str, Any]:
+        return {}
+
+
+class _MockArchicadHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        server: MockArchicadServer = self.server
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        reply = json.dumps(server.answer(body)).encode('UTF-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, *args):
+        pass
+
+
+class MockArchicadServer(ThreadingMixIn, HTTPServer):
+    """A local HTTP server which answers the commands of the Archicad JSON interface from a :obj:`SyntheticModel`.
+
+    The server can be used as a context manager, which starts it on a background thread and shuts it down on exit.
+
+    Args:
+        model (:obj:`SyntheticModel`, optional): The model which answers the commands. Defaults to a model with the default sizes.
+        host (:obj:`str`, optional): The host name to listen on. Defaults to 127.0.0.1.
+        port (:obj:`int`, optional): The port to listen on. Defaults to a free port.
+        latency (:obj:`float`, optional): The number of seconds every command is delayed by. Defaults to 0.
+        error_rate (:obj:`float`, optional): The probability of a command call being answered as unsuccessful. Defaults to 0.
+        seed (:obj:`int`, optional): The seed of the random generator of the injected errors. Defaults to 0.
+
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, model: Optional[SyntheticModel] = None, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, error_rate: float = 0.0, seed: int = 0):
+        super().__init__((host, port), _MockArchicadHandler)
+        self.model = model or SyntheticModel()
+        self.latency = latency
+        self.error_rate = error_rate
+        self.command_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.server_address[0]}:{self.port}'
+
+    def answer(self, body: bytes) -> Dict[str, Any]:
+        """Returns the response of the JSON interface to a posted command."""
+        with self._lock:
+            self.command_count += 1
+            injectError = self.error_rate > 0.0 and self._random.random() < self.error_rate
+        if self.latency > 0.0:
+            time.sleep(self.latency)
+        try:
+            command = json.loads(body)
+            name = command['command']
+        except (ValueError, KeyError, TypeError):
+            return {'succeeded': False, 'error': {'code': -2130313111, 'message': 'Invalid command'}}
+        if injectError:
+            return {'succeeded': False, 'error': {'code': -2130313110, 'message': 'Injected error'}}
+        handler = getattr(self.model, name[len('API.'):], None) if name.startswith('API.') else None
+        if handler is None or name[len('API.'):].startswith('_'):
+            return {'succeeded': False, 'error': {'code': -2130313111, 'message': f'Unknown command: {name}'}}
+        try:
+            result = handler(**command.get('parameters', {}))
+        except CommandError as e:
+            return {'succeeded': False, 'error': {'code': e.code, 'message': e.message}}
+        except (TypeError, KeyError, AttributeError) as e:
+            return {'succeeded': False, 'error': {'code': -2130313111, 'message': f'Invalid parameters: {e}'}}
+        return {'succeeded': True, 'result': result}
+
+    def start(self) -> 'MockArchicadServer':
+        """Starts serving on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving and closes the socket."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self) -> 'MockArchicadServer':
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Runs a mock Archicad JSON interface server with a synthetic model.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=19723)
+    parser.add_argument('--elements', type=int, default=1000)
+    parser.add_argument('--properties', type=int, default=30)
+    parser.add_argument('--string-length', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+    model = SyntheticModel(element_count=args.elements, property_count=args.properties, string_length=args.string_length)
+    server = MockArchicadServer(model, args.host, args.port, latency=args.latency, error_rate=args.error_rate)
+    print(f'Serving a synthetic model on {server.url}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""Graphisoft
+"""
+
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+class NavigatorTreeIndex:
+    """A flat index over the items of a navigator tree for constant time lookups and traversal steps.
+
+    The items are stored in depth-first order in :obj:`items`, so the descendants of an item are the items between its
+    position and :obj:`subtree_ends` of its position. :obj:`parents` and :obj:`depths` hold the position of the parent
+    (-1 for the root) and the depth of every item. The items are looked up by their ``navigatorItemId``, ``type``,
+    ``name`` and ``prefix`` through dicts.
+
+    The index is a snapshot of the tree it was built from. Build a new one after the navigator changes.
+
+    Args:
+        root (:obj:`NavigatorItem`): The root item of the tree, e.g. the ``rootItem`` of a :obj:`NavigatorTree`.
+
+    """
+
+    def __init__(self, root: Any):
+        self.items: List[Any] = []
+        self.parents: List[int] = []
+        self.depths: List[int] = []
+        self.subtree_ends: List[int] = []
+        self._children: List[List[int]] = []
+        self._positions: Dict[Hashable, int] = {}
+        self._by_type: Dict[str, List[int]] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_prefix: Dict[str, List[int]] = {}
+        self._build(root)
+
+    def _build(self, root: Any):
+        # the stack holds (item, parent position) pairs; the sentinel None closes the subtree of a position
+        stack: List[Tuple[Any, int]] = [(root, -1)]
+        while stack:
+            item, parent = stack.pop()
+            if item is None:
+                self.subtree_ends[parent] = len(self.items)
+                continue
+            position = len(self.items)
+            self.items.append(item)
+            self.parents.append(parent)
+            self.depths.append(0 if parent < 0 else self.depths[parent] + 1)
+            self.subtree_ends.append(position + 1)
+            self._children.append([])
+            if parent >= 0:
+                self._children[parent].append(position)
+            self._positions[item.navigatorItemId] = position
+            self._by_type.setdefault(item.type, []).append(position)
+            self._by_name.setdefault(item.name, []).append(position)
+            self._by_prefix.setdefault(item.prefix, []).append(position)
+            children = item.children
+            if children:
+                stack.append((None, position))
+                stack.extend((child.navigatorItem, position) for child in reversed(children))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, navigatorItemId: Hashable) -> bool:
+        return navigatorItemId in self._positions
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    @property
+    def root(self) -> Any:
+        return self.items[0]
+
+    def position(self, navigatorItemId: Hashable) -> int:
+        """Returns the position of the item in :obj:`items`.
+
+        Raises:
+            KeyError: When the tree has no item with the identifier.
+        """
+        return self._positions[navigatorItemId]
+
+    def get(self, navigatorItemId: Hashable) -> Optional[Any]:
+        """Returns the item with the identifier, or None if the tree has no such item."""
+        position = self._positions.get(navigatorItemId)
+        return None if position is None else self.items[position]
+
+    def parent(self, navigatorItemId: Hashable) -> Optional[Any]:
+        """Returns the parent of the item, or None for the root."""
+        parent = self.parents[self._positions[navigatorItemId]]
+        return None if parent < 0 else self.items[parent]
+
+    def children(self, navigatorItemId: Hashable) -> List[Any]:
+        """Returns the children of the item in the order of the tree."""
+        items = self.items
+        return [items[child] for child in self._children[self._positions[navigatorItemId]]]
+
+    def ancestors(self, navigatorItemId: Hashable) -> Iterator[Any]:
+        """Yields the ancestors of the item from its parent up to the root."""
+        parents = self.parents
+        position = parents[self._positions[navigatorItemId]]
+        while position >= 0:
+            yield self.items[position]
+            position = parents[position]
+
+    def descendants(self, navigatorItemId: Hashable) -> List[Any]:
+        """Returns the descendants of the item in depth-first order."""
+        position = self._positions[navigatorItemId]
+        return self.items[position + 1:self.subtree_ends[position]]
+
+    def depth(self, navigatorItemId: Hashable) -> int:
+        """Returns the depth of the item. The depth of the root is 0."""
+        return self.depths[self._positions[navigatorItemId]]
+
+    def path(self, navigatorItemId: Hashable) -> List[Any]:
+        """Returns the items from the root down to the item."""
+        path = list(self.ancestors(navigatorItemId))
+        path.reverse()
+        path.append(self.items[self._positions[navigatorItemId]])
+        return path
+
+    def is_ancestor(self, ancestorId: Hashable, navigatorItemId: Hashable) -> bool:
+        """Returns whether the first item is a proper ancestor of the second one."""
+        ancestor = self._positions[ancestorId]
+        return ancestor < self._positions[navigatorItemId] < self.subtree_ends[ancestor]
+
+    def of_type(self, type: str) -> List[Any]:
+        """Returns the items of the navigator item type, e.g. ``LayoutItem``, in depth-first order."""
+        items = self.items
+        return [items[position] for position in self._by_type.get(type, ())]
+
+    def named(self, name: str, prefix: Optional[str] = None) -> List[Any]:
+        """Returns the items with the name, and with the prefix if it is given, in depth-first order."""
+        items = self.items
+        return [items[position] for position in self._by_name.get(name, ()) if prefix is None or items[position].prefix == prefix]
+
+    def with_prefix(self, prefix: str) -> List[Any]:
+        """Returns the items with the prefix, e.g. the ID of a layout, in depth-first order."""
+        items = self.items
+        return [items[position] for position in self._by_prefix.get(prefix, ())]
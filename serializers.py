@@ -0,0 +1,88 @@
+"""Graphisoft
+"""
+
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from archicad import metadata
+from archicad.acbasetype import _ACBaseType, is_class
+
+
+def _deserialize(value: Any) -> Any:
+    """The generic conversion of a field value of :obj:`_ACBaseType.to_dict`, used for the fields whose type is not known ahead."""
+    if isinstance(value, _ACBaseType):
+        return value.to_dict()
+    if isinstance(value, UUID):
+        return str(value).upper()
+    if isinstance(value, list):
+        return [_deserialize(item) for item in value]
+    return value
+
+
+_OBJECT_KINDS = (metadata.CLASS, metadata.UNION_CLASS)
+
+
+def _field_expression(field: Optional[metadata.FieldMetadata]) -> str:
+    """Returns the expression converting the value ``v`` of a field to its JSON representation."""
+    kind = metadata.UNTYPED if field is None else field.kind
+    if kind in (metadata.SCALAR, metadata.FLOAT):
+        return 'v'
+    if kind == metadata.UUID_:
+        return 'str(v).upper() if type(v) is UUID else v'
+    if kind in _OBJECT_KINDS:
+        return 'v.to_dict()'
+    if kind == metadata.LIST:
+        if field.item_kind in (metadata.SCALAR, metadata.FLOAT):
+            return 'list(v)'
+        if field.item_kind == metadata.UUID_:
+            return '[str(item).upper() for item in v]'
+        if field.item_kind in _OBJECT_KINDS:
+            return '[item.to_dict() for item in v]'
+        return '[_deserialize(item) for item in v]'
+    return '_deserialize(v)'
+
+
+def compile_to_dict(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Generates the ``to_dict`` method of a type from its fields.
+
+    The generated method returns the same dictionary as the generic :obj:`_ACBaseType.to_dict`, but it reads
+    the fields directly and converts each of them by its declared type.
+    """
+    fields = {field.name: field for field in metadata.fields_of(cls)}
+    lines = ['def to_dict(self):', '    result = {}']
+    for name in cls.__slots__:
+        lines.append(f'    v = self.{name}')
+        lines.append('    if v is not None:')
+        lines.append(f'        result[{name!r}] = {_field_expression(fields.get(name))}')
+    lines.append('    return result')
+    namespace = {'UUID': UUID, '_deserialize': _deserialize}
+    exec(compile('\n'.join(lines), f'<to_dict of {cls.__name__}>', 'exec'), namespace)
+    to_dict = namespace['to_dict']
+    to_dict.__qualname__ = f'{cls.__name__}.to_dict'
+    to_dict.__doc__ = _ACBaseType.to_dict.__doc__
+    return to_dict
+
+
+def _compiling_to_dict(self) -> Dict[str, Any]:
+    """Returns the dict representation of the object.
+    """
+    cls = type(self)
+    to_dict = compile_to_dict(cls)
+    cls.to_dict = to_dict
+    return to_dict(self)
+
+
+def install_serializers(namespace: Dict[str, Any]):
+    """Replaces the generic ``to_dict`` of the types defined in a module by generated ones.
+
+    A type's serializer is generated the first time one of its objects is serialized.
+
+    Args:
+        namespace (:obj:`dict`): The globals of the module defining the types.
+
+    """
+    moduleName = namespace['__name__']
+    for obj in list(namespace.values()):
+        if is_class(obj) and obj.__module__ == moduleName and metadata.type_kind(obj) == metadata.CLASS:
+            obj.to_dict = _compiling_to_dict
+
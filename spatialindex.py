@@ -0,0 +1,236 @@
+"""Graphisoft
+"""
+
+import heapq
+import math
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+Box = Tuple[float, float, float, float, float, float]
+Point = Tuple[float, float, float]
+Cell = Tuple[int, int, int]
+
+MAX_CELLS_PER_BOX = 512
+
+
+def _intersects(a: Box, b: Box) -> bool:
+    return a[0] <= b[3] and b[0] <= a[3] and a[1] <= b[4] and b[1] <= a[4] and a[2] <= b[5] and b[2] <= a[5]
+
+
+def _contains(box: Box, point: Point) -> bool:
+    return box[0] <= point[0] <= box[3] and box[1] <= point[1] <= box[4] and box[2] <= point[2] <= box[5]
+
+
+def _distance(box: Box, point: Point) -> float:
+    dx = max(box[0] - point[0], 0.0, point[0] - box[3])
+    dy = max(box[1] - point[1], 0.0, point[1] - box[4])
+    dz = max(box[2] - point[2], 0.0, point[2] - box[5])
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
+class SpatialIndex:
+    """A uniform grid over axis-aligned 3D boxes for sub-linear overlap, containment and nearest neighbour queries.
+
+    Each box is registered in the grid cells it overlaps. Boxes which would overlap more than :obj:`MAX_CELLS_PER_BOX` cells
+    are kept in a separate list which is checked by every query.
+
+    Args:
+        cell_size (:obj:`float`, optional): The edge length of the grid cells. Defaults to the average largest extent of the boxes passed to :obj:`build`.
+
+    """
+
+    def __init__(self, cell_size: Optional[float] = None):
+        self.cell_size = cell_size
+        self._automatic_cell_size = cell_size is None
+        self._boxes: Dict[Hashable, Box] = {}
+        self._values: Dict[Hashable, Any] = {}
+        self._cells: Dict[Cell, Set[Hashable]] = {}
+        self._oversized: Set[Hashable] = set()
+        self._bounds: Optional[Tuple[List[int], List[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._boxes
+
+    @staticmethod
+    def _default_cell_size(boxes: List[Box]) -> float:
+        if not boxes:
+            return 1.0
+        size = sum(max(b[3] - b[0], b[4] - b[1], b[5] - b[2]) for b in boxes) / len(boxes)
+        if size > 0.0:
+            return size
+        extent = max(max(b[3] for b in boxes) - min(b[0] for b in boxes),
+                     max(b[4] for b in boxes) - min(b[1] for b in boxes),
+                     max(b[5] for b in boxes) - min(b[2] for b in boxes))
+        return extent / len(boxes) ** (1 / 3) if extent > 0.0 else 1.0
+
+    def _cell_of(self, point: Point) -> Cell:
+        size = self.cell_size
+        return math.floor(point[0] / size), math.floor(point[1] / size), math.floor(point[2] / size)
+
+    def _cell_range(self, box: Box) -> Tuple[Cell, Cell]:
+        return self._cell_of(box[:3]), self._cell_of(box[3:])
+
+    def build(self, items: Iterable[Tuple[Hashable, Box, Any]]):
+        """Replaces the content of the index with the given (key, box, value) triples.
+
+        The cell size is recomputed from the boxes unless it was given explicitly.
+        """
+        items = list(items)
+        self._boxes.clear()
+        self._values.clear()
+        self._cells.clear()
+        self._oversized.clear()
+        self._bounds = None
+        if self._automatic_cell_size:
+            self.cell_size = self._default_cell_size([box for _, box, _ in items])
+        for key, box, value in items:
+            self.insert(key, box, value)
+
+    def insert(self, key: Hashable, box: Box, value: Any = None):
+        """Adds a box to the index. A box already registered with the same key is replaced.
+
+        The queries return the value of the box, or its key if no value is given.
+        """
+        if self.cell_size is None:
+            self.cell_size = self._default_cell_size([box])
+        if key in self._boxes:
+            self.remove(key)
+        box = tuple(float(c) for c in box)
+        self._boxes[key] = box
+        self._values[key] = key if value is None else value
+        (x0, y0, z0), (x1, y1, z1) = self._cell_range(box)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) * (z1 - z0 + 1) > MAX_CELLS_PER_BOX:
+            self._oversized.add(key)
+            return
+        for cell in self._cells_in_range(x0, y0, z0, x1, y1, z1):
+            self._cells.setdefault(cell, set()).add(key)
+        self._bounds = None
+
+    def remove(self, key: Hashable):
+        """Removes the box registered with the key. Unknown keys are ignored."""
+        box = self._boxes.pop(key, None)
+        if box is None:
+            return
+        del self._values[key]
+        if key in self._oversized:
+            self._oversized.discard(key)
+            return
+        (x0, y0, z0), (x1, y1, z1) = self._cell_range(box)
+        for cell in self._cells_in_range(x0, y0, z0, x1, y1, z1):
+            keys = self._cells.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._cells[cell]
+        self._bounds = None
+
+    def update(self, items: Iterable[Tuple[Hashable, Optional[Box], Any]]):
+        """Refreshes the boxes of the given keys. A box of None removes the key from the index."""
+        for key, box, value in items:
+            if box is None:
+                self.remove(key)
+            else:
+                self.insert(key, box, value)
+
+    @staticmethod
+    def _cells_in_range(x0: int, y0: int, z0: int, x1: int, y1: int, z1: int) -> Iterator[Cell]:
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                for z in range(z0, z1 + 1):
+                    yield x, y, z
+
+    def _candidates(self, box: Box) -> Set[Hashable]:
+        (x0, y0, z0), (x1, y1, z1) = self._cell_range(box)
+        candidates = set(self._oversized)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) * (z1 - z0 + 1) > len(self._cells):
+            for (x, y, z), keys in self._cells.items():
+                if x0 <= x <= x1 and y0 <= y <= y1 and z0 <= z <= z1:
+                    candidates.update(keys)
+        else:
+            for cell in self._cells_in_range(x0, y0, z0, x1, y1, z1):
+                keys = self._cells.get(cell)
+                if keys:
+                    candidates.update(keys)
+        return candidates
+
+    def intersecting(self, box: Box) -> List[Any]:
+        """Returns the values of the boxes which intersect the given box. Touching boxes intersect."""
+        if not self._boxes:
+            return []
+        boxes = self._boxes
+        return [self._values[key] for key in self._candidates(box) if _intersects(boxes[key], box)]
+
+    def containing(self, point: Point) -> List[Any]:
+        """Returns the values of the boxes which contain the given point."""
+        if not self._boxes:
+            return []
+        candidates = set(self._oversized)
+        candidates.update(self._cells.get(self._cell_of(point), ()))
+        boxes = self._boxes
+        return [self._values[key] for key in candidates if _contains(boxes[key], point)]
+
+    def within_distance(self, point: Point, distance: float) -> List[Any]:
+        """Returns the values of the boxes whose distance from the given point is at most the given distance."""
+        if not self._boxes:
+            return []
+        x, y, z = point
+        boxes = self._boxes
+        candidates = self._candidates((x - distance, y - distance, z - distance, x + distance, y + distance, z + distance))
+        return [self._values[key] for key in candidates if _distance(boxes[key], point) <= distance]
+
+    def nearest(self, point: Point, k: int = 1) -> List[Tuple[Any, float]]:
+        """Returns the values of the k boxes nearest to the given point with their distances, nearest first.
+
+        The distance of a box containing the point is 0.
+        """
+        if k <= 0 or not self._boxes:
+            return []
+        boxes = self._boxes
+        seen = set(self._oversized)
+        best: List[Tuple[float, int, Hashable]] = []
+        order = 0
+
+        def consider(key: Hashable):
+            nonlocal order
+            entry = (-_distance(boxes[key], point), order, key)
+            order += 1
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif entry[0] > best[0][0]:
+                heapq.heapreplace(best, entry)
+
+        for key in self._oversized:
+            consider(key)
+
+        if self._cells:
+            if self._bounds is None:
+                self._bounds = [min(cell[i] for cell in self._cells) for i in range(3)], [max(cell[i] for cell in self._cells) for i in range(3)]
+            lo, hi = self._bounds
+            center = self._cell_of(point)
+            maxRing = max(max(center[i] - lo[i], hi[i] - center[i]) for i in range(3))
+            for ring in range(0, maxRing + 1):
+                for cell in self._ring(center, ring, lo, hi):
+                    for key in self._cells.get(cell, ()):
+                        if key not in seen:
+                            seen.add(key)
+                            consider(key)
+                if len(best) == k and -best[0][0] <= ring * self.cell_size:
+                    break
+
+        return [(self._values[key], -negativeDistance) for negativeDistance, _, key in sorted(best, key=lambda entry: (-entry[0], entry[1]))]
+
+    @staticmethod
+    def _ring(center: Cell, ring: int, lo: List[int], hi: List[int]) -> Iterator[Cell]:
+        cx, cy, cz = center
+        for x in range(max(cx - ring, lo[0]), min(cx + ring, hi[0]) + 1):
+            for y in range(max(cy - ring, lo[1]), min(cy + ring, hi[1]) + 1):
+                if abs(x - cx) == ring or abs(y - cy) == ring:
+                    for z in range(max(cz - ring, lo[2]), min(cz + ring, hi[2]) + 1):
+                        yield x, y, z
+                else:
+                    for z in (cz - ring, cz + ring) if ring else (cz,):
+                        if lo[2] <= z <= hi[2]:
+                            yield x, y, z
@@ -0,0 +1,79 @@
+"""Micro-benchmark of the per-call cost of building command parameters
+
+Compares the former pattern, which defined the parameter class inside every
+Commands method call, with the module level parameter classes.
+
+Usage: python bench_parameters.py [--number N]
+"""
+
+import argparse
+import timeit
+from typing import List
+
+from archicad.acbasetype import _ACBaseType
+from archicad.validators import min_length
+from archicad.releases.ac26 import b3000commands as C
+from archicad.releases.ac26.b3000types import ElementIdArrayItem, LayoutParameters, NavigatorItemId, PropertyIdArrayItem
+
+GUID = '2A4B5C6D-1E2F-4A3B-8C9D-0E1F2A3B4C5D'
+ELEMENTS = [ElementIdArrayItem({'guid': GUID})]
+PROPERTIES = [PropertyIdArrayItem({'guid': GUID})]
+NAVIGATOR_ITEM = NavigatorItemId(GUID)
+LAYOUT_PARAMETERS = LayoutParameters(horizontalSize=297, verticalSize=210, leftMargin=10, topMargin=10, rightMargin=10,
+                                     bottomMargin=10, customLayoutNumber='1', customLayoutNumbering=False,
+                                     doNotIncludeInNumbering=False, displayMasterLayoutBelow=False,
+                                     layoutPageNumber=1, actPageIndex=0, currentRevisionId='', currentFinalRevisionId='',
+                                     hasIssuedRevision=False, hasActualRevision=False)
+
+
+def per_call_GetPropertyValuesOfElements():
+    class GetPropertyValuesOfElements_parameters(_ACBaseType):
+        __slots__ = ("elements", "properties", )
+        def __init__(self, elements: List[ElementIdArrayItem], properties: List[PropertyIdArrayItem]):
+            self.elements: List[ElementIdArrayItem] = elements
+            self.properties: List[PropertyIdArrayItem] = properties
+
+    GetPropertyValuesOfElements_parameters.get_classinfo().add_field('elements', List[ElementIdArrayItem])
+    GetPropertyValuesOfElements_parameters.get_classinfo().add_field('properties', List[PropertyIdArrayItem])
+    return GetPropertyValuesOfElements_parameters(ELEMENTS, PROPERTIES).to_dict()
+
+
+def hoisted_GetPropertyValuesOfElements():
+    return C._GetPropertyValuesOfElements_parameters(ELEMENTS, PROPERTIES).to_dict()
+
+
+def per_call_CreateLayout():
+    class CreateLayout_parameters(_ACBaseType):
+        __slots__ = ("layoutName", "layoutParameters", "masterNavigatorItemId", "parentNavigatorItemId", )
+        def __init__(self, layoutName: str, layoutParameters: LayoutParameters, masterNavigatorItemId: NavigatorItemId, parentNavigatorItemId: NavigatorItemId):
+            self.layoutName: str = layoutName
+            self.layoutParameters: LayoutParameters = layoutParameters
+            self.masterNavigatorItemId: NavigatorItemId = masterNavigatorItemId
+            self.parentNavigatorItemId: NavigatorItemId = parentNavigatorItemId
+
+    CreateLayout_parameters.get_classinfo().add_field('layoutName', str, min_length(1))
+    CreateLayout_parameters.get_classinfo().add_field('layoutParameters', LayoutParameters)
+    CreateLayout_parameters.get_classinfo().add_field('masterNavigatorItemId', NavigatorItemId)
+    CreateLayout_parameters.get_classinfo().add_field('parentNavigatorItemId', NavigatorItemId)
+    return CreateLayout_parameters('Layout', LAYOUT_PARAMETERS, NAVIGATOR_ITEM, NAVIGATOR_ITEM).to_dict()
+
+
+def hoisted_CreateLayout():
+    return C._CreateLayout_parameters('Layout', LAYOUT_PARAMETERS, NAVIGATOR_ITEM, NAVIGATOR_ITEM).to_dict()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+
+    for name, before, after in (('GetPropertyValuesOfElements', per_call_GetPropertyValuesOfElements, hoisted_GetPropertyValuesOfElements),
+                                ('CreateLayout', per_call_CreateLayout, hoisted_CreateLayout)):
+        assert before() == after()
+        before_us = min(timeit.repeat(before, number=args.number, repeat=5)) / args.number * 1e6
+        after_us = min(timeit.repeat(after, number=args.number, repeat=5)) / args.number * 1e6
+        print(f'{name:30} per call class: {before_us:8.2f} us   module level class: {after_us:8.2f} us   speedup: {before_us / after_us:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
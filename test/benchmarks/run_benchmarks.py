@@ -0,0 +1,425 @@
+"""Benchmark suite of the hot paths of Commands, Types and Utilities
+
+Every benchmark times one callable with timeit and records the best, median
+and mean time per call. The payloads are generated by the synthetic model of
+archicad.mockserver, so the runs are reproducible. The results are written
+as JSON, and a previous result file can be passed to --compare to report
+regressions.
+
+Usage: python run_benchmarks.py [--output FILE] [--compare FILE] [--filter REGEX] [--repeat N] [--threshold RATIO]
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from urllib.request import Request
+from uuid import UUID
+
+import archicad
+from archicad import builders, codec, identifiers
+from archicad.acbasetype import _ACBaseType, _ListBuilder
+from archicad.mockserver import MockArchicadServer, SyntheticModel, _guid
+from archicad.navigatorindex import NavigatorTreeIndex
+from archicad.releases.ac26 import b3000commands as C
+from archicad.releases.ac26.b3000commands import Commands
+from archicad.releases.ac26.b3000types import (BoundingBox3DOrError, ClassificationItemInTree, ElementId, ElementIdArrayItem, ElementPropertyValue,
+                                               NavigatorTree, NormalLengthPropertyValue, NormalStringPropertyValue, PropertyDefinition,
+                                               PropertyDefinitionOrError, PropertyId, PropertyIdArrayItem, PropertyValuesOrError, TypeOfElementOrError)
+from archicad.releases.ac26.b3000utilities import Utilities
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    number: int
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, number: int = 10):
+    """Registers a benchmark. The decorated function prepares the payload and returns the callable to time."""
+    def register(setup: Callable[[], Callable[[], Any]]):
+        BENCHMARKS.append(Benchmark(name, setup, number))
+        return setup
+    return register
+
+
+def _model(**kwargs) -> SyntheticModel:
+    return SyntheticModel(**kwargs)
+
+
+def _json(obj: Any) -> Any:
+    """Returns the object as it is decoded from a response of Archicad."""
+    return json.loads(json.dumps(obj))
+
+
+# Types: construction and to_dict of deep types
+
+@benchmark('types.NavigatorTree.construct', number=20)
+def _():
+    tree = _json(_model(navigator_depth=4, navigator_branching=6).GetNavigatorItemTree({'type': 'ProjectMap'})['navigatorTree'])
+    return lambda: NavigatorTree(**tree)
+
+
+@benchmark('types.NavigatorTree.to_dict', number=20)
+def _():
+    tree = NavigatorTree(**_json(_model(navigator_depth=4, navigator_branching=6).GetNavigatorItemTree({'type': 'ProjectMap'})['navigatorTree']))
+    return tree.to_dict
+
+
+@benchmark('types.ClassificationItemInTree.construct', number=20)
+def _():
+    model = _model(classification_depth=4, classification_branching=6)
+    items = _json(model.GetAllClassificationsInSystem(model.GetClassificationSystemIds()['classificationSystemIds'][0]['classificationSystemId'])['classificationItems'])
+    return lambda: [ClassificationItemInTree(**item['classificationItem']) for item in items]
+
+
+@benchmark('types.ClassificationItemInTree.to_dict', number=20)
+def _():
+    model = _model(classification_depth=4, classification_branching=6)
+    items = [ClassificationItemInTree(**item['classificationItem'])
+             for item in model.GetAllClassificationsInSystem(model.GetClassificationSystemIds()['classificationSystemIds'][0]['classificationSystemId'])['classificationItems']]
+    return lambda: [item.to_dict() for item in items]
+
+
+@benchmark('types.PropertyDefinition.construct', number=20)
+def _():
+    model = _model(property_count=1000)
+    definitions = [item['propertyDefinition'] for item in _json(model.GetDetailsOfProperties(model.GetAllPropertyIds()['propertyIds'])['propertyDefinitions'])]
+    return lambda: [PropertyDefinition(**definition) for definition in definitions]
+
+
+@benchmark('types.PropertyDefinition.to_dict', number=20)
+def _():
+    model = _model(property_count=1000)
+    definitions = [PropertyDefinition(**item['propertyDefinition']) for item in model.GetDetailsOfProperties(model.GetAllPropertyIds()['propertyIds'])['propertyDefinitions']]
+    return lambda: [definition.to_dict() for definition in definitions]
+
+
+def _element_property_values(count: int) -> List[ElementPropertyValue]:
+    return [ElementPropertyValue(ElementId(_guid(1, i)), PropertyId(_guid(2, i % 30)),
+                                 NormalLengthPropertyValue(i * 0.5) if i % 2 else NormalStringPropertyValue(str(i)))
+            for i in range(count)]
+
+
+def _generic_to_dict(obj: Any) -> Dict[str, Any]:
+    """The generic walker of _ACBaseType.to_dict applied recursively, the baseline of the generated serializers."""
+    def deserialize(value):
+        if isinstance(value, _ACBaseType):
+            return _generic_to_dict(value)
+        if isinstance(value, UUID):
+            return str(value).upper()
+        if isinstance(value, list):
+            return [deserialize(item) for item in value]
+        return value
+    return {name: deserialize(getattr(obj, name)) for name in obj.__slots__ if getattr(obj, name) is not None}
+
+
+@benchmark('types.to_dict.SetPropertyValuesOfElements.100k', number=3)
+def _():
+    parameters = C._SetPropertyValuesOfElements_parameters(_element_property_values(100000))
+    return parameters.to_dict
+
+
+@benchmark('types.to_dict.generic.SetPropertyValuesOfElements.100k', number=3)
+def _():
+    parameters = C._SetPropertyValuesOfElements_parameters(_element_property_values(100000))
+    return lambda: _generic_to_dict(parameters)
+
+
+# Types: list building and union dispatch
+
+@benchmark('types._ListBuilder.ElementIdArrayItem.100k', number=3)
+def _():
+    elements = _json(_model(element_count=100000).GetAllElements()['elements'])
+    builder = _ListBuilder(ElementIdArrayItem)
+    return lambda: builder(elements)
+
+
+@benchmark('types._ConstructUnion.BoundingBox3DOrError.10k', number=3)
+def _():
+    model = _model(element_count=10000)
+    elements = model.GetAllElements()['elements'] + [{'elementId': {'guid': '00000000-0000-0000-0000-000000000000'}}] * 1000
+    boxes = _json(model.Get3DBoundingBoxes(elements)['boundingBoxes3D'])
+    builder = _ListBuilder(BoundingBox3DOrError)
+    return lambda: builder(boxes)
+
+
+@benchmark('types._ConstructUnion.TypeOfElementOrError.10k', number=3)
+def _():
+    model = _model(element_count=10000)
+    types = _json(model.GetTypesOfElements(model.GetAllElements()['elements'])['typesOfElements'])
+    builder = _ListBuilder(TypeOfElementOrError)
+    return lambda: builder(types)
+
+
+@benchmark('types._ConstructUnion.PropertyDefinitionOrError.1k', number=3)
+def _():
+    model = _model(property_count=1000)
+    definitions = _json(model.GetDetailsOfProperties(model.GetAllPropertyIds()['propertyIds'])['propertyDefinitions'])
+    builder = _ListBuilder(PropertyDefinitionOrError)
+    return lambda: builder(definitions)
+
+
+@benchmark('types._ConstructUnion.PropertyValuesOrError.200x30', number=1)
+def _():
+    model = _model(element_count=200, property_count=30)
+    values = _json(model.GetPropertyValuesOfElements(model.GetAllElements()['elements'], model.GetAllPropertyIds()['propertyIds'])['propertyValuesForElements'])
+    builder = _ListBuilder(PropertyValuesOrError)
+    return lambda: builder(values)
+
+
+@benchmark('types.from_dict.PropertyValuesOrError.200x30', number=3)
+def _():
+    model = _model(element_count=200, property_count=30)
+    values = _json(model.GetPropertyValuesOfElements(model.GetAllElements()['elements'], model.GetAllPropertyIds()['propertyIds'])['propertyValuesForElements'])
+    builder = builders.strict_list_builder(PropertyValuesOrError)
+    return lambda: builder(values)
+
+
+@benchmark('types.from_dict.ElementIdArrayItem.100k', number=3)
+def _():
+    elements = _json(_model(element_count=100000).GetAllElements()['elements'])
+    builder = builders.strict_list_builder(ElementIdArrayItem)
+    return lambda: builder(elements)
+
+
+@benchmark('types.from_dict.interned.ElementIdArrayItem.100k', number=3)
+def _():
+    elements = _json(_model(element_count=100000).GetAllElements()['elements'])
+    builder = builders.strict_list_builder(ElementIdArrayItem)
+
+    def build():
+        identifiers.set_interning(True)
+        try:
+            return builder(elements)
+        finally:
+            identifiers.set_interning(False)
+    return build
+
+
+@benchmark('types.ElementId.dict_lookup.100k', number=3)
+def _():
+    elements = [ElementId.from_dict(e['elementId']) for e in _json(_model(element_count=100000).GetAllElements()['elements'])]
+    table = {elementId: i for i, elementId in enumerate(elements)}
+    keys = [ElementId(elementId.guid) for elementId in elements]
+    return lambda: [table[key] for key in keys]
+
+
+@benchmark('types.ElementIdArrayItem.set_difference.100k', number=3)
+def _():
+    elements = builders.strict_list_builder(ElementIdArrayItem)(_json(_model(element_count=100000).GetAllElements()['elements']))
+    previous = builders.strict_list_builder(ElementIdArrayItem)(_json(_model(element_count=50000).GetAllElements()['elements']))
+    return lambda: set(elements).difference(previous)
+
+
+@benchmark('types.trusted.PropertyValuesOrError.200x30', number=3)
+def _():
+    model = _model(element_count=200, property_count=30)
+    values = _json(model.GetPropertyValuesOfElements(model.GetAllElements()['elements'], model.GetAllPropertyIds()['propertyIds'])['propertyValuesForElements'])
+    builder = builders.trusted_list_builder(PropertyValuesOrError)
+    return lambda: builder(values)
+
+
+# Commands: JSON encoding and decoding of post_command with the selected codec and with the standard library
+
+def _property_values_request(elementCount: int, propertyCount: int) -> Dict[str, Any]:
+    model = _model(element_count=elementCount, property_count=propertyCount)
+    elements = _ListBuilder(ElementIdArrayItem)(model.GetAllElements()['elements'])
+    properties = _ListBuilder(PropertyIdArrayItem)(model.GetAllPropertyIds()['propertyIds'])
+    return {"command": "API.GetPropertyValuesOfElements", "parameters": C._GetPropertyValuesOfElements_parameters(elements, properties).to_dict()}
+
+
+def _property_values_response(elementCount: int, propertyCount: int) -> bytes:
+    model = _model(element_count=elementCount, property_count=propertyCount)
+    return json.dumps({'succeeded': True, 'result': model.GetPropertyValuesOfElements(model.GetAllElements()['elements'], model.GetAllPropertyIds()['propertyIds'])}).encode('UTF-8')
+
+
+@benchmark('commands.encode.GetPropertyValuesOfElements.10kx30', number=5)
+def _():
+    request = _property_values_request(10000, 30)
+    return lambda: codec.dumps(request)
+
+
+@benchmark('commands.encode.stdlib.GetPropertyValuesOfElements.10kx30', number=5)
+def _():
+    request = _property_values_request(10000, 30)
+    stdlib = codec.StdlibJSONCodec()
+    return lambda: stdlib.dumps(request)
+
+
+@benchmark('commands.decode.GetPropertyValuesOfElements.10kx30', number=5)
+def _():
+    body = _property_values_response(10000, 30)
+    return lambda: codec.loads(body)
+
+
+@benchmark('commands.decode.stdlib.GetPropertyValuesOfElements.10kx30', number=5)
+def _():
+    body = _property_values_response(10000, 30)
+    stdlib = codec.StdlibJSONCodec()
+    return lambda: stdlib.loads(body)
+
+
+# Import: cold start of a fresh interpreter
+
+def _import_in_subprocess(statement: str) -> Callable[[], Any]:
+    """Returns a callable running the import statement in a new interpreter which finds the same archicad package."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.path.dirname(os.path.dirname(os.path.abspath(archicad.__file__))), env.get('PYTHONPATH')]))
+    return lambda: subprocess.run([sys.executable, '-c', statement], env=env, check=True)
+
+
+@benchmark('import.python', number=3)
+def _():
+    return _import_in_subprocess('pass')
+
+
+@benchmark('import.archicad', number=3)
+def _():
+    return _import_in_subprocess('import archicad')
+
+
+@benchmark('import.archicad.releases.ac26.b3000types', number=3)
+def _():
+    return _import_in_subprocess('import archicad.releases.ac26.b3000types')
+
+
+@benchmark('import.archicad.ACConnection', number=3)
+def _():
+    return _import_in_subprocess('from archicad import ACConnection')
+
+
+# Utilities: end to end against the mock server
+
+_servers: List[MockArchicadServer] = []
+
+
+@benchmark('utilities.GetPropertyValuesDictionary.1kx30', number=1)
+def _():
+    server = MockArchicadServer(SyntheticModel(element_count=1000, property_count=30)).start()
+    _servers.append(server)
+    commands = Commands(Request(server.url), chunkSize=1000)
+    utilities = Utilities(None, commands)
+    elements = commands.GetAllElements()
+    propertyIds = [p.propertyId for p in commands.GetAllPropertyIds()]
+
+    def run():
+        utilities.propertyDefinitionCache.Invalidate()
+        return utilities.GetPropertyValuesDictionary(elements, propertyIds)
+    return run
+
+
+@benchmark('utilities.FindClassificationItemInSystem.500', number=1)
+def _():
+    model = SyntheticModel(element_count=1, classification_depth=4, classification_branching=5)
+    server = MockArchicadServer(model).start()
+    _servers.append(server)
+    utilities = Utilities(None, Commands(Request(server.url)), cacheClassificationSystems=True)
+    systemName = model.GetAllClassificationSystems()['classificationSystems'][0]['name']
+    itemIds = [item.id for item in utilities.FindInClassificationItemTree(
+        utilities.accommands.GetAllClassificationsInSystem(utilities.FindClassificationSystem(systemName))[0].classificationItem, lambda item: True)]
+
+    def run():
+        utilities.classificationSystemCache.Invalidate()
+        return [utilities.FindClassificationItemInSystem(systemName, itemIds[i % len(itemIds)]) for i in range(500)]
+    return run
+
+
+def _navigator_tree(depth: int, branching: int) -> NavigatorTree:
+    model = _model(element_count=1, navigator_depth=depth, navigator_branching=branching)
+    return NavigatorTree(**_json(model.GetNavigatorItemTree({'type': 'ProjectMap'})['navigatorTree']))
+
+
+@benchmark('utilities.FindInNavigatorItemTree.20kx100', number=1)
+def _():
+    tree = _navigator_tree(7, 4)
+    names = [item.name for item in NavigatorTreeIndex(tree.rootItem).items[::200]]
+    return lambda: [Utilities.FindInNavigatorItemTree(tree.rootItem, lambda item: item.name == name) for name in names]
+
+
+@benchmark('utilities.NavigatorTreeIndex.20kx100', number=1)
+def _():
+    tree = _navigator_tree(7, 4)
+
+    def run():
+        index = NavigatorTreeIndex(tree.rootItem)
+        return [index.named(item.name) for item in index.items[::200]]
+    return run
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(benchmarks: List[Benchmark], repeat: int) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for bench in benchmarks:
+        func = bench.setup()
+        func()
+        times = [t / bench.number for t in timeit.repeat(func, number=bench.number, repeat=repeat)]
+        results[bench.name] = {'best': min(times), 'median': statistics.median(times), 'mean': statistics.mean(times), 'number': bench.number, 'repeat': repeat}
+        print(f'{bench.name:55} best {min(times) * 1e3:10.3f} ms   median {statistics.median(times) * 1e3:10.3f} ms', flush=True)
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], threshold: float) -> List[str]:
+    """Prints the ratio of the best times to the baseline and returns the names of the benchmarks slower than the threshold."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result['best'] / baseline[name]['best']
+        flag = ''
+        if ratio > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f'{name:55} {ratio:6.2f}x of baseline{flag}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', help='the JSON file to write the results to')
+    parser.add_argument('--compare', help='a JSON result file of a previous run to compare with')
+    parser.add_argument('--filter', default='', help='a regular expression selecting the benchmarks to run')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=1.2, help='the slowdown ratio reported as a regression')
+    args = parser.parse_args()
+
+    selected = [bench for bench in BENCHMARKS if re.search(args.filter, bench.name)]
+    try:
+        results = run(selected, args.repeat)
+    finally:
+        for server in _servers:
+            server.stop()
+
+    report = {
+        'metadata': {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'), 'python': sys.version, 'implementation': platform.python_implementation(),
+                     'platform': platform.platform(), 'revision': _git_revision()},
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f)['results'], args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+import contextlib
+import inspect
+import json
+import unittest
+from typing import Union
+from unittest.mock import patch
+from urllib.request import Request
+from uuid import UUID
+
+from archicad import builders
+from archicad import metadata
+from archicad.acbasetype import _ACBaseType, _ACUnionType, _ConstructUnion, _get_constructor
+from archicad.mockserver import MockArchicadServer, SyntheticModel
+from archicad.releases.ac26 import b3000types as T
+from archicad.releases.ac26.b3000commands import Commands
+from archicad.releases.ac26.b3000types import (BoundingBox3DOrError, ClassificationItemInTree, ElementId, NavigatorTree, NormalLengthPropertyValue,
+                                               NormalStringPropertyValue, OtherNavigatorTreeId, PropertyDefinitionOrError, PropertyValuesOrError, TypeOfElementOrError)
+
+
+def _json(obj):
+    return json.loads(json.dumps(obj))
+
+
+class TestTrustedBuilder(unittest.TestCase):
+    def assertSameObjects(self, strict, trusted, path='$'):
+        self.assertIs(type(strict), type(trusted), path)
+        if isinstance(strict, _ACBaseType):
+            for slot in type(strict).__slots__:
+                self.assertSameObjects(getattr(strict, slot), getattr(trusted, slot), f'{path}.{slot}')
+        elif isinstance(strict, list):
+            self.assertEqual(len(strict), len(trusted), path)
+            for i, (s, t) in enumerate(zip(strict, trusted)):
+                self.assertSameObjects(s, t, f'{path}[{i}]')
+        else:
+            self.assertEqual(strict, trusted, path)
+
+    def test_same_as_strict(self):
+        model = SyntheticModel(element_count=120, property_count=40, string_length=8)
+        elements = model.GetAllElements()['elements']
+        propertyIds = model.GetAllPropertyIds()['propertyIds']
+        systemId = model.GetClassificationSystemIds()['classificationSystemIds'][0]['classificationSystemId']
+        cases = [
+            (PropertyValuesOrError, model.GetPropertyValuesOfElements(elements, propertyIds)['propertyValuesForElements']),
+            (PropertyDefinitionOrError, model.GetDetailsOfProperties(propertyIds + [{'propertyId': {'guid': '00000000-0000-0000-0000-000000000000'}}])['propertyDefinitions']),
+            (BoundingBox3DOrError, model.Get3DBoundingBoxes(elements + [{'elementId': {'guid': '00000000-0000-0000-0000-000000000000'}}])['boundingBoxes3D']),
+            (TypeOfElementOrError, model.GetTypesOfElements(elements)['typesOfElements']),
+            (ClassificationItemInTree, [item['classificationItem'] for item in model.GetAllClassificationsInSystem(systemId)['classificationItems']]),
+            (NavigatorTree, [model.GetNavigatorItemTree({'type': 'ProjectMap'})['navigatorTree']]),
+        ]
+        for typ, items in cases:
+            items = _json(items)
+            generic = [_get_constructor(typ)(item) for item in items]
+            self.assertSameObjects(generic, builders.trusted_list_builder(typ)(items))
+            self.assertSameObjects(generic, builders.strict_list_builder(typ)(items))
+            self.assertSameObjects(generic, [typ.from_dict(item) for item in items])
+
+    def test_skips_validation_of_nested_lists(self):
+        tree = _json(SyntheticModel(element_count=30).GetNavigatorItemTree({'type': 'ProjectMap'})['navigatorTree'])
+        child = tree['rootItem']['children'][0]['navigatorItem']
+        while child.get('children'):
+            child = child['children'][0]['navigatorItem']
+        child['type'] = 'Invalid'
+        with self.assertRaises(TypeError):
+            _get_constructor(NavigatorTree)(tree)
+        with patch.object(_ACBaseType, '__setattr__', autospec=True, side_effect=_ACBaseType.__setattr__) as setattr_:
+            built = builders.trusted_builder(NavigatorTree)(tree)
+        self.assertEqual(setattr_.call_count, 0)
+        item = built.rootItem.children[0].navigatorItem
+        while item.children:
+            item = item.children[0].navigatorItem
+        self.assertIsInstance(built.rootItem.children, list)
+        self.assertEqual(item.type, 'Invalid')
+
+    def test_skips_validators(self):
+        value = builders.trusted_builder(NormalStringPropertyValue)({'value': 'text', 'type': 'number', 'status': 'normal'})
+        self.assertEqual(value.type, 'number')
+        with self.assertRaises(ValueError):
+            NormalStringPropertyValue('text', 'number')
+
+    def test_unknown_union_member_raises(self):
+        with self.assertRaises(TypeError):
+            builders.trusted_builder(PropertyValuesOrError)({'unknown': 1})
+
+
+class TestStrictBuilder(unittest.TestCase):
+    def test_validates(self):
+        with self.assertRaises(ValueError):
+            NormalStringPropertyValue.from_dict({'value': 'text', 'type': 'number'})
+        with self.assertRaises(TypeError):
+            NormalStringPropertyValue.from_dict({'value': 1})
+        with self.assertRaises(TypeError):
+            NormalStringPropertyValue.from_dict({'value': 'text', 'unknown': 1})
+        with self.assertRaises(TypeError):
+            NormalStringPropertyValue.from_dict({'type': 'string'})
+        with self.assertRaises(TypeError):
+            PropertyValuesOrError.from_dict({'propertyValues': [{'propertyValue': {'type': 'string', 'status': 'normal', 'value': 1}}]})
+
+    def test_conversions(self):
+        value = NormalLengthPropertyValue.from_dict({'value': 2})
+        self.assertEqual(value.value, 2.0)
+        self.assertIs(type(value.value), float)
+        elementId = ElementId.from_dict({'guid': '3F2504E0-4F89-11D3-9A0C-0305E82C3301'})
+        self.assertEqual(elementId.guid, UUID('3F2504E0-4F89-11D3-9A0C-0305E82C3301'))
+        self.assertIs(ElementId.from_dict(elementId), elementId)
+
+
+_PROPERTY_VALUES = [
+    {'type': 'number', 'status': 'normal', 'value': 1.5},
+    {'type': 'integer', 'status': 'normal', 'value': 2},
+    {'type': 'string', 'status': 'normal', 'value': 'text'},
+    {'type': 'boolean', 'status': 'normal', 'value': True},
+    {'type': 'length', 'status': 'normal', 'value': 3},
+    {'type': 'area', 'status': 'normal', 'value': 4.0},
+    {'type': 'volume', 'status': 'normal', 'value': 5.0},
+    {'type': 'angle', 'status': 'normal', 'value': 0.5},
+    {'type': 'numberList', 'status': 'normal', 'value': [1.0, 2]},
+    {'type': 'integerList', 'status': 'normal', 'value': [1, 2]},
+    {'type': 'stringList', 'status': 'normal', 'value': ['a', 'b']},
+    {'type': 'booleanList', 'status': 'normal', 'value': [True]},
+    {'type': 'lengthList', 'status': 'normal', 'value': [1.0]},
+    {'type': 'singleEnum', 'status': 'normal', 'value': {'type': 'displayValue', 'displayValue': 'A'}},
+    {'type': 'multiEnum', 'status': 'normal', 'value': [{'enumValueId': {'type': 'nonLocalizedValue', 'nonLocalizedValue': 'B'}}]},
+    {'type': 'string', 'status': 'userUndefined'},
+    {'type': 'length', 'status': 'notAvailable'},
+    {'type': 'integer', 'status': 'notEvaluated'},
+]
+
+
+@contextlib.contextmanager
+def _trial_construction():
+    """Restores the trial construction of every union type."""
+    dispatchers = {obj: obj.constructor for obj in vars(T).values() if inspect.isclass(obj) and issubclass(obj, _ACUnionType)
+                   and isinstance(getattr(obj, 'constructor', None), builders.UnionDispatcher)}
+    for union, dispatcher in dispatchers.items():
+        union.constructor = dispatcher._trial
+    try:
+        yield
+    finally:
+        for union, dispatcher in dispatchers.items():
+            union.constructor = dispatcher
+
+
+class TestUnionDispatcher(unittest.TestCase):
+    assertSameObjects = TestTrustedBuilder.assertSameObjects
+
+    def test_same_as_trial(self):
+        model = SyntheticModel(element_count=60, property_count=40, string_length=8)
+        elements = model.GetAllElements()['elements']
+        propertyIds = model.GetAllPropertyIds()['propertyIds']
+        cases = [
+            (T.PropertyValue, _PROPERTY_VALUES),
+            (T.PropertyValuesOrError, model.GetPropertyValuesOfElements(elements, propertyIds)['propertyValuesForElements']),
+            (T.PropertyDefinitionOrError, model.GetDetailsOfProperties(propertyIds + [{'propertyId': {'guid': '00000000-0000-0000-0000-000000000000'}}])['propertyDefinitions']),
+            (T.BoundingBox3DOrError, model.Get3DBoundingBoxes(elements + [{'elementId': {'guid': '00000000-0000-0000-0000-000000000000'}}])['boundingBoxes3D']),
+        ]
+        for typ, items in cases:
+            items = _json(items)
+            with _trial_construction():
+                expected = [typ(**item) for item in items]
+            self.assertSameObjects(expected, [typ(**item) for item in items])
+            self.assertSameObjects(expected, builders.strict_list_builder(typ)(items))
+            self.assertSameObjects(expected, builders.trusted_list_builder(typ)(items))
+
+    def test_tags(self):
+        dispatcher = T.PropertyValue.constructor
+        self.assertIsInstance(dispatcher, builders.UnionDispatcher)
+        self.assertEqual(dispatcher.optional_types, (T.NormalOrUserUndefinedPropertyValue, T.NotAvailablePropertyValue, T.NotEvaluatedPropertyValue))
+        self.assertEqual([member.type for member in dispatcher.candidates({'type': 'length', 'status': 'normal', 'value': 1.0})], [T.NormalLengthPropertyValue])
+        self.assertEqual([member.type for member in dispatcher.candidates({'type': 'length', 'status': 'notAvailable'})], [T.NotAvailablePropertyValue])
+        self.assertEqual({member.type for member in T.PropertyValuesOrError.constructor.candidates({'error': {}})}, {T.PropertyValuesWrapper, T.ErrorItem})
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            T.PropertyValue(type='string', status='normal', value=1)
+        with self.assertRaises(TypeError):
+            T.PropertyValue(type='unknown', status='normal', value=1)
+        with self.assertRaises(TypeError):
+            builders.strict_builder(T.PropertyValue)({'type': 'string', 'status': 'normal', 'value': [1]})
+        self.assertIsInstance(T.PropertyValue(type='length', status='normal', value=1), T.NormalLengthPropertyValue)
+
+    def test_ambiguous(self):
+        class Width(_ACBaseType):
+            __slots__ = ('value',)
+
+            def __init__(self, value: float):
+                self.value = value
+
+        class Height(_ACBaseType):
+            __slots__ = ('value',)
+
+            def __init__(self, value: float):
+                self.value = value
+
+        metadata.install_classinfo({'Width': Width, 'Height': Height}, (('Width', (('value', 'float'),)), ('Height', (('value', 'float', ('minimum', 0, False)),))))
+        size = Union[Width, Height]
+        with self.assertRaises(AssertionError):
+            _ConstructUnion(size)(value=1.0)
+        with self.assertRaises(AssertionError):
+            builders.UnionDispatcher(size)(value=1.0)
+        self.assertIsInstance(builders.UnionDispatcher(size)(value=-1.0), Width)
+
+
+class TestTrustResponses(unittest.TestCase):
+    def setUp(self):
+        self.server = MockArchicadServer(SyntheticModel(element_count=30, property_count=6)).start()
+
+    def tearDown(self):
+        builders.set_trust_responses(False)
+        self.server.stop()
+
+    def test_switches(self):
+        elements = Commands(Request(self.server.url)).GetAllElements()
+        with patch('archicad.builders.trusted_list_builder', wraps=builders.trusted_list_builder) as trusted:
+            Commands(Request(self.server.url)).GetTypesOfElements(elements)
+            self.assertEqual(trusted.call_count, 0)
+            Commands(Request(self.server.url), trustResponses=True).GetTypesOfElements(elements)
+            self.assertEqual(trusted.call_count, 1)
+            builders.set_trust_responses(True)
+            Commands(Request(self.server.url)).GetTypesOfElements(elements)
+            self.assertEqual(trusted.call_count, 2)
+            Commands(Request(self.server.url), trustResponses=False).GetTypesOfElements(elements)
+            self.assertEqual(trusted.call_count, 2)
+
+    def test_results(self):
+        strict = Commands(Request(self.server.url))
+        trusted = Commands(Request(self.server.url), trustResponses=True)
+        elements = strict.GetAllElements()
+        self.assertEqual([e.to_dict() for e in trusted.GetAllElements()], [e.to_dict() for e in elements])
+        self.assertEqual([t.to_dict() for t in trusted.GetTypesOfElements(elements)], [t.to_dict() for t in strict.GetTypesOfElements(elements)])
+        treeId = OtherNavigatorTreeId('ProjectMap')
+        self.assertEqual(trusted.GetNavigatorItemTree(treeId).to_dict(), strict.GetNavigatorItemTree(treeId).to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import json
+import unittest
+from urllib.request import Request
+
+from archicad import codec
+from archicad.mockserver import MockArchicadServer, SyntheticModel
+from archicad.releases.ac26.b3000commands import Commands
+
+
+class TestCodecs(unittest.TestCase):
+    def tearDown(self):
+        codec.set_codec(None)
+
+    def test_round_trip(self):
+        obj = {'command': 'API.GetAllElements', 'parameters': {'elements': [{'elementId': {'guid': 'A'}}], 'value': 1.5, 'flag': True, 'text': 'Falá'}}
+        for cls in codec.available_codecs().values():
+            instance = cls()
+            body = instance.dumps(obj)
+            self.assertIsInstance(body, bytes)
+            self.assertEqual(json.loads(body), obj)
+            for data in (body, bytearray(body), memoryview(body)):
+                self.assertEqual(instance.loads(data), obj)
+
+    def test_default(self):
+        expected = 'orjson' if codec.orjson is not None else 'json'
+        self.assertEqual(codec.get_codec().name, expected)
+        codec.set_codec('json')
+        self.assertIsInstance(codec.get_codec(), codec.StdlibJSONCodec)
+        codec.set_codec(None)
+        self.assertEqual(codec.get_codec().name, expected)
+        with self.assertRaises(KeyError):
+            codec.set_codec('unknown')
+
+    def test_incomplete_codec(self):
+        class EncodingOnlyCodec(codec.JSONCodec):
+            name = 'encodingOnly'
+
+            def dumps(self, obj):
+                return json.dumps(obj).encode('UTF-8')
+        codec.register_codec(EncodingOnlyCodec)
+        try:
+            with self.assertRaises(TypeError):
+                codec.set_codec('encodingOnly')
+        finally:
+            del codec._codec_classes['encodingOnly']
+
+    def test_commands(self):
+        with MockArchicadServer(SyntheticModel(element_count=50)) as server:
+            for name in codec.available_codecs():
+                codec.set_codec(name)
+                commands = Commands(Request(server.url), chunkSize=20)
+                elements = commands.GetAllElements()
+                self.assertEqual(len(commands.GetTypesOfElements(elements)), 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import threading
+import unittest
+from unittest.mock import patch
+from urllib.request import Request
+
+from archicad import columnar
+from archicad.releases.ac26.b3000commands import Commands, AsyncCommands, UnsucceededCommandCall
+from archicad.releases.ac26.b3000types import ElementIdArrayItem, PropertyIdArrayItem, BoundingBox3DWrapper, ErrorItem, PropertyValuesWrapper
+
+
+def _guid(i: int) -> str:
+    return f'00000000-0000-0000-0000-{i:012X}'
+
+
+def _fake_bounding_boxes(req, jsonStr):
+    """Answers Get3DBoundingBoxes with an error for every third element."""
+    command = json.loads(jsonStr)
+    items = []
+    for element in command['parameters']['elements']:
+        i = int(element['elementId']['guid'].split('-')[-1], 16)
+        if i % 3 == 0:
+            items.append({'error': {'code': i, 'message': 'No bounding box'}})
+        else:
+            items.append({'boundingBox3D': {'xMin': i, 'yMin': i, 'zMin': i, 'xMax': i + 1, 'yMax': i + 1, 'zMax': i + 1}})
+    return {'succeeded': True, 'result': {'boundingBoxes3D': items}}
+
+
+class TestChunkedCommands(unittest.TestCase):
+    def setUp(self):
+        self.elements = [ElementIdArrayItem({'guid': _guid(i)}) for i in range(25)]
+
+    def check_bounding_boxes(self, boxes):
+        self.assertEqual(len(boxes), len(self.elements))
+        for i, box in enumerate(boxes):
+            if i % 3 == 0:
+                self.assertIsInstance(box, ErrorItem)
+                self.assertEqual(box.error.code, i)
+            else:
+                self.assertIsInstance(box, BoundingBox3DWrapper)
+                self.assertEqual(box.boundingBox3D.xMin, i)
+
+    @patch('archicad.releases.ac26.b3000commands.post_command')
+    def test_without_chunks(self, mocked_post_command):
+        mocked_post_command.side_effect = _fake_bounding_boxes
+        commands = Commands(Request('http://127.0.0.1:19723'))
+        self.check_bounding_boxes(commands.Get3DBoundingBoxes(self.elements))
+        self.assertEqual(mocked_post_command.call_count, 1)
+
+    @patch('archicad.releases.ac26.b3000commands.post_command')
+    def test_sequential_chunks(self, mocked_post_command):
+        mocked_post_command.side_effect = _fake_bounding_boxes
+        commands = Commands(Request('http://127.0.0.1:19723'), chunkSize=10)
+        self.check_bounding_boxes(commands.Get3DBoundingBoxes(self.elements))
+        self.assertEqual(mocked_post_command.call_count, 3)
+        self.assertEqual([len(json.loads(call[0][1])['parameters']['elements']) for call in mocked_post_command.call_args_list], [10, 10, 5])
+
+    @patch('archicad.releases.ac26.b3000commands.post_command')
+    def test_parallel_chunks(self, mocked_post_command):
+        threads = set()
+
+        def fake(req, jsonStr):
+            threads.add(threading.get_ident())
+            return _fake_bounding_boxes(req, jsonStr)
+
+        mocked_post_command.side_effect = fake
+        commands = Commands(Request('http://127.0.0.1:19723'), chunkSize=4, maxParallelChunks=3)
+        self.check_bounding_boxes(commands.Get3DBoundingBoxes(self.elements))
+        self.assertEqual(mocked_post_command.call_count, 7)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    @patch('archicad.releases.ac26.b3000commands.post_command')
+    def test_failed_chunk(self, mocked_post_command):
+        mocked_post_command.side_effect = [_fake_bounding_boxes(None, json.dumps({'parameters': {'elements': [e.to_dict() for e in self.elements[:10]]}})),
+                                           {'succeeded': False, 'error': {'code': 1, 'message': 'Failed'}}]
+        commands = Commands(Request('http://127.0.0.1:19723'), chunkSize=10, maxParallelChunks=2)
+        with self.assertRaises(UnsucceededCommandCall):
+            commands.Get3DBoundingBoxes(self.elements[:20])
+
+    def test_async_chunks(self):
+        in_flight = []
+        max_in_flight = []
+
+        async def fake(req, pool, jsonStr):
+            in_flight.append(jsonStr)
+            max_in_flight.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(jsonStr)
+            return _fake_bounding_boxes(req, jsonStr)
+
+        async def run():
+            commands = AsyncCommands(Request('http://127.0.0.1:19723'), chunkSize=4, maxParallelChunks=3)
+            return await commands.Get3DBoundingBoxes(self.elements)
+
+        with patch('archicad.releases.ac26.b3000commands.async_post_command', new=fake):
+            self.check_bounding_boxes(asyncio.run(run()))
+        self.assertEqual(len(max_in_flight), 7)
+        self.assertEqual(max(max_in_flight), 3)
+
+
+def _fake_property_values(req, jsonStr):
+    command = json.loads(jsonStr)
+    if command['command'] == 'API.GetAllElements':
+        return {'succeeded': True, 'result': {'elements': [{'elementId': {'guid': _guid(i)}} for i in range(25)]}}
+    items = []
+    for element in command['parameters']['elements']:
+        i = int(element['elementId']['guid'].split('-')[-1], 16)
+        items.append({'propertyValues': [{'propertyValue': {'type': 'integer', 'status': 'normal', 'value': i}}]})
+    return {'succeeded': True, 'result': {'propertyValuesForElements': items}}
+
+
+class TestIterCommands(unittest.TestCase):
+    @patch('archicad.releases.ac26.b3000commands.post_command')
+    def test_iter_all_elements(self, mocked_post_command):
+        mocked_post_command.side_effect = _fake_property_values
+        commands = Commands(Request('http://127.0.0.1:19723'))
+        elements = commands.IterAllElements(chunkSize=10)
+        self.assertEqual(mocked_post_command.call_count, 0)
+        self.assertEqual([str(e.elementId.guid).upper() for e in elements], [_guid(i) for i in range(25)])
+        self.assertEqual(mocked_post_command.call_count, 1)
+
+    @patch('archicad.releases.ac26.b3000commands.post_command')
+    def test_iter_property_values_of_elements(self, mocked_post_command):
+        mocked_post_command.side_effect = _fake_property_values
+        commands = Commands(Request('http://127.0.0.1:19723'))
+        elements = [ElementIdArrayItem({'guid': _guid(i)}) for i in range(25)]
+        properties = [PropertyIdArrayItem({'guid': _guid(0)})]
+        values = commands.IterPropertyValuesOfElements(elements, properties, chunkSize=10)
+        first = next(values)
+        self.assertIsInstance(first, PropertyValuesWrapper)
+        self.assertEqual(mocked_post_command.call_count, 1)
+        self.assertEqual([first.propertyValues[0].propertyValue.value] + [v.propertyValues[0].propertyValue.value for v in values], list(range(25)))
+        self.assertEqual(mocked_post_command.call_count, 3)
+
+    def test_async_iter_property_values_of_elements(self):
+        async def fake(req, pool, jsonStr):
+            return _fake_property_values(req, jsonStr)
+
+        async def run():
+            commands = AsyncCommands(Request('http://127.0.0.1:19723'), chunkSize=10)
+            elements = [element async for element in commands.IterAllElements()]
+            properties = [PropertyIdArrayItem({'guid': _guid(0)})]
+            return [v.propertyValues[0].propertyValue.value async for v in commands.IterPropertyValuesOfElements(elements, properties)]
+
+        with patch('archicad.releases.ac26.b3000commands.async_post_command', new=fake):
+            self.assertEqual(asyncio.run(run()), list(range(25)))
+
+
+def _fake_mixed_property_values(req, jsonStr):
+    command = json.loads(jsonStr)
+    items = []
+    for element in command['parameters']['elements']:
+        i = int(element['elementId']['guid'].split('-')[-1], 16)
+        if i == 7:
+            items.append({'error': {'code': 1, 'message': 'No such element'}})
+            continue
+        length = {'propertyValue': {'type': 'length', 'status': 'normal', 'value': i / 2}} if i % 4 else {'propertyValue': {'type': 'length', 'status': 'userUndefined'}}
+        name = {'propertyValue': {'type': 'string', 'status': 'normal', 'value': f'E{i}'}} if i > 2 else {'propertyValue': {'type': 'string', 'status': 'notAvailable'}}
+        items.append({'propertyValues': [length, name, {'error': {'code': 2, 'message': 'No such property'}}]})
+    return {'succeeded': True, 'result': {'propertyValuesForElements': items}}
+
+
+class TestPropertyValueColumns(unittest.TestCase):
+    @patch('archicad.releases.ac26.b3000commands.post_command')
+    def test_columns(self, mocked_post_command):
+        mocked_post_command.side_effect = _fake_mixed_property_values
+        commands = Commands(Request('http://127.0.0.1:19723'), chunkSize=5)
+        elements = [ElementIdArrayItem({'guid': _guid(i)}) for i in range(12)]
+        properties = [PropertyIdArrayItem({'guid': _guid(i)}) for i in range(3)]
+        lengths, names, missing = commands.GetPropertyValueColumnsOfElements(elements, properties)
+        self.assertEqual(mocked_post_command.call_count, 3)
+
+        self.assertIs(lengths.property, properties[0])
+        self.assertEqual(lengths.type, 'length')
+        self.assertEqual(lengths.values.typecode, 'd')
+        self.assertEqual(list(lengths.values), [0 if i % 4 == 0 or i == 7 else i / 2 for i in range(12)])
+        self.assertEqual(list(lengths.status), [columnar.STATUS_ERROR if i == 7 else columnar.STATUS_USER_UNDEFINED if i % 4 == 0 else columnar.STATUS_NORMAL for i in range(12)])
+        self.assertEqual(list(lengths.valid), [int(i % 4 != 0 and i != 7) for i in range(12)])
+
+        self.assertEqual(names.type, 'string')
+        self.assertEqual(names.values, [None if i <= 2 or i == 7 else f'E{i}' for i in range(12)])
+        self.assertEqual(list(names.status[:3]), [columnar.STATUS_NOT_AVAILABLE] * 3)
+
+        self.assertIsNone(missing.type)
+        self.assertEqual(len(missing), 12)
+        self.assertEqual(set(missing.status), {columnar.STATUS_ERROR})
+
+    @unittest.skipIf(columnar.numpy is None, 'NumPy is not installed')
+    @patch('archicad.releases.ac26.b3000commands.post_command')
+    def test_to_numpy(self, mocked_post_command):
+        mocked_post_command.side_effect = _fake_mixed_property_values
+        commands = Commands(Request('http://127.0.0.1:19723'))
+        elements = [ElementIdArrayItem({'guid': _guid(i)}) for i in range(12)]
+        properties = [PropertyIdArrayItem({'guid': _guid(i)}) for i in range(3)]
+        lengths = commands.GetPropertyValueColumnsOfElements(elements, properties)[0]
+        values, status = lengths.to_numpy()
+        self.assertEqual(values[status == columnar.STATUS_NORMAL].tolist(), [i / 2 for i in range(12) if i % 4 and i != 7])
+
+    def test_mismatching_value_count(self):
+        builder = columnar.PropertyColumnsBuilder([PropertyIdArrayItem({'guid': _guid(i)}) for i in range(2)])
+        with self.assertRaises(ValueError):
+            builder.extend([{'propertyValues': [{'propertyValue': {'type': 'integer', 'status': 'normal', 'value': 1}}]}])
+
+
+class TestBoundingBoxArrays(unittest.TestCase):
+    def setUp(self):
+        self.elements = [ElementIdArrayItem({'guid': _guid(i)}) for i in range(25)]
+
+    @patch('archicad.releases.ac26.b3000commands.post_command')
+    def test_3d_bounding_box_array(self, mocked_post_command):
+        mocked_post_command.side_effect = _fake_bounding_boxes
+        boxes = Commands(Request('http://127.0.0.1:19723'), chunkSize=10).Get3DBoundingBoxArray(self.elements)
+        self.assertEqual(len(boxes), 25)
+        self.assertEqual(len(boxes.values), 25 * 6)
+        self.assertEqual(list(boxes.errors), [int(i % 3 == 0) for i in range(25)])
+        self.assertEqual(boxes[4], (4, 4, 4, 5, 5, 5))
+        self.assertIsNone(boxes[3])
+        self.assertEqual(boxes.errorItems[3], {'code': 3, 'message': 'No bounding box'})
+
+    @unittest.skipIf(columnar.numpy is None, 'NumPy is not installed')
+    @patch('archicad.releases.ac26.b3000commands.post_command')
+    def test_to_numpy(self, mocked_post_command):
+        mocked_post_command.side_effect = _fake_bounding_boxes
+        values, errors = Commands(Request('http://127.0.0.1:19723')).Get3DBoundingBoxArray(self.elements).to_numpy()
+        self.assertEqual(values.shape, (25, 6))
+        self.assertEqual(errors.tolist(), [i % 3 == 0 for i in range(25)])
+        self.assertEqual(values[~errors, 0].tolist(), [i for i in range(25) if i % 3])
+
+    def test_async_2d_bounding_box_array(self):
+        async def fake(req, pool, jsonStr):
+            command = json.loads(jsonStr)
+            return {'succeeded': True, 'result': {'boundingBoxes2D': [{'boundingBox2D': {'xMin': 0, 'yMin': 1, 'xMax': 2, 'yMax': 3}} for _ in command['parameters']['elements']]}}
+
+        async def run():
+            return await AsyncCommands(Request('http://127.0.0.1:19723'), chunkSize=10).Get2DBoundingBoxArray(self.elements)
+
+        with patch('archicad.releases.ac26.b3000commands.async_post_command', new=fake):
+            boxes = asyncio.run(run())
+        self.assertEqual(len(boxes), 25)
+        self.assertEqual(boxes[-1], (0, 1, 2, 3))
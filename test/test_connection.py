@@ -1,6 +1,10 @@
+import os
+import subprocess
+import sys
 import unittest
 from unittest.mock import patch, ANY
 
+import archicad
 from archicad.commands import UnsucceededCommandCall
 from archicad.connection import ACConnection
 
@@ -152,3 +156,12 @@ class TestACConnection(unittest.TestCase):
         self.mocked_prod_info.assert_called_with()
         self.mocked_versioning.assert_called_with(24, 2310, ANY)
 
+
+class TestPackageImport(unittest.TestCase):
+    def test_exports_are_imported_on_access(self):
+        statement = ("import sys, archicad\n"
+                     "assert 'archicad.connection' not in sys.modules and 'archicad.releases' not in sys.modules\n"
+                     "from archicad import ACConnection, Types\n"
+                     "assert ACConnection.__module__ == 'archicad.connection' and 'archicad.releases' in sys.modules")
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(archicad.__file__))))
+        subprocess.run([sys.executable, '-c', statement], env=env, check=True)
@@ -0,0 +1,76 @@
+import unittest
+from uuid import UUID
+
+from archicad import builders, identifiers
+from archicad.releases.ac26 import b3000types as T
+from archicad.releases.ac26.b3000types import ElementId, ElementIdArrayItem, NavigatorItemId, PropertyId
+
+
+_GUID = '3F2504E0-4F89-11D3-9A0C-0305E82C3301'
+
+
+class TestGuidIdentifiers(unittest.TestCase):
+    def test_equality(self):
+        self.assertEqual(ElementId(_GUID), ElementId(_GUID.lower()))
+        self.assertEqual(hash(ElementId(_GUID)), hash(ElementId(UUID(_GUID))))
+        self.assertNotEqual(ElementId(_GUID), ElementId('00000000-0000-0000-0000-000000000000'))
+        self.assertNotEqual(ElementId(_GUID), PropertyId(_GUID))
+        self.assertNotEqual(ElementId(_GUID), _GUID)
+
+    def test_dictionary_keys(self):
+        values = {ElementId(_GUID): 1, PropertyId(_GUID): 2}
+        self.assertEqual(values[ElementId.from_dict({'guid': _GUID})], 1)
+        self.assertEqual(values[PropertyId(_GUID.lower())], 2)
+        self.assertNotIn(NavigatorItemId(_GUID), values)
+
+
+class TestStructuralIdentity(unittest.TestCase):
+    def test_compound_identifiers(self):
+        classificationId = T.ClassificationId(T.ClassificationSystemId(_GUID), T.ClassificationItemId(_GUID))
+        self.assertEqual(classificationId, T.ClassificationId(T.ClassificationSystemId(_GUID.lower()), T.ClassificationItemId(_GUID)))
+        self.assertNotEqual(classificationId, T.ClassificationId(T.ClassificationSystemId(_GUID)))
+        self.assertEqual({ElementIdArrayItem(ElementId(_GUID)), ElementIdArrayItem(ElementId(_GUID))}, {ElementIdArrayItem(ElementId(_GUID.lower()))})
+        self.assertEqual(T.UserDefinedPropertyUserId(['Group', 'Name']), T.UserDefinedPropertyUserId(['Group', 'Name']))
+        self.assertEqual(hash(T.UserDefinedPropertyUserId(['Group', 'Name'])), hash(T.UserDefinedPropertyUserId(['Group', 'Name'])))
+        self.assertNotEqual(T.DisplayValueEnumId('A'), T.NonLocalizedValueEnumId('A'))
+        self.assertIn(T.EnumValueId(type='displayValue', displayValue='A'), {T.DisplayValueEnumId('A')})
+
+    def test_other_types_unchanged(self):
+        self.assertNotEqual(T.NormalStringPropertyValue('a'), T.NormalStringPropertyValue('a'))
+
+    def test_generated_once(self):
+        T.AddOnCommandId('namespace', 'name') == T.AddOnCommandId('namespace', 'name')
+        eq = T.AddOnCommandId.__eq__
+        self.assertEqual(eq.__qualname__, 'AddOnCommandId.__eq__')
+        hash(T.AddOnCommandId('namespace', 'name'))
+        self.assertIs(T.AddOnCommandId.__eq__, eq)
+
+
+class TestInterning(unittest.TestCase):
+    def tearDown(self):
+        identifiers.set_interning(False)
+        identifiers.interned.clear()
+
+    def test_disabled(self):
+        self.assertIsNot(ElementId.from_dict({'guid': _GUID}), ElementId.from_dict({'guid': _GUID}))
+        self.assertEqual(len(identifiers.interned), 0)
+
+    def test_shared_instances(self):
+        identifiers.set_interning(True)
+        items = [{'elementId': {'guid': _GUID}}, {'elementId': {'guid': _GUID.lower()}}]
+        strict = builders.strict_list_builder(ElementIdArrayItem)(items)
+        trusted = builders.trusted_list_builder(ElementIdArrayItem)(items)
+        self.assertEqual(len({id(item.elementId) for item in strict + trusted}), 1)
+        self.assertIs(ElementId.from_dict({'guid': _GUID}), strict[0].elementId)
+        self.assertIsNot(PropertyId.from_dict({'guid': _GUID}), strict[0].elementId)
+        self.assertEqual(len(identifiers.interned), 2)
+
+    def test_validates_first_construction(self):
+        identifiers.set_interning(True)
+        with self.assertRaises(ValueError):
+            ElementId.from_dict({'guid': 'not a guid'})
+        self.assertEqual(len(identifiers.interned), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
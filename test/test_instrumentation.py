@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import unittest
+from urllib.request import Request
+
+from archicad import instrumentation
+from archicad.mockserver import MockArchicadServer, SyntheticModel
+from archicad.releases.ac26.b3000commands import AsyncCommands, Commands, UnsucceededCommandCall
+from archicad.releases.ac26.b3000types import ClassificationSystemId, PropertyIdArrayItem
+
+
+class _ListSink(instrumentation.MetricsSink):
+    def __init__(self):
+        self.records = []
+
+    def record(self, metrics):
+        self.records.append(metrics)
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.server = MockArchicadServer(SyntheticModel(element_count=120, property_count=8)).start()
+        self.sink = _ListSink()
+        instrumentation.add_sink(self.sink)
+
+    def tearDown(self):
+        instrumentation.remove_sink(self.sink)
+        self.server.stop()
+
+    def test_command(self):
+        elements = Commands(Request(self.server.url)).GetAllElements()
+        self.assertEqual(len(self.sink.records), 1)
+        metrics = self.sink.records[0]
+        self.assertEqual(metrics.method, 'GetAllElements')
+        self.assertEqual(metrics.command, 'API.GetAllElements')
+        self.assertEqual(metrics.requests, 1)
+        self.assertTrue(metrics.succeeded)
+        self.assertGreater(metrics.response_bytes, 120 * 36)
+        self.assertGreater(metrics.request_bytes, 0)
+        self.assertGreater(metrics.round_trip_time, 0.0)
+        for phase in instrumentation.TIME_PHASES:
+            self.assertGreaterEqual(getattr(metrics, phase), 0.0)
+        self.assertLessEqual(metrics.serialize_time + metrics.round_trip_time + metrics.decode_time + metrics.build_time, metrics.total_time + 1e-9)
+        self.assertEqual(len(elements), 120)
+
+    def test_chunks(self):
+        for maxParallelChunks in (1, 3):
+            self.sink.records.clear()
+            commands = Commands(Request(self.server.url), chunkSize=25, maxParallelChunks=maxParallelChunks)
+            elements = commands.GetAllElements()
+            self.sink.records.clear()
+            self.assertEqual(len(commands.GetTypesOfElements(elements)), 120)
+            metrics, = self.sink.records
+            self.assertEqual(metrics.command, 'API.GetTypesOfElements')
+            self.assertEqual(metrics.requests, 5)
+            self.assertGreater(metrics.serialize_time, 0.0)
+
+    def test_iterator(self):
+        commands = Commands(Request(self.server.url), chunkSize=50)
+        elements = commands.GetAllElements()
+        properties = [PropertyIdArrayItem(p.propertyId) for p in commands.GetAllPropertyIds()][:2]
+        self.sink.records.clear()
+        self.assertEqual(len(list(commands.IterPropertyValuesOfElements(elements, properties))), 120)
+        metrics, = self.sink.records
+        self.assertEqual(metrics.method, 'IterPropertyValuesOfElements')
+        self.assertEqual(metrics.command, 'API.GetPropertyValuesOfElements')
+        self.assertEqual(metrics.requests, 3)
+
+    def test_failure(self):
+        with self.assertRaises(UnsucceededCommandCall):
+            Commands(Request(self.server.url)).GetAllClassificationsInSystem(ClassificationSystemId('00000000-0000-0000-0000-000000000000'))
+        metrics, = self.sink.records
+        self.assertFalse(metrics.succeeded)
+
+    def test_async(self):
+        async def run():
+            async with AsyncCommands(Request(self.server.url), chunkSize=40, maxParallelChunks=2) as commands:
+                elements = await commands.GetAllElements()
+                return await commands.GetTypesOfElements(elements)
+
+        self.assertEqual(len(asyncio.run(run())), 120)
+        self.assertEqual([m.command for m in self.sink.records], ['API.GetAllElements', 'API.GetTypesOfElements'])
+        self.assertEqual(self.sink.records[1].requests, 3)
+
+    def test_no_sink(self):
+        instrumentation.remove_sink(self.sink)
+        Commands(Request(self.server.url)).GetAllElements()
+        self.assertEqual(self.sink.records, [])
+        self.assertIsNone(instrumentation.current())
+
+
+class TestSinks(unittest.TestCase):
+    def _metrics(self, command, total):
+        metrics = instrumentation.CommandMetrics(command[len('API.'):])
+        metrics.command = command
+        metrics.total_time = total
+        metrics.round_trip_time = total / 2
+        metrics.response_bytes = 5000
+        return metrics
+
+    def test_histogram(self):
+        sink = instrumentation.HistogramSink()
+        for total in (0.002, 0.004, 0.2):
+            sink.record(self._metrics('API.GetAllElements', total))
+        histogram = sink.histogram('API.GetAllElements', 'total_time')
+        self.assertEqual(histogram.count, 3)
+        self.assertAlmostEqual(histogram.sum, 0.206)
+        self.assertEqual(histogram.cumulative_counts()[-1], 3)
+        self.assertEqual(histogram.quantile(0.5), 0.005)
+        self.assertEqual(sink.histogram('API.GetAllElements', 'response_bytes').quantile(1.0), 1e4)
+        summary = sink.summary()['API.GetAllElements']
+        self.assertEqual(summary['calls'], 3)
+        self.assertAlmostEqual(summary['round_trip_time'], 0.206 / 6)
+
+    def test_prometheus(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'archicad.prom')
+            sink = instrumentation.PrometheusTextFileSink(path, interval=3600)
+            sink.record(self._metrics('API.GetAllElements', 0.01))
+            failed = self._metrics('API.IsAlive', 0.001)
+            failed.succeeded = False
+            sink.record(failed)
+            with open(path) as f:
+                self.assertEqual(f.read().count('_count{'), 7)
+            sink.write()
+            with open(path) as f:
+                text = f.read()
+        self.assertIn('# TYPE archicad_command_total_seconds histogram', text)
+        self.assertIn('archicad_command_total_seconds_bucket{command="API.GetAllElements",le="0.01"} 1', text)
+        self.assertIn('archicad_command_response_bytes_bucket{command="API.IsAlive",le="+Inf"} 1', text)
+        self.assertIn('archicad_command_failures_total{command="API.IsAlive"} 1', text)
+
+    def test_prometheus_label_escaping(self):
+        with tempfile.TemporaryDirectory() as directory:
+            sink = instrumentation.PrometheusTextFileSink(os.path.join(directory, 'archicad.prom'), interval=3600)
+            failed = self._metrics('API.Add"On\\Command\nX', 0.01)
+            failed.succeeded = False
+            sink.record(failed)
+            text = sink.render()
+        self.assertIn('archicad_command_total_seconds_count{command="API.Add\\"On\\\\Command\\nX"} 1', text)
+        self.assertIn('archicad_command_failures_total{command="API.Add\\"On\\\\Command\\nX"} 1', text)
+        self.assertTrue(all(line.startswith(('#', 'archicad_command_')) for line in text.splitlines()))
+
+    def test_prometheus_threads(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'archicad.prom')
+            sink = instrumentation.PrometheusTextFileSink(path, interval=0)
+            errors = []
+
+            def record():
+                try:
+                    for _ in range(50):
+                        sink.record(self._metrics('API.GetAllElements', 0.01))
+                except Exception as e:
+                    errors.append(e)
+            threads = [threading.Thread(target=record) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(errors, [])
+            self.assertEqual(os.listdir(directory), ['archicad.prom'])
+            with open(path) as f:
+                self.assertEqual(f.read(), sink.render())
+
+    def test_abstract_sink(self):
+        with self.assertRaises(TypeError):
+            instrumentation.MetricsSink()
+
+    def test_logging(self):
+        with self.assertLogs('archicad.instrumentation', logging.INFO) as logs:
+            instrumentation.LoggingSink().record(self._metrics('API.GetAllElements', 0.01))
+        self.assertIn('GetAllElements (API.GetAllElements): total 10.0 ms', logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
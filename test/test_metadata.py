@@ -0,0 +1,112 @@
+import unittest
+from typing import List, Optional
+from uuid import UUID
+
+from archicad import metadata
+from archicad.acbasetype import _ACBaseType
+from archicad.releases.ac26 import b3000classdata, b3000commands, b3000types as T
+
+
+class TestMetadata(unittest.TestCase):
+    def test_kinds(self):
+        self.assertEqual(metadata.type_kind(str), metadata.SCALAR)
+        self.assertEqual(metadata.type_kind(float), metadata.FLOAT)
+        self.assertEqual(metadata.type_kind(UUID), metadata.UUID_)
+        self.assertEqual(metadata.type_kind(List[T.ElementIdArrayItem]), metadata.LIST)
+        self.assertEqual(metadata.type_kind(T.ElementId), metadata.CLASS)
+        self.assertEqual(metadata.type_kind(T.PropertyValue), metadata.UNION_CLASS)
+        self.assertEqual(metadata.type_kind(None), metadata.UNTYPED)
+        self.assertEqual(metadata.type_kind(dict), metadata.OTHER)
+
+    def test_fields(self):
+        fields = metadata.fields_of(T.NormalStringPropertyValue)
+        self.assertEqual([field.name for field in fields], ['value', 'type', 'status'])
+        value, type_, status = fields
+        self.assertTrue(value.required)
+        self.assertIs(value.default, metadata.MISSING)
+        self.assertEqual((value.kind, value.validators, value.allowed_values), (metadata.SCALAR, (), None))
+        self.assertFalse(type_.required)
+        self.assertEqual(type_.default, 'string')
+        self.assertTrue(all(validator('string') and not validator('number') for validator in type_.validators))
+        self.assertEqual(type_.allowed_values, ('string',))
+        self.assertIs(metadata.fields_of(T.NormalStringPropertyValue), fields)
+
+    def test_list_items(self):
+        field, = metadata.fields_of(T.UserDefinedPropertyUserId)[:1]
+        self.assertEqual((field.kind, field.item_type, field.item_kind), (metadata.LIST, str, metadata.SCALAR))
+        self.assertIsNone(metadata.fields_of(T.ElementId)[0].item_kind)
+
+
+_GENERATED = (
+    'class Pen(_ACBaseType):\r\n'
+    '    def __init__(self, index: int, names: Optional[List[str]] = None):\r\n'
+    '        self.index: int = index\r\n'
+    '        self.names: Optional[List[str]] = names\r\n'
+    '\r\n'
+    "Pen.get_classinfo().add_field('index', int, maximum(255, False))\r\n"
+    "Pen.get_classinfo().add_field('names', Optional[List[str]], listitem_validator(value_set(['a', 'b'])), min_items(1))\r\n"
+    '\r\n'
+    '\r\n'
+    'class Other(_ACBaseType):\r\n'
+    '    pass\r\n')
+
+
+class TestFieldTable(unittest.TestCase):
+    def test_extract_declarations(self):
+        table, stripped = metadata.extract_declarations(_GENERATED)
+        self.assertEqual(table, (('Pen', (('index', 'int', ('maximum', 255, False)),
+                                          ('names', ('Optional', ('List', 'str')), ('listitem_validator', ('value_set', ('a', 'b'))), ('min_items', 1)))),))
+        self.assertEqual(stripped, _GENERATED[:_GENERATED.index('Pen.get_classinfo')] + '\r\n' + _GENERATED[_GENERATED.index('class Other'):])
+        self.assertEqual(metadata.resolve_type(table[0][1][1][1], {}), Optional[List[str]])
+        validator = metadata.resolve_validator(table[0][1][1][2])
+        self.assertTrue(validator(['a', 'b']))
+        self.assertFalse(validator(['c']))
+
+    def test_shipped_table_is_up_to_date(self):
+        for module in (T, b3000commands):
+            with open(module.__file__, newline='') as f:
+                source = f.read()
+            self.assertEqual(metadata.extract_declarations(source), ((), source))
+        with open(b3000classdata.__file__, newline='') as f:
+            rendered = f.read()
+        self.assertEqual(metadata.render_table({'TYPES': b3000classdata.TYPES, 'COMMANDS': b3000classdata.COMMANDS}, '\r\n'), rendered)
+
+    def test_table_declares_every_parameter(self):
+        for module, table in ((T, b3000classdata.TYPES), (b3000commands, b3000classdata.COMMANDS)):
+            for typeName, fields in table:
+                cls = getattr(module, typeName)
+                self.assertEqual(list(cls.get_classinfo().fields), [field[0] for field in fields])
+                self.assertEqual([field.name for field in metadata.fields_of(cls)], [field[0] for field in fields])
+
+    def test_lazy_classinfo(self):
+        class Pen(_ACBaseType):
+            __slots__ = ('index', 'color')
+
+            def __init__(self, index: int, color: Optional[T.RGBColor] = None):
+                self.index = index
+                self.color = color
+
+        metadata.install_classinfo({'Pen': Pen, 'RGBColor': T.RGBColor}, (('Pen', (('index', 'int', ('maximum', 255, False)), ('color', ('Optional', 'RGBColor')))),))
+        classinfo = Pen.get_classinfo()
+        self.assertNotIn('fields', vars(classinfo))
+        self.assertEqual(Pen(3).index, 3)
+        self.assertEqual(classinfo.fields, {'index': int, 'color': Optional[T.RGBColor]})
+        self.assertEqual(list(classinfo.value_validators), ['index'])
+        with self.assertRaises(ValueError):
+            Pen(256)
+
+
+class TestTypes(unittest.TestCase):
+    def test_lazy_namespace(self):
+        self.assertIs(T.Types.ElementId, T.ElementId)
+        self.assertIs(T.Types().NavigatorItemId, T.NavigatorItemId)
+        self.assertIn('PropertyValue', dir(T.Types))
+        self.assertIn('PropertyValue', dir(T.Types()))
+        with self.assertRaises(AttributeError):
+            T.Types.metadata
+        with self.assertRaises(AttributeError):
+            T.Types().Missing
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import inspect
+import json
+import re
+import time
+import unittest
+from urllib.request import Request
+
+from archicad.mockserver import MockArchicadServer, SyntheticModel
+from archicad.releases.ac26 import b3000commands
+from archicad.releases.ac26.b3000commands import Commands, UnsucceededCommandCall
+from archicad.releases.ac26.b3000types import (BoundingBox3DWrapper, ClassificationIdsOrErrorsWrapper, ClassificationSystemIdArrayItem,
+                                               ElementIdArrayItem, ErrorItem, OtherNavigatorTreeId, PropertyIdArrayItem, TypeOfElementWrapper)
+
+
+class TestSyntheticModel(unittest.TestCase):
+    def test_answers_every_command(self):
+        commandNames = set(re.findall(r'"command": "API\.(\w+)"', inspect.getsource(b3000commands)))
+        self.assertGreater(len(commandNames), 50)
+        for name in commandNames:
+            self.assertTrue(callable(getattr(SyntheticModel, name, None)), name)
+
+
+class TestMockArchicadServer(unittest.TestCase):
+    def setUp(self):
+        self.server = MockArchicadServer(SyntheticModel(element_count=200, property_count=12, string_length=64)).start()
+        self.commands = Commands(Request(self.server.url), chunkSize=50)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_elements(self):
+        self.assertTrue(self.commands.IsAlive())
+        elements = self.commands.GetAllElements()
+        self.assertEqual(len(elements), 200)
+        types = self.commands.GetTypesOfElements(elements[:8])
+        self.assertTrue(all(isinstance(t, TypeOfElementWrapper) for t in types))
+        self.assertEqual(len(self.commands.GetElementsByType('Wall')), 25)
+        boxes = self.commands.Get3DBoundingBoxes(elements + [ElementIdArrayItem({'guid': '00000000-0000-0000-0000-000000000000'})])
+        self.assertIsInstance(boxes[0], BoundingBox3DWrapper)
+        self.assertIsInstance(boxes[-1], ErrorItem)
+        self.assertEqual(len(self.commands.Get3DBoundingBoxArray(elements)), 200)
+
+    def test_properties(self):
+        elements = self.commands.GetAllElements()
+        properties = self.commands.GetAllPropertyIds()
+        self.assertEqual(len(properties), 12)
+        definitions = self.commands.GetDetailsOfProperties(properties)
+        self.assertLessEqual({'length', 'string', 'singleEnum', 'multiEnum'}, {d.propertyDefinition.type for d in definitions})
+        values = self.commands.GetPropertyValuesOfElements(elements, properties)
+        self.assertEqual(len(values), 200)
+        self.assertEqual(len(values[0].propertyValues), 12)
+        self.assertEqual(len(values[1].propertyValues[0].propertyValue.value), 64)
+        self.assertEqual(self.commands.GetPropertyIds(self.commands.GetAllPropertyNames())[3].propertyId.guid, properties[3].propertyId.guid)
+
+    def test_classifications_and_navigator(self):
+        systems = self.commands.GetAllClassificationSystems()
+        self.assertEqual(len(systems), 2)
+        items = self.commands.GetAllClassificationsInSystem(systems[0].classificationSystemId)
+        self.assertEqual(len(items), 4)
+        self.assertEqual(len(items[0].classificationItem.children[0].classificationItem.children), 4)
+        classifications = self.commands.GetClassificationsOfElements(self.commands.GetAllElements()[:3], [ClassificationSystemIdArrayItem(s.classificationSystemId) for s in systems])
+        self.assertIsInstance(classifications[0], ClassificationIdsOrErrorsWrapper)
+        tree = self.commands.GetNavigatorItemTree(OtherNavigatorTreeId('ProjectMap'))
+        self.assertEqual(tree.rootItem.type, 'ProjectMapRootItem')
+        self.assertEqual(len(tree.rootItem.children), 4)
+
+    def test_mutation(self):
+        elements = self.commands.GetAllElements()[:1]
+        properties = [PropertyIdArrayItem(p.propertyId) for p in self.commands.GetAllPropertyIds('UserDefined')[:1]]
+        definition = self.commands.GetDetailsOfProperties(properties)[0].propertyDefinition
+        self.assertEqual(definition.type, 'boolean')
+        results = self.commands.SetPropertyValuesOfElements([{'elementId': elements[0].elementId.to_dict(), 'propertyId': properties[0].propertyId.to_dict(),
+                                                               'propertyValue': {'type': 'boolean', 'status': 'normal', 'value': True}}])
+        self.assertTrue(results[0].success)
+        self.assertEqual(self.commands.GetPropertyValuesOfElements(elements, properties)[0].propertyValues[0].propertyValue.value, True)
+
+    def test_unknown_command_and_injected_errors(self):
+        with self.assertRaises(UnsucceededCommandCall):
+            self.commands.GetLayoutSettings({'guid': '00000000-0000-0000-0000-000000000000'})
+        self.assertFalse(self.server.answer(json.dumps({'command': 'API.Nothing'}).encode())['succeeded'])
+        self.server.error_rate = 1.0
+        with self.assertRaises(UnsucceededCommandCall):
+            self.commands.GetAllElements()
+        self.server.error_rate = 0.0
+        self.server.latency = 0.05
+        start = time.monotonic()
+        self.commands.IsAlive()
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
@@ -0,0 +1,55 @@
+import json
+import unittest
+
+from archicad.mockserver import SyntheticModel
+from archicad.navigatorindex import NavigatorTreeIndex
+from archicad.releases.ac26.b3000types import NavigatorItemId, NavigatorTree
+
+
+def _walk(item, parent=None, depth=0):
+    yield item, parent, depth
+    for child in item.children or []:
+        yield from _walk(child.navigatorItem, item, depth + 1)
+
+
+class TestNavigatorTreeIndex(unittest.TestCase):
+    def setUp(self):
+        model = SyntheticModel(navigator_depth=3, navigator_branching=3)
+        self.tree = NavigatorTree(**json.loads(json.dumps(model.GetNavigatorItemTree({'type': 'ProjectMap'})['navigatorTree'])))
+        self.index = NavigatorTreeIndex(self.tree.rootItem)
+
+    def test_same_as_tree(self):
+        walk = list(_walk(self.tree.rootItem))
+        self.assertEqual(len(self.index), len(walk))
+        self.assertEqual(list(self.index), [item for item, _, _ in walk])
+        for item, parent, depth in walk:
+            itemId = NavigatorItemId(item.navigatorItemId.guid)
+            self.assertIs(self.index.get(itemId), item)
+            self.assertIs(self.index.parent(itemId), parent)
+            self.assertEqual(self.index.depth(itemId), depth)
+            self.assertEqual(self.index.children(itemId), [child.navigatorItem for child in item.children or []])
+            self.assertEqual(self.index.descendants(itemId), [descendant for descendant, _, _ in _walk(item)][1:])
+
+    def test_traversal(self):
+        leaf = self.index.items[-1]
+        path = self.index.path(leaf.navigatorItemId)
+        self.assertEqual(len(path), 4)
+        self.assertIs(path[0], self.index.root)
+        self.assertEqual(list(self.index.ancestors(leaf.navigatorItemId)), path[-2::-1])
+        self.assertTrue(self.index.is_ancestor(path[1].navigatorItemId, leaf.navigatorItemId))
+        self.assertFalse(self.index.is_ancestor(leaf.navigatorItemId, path[1].navigatorItemId))
+        self.assertIsNone(self.index.parent(self.index.root.navigatorItemId))
+
+    def test_lookups(self):
+        item = self.index.items[5]
+        self.assertEqual(self.index.with_prefix(item.prefix), [item])
+        self.assertEqual(self.index.named(item.name), [item])
+        self.assertEqual(self.index.named(item.name, prefix='other'), [])
+        self.assertEqual(self.index.of_type(item.type), [i for i in self.index if i.type == item.type])
+        self.assertIsNone(self.index.get(NavigatorItemId('00000000-0000-0000-0000-000000000000')))
+        with self.assertRaises(KeyError):
+            self.index.parent(NavigatorItemId('00000000-0000-0000-0000-000000000000'))
+
+
+if __name__ == '__main__':
+    unittest.main()
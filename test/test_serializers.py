@@ -0,0 +1,60 @@
+import json
+import unittest
+from uuid import UUID
+
+from archicad import builders, serializers
+from archicad.acbasetype import _ACBaseType
+from archicad.mockserver import SyntheticModel
+from archicad.releases.ac26 import b3000commands as C
+from archicad.releases.ac26.b3000types import (ElementId, ElementPropertyValue, NavigatorTree, NormalLengthPropertyValue, NormalStringPropertyValue,
+                                               PropertyDefinitionOrError, PropertyId, PropertyValuesOrError)
+
+
+def _generic_to_dict(obj):
+    """The generic walker of _ACBaseType.to_dict applied recursively."""
+    def deserialize(value):
+        if isinstance(value, _ACBaseType):
+            return _generic_to_dict(value)
+        if isinstance(value, UUID):
+            return str(value).upper()
+        if isinstance(value, list):
+            return [deserialize(item) for item in value]
+        return value
+    return {name: deserialize(getattr(obj, name)) for name in obj.__slots__ if getattr(obj, name) is not None}
+
+
+class TestSerializers(unittest.TestCase):
+    def test_same_as_generic(self):
+        model = SyntheticModel(element_count=60, property_count=40, string_length=8)
+        elements = model.GetAllElements()['elements']
+        propertyIds = model.GetAllPropertyIds()['propertyIds']
+        objects = builders.trusted_list_builder(PropertyValuesOrError)(json.loads(json.dumps(model.GetPropertyValuesOfElements(elements, propertyIds)['propertyValuesForElements'])))
+        objects += builders.trusted_list_builder(PropertyDefinitionOrError)(json.loads(json.dumps(model.GetDetailsOfProperties(propertyIds)['propertyDefinitions'])))
+        objects.append(NavigatorTree(**json.loads(json.dumps(model.GetNavigatorItemTree({'type': 'ProjectMap'})['navigatorTree']))))
+        for obj in objects:
+            self.assertEqual(obj.to_dict(), _generic_to_dict(obj))
+
+    def test_parameters(self):
+        elementPropertyValues = [ElementPropertyValue(ElementId('00000000-0000-0000-0000-00000000000%d' % i),
+                                                      PropertyId('10000000-0000-0000-0000-00000000000%d' % i),
+                                                      NormalLengthPropertyValue(i) if i % 2 else NormalStringPropertyValue(str(i)))
+                                 for i in range(4)]
+        parameters = C._SetPropertyValuesOfElements_parameters(elementPropertyValues)
+        result = parameters.to_dict()
+        self.assertEqual(result, _generic_to_dict(parameters))
+        self.assertEqual(result['elementPropertyValues'][1], {'elementId': {'guid': '00000000-0000-0000-0000-000000000001'},
+                                                              'propertyId': {'guid': '10000000-0000-0000-0000-000000000001'},
+                                                              'propertyValue': {'value': 1.0, 'type': 'length', 'status': 'normal'}})
+
+    def test_generated_once(self):
+        value = NormalStringPropertyValue('a')
+        value.to_dict()
+        to_dict = NormalStringPropertyValue.to_dict
+        self.assertIsNot(to_dict, serializers._compiling_to_dict)
+        NormalStringPropertyValue('b').to_dict()
+        self.assertIs(NormalStringPropertyValue.to_dict, to_dict)
+        self.assertEqual(to_dict.__qualname__, 'NormalStringPropertyValue.to_dict')
+
+
+if __name__ == '__main__':
+    unittest.main()
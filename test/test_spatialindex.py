@@ -0,0 +1,63 @@
+import math
+import random
+import unittest
+
+from archicad.spatialindex import SpatialIndex
+
+
+def _random_boxes(count, seed=0):
+    rnd = random.Random(seed)
+    boxes = {}
+    for i in range(count):
+        x, y, z = rnd.uniform(0, 100), rnd.uniform(0, 100), rnd.uniform(0, 10)
+        boxes[i] = (x, y, z, x + rnd.uniform(0, 5), y + rnd.uniform(0, 5), z + rnd.uniform(0, 3))
+    boxes[count] = (-1000, -1000, -1000, 1000, 1000, 1000)
+    return boxes
+
+
+def _distance(box, point):
+    return math.sqrt(sum(max(box[i] - point[i], 0, point[i] - box[i + 3]) ** 2 for i in range(3)))
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        self.boxes = _random_boxes(2000)
+        self.index = SpatialIndex()
+        self.index.build((key, box, None) for key, box in self.boxes.items())
+
+    def test_oversized_box(self):
+        self.assertIn(2000, self.index._oversized)
+        self.assertEqual(len(self.index), 2001)
+
+    def test_intersecting(self):
+        for query in [(10, 10, 0, 20, 20, 5), (50, 50, 5, 50, 50, 5), (-5, -5, -5, 200, 200, 20), (500, 500, 500, 600, 600, 600)]:
+            expected = {key for key, box in self.boxes.items() if all(box[i] <= query[i + 3] and query[i] <= box[i + 3] for i in range(3))}
+            self.assertEqual(set(self.index.intersecting(query)), expected)
+
+    def test_containing(self):
+        for point in [(10, 10, 2), (50.5, 60.5, 4), (-500, 0, 0)]:
+            expected = {key for key, box in self.boxes.items() if all(box[i] <= point[i] <= box[i + 3] for i in range(3))}
+            self.assertEqual(set(self.index.containing(point)), expected)
+
+    def test_within_distance_and_nearest(self):
+        self.index.remove(2000)
+        del self.boxes[2000]
+        for point in [(10, 10, 2), (150, -20, 30)]:
+            expected = {key for key, box in self.boxes.items() if _distance(box, point) <= 3}
+            self.assertEqual(set(self.index.within_distance(point, 3)), expected)
+            expected = sorted(_distance(box, point) for box in self.boxes.values())[:5]
+            self.assertEqual([round(d, 9) for _, d in self.index.nearest(point, 5)], [round(d, 9) for d in expected])
+
+    def test_update(self):
+        self.index.update([(0, (500, 500, 500, 501, 501, 501), 'moved'), (1, None, None)])
+        self.assertEqual(set(self.index.containing((500.5, 500.5, 500.5))), {2000, 'moved'})
+        self.assertNotIn(1, self.index)
+        self.assertNotIn(1, self.index.intersecting((-1, -1, -1, 200, 200, 200)))
+        self.assertEqual(len(self.index), 2000)
+
+    def test_empty(self):
+        index = SpatialIndex()
+        self.assertEqual(index.intersecting((0, 0, 0, 1, 1, 1)), [])
+        self.assertEqual(index.nearest((0, 0, 0)), [])
+        index.insert('a', (0, 0, 0, 1, 1, 1))
+        self.assertEqual(index.nearest((3, 1, 1)), [('a', 2.0)])
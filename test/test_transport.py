@@ -0,0 +1,247 @@
+import asyncio
+import collections.abc
+import inspect
+import json
+import socket
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from unittest.mock import patch
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
+
+from archicad import transport
+from archicad.transport import HTTPConnectionPool, AsyncHTTPConnectionPool
+from archicad.releases.ac26.b3000commands import Commands, AsyncCommands
+
+
+GUID = '2A4B5C6D-1E2F-4A3B-8C9D-0E1F2A3B4C5D'
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.request_count += 1
+        if body.get('drop'):
+            self.close_connection = True
+            return
+        if body.get('truncate'):
+            self.send_response(200)
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            self.wfile.write(b'2\r\n{}\r\n')
+            self.close_connection = True
+            return
+        status = 500 if body.get('fail') else 200
+        if body.get('command') == 'API.GetAllElements':
+            reply = json.dumps({'succeeded': True, 'result': {'elements': [{'elementId': {'guid': GUID}}]}}).encode()
+        else:
+            reply = json.dumps({'port': self.server.server_port, 'echo': body}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, *args):
+        pass
+
+
+class _CountingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _EchoHandler)
+        self.connection_count = 0
+        self.request_count = 0
+
+    def process_request(self, request, client_address):
+        self.connection_count += 1
+        super().process_request(request, client_address)
+
+
+class TestHTTPConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.server = _CountingServer()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.port = self.server.server_port
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connection_reuse(self):
+        pool = HTTPConnectionPool('127.0.0.1', self.port)
+        for i in range(20):
+            self.assertEqual(json.loads(pool.post(json.dumps({'i': i}).encode()))['echo'], {'i': i})
+        self.assertEqual(self.server.connection_count, 1)
+        self.assertEqual(pool.idle_count, 1)
+        pool.close()
+        self.assertEqual(pool.idle_count, 0)
+
+    def test_bounded_size_under_threads(self):
+        pool = HTTPConnectionPool('127.0.0.1', self.port, max_size=3)
+        errors = []
+
+        def worker():
+            try:
+                for i in range(20):
+                    pool.post(json.dumps({'i': i}).encode())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertFalse(errors)
+        self.assertLessEqual(self.server.connection_count, 3)
+        self.assertLessEqual(pool.idle_count, 3)
+
+    def test_idle_eviction(self):
+        pool = HTTPConnectionPool('127.0.0.1', self.port, idle_timeout=10.0)
+        with patch('archicad.transport.time.monotonic', return_value=100.0):
+            pool.post(b'{}')
+        self.assertEqual(pool.idle_count, 1)
+        with patch('archicad.transport.time.monotonic', return_value=111.0):
+            pool.post(b'{}')
+        self.assertEqual(self.server.connection_count, 2)
+
+    def test_reconnect_after_server_side_close(self):
+        pool = HTTPConnectionPool('127.0.0.1', self.port)
+        pool.post(b'{}')
+        pool._idle[-1][0].sock.shutdown(socket.SHUT_RDWR)
+        self.assertEqual(json.loads(pool.post(b'{"a": 1}'))['echo'], {'a': 1})
+
+    def test_no_resend_after_lost_response(self):
+        pool = HTTPConnectionPool('127.0.0.1', self.port)
+        pool.post(b'{}')
+        with self.assertRaises(URLError):
+            pool.post(b'{"drop": true}')
+        self.assertEqual(self.server.request_count, 2)
+        self.assertEqual(pool.idle_count, 0)
+
+    def test_errors(self):
+        pool = HTTPConnectionPool('127.0.0.1', self.port)
+        with self.assertRaises(HTTPError):
+            pool.post(b'{"fail": true}')
+        self.server.shutdown()
+        self.server.server_close()
+        pool.close()
+        with self.assertRaises(URLError):
+            pool.post(b'{}')
+
+
+class TestAsyncHTTPConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.servers = [_CountingServer(), _CountingServer()]
+        for server in self.servers:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+    def test_concurrent_requests_on_multiple_ports(self):
+        pools = [AsyncHTTPConnectionPool('127.0.0.1', server.server_port, max_size=2) for server in self.servers]
+
+        async def run():
+            results = await asyncio.gather(*(pools[i % 2].post(json.dumps({'i': i}).encode()) for i in range(20)))
+            self.assertTrue(all(pool.idle_count <= 2 for pool in pools))
+            for pool in pools:
+                pool.close()
+            return results
+
+        results = [json.loads(result) for result in asyncio.run(run())]
+        self.assertEqual([result['echo'] for result in results], [{'i': i} for i in range(20)])
+        self.assertEqual([result['port'] for result in results], [self.servers[i % 2].server_port for i in range(20)])
+        for server in self.servers:
+            self.assertLessEqual(server.connection_count, 2)
+
+    def test_errors(self):
+        pool = AsyncHTTPConnectionPool('127.0.0.1', self.servers[0].server_port)
+
+        async def run():
+            with self.assertRaises(HTTPError):
+                await pool.post(b'{"fail": true}')
+            self.servers[0].shutdown()
+            self.servers[0].server_close()
+            pool.close()
+            with self.assertRaises(URLError):
+                await pool.post(b'{}')
+
+        asyncio.run(run())
+
+    def test_no_resend_after_lost_response(self):
+        pool = AsyncHTTPConnectionPool('127.0.0.1', self.servers[0].server_port)
+
+        async def run():
+            await pool.post(b'{}')
+            with self.assertRaises(URLError):
+                await pool.post(b'{"drop": true}')
+            self.assertEqual(pool.idle_count, 0)
+
+        asyncio.run(run())
+        self.assertEqual(self.servers[0].request_count, 2)
+
+    def test_truncated_chunked_response(self):
+        pool = AsyncHTTPConnectionPool('127.0.0.1', self.servers[0].server_port)
+
+        async def run():
+            with self.assertRaises(URLError):
+                await pool.post(b'{"truncate": true}')
+            self.assertEqual(pool.idle_count, 0)
+
+        asyncio.run(run())
+
+
+class TestAsyncCommands(unittest.TestCase):
+    def test_mirrors_commands(self):
+        command_names = {name for name in vars(Commands) if not name.startswith('_')}
+        self.assertTrue(command_names)
+        for name in command_names:
+            if name.startswith('Iter'):
+                self.assertTrue(inspect.isgeneratorfunction(getattr(Commands, name)), name)
+                self.assertTrue(inspect.isasyncgenfunction(getattr(AsyncCommands, name)), name)
+                self.assertEqual(inspect.signature(getattr(Commands, name)).parameters, inspect.signature(getattr(AsyncCommands, name)).parameters)
+                self.assertEqual(inspect.signature(getattr(Commands, name)).return_annotation.__origin__, collections.abc.Iterator)
+            else:
+                self.assertFalse(inspect.iscoroutinefunction(getattr(Commands, name)), name)
+                self.assertTrue(inspect.iscoroutinefunction(getattr(AsyncCommands, name)), name)
+                self.assertEqual(inspect.signature(getattr(Commands, name)), inspect.signature(getattr(AsyncCommands, name)))
+
+    def test_command_call(self):
+        server = _CountingServer()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        async def run():
+            async with AsyncCommands(Request(f'http://127.0.0.1:{server.server_port}')) as commands:
+                return await asyncio.gather(*(commands.GetAllElements() for _ in range(5)))
+
+        try:
+            for elements in asyncio.run(run()):
+                self.assertEqual(len(elements), 1)
+                self.assertEqual(str(elements[0].elementId.guid).upper(), GUID)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestSharedPools(unittest.TestCase):
+    def test_pool_per_address(self):
+        req1 = Request('http://127.0.0.1:19723')
+        req2 = Request('http://127.0.0.1:19723')
+        req3 = Request('http://127.0.0.1:19724')
+        self.assertIs(transport.get_connection_pool(req1), transport.get_connection_pool(req2))
+        self.assertIsNot(transport.get_connection_pool(req1), transport.get_connection_pool(req3))
+        self.assertEqual(transport.get_connection_pool(req3).port, 19724)
+
+        pool = HTTPConnectionPool('127.0.0.1', 19723, max_size=1)
+        transport.set_connection_pool(req1, pool)
+        self.assertIs(transport.get_connection_pool(req2), pool)
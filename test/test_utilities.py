@@ -0,0 +1,227 @@
+import unittest
+from unittest.mock import Mock, patch
+from uuid import UUID
+
+from archicad import columnar
+
+from archicad.releases.ac26.b3000types import PropertyId, PropertyDefinitionOrError, DisplayValueEnumId, NonLocalizedValueEnumId, ElementId, PropertyValuesWrapper, ElementIdArrayItem, BoundingBox3DOrError, NavigatorItemId, NavigatorTree, OtherNavigatorTreeId, ClassificationItemArrayItem, ClassificationItemId, ClassificationItemInTree, ClassificationSystem, ClassificationSystemId
+from archicad.releases.ac26.b3000utilities import Utilities
+
+
+PROPERTY_GUID = '2A4B5C6D-1E2F-4A3B-8C9D-0E1F2A3B4C5D'
+
+
+def _guid(i: int) -> str:
+    return f'00000000-0000-0000-0000-{i:012X}'
+
+
+def _enum_property_definition(displayValues):
+    return PropertyDefinitionOrError(propertyDefinition={
+        'propertyId': {'guid': PROPERTY_GUID},
+        'group': {'propertyGroupId': {'guid': PROPERTY_GUID}, 'name': 'Group'},
+        'name': 'Enum', 'description': '', 'isEditable': True,
+        'type': 'singleEnum',
+        'possibleEnumValues': [{'enumValue': {'enumValueId': {'type': 'nonLocalizedValue', 'nonLocalizedValue': f'id{i}'}, 'displayValue': value, 'nonLocalizedValue': f'id{i}'}}
+                               for i, value in enumerate(displayValues)]})
+
+
+class TestPropertyDefinitionCache(unittest.TestCase):
+    def setUp(self):
+        self.accommands = Mock()
+        self.accommands.GetDetailsOfProperties.side_effect = lambda propertyIds: [_enum_property_definition(['Red', 'Green', 'Blue'])] * len(propertyIds)
+        self.utilities = Utilities(Mock(), self.accommands)
+        self.propertyId = PropertyId(PROPERTY_GUID)
+
+    def test_enum_display_value_is_cached(self):
+        for _ in range(10):
+            self.assertEqual(self.utilities.GetDisplayValueFromPropertyEnumValueId(self.propertyId, NonLocalizedValueEnumId('id1')), 'Green')
+            self.assertEqual(self.utilities.GetDisplayValueFromPropertyEnumValueId(self.propertyId, DisplayValueEnumId('Blue')), 'Blue')
+        self.assertEqual(self.accommands.GetDetailsOfProperties.call_count, 1)
+
+    def test_invalidate(self):
+        self.utilities.GetDisplayValueFromPropertyEnumValueId(self.propertyId, NonLocalizedValueEnumId('id0'))
+        self.accommands.GetDetailsOfProperties.side_effect = lambda propertyIds: [_enum_property_definition(['Rot', 'Grün', 'Blau'])]
+        self.utilities.propertyDefinitionCache.Invalidate()
+        self.assertEqual(self.utilities.GetDisplayValueFromPropertyEnumValueId(self.propertyId, NonLocalizedValueEnumId('id0')), 'Rot')
+        self.assertEqual(self.accommands.GetDetailsOfProperties.call_count, 2)
+
+    def test_ttl(self):
+        self.utilities.propertyDefinitionCache.ttl = 10.0
+        with patch('archicad.releases.ac26.b3000utilities.time.monotonic', return_value=100.0):
+            self.utilities.GetDisplayValueFromPropertyEnumValueId(self.propertyId, NonLocalizedValueEnumId('id0'))
+        with patch('archicad.releases.ac26.b3000utilities.time.monotonic', return_value=105.0):
+            self.utilities.GetDisplayValueFromPropertyEnumValueId(self.propertyId, NonLocalizedValueEnumId('id0'))
+        self.assertEqual(self.accommands.GetDetailsOfProperties.call_count, 1)
+        with patch('archicad.releases.ac26.b3000utilities.time.monotonic', return_value=111.0):
+            self.utilities.GetDisplayValueFromPropertyEnumValueId(self.propertyId, NonLocalizedValueEnumId('id0'))
+        self.assertEqual(self.accommands.GetDetailsOfProperties.call_count, 2)
+
+    def test_unknown_enum_value_refetches_once(self):
+        self.utilities.GetDisplayValueFromPropertyEnumValueId(self.propertyId, NonLocalizedValueEnumId('id0'))
+        with self.assertRaises(KeyError):
+            self.utilities.GetDisplayValueFromPropertyEnumValueId(self.propertyId, NonLocalizedValueEnumId('id9'))
+        self.assertEqual(self.accommands.GetDetailsOfProperties.call_count, 2)
+
+    def test_prefetch_returns_the_definitions(self):
+        definitions = self.utilities.propertyDefinitionCache.Prefetch([self.propertyId, self.propertyId])
+        self.assertEqual(list(definitions), [UUID(PROPERTY_GUID)])
+        self.assertEqual(definitions[UUID(PROPERTY_GUID)].name, 'Enum')
+        self.assertIs(self.utilities.propertyDefinitionCache.Prefetch([self.propertyId])[UUID(PROPERTY_GUID)], definitions[UUID(PROPERTY_GUID)])
+        self.assertEqual(self.accommands.GetDetailsOfProperties.call_count, 1)
+
+    def test_lookup_survives_concurrent_invalidate(self):
+        class InvalidatedDict(dict):
+            # another thread invalidates the cache right after the fetched entries are stored
+            def update(self, entries):
+                pass
+
+        self.utilities.propertyDefinitionCache._entries = InvalidatedDict()
+        self.assertEqual(self.utilities.GetDisplayValueFromPropertyEnumValueId(self.propertyId, NonLocalizedValueEnumId('id1')), 'Green')
+
+
+class TestPropertyValuesDictionary(unittest.TestCase):
+    def test_definitions_are_fetched_once(self):
+        propertyIds = [PropertyId(_guid(i)) for i in range(3)]
+        elements = [ElementId(_guid(100 + i)) for i in range(50)]
+
+        def values(elements, properties, chunkSize):
+            for i, _ in enumerate(elements):
+                yield PropertyValuesWrapper([
+                    {'propertyValue': {'type': 'singleEnum', 'status': 'normal', 'value': {'type': 'nonLocalizedValue', 'nonLocalizedValue': f'id{i % 3}'}}},
+                    {'propertyValue': {'type': 'multiEnum', 'status': 'normal', 'value': [{'enumValueId': {'type': 'displayValue', 'displayValue': 'Green'}}]}},
+                    {'propertyValue': {'type': 'integer', 'status': 'normal', 'value': i}}])
+
+        accommands = Mock()
+        accommands.IterPropertyValuesOfElements.side_effect = values
+        accommands.GetDetailsOfProperties.side_effect = lambda propertyIds: [_enum_property_definition(['Red', 'Green', 'Blue'])] * len(propertyIds)
+        utilities = Utilities(Mock(), accommands)
+
+        dictionary = utilities.GetPropertyValuesDictionary(elements, propertyIds, chunkSize=10)
+        self.assertEqual([dictionary[element][propertyIds[0]] for element in elements[:4]], ['Red', 'Green', 'Blue', 'Red'])
+        self.assertEqual(dictionary[elements[7]][propertyIds[1]], ['Green'])
+        self.assertEqual(dictionary[elements[7]][propertyIds[2]], 7)
+        self.assertEqual(accommands.GetDetailsOfProperties.call_count, 1)
+        self.assertEqual({str(p.guid).upper() for p in accommands.GetDetailsOfProperties.call_args[0][0]}, {_guid(0), _guid(1)})
+        self.assertEqual(accommands.IterPropertyValuesOfElements.call_args[0][2], 10)
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def test_build_and_refresh(self):
+        elements = [ElementIdArrayItem({'guid': _guid(i)}) for i in range(10)]
+
+        def boxes(elements):
+            result = columnar.BoundingBoxArray(columnar.BOUNDING_BOX_3D_KEYS)
+            result.extend([{'boundingBox3D': {'xMin': i * 10, 'yMin': 0, 'zMin': 0, 'xMax': i * 10 + 1, 'yMax': 1, 'zMax': 1}} if i != 3 else {'error': {'code': 1, 'message': 'No box'}}
+                           for i in (int(str(e.elementId.guid)[-12:], 16) for e in elements)], 'boundingBox3D')
+            return result
+
+        accommands = Mock()
+        accommands.Get3DBoundingBoxArray.side_effect = boxes
+        utilities = Utilities(Mock(), accommands)
+        index = utilities.BuildSpatialIndex(elements)
+        self.assertEqual(len(index), 9)
+        self.assertEqual(index.containing((50.5, 0.5, 0.5)), [elements[5]])
+        self.assertEqual([element for element, _ in index.nearest((29, 0, 0), 2)], [elements[2], elements[4]])
+
+        movedBox = BoundingBox3DOrError(boundingBox3D={'xMin': 100, 'yMin': 0, 'zMin': 0, 'xMax': 101, 'yMax': 1, 'zMax': 1})
+        utilities.RefreshSpatialIndex(index, [elements[5], elements[6]], [movedBox, BoundingBox3DOrError(error={'code': 1, 'message': 'Deleted'})])
+        self.assertEqual(index.containing((50.5, 0.5, 0.5)), [])
+        self.assertEqual(index.containing((100.5, 0.5, 0.5)), [elements[5]])
+        self.assertEqual(len(index), 8)
+
+
+class TestNavigatorTreeIndex(unittest.TestCase):
+    def test_build(self):
+        tree = NavigatorTree({'navigatorItemId': {'guid': _guid(0)}, 'prefix': '', 'name': 'Root', 'type': 'ProjectMapRootItem',
+                              'children': [{'navigatorItem': {'navigatorItemId': {'guid': _guid(1)}, 'prefix': '1.', 'name': 'Story', 'type': 'StoryItem'}}]})
+        accommands = Mock()
+        accommands.GetNavigatorItemTree.return_value = tree
+        index = Utilities(Mock(), accommands).BuildNavigatorTreeIndex(OtherNavigatorTreeId('ProjectMap'))
+        self.assertEqual(index.of_type('StoryItem'), [tree.rootItem.children[0].navigatorItem])
+        self.assertIs(index.parent(NavigatorItemId(_guid(1))), tree.rootItem)
+
+
+def _classification_item(i, children=()):
+    return {'classificationItem': {'classificationItemId': {'guid': _guid(i)}, 'id': f'C{i}', 'name': f'Item {i}', 'description': '',
+                                   'children': list(children)}}
+
+
+class TestTreeSearch(unittest.TestCase):
+    def setUp(self):
+        # C0 > (C1 > (C2, C3), C4 > C5)
+        self.root = ClassificationItemArrayItem(**_classification_item(0, [_classification_item(1, [_classification_item(2), _classification_item(3)]),
+                                                                           _classification_item(4, [_classification_item(5)])])).classificationItem
+
+    def test_depth_first_order(self):
+        self.assertEqual([item.id for item in Utilities.FindInClassificationItemTree(self.root, lambda item: True)], ['C0', 'C1', 'C2', 'C3', 'C4', 'C5'])
+
+    def test_prune(self):
+        found = Utilities.FindInClassificationItemTree(self.root, lambda item: True, prune=lambda item: item.id == 'C1')
+        self.assertEqual([item.id for item in found], ['C0', 'C1', 'C4', 'C5'])
+
+    def test_lazy(self):
+        visited = []
+
+        def criterion(item):
+            visited.append(item.id)
+            return item.id.startswith('C') and item.id != 'C0'
+        self.assertEqual(next(Utilities.IterClassificationItemTree(self.root, criterion)).id, 'C1')
+        self.assertEqual(visited, ['C0', 'C1'])
+
+    def test_deep_tree(self):
+        root = ClassificationItemInTree(ClassificationItemId(_guid(5000)), 'C5000', 'Item 5000', '')
+        for i in reversed(range(5000)):
+            root = ClassificationItemInTree(ClassificationItemId(_guid(i)), f'C{i}', f'Item {i}', '', [ClassificationItemArrayItem(root)])
+        self.assertEqual([found.id for found in Utilities.FindInClassificationItemTree(root, lambda item: item.id == 'C5000')], ['C5000'])
+
+
+class TestClassificationSystemCache(unittest.TestCase):
+    def setUp(self):
+        self.accommands = Mock()
+        self.accommands.GetAllClassificationSystems.return_value = [
+            ClassificationSystem({'guid': _guid(1000)}, 'System', '', '', '1.0', '2022-01-01'),
+            ClassificationSystem({'guid': _guid(2000)}, 'Other', '', '', '1.0', '2022-01-01')]
+        self.accommands.GetAllClassificationsInSystem.side_effect = lambda systemId: [ClassificationItemArrayItem(**_classification_item(
+            int(str(systemId.guid)[-12:], 16), [_classification_item(int(str(systemId.guid)[-12:], 16) + i) for i in range(1, 4)]))]
+        self.utilities = Utilities(Mock(), self.accommands, cacheClassificationSystems=True)
+
+    def test_lookups_are_cached(self):
+        for i in range(100):
+            self.assertEqual(self.utilities.FindClassificationItemInSystem('System', f'C{1000 + i % 4}').classificationItemId.guid, UUID(_guid(1000 + i % 4)))
+        self.assertIsNone(self.utilities.FindClassificationItemInSystem('System', 'C2001'))
+        self.assertEqual(self.utilities.FindClassificationItemInSystem('Other', 'C2001').name, 'Item 2001')
+        self.assertIsNone(self.utilities.FindClassificationItemInSystem('Unknown', 'C1000'))
+        self.assertEqual(self.accommands.GetAllClassificationSystems.call_count, 1)
+        self.assertEqual(self.accommands.GetAllClassificationsInSystem.call_count, 2)
+
+    def test_disabled_by_default(self):
+        utilities = Utilities(Mock(), self.accommands)
+        self.assertIsNone(utilities.classificationSystemCache)
+        for _ in range(2):
+            self.assertEqual(utilities.FindClassificationItemInSystem('System', 'C1002').name, 'Item 1002')
+            self.assertIsNone(utilities.FindClassificationItemInSystem('System', 'C2001'))
+        self.assertIsNone(utilities.FindClassificationItemInSystem('Unknown', 'C1000'))
+        self.assertEqual(self.accommands.GetAllClassificationSystems.call_count, 5)
+        self.assertEqual(self.accommands.GetAllClassificationsInSystem.call_count, 4)
+
+    def test_refresh(self):
+        cache = self.utilities.classificationSystemCache
+        self.assertEqual(self.utilities.FindClassificationSystem('System'), ClassificationSystemId(_guid(1000)))
+        cache.GetClassificationTree(ClassificationSystemId(_guid(1000)))
+        cache.Refresh()
+        self.assertEqual(self.accommands.GetAllClassificationSystems.call_count, 2)
+        self.assertEqual(self.accommands.GetAllClassificationsInSystem.call_count, 2)
+        cache.Invalidate([ClassificationSystemId(_guid(1000))])
+        self.utilities.FindClassificationItemInSystem('System', 'C1001')
+        self.assertEqual(self.accommands.GetAllClassificationSystems.call_count, 2)
+        self.assertEqual(self.accommands.GetAllClassificationsInSystem.call_count, 3)
+
+    def test_ttl(self):
+        self.utilities.classificationSystemCache.ttl = 10.0
+        with patch('archicad.releases.ac26.b3000utilities.time.monotonic', return_value=100.0):
+            self.utilities.FindClassificationItemInSystem('System', 'C1001')
+        with patch('archicad.releases.ac26.b3000utilities.time.monotonic', return_value=111.0):
+            self.utilities.FindClassificationItemInSystem('System', 'C1001')
+        self.assertEqual(self.accommands.GetAllClassificationSystems.call_count, 2)
+        self.assertEqual(self.accommands.GetAllClassificationsInSystem.call_count, 2)
+
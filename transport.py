@@ -0,0 +1,348 @@
+"""Graphisoft
+"""
+
+import http.client
+import select
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import Request
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+# the errors of sending on a connection which the server has closed; the request did not reach the server,
+# so it is sent again on a new connection. Errors while reading the response are never retried, as the command
+# may already have run.
+_RETRYABLE_ERRORS = (ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+
+def _is_dropped(sock) -> bool:
+    """Returns whether an idle socket was closed by the server, which makes it readable before a request was sent."""
+    if sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return False
+    return bool(readable)
+
+
+class HTTPConnectionPool:
+    """A thread-safe pool of persistent HTTP/1.1 connections to one Archicad instance.
+
+    Args:
+        host (:obj:`str`): The host name of the Archicad instance.
+        port (:obj:`int`): The port of the Archicad instance.
+        max_size (:obj:`int`, optional): The maximum number of simultaneously open connections. Callers block while all of them are in use. Defaults to 4.
+        idle_timeout (:obj:`float`, optional): Connections which were idle for more seconds than this are closed instead of being reused. Defaults to 30.
+        timeout (:obj:`float`, optional): The socket timeout of the connections. Defaults to the global socket timeout.
+
+    """
+
+    def __init__(self, host: str, port: int, max_size: int = 4, idle_timeout: float = 30.0, timeout: Optional[float] = None):
+        assert max_size > 0
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle: Deque[Tuple[http.client.HTTPConnection, float]] = deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.host}:{self.port}'
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.timeout is None:
+            return http.client.HTTPConnection(self.host, self.port)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _evict_idle(self, now: float):
+        """Closes the expired idle connections. The caller must hold the lock."""
+        while self._idle and now - self._idle[0][1] > self.idle_timeout:
+            self._idle.popleft()[0].close()
+
+    def _acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        self._slots.acquire()
+        with self._lock:
+            self._evict_idle(time.monotonic())
+            while self._idle:
+                conn = self._idle.pop()[0]
+                if not _is_dropped(conn.sock):
+                    return conn, True
+                conn.close()
+        return self._new_connection(), False
+
+    def _release(self, conn: http.client.HTTPConnection, reusable: bool):
+        if reusable:
+            with self._lock:
+                now = time.monotonic()
+                self._evict_idle(now)
+                self._idle.append((conn, now))
+        else:
+            conn.close()
+        self._slots.release()
+
+    def post(self, body: bytes, headers: Optional[Dict[str, str]] = None) -> bytes:
+        """Posts the body on a pooled connection and returns the body of the response.
+
+        Idle connections closed by the server are not reused. A reused connection which fails while the request is
+        being sent is reopened once. A connection lost while waiting for the response raises, because the commands
+        are not idempotent and the request may already have been processed.
+
+        Raises:
+            URLError: When the connection cannot be established.
+            HTTPError: When the response status is not successful.
+        """
+        headers = headers or {}
+        conn, reused = self._acquire()
+        try:
+            try:
+                conn.request('POST', '/', body, headers)
+            except _RETRYABLE_ERRORS:
+                if not reused:
+                    raise
+                conn.close()
+                conn.request('POST', '/', body, headers)
+            response = conn.getresponse()
+            data = response.read()
+        except BaseException as e:
+            self._release(conn, False)
+            if isinstance(e, OSError):
+                raise URLError(e)
+            raise
+
+        self._release(conn, not response.will_close)
+        if not 200 <= response.status < 300:
+            raise HTTPError(self.url, response.status, response.reason, response.headers, None)
+        return data
+
+    def close(self):
+        """Closes the idle connections of the pool. Connections in use are closed when they are released."""
+        with self._lock:
+            while self._idle:
+                self._idle.popleft()[0].close()
+
+    @property
+    def idle_count(self) -> int:
+        """The number of idle connections."""
+        with self._lock:
+            return len(self._idle)
+
+
+_pools: Dict[Tuple[str, int], HTTPConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+DEFAULT_MAX_SIZE = 4
+DEFAULT_IDLE_TIMEOUT = 30.0
+
+
+class AsyncHTTPConnectionPool:
+    """A pool of persistent HTTP/1.1 connections to one Archicad instance for asyncio.
+
+    The pool must be used from a single event loop. At most ``max_size`` requests are in flight at the same time,
+    further requests wait for a free connection. asyncio is imported on the first request, so the synchronous
+    clients do not load it.
+
+    Args:
+        host (:obj:`str`): The host name of the Archicad instance.
+        port (:obj:`int`): The port of the Archicad instance.
+        max_size (:obj:`int`, optional): The maximum number of simultaneously open connections. Defaults to 8.
+        idle_timeout (:obj:`float`, optional): Connections which were idle for more seconds than this are closed instead of being reused. Defaults to 30.
+        timeout (:obj:`float`, optional): The timeout of one request-response exchange in seconds. Defaults to no timeout.
+
+    """
+
+    def __init__(self, host: str, port: int, max_size: int = 8, idle_timeout: float = 30.0, timeout: Optional[float] = None):
+        assert max_size > 0
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle: Deque[Tuple[asyncio.StreamReader, asyncio.StreamWriter, float]] = deque()
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def from_request(cls, req: Request, **kwargs) -> 'AsyncHTTPConnectionPool':
+        """Creates a pool for the address of the given request."""
+        return cls(*_address_of(req), **kwargs)
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.host}:{self.port}'
+
+    def _evict_idle(self, now: float):
+        while self._idle and now - self._idle[0][2] > self.idle_timeout:
+            self._idle.popleft()[1].close()
+
+    async def _acquire(self) -> Tuple['asyncio.StreamReader', 'asyncio.StreamWriter', bool]:
+        import asyncio
+        self._evict_idle(time.monotonic())
+        while self._idle:
+            reader, writer, _ = self._idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        return reader, writer, False
+
+    def _release(self, reader: 'asyncio.StreamReader', writer: 'asyncio.StreamWriter', reusable: bool):
+        if reusable:
+            now = time.monotonic()
+            self._evict_idle(now)
+            self._idle.append((reader, writer, now))
+        else:
+            writer.close()
+
+    @staticmethod
+    async def _send(writer: 'asyncio.StreamWriter', request: bytes):
+        writer.write(request)
+        await writer.drain()
+
+    @staticmethod
+    async def _receive(reader: 'asyncio.StreamReader') -> Tuple[int, str, Dict[str, str], bytes, bool]:
+        status_line = await reader.readline()
+        if not status_line:
+            raise http.client.RemoteDisconnected('Remote end closed connection without response')
+        version, status, reason = (status_line.decode('iso-8859-1').rstrip('\r\n').split(' ', 2) + [''])[:3]
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('iso-8859-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        will_close = version == 'HTTP/1.0' or headers.get('connection', '').lower() == 'close'
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                if not size_line:
+                    raise ConnectionError('Remote end closed connection while sending the response')
+                size = int(size_line.split(b';', 1)[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        else:
+            body = await reader.read()
+            will_close = True
+        return int(status), reason, headers, body, will_close
+
+    async def post(self, body: bytes, headers: Optional[Dict[str, str]] = None) -> bytes:
+        """Posts the body on a pooled connection and returns the body of the response.
+
+        Idle connections closed by the server are not reused. A reused connection which fails while the request is
+        being sent is reopened once. A connection lost while waiting for the response raises, because the commands
+        are not idempotent and the request may already have been processed.
+
+        Raises:
+            URLError: When the connection cannot be established.
+            HTTPError: When the response status is not successful.
+        """
+        request_headers = {'Host': f'{self.host}:{self.port}', 'Content-Length': str(len(body))}
+        request_headers.update(headers or {})
+        request = ''.join(['POST / HTTP/1.1\r\n'] + [f'{name}: {value}\r\n' for name, value in request_headers.items()] + ['\r\n']).encode('iso-8859-1') + body
+
+        import asyncio
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_size)
+        async with self._slots:
+            try:
+                reader, writer, reused = await self._acquire()
+            except OSError as e:
+                raise URLError(e)
+
+            async def exchange() -> Tuple[int, str, Dict[str, str], bytes, bool]:
+                nonlocal reader, writer
+                try:
+                    await self._send(writer, request)
+                except _RETRYABLE_ERRORS:
+                    if not reused:
+                        raise
+                    writer.close()
+                    reader, writer = await asyncio.open_connection(self.host, self.port)
+                    await self._send(writer, request)
+                return await self._receive(reader)
+
+            try:
+                response = await asyncio.wait_for(exchange(), self.timeout)
+            except BaseException as e:
+                writer.close()
+                if isinstance(e, (OSError, asyncio.IncompleteReadError)):
+                    raise URLError(e)
+                raise
+
+            status, reason, response_headers, data, will_close = response
+            self._release(reader, writer, not will_close)
+        if not 200 <= status < 300:
+            raise HTTPError(self.url, status, reason, response_headers, None)
+        return data
+
+    def close(self):
+        """Closes the idle connections of the pool."""
+        while self._idle:
+            self._idle.popleft()[1].close()
+
+    @property
+    def idle_count(self) -> int:
+        """The number of idle connections."""
+        return len(self._idle)
+
+
+def _address_of(req: Request) -> Tuple[str, int]:
+    url = urlsplit(req.full_url)
+    return url.hostname or '127.0.0.1', url.port or 80
+
+
+def get_connection_pool(req: Request) -> HTTPConnectionPool:
+    """Returns the connection pool shared by every request targeting the same address as the given request.
+
+    The pool is created with :obj:`DEFAULT_MAX_SIZE` and :obj:`DEFAULT_IDLE_TIMEOUT` on first use.
+    """
+    address = _address_of(req)
+    pool = _pools.get(address)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(address)
+            if pool is None:
+                pool = HTTPConnectionPool(*address, max_size=DEFAULT_MAX_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT)
+                _pools[address] = pool
+    return pool
+
+
+def set_connection_pool(req: Request, pool: HTTPConnectionPool):
+    """Replaces the shared connection pool of the address of the given request."""
+    address = _address_of(req)
+    with _pools_lock:
+        previous = _pools.get(address)
+        _pools[address] = pool
+    if previous is not None and previous is not pool:
+        previous.close()
+
+
+def close_connection_pools():
+    """Closes the idle connections of every shared pool."""
+    with _pools_lock:
+        pools: Iterable[HTTPConnectionPool] = list(_pools.values())
+    for pool in pools:
+        pool.close()
+
+
+def post(req: Request, body: bytes) -> bytes:
+    """Posts the body to the address of the request on its shared connection pool."""
+    return get_connection_pool(req).post(body, dict(req.header_items()))
@@ -3,8 +3,9 @@
 from uuid import UUID
 from typing import Union, Optional, List
 
+from archicad import builders, identifiers, metadata, serializers
 from archicad.acbasetype import _ACBaseType, _ACUnionType, _ConstructUnion
-from archicad.validators import value_set, matches, min_length, max_length, multiple_of, minimum, maximum, listitem_validator, min_items, max_items, unique_items
+from . import b3000classdata
 
 
 class AddOnCommandId(_ACBaseType):
@@ -21,9 +22,6 @@ class AddOnCommandId(_ACBaseType):
         self.commandNamespace: str = commandNamespace
         self.commandName: str = commandName
 
-AddOnCommandId.get_classinfo().add_field('commandNamespace', str, min_length(1))
-AddOnCommandId.get_classinfo().add_field('commandName', str, min_length(1))
-
 
 class AddOnCommandIdArrayItem(_ACBaseType):
     """ EMPTY STRING
@@ -37,8 +35,6 @@ class AddOnCommandIdArrayItem(_ACBaseType):
     def __init__(self, addOnCommandId: AddOnCommandId):
         self.addOnCommandId: AddOnCommandId = addOnCommandId
 
-AddOnCommandIdArrayItem.get_classinfo().add_field('addOnCommandId', AddOnCommandId)
-
 
 class AddOnCommandParameters(_ACBaseType):
     """ The input parameters of an Add-On command.
@@ -68,8 +64,6 @@ class AttributeId(_ACBaseType):
     def __init__(self, guid: UUID):
         self.guid: UUID = guid
 
-AttributeId.get_classinfo().add_field('guid', UUID)
-
 
 class AttributeFolderId(_ACBaseType):
     """ The identifier of an attribute folder.
@@ -83,8 +77,6 @@ class AttributeFolderId(_ACBaseType):
     def __init__(self, guid: UUID):
         self.guid: UUID = guid
 
-AttributeFolderId.get_classinfo().add_field('guid', UUID)
-
 
 class AttributeIdWrapperItem(_ACBaseType):
     """ EMPTY STRING
@@ -98,8 +90,6 @@ class AttributeIdWrapperItem(_ACBaseType):
     def __init__(self, attributeId: AttributeId):
         self.attributeId: AttributeId = attributeId
 
-AttributeIdWrapperItem.get_classinfo().add_field('attributeId', AttributeId)
-
 
 class AttributeFolder(_ACBaseType):
     """ Identifies an attribute folder. The path of the root folder is repesented by empty array.
@@ -117,10 +107,6 @@ class AttributeFolder(_ACBaseType):
         self.path: Optional[List[str]] = path
         self.attributeFolderId: Optional[AttributeFolderId] = attributeFolderId
 
-AttributeFolder.get_classinfo().add_field('attributeType', str, value_set(['BuildingMaterial', 'Composite', 'Fill', 'Layer', 'LayerCombination', 'Line', 'PenTable', 'Profile', 'Surface', 'ZoneCategory']))
-AttributeFolder.get_classinfo().add_field('path', Optional[List[str]])
-AttributeFolder.get_classinfo().add_field('attributeFolderId', Optional[AttributeFolderId])
-
 
 class AttributeFolderContent(_ACBaseType):
     """ An attribute folder content. Contains subfolders and attributes.
@@ -136,9 +122,6 @@ class AttributeFolderContent(_ACBaseType):
         self.subfolders: List[AttributeFolder] = subfolders
         self.attributeIds: List[AttributeIdWrapperItem] = attributeIds
 
-AttributeFolderContent.get_classinfo().add_field('subfolders', List[AttributeFolder])
-AttributeFolderContent.get_classinfo().add_field('attributeIds', List[AttributeIdWrapperItem])
-
 
 class AttributeHeader(_ACBaseType):
     """ The header object of an attribute.
@@ -154,9 +137,6 @@ class AttributeHeader(_ACBaseType):
         self.attributeId: AttributeId = attributeId
         self.name: str = name
 
-AttributeHeader.get_classinfo().add_field('attributeId', AttributeId)
-AttributeHeader.get_classinfo().add_field('name', str)
-
 
 class LayerAttribute(_ACBaseType):
     """ A layer attribute
@@ -180,13 +160,6 @@ class LayerAttribute(_ACBaseType):
         self.isHidden: bool = isHidden
         self.isWireframe: bool = isWireframe
 
-LayerAttribute.get_classinfo().add_field('attributeId', AttributeId)
-LayerAttribute.get_classinfo().add_field('name', str)
-LayerAttribute.get_classinfo().add_field('intersectionGroupNr', int)
-LayerAttribute.get_classinfo().add_field('isLocked', bool)
-LayerAttribute.get_classinfo().add_field('isHidden', bool)
-LayerAttribute.get_classinfo().add_field('isWireframe', bool)
-
 
 class FillAttribute(_ACBaseType):
     """ A fill attribute.
@@ -208,12 +181,6 @@ class FillAttribute(_ACBaseType):
         self.pattern: int = pattern
         self.appearanceType: str = appearanceType
 
-FillAttribute.get_classinfo().add_field('attributeId', AttributeId)
-FillAttribute.get_classinfo().add_field('name', str)
-FillAttribute.get_classinfo().add_field('subType', str, value_set(['Vector', 'Symbol', 'Solid', 'Empty', 'LinearGradient', 'RadialGradient', 'Image']))
-FillAttribute.get_classinfo().add_field('pattern', int)
-FillAttribute.get_classinfo().add_field('appearanceType', str, value_set(['ScaleWithPlan', 'ScaleIndependent']))
-
 
 class ProfileModifier(_ACBaseType):
     """ A profile modifier parameter.
@@ -229,9 +196,6 @@ class ProfileModifier(_ACBaseType):
         self.name: str = name
         self.value: float = value
 
-ProfileModifier.get_classinfo().add_field('name', str)
-ProfileModifier.get_classinfo().add_field('value', float)
-
 
 class ProfileModifierListItem(_ACBaseType):
     """ EMPTY STRING
@@ -245,8 +209,6 @@ class ProfileModifierListItem(_ACBaseType):
     def __init__(self, profileModifier: ProfileModifier):
         self.profileModifier: ProfileModifier = profileModifier
 
-ProfileModifierListItem.get_classinfo().add_field('profileModifier', ProfileModifier)
-
 
 class ProfileAttribute(_ACBaseType):
     """ A profile attribute.
@@ -280,18 +242,6 @@ class ProfileAttribute(_ACBaseType):
         self.hasCoreSkin: bool = hasCoreSkin
         self.profileModifiers: List[ProfileModifierListItem] = profileModifiers
 
-ProfileAttribute.get_classinfo().add_field('attributeId', AttributeId)
-ProfileAttribute.get_classinfo().add_field('name', str)
-ProfileAttribute.get_classinfo().add_field('useWith', List[str], listitem_validator(value_set(['Wall', 'Column', 'Beam', 'Window', 'Door', 'Object', 'Lamp', 'Slab', 'Roof', 'Mesh', 'Zone', 'CurtainWall', 'Shell', 'Skylight', 'Morph', 'Stair', 'Railing', 'Opening'])))
-ProfileAttribute.get_classinfo().add_field('width', float)
-ProfileAttribute.get_classinfo().add_field('height', float)
-ProfileAttribute.get_classinfo().add_field('minimumWidth', float)
-ProfileAttribute.get_classinfo().add_field('minimumHeight', float)
-ProfileAttribute.get_classinfo().add_field('widthStretchable', bool)
-ProfileAttribute.get_classinfo().add_field('heightStretchable', bool)
-ProfileAttribute.get_classinfo().add_field('hasCoreSkin', bool)
-ProfileAttribute.get_classinfo().add_field('profileModifiers', List[ProfileModifierListItem])
-
 
 class Texture(_ACBaseType):
     """ A texture
@@ -305,8 +255,6 @@ class Texture(_ACBaseType):
     def __init__(self, name: str):
         self.name: str = name
 
-Texture.get_classinfo().add_field('name', str)
-
 
 class DashItem(_ACBaseType):
     """ A dash item.
@@ -322,9 +270,6 @@ class DashItem(_ACBaseType):
         self.dash: float = dash
         self.gap: float = gap
 
-DashItem.get_classinfo().add_field('dash', float)
-DashItem.get_classinfo().add_field('gap', float)
-
 
 class LayerCombinationAttribute(_ACBaseType):
     """ A layer combination attribute
@@ -342,10 +287,6 @@ class LayerCombinationAttribute(_ACBaseType):
         self.name: str = name
         self.layerAttributeIds: List[AttributeIdWrapperItem] = layerAttributeIds
 
-LayerCombinationAttribute.get_classinfo().add_field('attributeId', AttributeId)
-LayerCombinationAttribute.get_classinfo().add_field('name', str)
-LayerCombinationAttribute.get_classinfo().add_field('layerAttributeIds', List[AttributeIdWrapperItem])
-
 
 class ClassificationSystemId(_ACBaseType):
     """ The identifier of a classification system.
@@ -359,8 +300,6 @@ class ClassificationSystemId(_ACBaseType):
     def __init__(self, guid: UUID):
         self.guid: UUID = guid
 
-ClassificationSystemId.get_classinfo().add_field('guid', UUID)
-
 
 class ClassificationSystemIdArrayItem(_ACBaseType):
     """ EMPTY STRING
@@ -374,8 +313,6 @@ class ClassificationSystemIdArrayItem(_ACBaseType):
     def __init__(self, classificationSystemId: ClassificationSystemId):
         self.classificationSystemId: ClassificationSystemId = classificationSystemId
 
-ClassificationSystemIdArrayItem.get_classinfo().add_field('classificationSystemId', ClassificationSystemId)
-
 
 class ClassificationItemId(_ACBaseType):
     """ The identifier of a classification item.
@@ -389,8 +326,6 @@ class ClassificationItemId(_ACBaseType):
     def __init__(self, guid: UUID):
         self.guid: UUID = guid
 
-ClassificationItemId.get_classinfo().add_field('guid', UUID)
-
 
 class ClassificationItemIdArrayItem(_ACBaseType):
     """ EMPTY STRING
@@ -404,8 +339,6 @@ class ClassificationItemIdArrayItem(_ACBaseType):
     def __init__(self, classificationItemId: ClassificationItemId):
         self.classificationItemId: ClassificationItemId = classificationItemId
 
-ClassificationItemIdArrayItem.get_classinfo().add_field('classificationItemId', ClassificationItemId)
-
 
 class ClassificationId(_ACBaseType):
     """ The element classification identifier.
@@ -421,9 +354,6 @@ class ClassificationId(_ACBaseType):
         self.classificationSystemId: ClassificationSystemId = classificationSystemId
         self.classificationItemId: Optional[ClassificationItemId] = classificationItemId
 
-ClassificationId.get_classinfo().add_field('classificationSystemId', ClassificationSystemId)
-ClassificationId.get_classinfo().add_field('classificationItemId', Optional[ClassificationItemId])
-
 
 class ClassificationItemDetails(_ACBaseType):
     """ The details of a classification item.
@@ -443,11 +373,6 @@ class ClassificationItemDetails(_ACBaseType):
         self.name: str = name
         self.description: str = description
 
-ClassificationItemDetails.get_classinfo().add_field('classificationItemId', ClassificationItemId)
-ClassificationItemDetails.get_classinfo().add_field('id', str)
-ClassificationItemDetails.get_classinfo().add_field('name', str)
-ClassificationItemDetails.get_classinfo().add_field('description', str)
-
 
 class ClassificationSystem(_ACBaseType):
     """ The details of a classification system.
@@ -471,13 +396,6 @@ class ClassificationSystem(_ACBaseType):
         self.version: str = version
         self.date: str = date
 
-ClassificationSystem.get_classinfo().add_field('classificationSystemId', ClassificationSystemId)
-ClassificationSystem.get_classinfo().add_field('name', str)
-ClassificationSystem.get_classinfo().add_field('description', str)
-ClassificationSystem.get_classinfo().add_field('source', str)
-ClassificationSystem.get_classinfo().add_field('version', str)
-ClassificationSystem.get_classinfo().add_field('date', str, matches(r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$"))
-
 
 class Point2D(_ACBaseType):
     """ Coordinates of a 2D point
@@ -493,9 +411,6 @@ class Point2D(_ACBaseType):
         self.x: float = x
         self.y: float = y
 
-Point2D.get_classinfo().add_field('x', float)
-Point2D.get_classinfo().add_field('y', float)
-
 
 class NavigatorItemId(_ACBaseType):
     """ The identifier of a navigator item.
@@ -509,8 +424,6 @@ class NavigatorItemId(_ACBaseType):
     def __init__(self, guid: UUID):
         self.guid: UUID = guid
 
-NavigatorItemId.get_classinfo().add_field('guid', UUID)
-
 
 class PublisherSetId(_ACBaseType):
     """ The identifier of a publisher set.
@@ -526,9 +439,6 @@ class PublisherSetId(_ACBaseType):
         self.name: str = name
         self.type: str = type
 
-PublisherSetId.get_classinfo().add_field('name', str)
-PublisherSetId.get_classinfo().add_field('type', str, value_set(['PublisherSets']))
-
 
 class OtherNavigatorTreeId(_ACBaseType):
     """ The identifier of a navigator item tree.
@@ -542,8 +452,6 @@ class OtherNavigatorTreeId(_ACBaseType):
     def __init__(self, type: str):
         self.type: str = type
 
-OtherNavigatorTreeId.get_classinfo().add_field('type', str, value_set(['ProjectMap', 'ViewMap', 'MyViewMap', 'LayoutBook']))
-
 
 class NavigatorTreeId(_ACUnionType):
     """ The identifier of a navigator item tree.
@@ -581,10 +489,6 @@ class GeneralNavigatorItemData(_ACBaseType):
         self.prefix: str = prefix
         self.name: str = name
 
-GeneralNavigatorItemData.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-GeneralNavigatorItemData.get_classinfo().add_field('prefix', str)
-GeneralNavigatorItemData.get_classinfo().add_field('name', str)
-
 
 class NavigatorItemIdAndType(_ACBaseType):
     """ Consists of a navigator item type and an identifier.
@@ -600,9 +504,6 @@ class NavigatorItemIdAndType(_ACBaseType):
         self.navigatorItemType: str = navigatorItemType
         self.navigatorItemId: NavigatorItemId = navigatorItemId
 
-NavigatorItemIdAndType.get_classinfo().add_field('navigatorItemType', str, value_set(['UndefinedItem', 'ProjectMapRootItem', 'StoryItem', 'SectionItem', 'ElevationItem', 'InteriorElevationItem', 'WorksheetItem', 'DetailItem', 'DocumentFrom3DItem', 'Perspective3DItem', 'Axonometry3DItem', 'CameraSetItem', 'CameraItem', 'ScheduleItem', 'ProjectIndexItem', 'TextListItem', 'GraphicListItem', 'InfoItem', 'HelpItem', 'FolderItem', 'LayoutBookRootItem', 'SubsetItem', 'LayoutItem', 'DrawingItem', 'MasterFolderItem', 'MasterLayoutItem']))
-NavigatorItemIdAndType.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-
 
 class DetailNavigatorItem(_ACBaseType):
     """ The details of a detail navigator item.
@@ -620,10 +521,6 @@ class DetailNavigatorItem(_ACBaseType):
         self.prefix: str = prefix
         self.name: str = name
 
-DetailNavigatorItem.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-DetailNavigatorItem.get_classinfo().add_field('prefix', str)
-DetailNavigatorItem.get_classinfo().add_field('name', str)
-
 
 class Document3DNavigatorItem(_ACBaseType):
     """ The details of a 3D document navigator item.
@@ -641,10 +538,6 @@ class Document3DNavigatorItem(_ACBaseType):
         self.prefix: str = prefix
         self.name: str = name
 
-Document3DNavigatorItem.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-Document3DNavigatorItem.get_classinfo().add_field('prefix', str)
-Document3DNavigatorItem.get_classinfo().add_field('name', str)
-
 
 class ElevationNavigatorItem(_ACBaseType):
     """ The details of an elevation navigator item.
@@ -662,10 +555,6 @@ class ElevationNavigatorItem(_ACBaseType):
         self.prefix: str = prefix
         self.name: str = name
 
-ElevationNavigatorItem.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-ElevationNavigatorItem.get_classinfo().add_field('prefix', str)
-ElevationNavigatorItem.get_classinfo().add_field('name', str)
-
 
 class InteriorElevationNavigatorItem(_ACBaseType):
     """ The details of an interior elevation navigator item.
@@ -683,10 +572,6 @@ class InteriorElevationNavigatorItem(_ACBaseType):
         self.prefix: str = prefix
         self.name: str = name
 
-InteriorElevationNavigatorItem.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-InteriorElevationNavigatorItem.get_classinfo().add_field('prefix', str)
-InteriorElevationNavigatorItem.get_classinfo().add_field('name', str)
-
 
 class SectionNavigatorItem(_ACBaseType):
     """ The details of a section navigator item.
@@ -704,10 +589,6 @@ class SectionNavigatorItem(_ACBaseType):
         self.prefix: str = prefix
         self.name: str = name
 
-SectionNavigatorItem.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-SectionNavigatorItem.get_classinfo().add_field('prefix', str)
-SectionNavigatorItem.get_classinfo().add_field('name', str)
-
 
 class StoryNavigatorItem(_ACBaseType):
     """ The details of a story navigator item.
@@ -729,12 +610,6 @@ class StoryNavigatorItem(_ACBaseType):
         self.floorLevel: float = floorLevel
         self.floorNumber: float = floorNumber
 
-StoryNavigatorItem.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-StoryNavigatorItem.get_classinfo().add_field('prefix', str)
-StoryNavigatorItem.get_classinfo().add_field('name', str)
-StoryNavigatorItem.get_classinfo().add_field('floorLevel', float)
-StoryNavigatorItem.get_classinfo().add_field('floorNumber', float)
-
 
 class WorksheetNavigatorItem(_ACBaseType):
     """ The details of a worksheet navigator item.
@@ -752,10 +627,6 @@ class WorksheetNavigatorItem(_ACBaseType):
         self.prefix: str = prefix
         self.name: str = name
 
-WorksheetNavigatorItem.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-WorksheetNavigatorItem.get_classinfo().add_field('prefix', str)
-WorksheetNavigatorItem.get_classinfo().add_field('name', str)
-
 
 class UserDefinedPropertyUserId(_ACBaseType):
     """ The unique identifier of a User-Defined Property, identified by its name.
@@ -771,9 +642,6 @@ class UserDefinedPropertyUserId(_ACBaseType):
         self.localizedName: List[str] = localizedName
         self.type: str = type
 
-UserDefinedPropertyUserId.get_classinfo().add_field('localizedName', List[str], min_items(2), max_items(2))
-UserDefinedPropertyUserId.get_classinfo().add_field('type', str, value_set(['UserDefined']))
-
 
 class BuiltInPropertyUserId(_ACBaseType):
     """ The unique identifier of a Built-In Property, identified by its name.
@@ -789,9 +657,6 @@ class BuiltInPropertyUserId(_ACBaseType):
         self.nonLocalizedName: str = nonLocalizedName
         self.type: str = type
 
-BuiltInPropertyUserId.get_classinfo().add_field('nonLocalizedName', str)
-BuiltInPropertyUserId.get_classinfo().add_field('type', str, value_set(['BuiltIn']))
-
 
 class PropertyUserId(_ACUnionType):
     """ The unique identifier of a Property, identified by its name. May represent a User-Defined or a Built-In Property.
@@ -827,8 +692,6 @@ class PropertyId(_ACBaseType):
     def __init__(self, guid: UUID):
         self.guid: UUID = guid
 
-PropertyId.get_classinfo().add_field('guid', UUID)
-
 
 class PropertyIdArrayItem(_ACBaseType):
     """ EMPTY STRING
@@ -842,8 +705,6 @@ class PropertyIdArrayItem(_ACBaseType):
     def __init__(self, propertyId: PropertyId):
         self.propertyId: PropertyId = propertyId
 
-PropertyIdArrayItem.get_classinfo().add_field('propertyId', PropertyId)
-
 
 class PropertyGroupId(_ACBaseType):
     """ The identifier of a property group.
@@ -857,8 +718,6 @@ class PropertyGroupId(_ACBaseType):
     def __init__(self, guid: UUID):
         self.guid: UUID = guid
 
-PropertyGroupId.get_classinfo().add_field('guid', UUID)
-
 
 class PropertyGroupIdArrayItem(_ACBaseType):
     """ EMPTY STRING
@@ -872,8 +731,6 @@ class PropertyGroupIdArrayItem(_ACBaseType):
     def __init__(self, propertyGroupId: PropertyGroupId):
         self.propertyGroupId: PropertyGroupId = propertyGroupId
 
-PropertyGroupIdArrayItem.get_classinfo().add_field('propertyGroupId', PropertyGroupId)
-
 
 class PropertyGroup(_ACBaseType):
     """ A property group.
@@ -889,9 +746,6 @@ class PropertyGroup(_ACBaseType):
         self.propertyGroupId: PropertyGroupId = propertyGroupId
         self.name: str = name
 
-PropertyGroup.get_classinfo().add_field('propertyGroupId', PropertyGroupId)
-PropertyGroup.get_classinfo().add_field('name', str)
-
 
 class NormalNumberPropertyValue(_ACBaseType):
     """ A number property value containing a valid numeric value.
@@ -909,10 +763,6 @@ class NormalNumberPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalNumberPropertyValue.get_classinfo().add_field('value', float)
-NormalNumberPropertyValue.get_classinfo().add_field('type', str, value_set(['number']))
-NormalNumberPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalIntegerPropertyValue(_ACBaseType):
     """ An integer property value containing a valid integer number.
@@ -930,10 +780,6 @@ class NormalIntegerPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalIntegerPropertyValue.get_classinfo().add_field('value', int)
-NormalIntegerPropertyValue.get_classinfo().add_field('type', str, value_set(['integer']))
-NormalIntegerPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalStringPropertyValue(_ACBaseType):
     """ A string property value containing a valid string.
@@ -951,10 +797,6 @@ class NormalStringPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalStringPropertyValue.get_classinfo().add_field('value', str)
-NormalStringPropertyValue.get_classinfo().add_field('type', str, value_set(['string']))
-NormalStringPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalBooleanPropertyValue(_ACBaseType):
     """ A boolean property value containing a valid boolean value.
@@ -972,10 +814,6 @@ class NormalBooleanPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalBooleanPropertyValue.get_classinfo().add_field('value', bool)
-NormalBooleanPropertyValue.get_classinfo().add_field('type', str, value_set(['boolean']))
-NormalBooleanPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalLengthPropertyValue(_ACBaseType):
     """ A length property value containing a real length value. The value is measured in SI (meters).
@@ -993,10 +831,6 @@ class NormalLengthPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalLengthPropertyValue.get_classinfo().add_field('value', float)
-NormalLengthPropertyValue.get_classinfo().add_field('type', str, value_set(['length']))
-NormalLengthPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalAreaPropertyValue(_ACBaseType):
     """ An area property value containing a real area. The value is measured in SI (square meters).
@@ -1014,10 +848,6 @@ class NormalAreaPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalAreaPropertyValue.get_classinfo().add_field('value', float)
-NormalAreaPropertyValue.get_classinfo().add_field('type', str, value_set(['area']))
-NormalAreaPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalVolumePropertyValue(_ACBaseType):
     """ A volume property value containing a real volume. The value is measured in SI (cubic meters).
@@ -1035,10 +865,6 @@ class NormalVolumePropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalVolumePropertyValue.get_classinfo().add_field('value', float)
-NormalVolumePropertyValue.get_classinfo().add_field('type', str, value_set(['volume']))
-NormalVolumePropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalAnglePropertyValue(_ACBaseType):
     """ An angle property value containing a real angle. The value is measured in SI (radians).
@@ -1056,10 +882,6 @@ class NormalAnglePropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalAnglePropertyValue.get_classinfo().add_field('value', float)
-NormalAnglePropertyValue.get_classinfo().add_field('type', str, value_set(['angle']))
-NormalAnglePropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalNumberListPropertyValue(_ACBaseType):
     """ A number list property value containing numbers in an array.
@@ -1077,10 +899,6 @@ class NormalNumberListPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalNumberListPropertyValue.get_classinfo().add_field('value', List[float])
-NormalNumberListPropertyValue.get_classinfo().add_field('type', str, value_set(['numberList']))
-NormalNumberListPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalIntegerListPropertyValue(_ACBaseType):
     """ An integer list property value containing integers in an array.
@@ -1098,10 +916,6 @@ class NormalIntegerListPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalIntegerListPropertyValue.get_classinfo().add_field('value', List[int])
-NormalIntegerListPropertyValue.get_classinfo().add_field('type', str, value_set(['integerList']))
-NormalIntegerListPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalStringListPropertyValue(_ACBaseType):
     """ A string list property value containing strings in an array.
@@ -1119,10 +933,6 @@ class NormalStringListPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalStringListPropertyValue.get_classinfo().add_field('value', List[str])
-NormalStringListPropertyValue.get_classinfo().add_field('type', str, value_set(['stringList']))
-NormalStringListPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalBooleanListPropertyValue(_ACBaseType):
     """ A boolean list property value containing boolean values in an array.
@@ -1140,10 +950,6 @@ class NormalBooleanListPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalBooleanListPropertyValue.get_classinfo().add_field('value', List[bool])
-NormalBooleanListPropertyValue.get_classinfo().add_field('type', str, value_set(['booleanList']))
-NormalBooleanListPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalLengthListPropertyValue(_ACBaseType):
     """ A length list property value containing length values in an array. The values are measured in SI (meters).
@@ -1161,10 +967,6 @@ class NormalLengthListPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalLengthListPropertyValue.get_classinfo().add_field('value', List[float])
-NormalLengthListPropertyValue.get_classinfo().add_field('type', str, value_set(['lengthList']))
-NormalLengthListPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalAreaListPropertyValue(_ACBaseType):
     """ An area list property value containing areas in an array. The values are measured in SI (square meters).
@@ -1182,10 +984,6 @@ class NormalAreaListPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalAreaListPropertyValue.get_classinfo().add_field('value', List[float])
-NormalAreaListPropertyValue.get_classinfo().add_field('type', str, value_set(['areaList']))
-NormalAreaListPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalVolumeListPropertyValue(_ACBaseType):
     """ A volume list property value containing volumes in an array. The values are measured in SI (cubic meters).
@@ -1203,10 +1001,6 @@ class NormalVolumeListPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalVolumeListPropertyValue.get_classinfo().add_field('value', List[float])
-NormalVolumeListPropertyValue.get_classinfo().add_field('type', str, value_set(['volumeList']))
-NormalVolumeListPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalAngleListPropertyValue(_ACBaseType):
     """ An angle list property value containing angles in an array. The values are measured in SI (radians).
@@ -1224,10 +1018,6 @@ class NormalAngleListPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalAngleListPropertyValue.get_classinfo().add_field('value', List[float])
-NormalAngleListPropertyValue.get_classinfo().add_field('type', str, value_set(['angleList']))
-NormalAngleListPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class UserUndefinedPropertyValue(_ACBaseType):
     """ A userUndefined value means that there is no actual number/string/etc. value, but the user deliberately set an Undefined value: this is a valid value, too.
@@ -1243,9 +1033,6 @@ class UserUndefinedPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-UserUndefinedPropertyValue.get_classinfo().add_field('type', str, value_set(['number', 'integer', 'string', 'boolean', 'length', 'area', 'volume', 'angle', 'numberList', 'integerList', 'stringList', 'booleanList', 'lengthList', 'areaList', 'volumeList', 'angleList', 'singleEnum', 'multiEnum']))
-UserUndefinedPropertyValue.get_classinfo().add_field('status', str, value_set(['userUndefined']))
-
 
 class NotAvailablePropertyValue(_ACBaseType):
     """ A notAvailable value means that the property is not available for the property owner (and therefore it has no property value for it).
@@ -1261,9 +1048,6 @@ class NotAvailablePropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NotAvailablePropertyValue.get_classinfo().add_field('type', str, value_set(['number', 'integer', 'string', 'boolean', 'length', 'area', 'volume', 'angle', 'numberList', 'integerList', 'stringList', 'booleanList', 'lengthList', 'areaList', 'volumeList', 'angleList', 'singleEnum', 'multiEnum']))
-NotAvailablePropertyValue.get_classinfo().add_field('status', str, value_set(['notAvailable']))
-
 
 class NotEvaluatedPropertyValue(_ACBaseType):
     """ A notEvaluated value means that the property could not be evaluated for the property owner for some reason.
@@ -1279,9 +1063,6 @@ class NotEvaluatedPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NotEvaluatedPropertyValue.get_classinfo().add_field('type', str, value_set(['number', 'integer', 'string', 'boolean', 'length', 'area', 'volume', 'angle', 'numberList', 'integerList', 'stringList', 'booleanList', 'lengthList', 'areaList', 'volumeList', 'angleList', 'singleEnum', 'multiEnum']))
-NotEvaluatedPropertyValue.get_classinfo().add_field('status', str, value_set(['notEvaluated']))
-
 
 class DisplayValueEnumId(_ACBaseType):
     """ An enumeration value identifier using the displayed value.
@@ -1297,9 +1078,6 @@ class DisplayValueEnumId(_ACBaseType):
         self.displayValue: str = displayValue
         self.type: str = type
 
-DisplayValueEnumId.get_classinfo().add_field('displayValue', str)
-DisplayValueEnumId.get_classinfo().add_field('type', str, value_set(['displayValue']))
-
 
 class NonLocalizedValueEnumId(_ACBaseType):
     """ An enumeration value identifier using the nonlocalized value.
@@ -1315,9 +1093,6 @@ class NonLocalizedValueEnumId(_ACBaseType):
         self.nonLocalizedValue: str = nonLocalizedValue
         self.type: str = type
 
-NonLocalizedValueEnumId.get_classinfo().add_field('nonLocalizedValue', str)
-NonLocalizedValueEnumId.get_classinfo().add_field('type', str, value_set(['nonLocalizedValue']))
-
 
 class EnumValueId(_ACUnionType):
     """ The identifier of a property enumeration value.
@@ -1357,10 +1132,6 @@ class PossibleEnumValue(_ACBaseType):
         self.displayValue: str = displayValue
         self.nonLocalizedValue: Optional[str] = nonLocalizedValue
 
-PossibleEnumValue.get_classinfo().add_field('enumValueId', EnumValueId)
-PossibleEnumValue.get_classinfo().add_field('displayValue', str)
-PossibleEnumValue.get_classinfo().add_field('nonLocalizedValue', Optional[str])
-
 
 class PossibleEnumValuesArrayItem(_ACBaseType):
     """ EMPTY STRING
@@ -1374,8 +1145,6 @@ class PossibleEnumValuesArrayItem(_ACBaseType):
     def __init__(self, enumValue: PossibleEnumValue):
         self.enumValue: PossibleEnumValue = enumValue
 
-PossibleEnumValuesArrayItem.get_classinfo().add_field('enumValue', PossibleEnumValue)
-
 
 class Error(_ACBaseType):
     """ The details of an error.
@@ -1391,9 +1160,6 @@ class Error(_ACBaseType):
         self.code: int = code
         self.message: str = message
 
-Error.get_classinfo().add_field('code', int)
-Error.get_classinfo().add_field('message', str)
-
 
 class ErrorItem(_ACBaseType):
     """ EMPTY STRING
@@ -1407,8 +1173,6 @@ class ErrorItem(_ACBaseType):
     def __init__(self, error: Error):
         self.error: Error = error
 
-ErrorItem.get_classinfo().add_field('error', Error)
-
 
 class SuccessfulExecutionResult(_ACBaseType):
     """ The result of a successful execution.
@@ -1422,8 +1186,6 @@ class SuccessfulExecutionResult(_ACBaseType):
     def __init__(self, success: bool):
         self.success: bool = success
 
-SuccessfulExecutionResult.get_classinfo().add_field('success', bool)
-
 
 class FailedExecutionResult(_ACBaseType):
     """ The result of a failed execution.
@@ -1439,9 +1201,6 @@ class FailedExecutionResult(_ACBaseType):
         self.success: bool = success
         self.error: Error = error
 
-FailedExecutionResult.get_classinfo().add_field('success', bool)
-FailedExecutionResult.get_classinfo().add_field('error', Error)
-
 
 class ExecutionResult(_ACUnionType):
     """ The result of the execution.
@@ -1475,8 +1234,6 @@ class ElementId(_ACBaseType):
     def __init__(self, guid: UUID):
         self.guid: UUID = guid
 
-ElementId.get_classinfo().add_field('guid', UUID)
-
 
 class ElementIdArrayItem(_ACBaseType):
     """ EMPTY STRING
@@ -1490,8 +1247,6 @@ class ElementIdArrayItem(_ACBaseType):
     def __init__(self, elementId: ElementId):
         self.elementId: ElementId = elementId
 
-ElementIdArrayItem.get_classinfo().add_field('elementId', ElementId)
-
 
 class TypeOfElement(_ACBaseType):
     """ An element id and its corresponding element type.
@@ -1507,9 +1262,6 @@ class TypeOfElement(_ACBaseType):
         self.elementId: ElementId = elementId
         self.elementType: str = elementType
 
-TypeOfElement.get_classinfo().add_field('elementId', ElementId)
-TypeOfElement.get_classinfo().add_field('elementType', str, value_set(['Wall', 'Column', 'Beam', 'Window', 'Door', 'Object', 'Lamp', 'Slab', 'Roof', 'Mesh', 'Zone', 'CurtainWall', 'Shell', 'Skylight', 'Morph', 'Stair', 'Railing', 'Opening']))
-
 
 class ElementsWrapper(_ACBaseType):
     """ A wrapper for a list of elements.
@@ -1523,8 +1275,6 @@ class ElementsWrapper(_ACBaseType):
     def __init__(self, elements: List[ElementIdArrayItem]):
         self.elements: List[ElementIdArrayItem] = elements
 
-ElementsWrapper.get_classinfo().add_field('elements', List[ElementIdArrayItem])
-
 
 class ElementsOrError(_ACUnionType):
     """ A list of elements or an error.
@@ -1558,8 +1308,6 @@ class Image(_ACBaseType):
     def __init__(self, content: str):
         self.content: str = content
 
-Image.get_classinfo().add_field('content', str)
-
 
 class FolderParameters(_ACBaseType):
     """ The parameters of a folder.
@@ -1573,8 +1321,6 @@ class FolderParameters(_ACBaseType):
     def __init__(self, name: str):
         self.name: str = name
 
-FolderParameters.get_classinfo().add_field('name', str)
-
 
 class BoundingBox2D(_ACBaseType):
     """ The 2D bounding box of an element.
@@ -1594,11 +1340,6 @@ class BoundingBox2D(_ACBaseType):
         self.xMax: float = xMax
         self.yMax: float = yMax
 
-BoundingBox2D.get_classinfo().add_field('xMin', float)
-BoundingBox2D.get_classinfo().add_field('yMin', float)
-BoundingBox2D.get_classinfo().add_field('xMax', float)
-BoundingBox2D.get_classinfo().add_field('yMax', float)
-
 
 class BoundingBox3D(_ACBaseType):
     """ A 3D bounding box of an element.
@@ -1622,13 +1363,6 @@ class BoundingBox3D(_ACBaseType):
         self.yMax: float = yMax
         self.zMax: float = zMax
 
-BoundingBox3D.get_classinfo().add_field('xMin', float)
-BoundingBox3D.get_classinfo().add_field('yMin', float)
-BoundingBox3D.get_classinfo().add_field('zMin', float)
-BoundingBox3D.get_classinfo().add_field('xMax', float)
-BoundingBox3D.get_classinfo().add_field('yMax', float)
-BoundingBox3D.get_classinfo().add_field('zMax', float)
-
 
 class RGBColor(_ACBaseType):
     """ A color model represented via its red, green and blue components.
@@ -1646,10 +1380,6 @@ class RGBColor(_ACBaseType):
         self.green: float = green
         self.blue: float = blue
 
-RGBColor.get_classinfo().add_field('red', float, maximum(1, False))
-RGBColor.get_classinfo().add_field('green', float, maximum(1, False))
-RGBColor.get_classinfo().add_field('blue', float, maximum(1, False))
-
 
 class Subset(_ACBaseType):
     """ A set of options used to assign IDs to the layouts contained in the subset.
@@ -1683,18 +1413,6 @@ class Subset(_ACBaseType):
         self.startAt: int = startAt
         self.ownPrefix: str = ownPrefix
 
-Subset.get_classinfo().add_field('name', str, min_length(1))
-Subset.get_classinfo().add_field('includeToIDSequence', bool)
-Subset.get_classinfo().add_field('customNumbering', bool)
-Subset.get_classinfo().add_field('continueNumbering', bool)
-Subset.get_classinfo().add_field('useUpperPrefix', bool)
-Subset.get_classinfo().add_field('addOwnPrefix', bool)
-Subset.get_classinfo().add_field('customNumber', str)
-Subset.get_classinfo().add_field('autoNumber', str)
-Subset.get_classinfo().add_field('numberingStyle', str, value_set(['Undefined', 'abc', 'ABC', '1', '01', '001', '0001', 'noID']))
-Subset.get_classinfo().add_field('startAt', int)
-Subset.get_classinfo().add_field('ownPrefix', str)
-
 
 class LayoutParameters(_ACBaseType):
     """ The parameters of the layout.
@@ -1738,23 +1456,6 @@ class LayoutParameters(_ACBaseType):
         self.hasIssuedRevision: bool = hasIssuedRevision
         self.hasActualRevision: bool = hasActualRevision
 
-LayoutParameters.get_classinfo().add_field('horizontalSize', float)
-LayoutParameters.get_classinfo().add_field('verticalSize', float)
-LayoutParameters.get_classinfo().add_field('leftMargin', float)
-LayoutParameters.get_classinfo().add_field('topMargin', float)
-LayoutParameters.get_classinfo().add_field('rightMargin', float)
-LayoutParameters.get_classinfo().add_field('bottomMargin', float)
-LayoutParameters.get_classinfo().add_field('customLayoutNumber', str)
-LayoutParameters.get_classinfo().add_field('customLayoutNumbering', bool)
-LayoutParameters.get_classinfo().add_field('doNotIncludeInNumbering', bool)
-LayoutParameters.get_classinfo().add_field('displayMasterLayoutBelow', bool)
-LayoutParameters.get_classinfo().add_field('layoutPageNumber', int)
-LayoutParameters.get_classinfo().add_field('actPageIndex', int)
-LayoutParameters.get_classinfo().add_field('currentRevisionId', str)
-LayoutParameters.get_classinfo().add_field('currentFinalRevisionId', str)
-LayoutParameters.get_classinfo().add_field('hasIssuedRevision', bool)
-LayoutParameters.get_classinfo().add_field('hasActualRevision', bool)
-
 
 class ComponentId(_ACBaseType):
     """ The identifier of a component.
@@ -1768,8 +1469,6 @@ class ComponentId(_ACBaseType):
     def __init__(self, guid: UUID):
         self.guid: UUID = guid
 
-ComponentId.get_classinfo().add_field('guid', UUID)
-
 
 class ElementComponentId(_ACBaseType):
     """ The identifier of an element's component.
@@ -1785,9 +1484,6 @@ class ElementComponentId(_ACBaseType):
         self.elementId: ElementId = elementId
         self.componentId: ComponentId = componentId
 
-ElementComponentId.get_classinfo().add_field('elementId', ElementId)
-ElementComponentId.get_classinfo().add_field('componentId', ComponentId)
-
 
 class ElementComponentIdArrayItem(_ACBaseType):
     """ An item of a component array.
@@ -1801,8 +1497,6 @@ class ElementComponentIdArrayItem(_ACBaseType):
     def __init__(self, elementComponentId: ElementComponentId):
         self.elementComponentId: ElementComponentId = elementComponentId
 
-ElementComponentIdArrayItem.get_classinfo().add_field('elementComponentId', ElementComponentId)
-
 
 class ElementComponentsWrapper(_ACBaseType):
     """ List of components.
@@ -1816,8 +1510,6 @@ class ElementComponentsWrapper(_ACBaseType):
     def __init__(self, elementComponents: List[ElementComponentIdArrayItem]):
         self.elementComponents: List[ElementComponentIdArrayItem] = elementComponents
 
-ElementComponentsWrapper.get_classinfo().add_field('elementComponents', List[ElementComponentIdArrayItem])
-
 
 class ElementComponentsOrError(_ACUnionType):
     """ List of components or error.
@@ -1851,8 +1543,6 @@ class LayerAttributeWrapper(_ACBaseType):
     def __init__(self, layerAttribute: LayerAttribute):
         self.layerAttribute: LayerAttribute = layerAttribute
 
-LayerAttributeWrapper.get_classinfo().add_field('layerAttribute', LayerAttribute)
-
 
 class FillAttributeWrapper(_ACBaseType):
     """ 
@@ -1866,8 +1556,6 @@ class FillAttributeWrapper(_ACBaseType):
     def __init__(self, fillAttribute: FillAttribute):
         self.fillAttribute: FillAttribute = fillAttribute
 
-FillAttributeWrapper.get_classinfo().add_field('fillAttribute', FillAttribute)
-
 
 class ProfileAttributeWrapper(_ACBaseType):
     """ 
@@ -1881,8 +1569,6 @@ class ProfileAttributeWrapper(_ACBaseType):
     def __init__(self, profileAttribute: ProfileAttribute):
         self.profileAttribute: ProfileAttribute = profileAttribute
 
-ProfileAttributeWrapper.get_classinfo().add_field('profileAttribute', ProfileAttribute)
-
 
 class DashItemWrapper(_ACBaseType):
     """ 
@@ -1896,8 +1582,6 @@ class DashItemWrapper(_ACBaseType):
     def __init__(self, dashItem: DashItem):
         self.dashItem: DashItem = dashItem
 
-DashItemWrapper.get_classinfo().add_field('dashItem', DashItem)
-
 
 class LayerCombinationAttributeWrapper(_ACBaseType):
     """ 
@@ -1911,8 +1595,6 @@ class LayerCombinationAttributeWrapper(_ACBaseType):
     def __init__(self, layerCombinationAttribute: LayerCombinationAttribute):
         self.layerCombinationAttribute: LayerCombinationAttribute = layerCombinationAttribute
 
-LayerCombinationAttributeWrapper.get_classinfo().add_field('layerCombinationAttribute', LayerCombinationAttribute)
-
 
 class ClassificationIdWrapper(_ACBaseType):
     """ 
@@ -1926,8 +1608,6 @@ class ClassificationIdWrapper(_ACBaseType):
     def __init__(self, classificationId: ClassificationId):
         self.classificationId: ClassificationId = classificationId
 
-ClassificationIdWrapper.get_classinfo().add_field('classificationId', ClassificationId)
-
 
 class ClassificationItemDetailsWrapper(_ACBaseType):
     """ 
@@ -1941,8 +1621,6 @@ class ClassificationItemDetailsWrapper(_ACBaseType):
     def __init__(self, classificationItem: ClassificationItemDetails):
         self.classificationItem: ClassificationItemDetails = classificationItem
 
-ClassificationItemDetailsWrapper.get_classinfo().add_field('classificationItem', ClassificationItemDetails)
-
 
 class ClassificationSystemWrapper(_ACBaseType):
     """ 
@@ -1956,8 +1634,6 @@ class ClassificationSystemWrapper(_ACBaseType):
     def __init__(self, classificationSystem: ClassificationSystem):
         self.classificationSystem: ClassificationSystem = classificationSystem
 
-ClassificationSystemWrapper.get_classinfo().add_field('classificationSystem', ClassificationSystem)
-
 
 class NavigatorItemIdWrapper(_ACBaseType):
     """ 
@@ -1971,8 +1647,6 @@ class NavigatorItemIdWrapper(_ACBaseType):
     def __init__(self, navigatorItemId: NavigatorItemId):
         self.navigatorItemId: NavigatorItemId = navigatorItemId
 
-NavigatorItemIdWrapper.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-
 
 class NavigatorItemIdAndTypeWrapper(_ACBaseType):
     """ 
@@ -1986,8 +1660,6 @@ class NavigatorItemIdAndTypeWrapper(_ACBaseType):
     def __init__(self, navigatorItemIdAndType: NavigatorItemIdAndType):
         self.navigatorItemIdAndType: NavigatorItemIdAndType = navigatorItemIdAndType
 
-NavigatorItemIdAndTypeWrapper.get_classinfo().add_field('navigatorItemIdAndType', NavigatorItemIdAndType)
-
 
 class DetailNavigatorItemWrapper(_ACBaseType):
     """ 
@@ -2001,8 +1673,6 @@ class DetailNavigatorItemWrapper(_ACBaseType):
     def __init__(self, detailNavigatorItem: DetailNavigatorItem):
         self.detailNavigatorItem: DetailNavigatorItem = detailNavigatorItem
 
-DetailNavigatorItemWrapper.get_classinfo().add_field('detailNavigatorItem', DetailNavigatorItem)
-
 
 class Document3DNavigatorItemWrapper(_ACBaseType):
     """ 
@@ -2016,8 +1686,6 @@ class Document3DNavigatorItemWrapper(_ACBaseType):
     def __init__(self, document3DNavigatorItem: Document3DNavigatorItem):
         self.document3DNavigatorItem: Document3DNavigatorItem = document3DNavigatorItem
 
-Document3DNavigatorItemWrapper.get_classinfo().add_field('document3DNavigatorItem', Document3DNavigatorItem)
-
 
 class ElevationNavigatorItemWrapper(_ACBaseType):
     """ 
@@ -2031,8 +1699,6 @@ class ElevationNavigatorItemWrapper(_ACBaseType):
     def __init__(self, elevationNavigatorItem: ElevationNavigatorItem):
         self.elevationNavigatorItem: ElevationNavigatorItem = elevationNavigatorItem
 
-ElevationNavigatorItemWrapper.get_classinfo().add_field('elevationNavigatorItem', ElevationNavigatorItem)
-
 
 class InteriorElevationNavigatorItemWrapper(_ACBaseType):
     """ 
@@ -2046,8 +1712,6 @@ class InteriorElevationNavigatorItemWrapper(_ACBaseType):
     def __init__(self, interiorElevationNavigatorItem: InteriorElevationNavigatorItem):
         self.interiorElevationNavigatorItem: InteriorElevationNavigatorItem = interiorElevationNavigatorItem
 
-InteriorElevationNavigatorItemWrapper.get_classinfo().add_field('interiorElevationNavigatorItem', InteriorElevationNavigatorItem)
-
 
 class SectionNavigatorItemWrapper(_ACBaseType):
     """ 
@@ -2061,8 +1725,6 @@ class SectionNavigatorItemWrapper(_ACBaseType):
     def __init__(self, sectionNavigatorItem: SectionNavigatorItem):
         self.sectionNavigatorItem: SectionNavigatorItem = sectionNavigatorItem
 
-SectionNavigatorItemWrapper.get_classinfo().add_field('sectionNavigatorItem', SectionNavigatorItem)
-
 
 class StoryNavigatorItemWrapper(_ACBaseType):
     """ 
@@ -2076,8 +1738,6 @@ class StoryNavigatorItemWrapper(_ACBaseType):
     def __init__(self, storyNavigatorItem: StoryNavigatorItem):
         self.storyNavigatorItem: StoryNavigatorItem = storyNavigatorItem
 
-StoryNavigatorItemWrapper.get_classinfo().add_field('storyNavigatorItem', StoryNavigatorItem)
-
 
 class WorksheetNavigatorItemWrapper(_ACBaseType):
     """ 
@@ -2091,8 +1751,6 @@ class WorksheetNavigatorItemWrapper(_ACBaseType):
     def __init__(self, worksheetNavigatorItem: WorksheetNavigatorItem):
         self.worksheetNavigatorItem: WorksheetNavigatorItem = worksheetNavigatorItem
 
-WorksheetNavigatorItemWrapper.get_classinfo().add_field('worksheetNavigatorItem', WorksheetNavigatorItem)
-
 
 class PropertyGroupWrapper(_ACBaseType):
     """ 
@@ -2106,8 +1764,6 @@ class PropertyGroupWrapper(_ACBaseType):
     def __init__(self, propertyGroup: PropertyGroup):
         self.propertyGroup: PropertyGroup = propertyGroup
 
-PropertyGroupWrapper.get_classinfo().add_field('propertyGroup', PropertyGroup)
-
 
 class EnumValueIdWrapper(_ACBaseType):
     """ 
@@ -2121,8 +1777,6 @@ class EnumValueIdWrapper(_ACBaseType):
     def __init__(self, enumValueId: EnumValueId):
         self.enumValueId: EnumValueId = enumValueId
 
-EnumValueIdWrapper.get_classinfo().add_field('enumValueId', EnumValueId)
-
 
 class TypeOfElementWrapper(_ACBaseType):
     """ 
@@ -2136,8 +1790,6 @@ class TypeOfElementWrapper(_ACBaseType):
     def __init__(self, typeOfElement: TypeOfElement):
         self.typeOfElement: TypeOfElement = typeOfElement
 
-TypeOfElementWrapper.get_classinfo().add_field('typeOfElement', TypeOfElement)
-
 
 class ImageWrapper(_ACBaseType):
     """ 
@@ -2151,8 +1803,6 @@ class ImageWrapper(_ACBaseType):
     def __init__(self, image: Image):
         self.image: Image = image
 
-ImageWrapper.get_classinfo().add_field('image', Image)
-
 
 class BoundingBox2DWrapper(_ACBaseType):
     """ 
@@ -2166,8 +1816,6 @@ class BoundingBox2DWrapper(_ACBaseType):
     def __init__(self, boundingBox2D: BoundingBox2D):
         self.boundingBox2D: BoundingBox2D = boundingBox2D
 
-BoundingBox2DWrapper.get_classinfo().add_field('boundingBox2D', BoundingBox2D)
-
 
 class BoundingBox3DWrapper(_ACBaseType):
     """ 
@@ -2181,8 +1829,6 @@ class BoundingBox3DWrapper(_ACBaseType):
     def __init__(self, boundingBox3D: BoundingBox3D):
         self.boundingBox3D: BoundingBox3D = boundingBox3D
 
-BoundingBox3DWrapper.get_classinfo().add_field('boundingBox3D', BoundingBox3D)
-
 
 class AttributeIdOrError(_ACUnionType):
     """ The attribute's identifier or an error.
@@ -2284,22 +1930,6 @@ class SurfaceAttribute(_ACBaseType):
         self.shine: int = shine
         self.texture: Optional[Texture] = texture
 
-SurfaceAttribute.get_classinfo().add_field('attributeId', AttributeId)
-SurfaceAttribute.get_classinfo().add_field('name', str)
-SurfaceAttribute.get_classinfo().add_field('materialType', str, value_set(['General', 'Simple', 'Matte', 'Metal', 'Plastic', 'Glass', 'Glowing', 'Constant']))
-SurfaceAttribute.get_classinfo().add_field('ambientReflection', int, maximum(100, False))
-SurfaceAttribute.get_classinfo().add_field('diffuseReflection', int, maximum(100, False))
-SurfaceAttribute.get_classinfo().add_field('specularReflection', int, maximum(100, False))
-SurfaceAttribute.get_classinfo().add_field('transparencyAttenuation', int, maximum(400, False))
-SurfaceAttribute.get_classinfo().add_field('emissionAttenuation', int, maximum(65535, False))
-SurfaceAttribute.get_classinfo().add_field('surfaceColor', RGBColor)
-SurfaceAttribute.get_classinfo().add_field('specularColor', RGBColor)
-SurfaceAttribute.get_classinfo().add_field('emissionColor', RGBColor)
-SurfaceAttribute.get_classinfo().add_field('fillId', AttributeIdOrError)
-SurfaceAttribute.get_classinfo().add_field('transparency', int, maximum(100, False))
-SurfaceAttribute.get_classinfo().add_field('shine', int, maximum(10000, False))
-SurfaceAttribute.get_classinfo().add_field('texture', Optional[Texture])
-
 
 class ProfileAttributeOrError(_ACUnionType):
     """ A profile attribute or an error.
@@ -2335,9 +1965,6 @@ class CompositeLine(_ACBaseType):
         self.lineId: AttributeIdOrError = lineId
         self.linePenIndex: Optional[int] = linePenIndex
 
-CompositeLine.get_classinfo().add_field('lineId', AttributeIdOrError)
-CompositeLine.get_classinfo().add_field('linePenIndex', Optional[int], maximum(255, False))
-
 
 class CompositeLineListItem(_ACBaseType):
     """ EMPTY STRING
@@ -2351,8 +1978,6 @@ class CompositeLineListItem(_ACBaseType):
     def __init__(self, compositeLine: CompositeLine):
         self.compositeLine: CompositeLine = compositeLine
 
-CompositeLineListItem.get_classinfo().add_field('compositeLine', CompositeLine)
-
 
 class CompositeSkin(_ACBaseType):
     """ A skin component for a composite attribute.
@@ -2374,12 +1999,6 @@ class CompositeSkin(_ACBaseType):
         self.isFinish: bool = isFinish
         self.framePenIndex: Optional[int] = framePenIndex
 
-CompositeSkin.get_classinfo().add_field('buildingMaterialId', AttributeIdOrError)
-CompositeSkin.get_classinfo().add_field('thickness', float)
-CompositeSkin.get_classinfo().add_field('isCore', bool)
-CompositeSkin.get_classinfo().add_field('isFinish', bool)
-CompositeSkin.get_classinfo().add_field('framePenIndex', Optional[int], maximum(255, False))
-
 
 class CompositeSkinListItem(_ACBaseType):
     """ EMPTY STRING
@@ -2393,8 +2012,6 @@ class CompositeSkinListItem(_ACBaseType):
     def __init__(self, compositeSkin: CompositeSkin):
         self.compositeSkin: CompositeSkin = compositeSkin
 
-CompositeSkinListItem.get_classinfo().add_field('compositeSkin', CompositeSkin)
-
 
 class CompositeAttribute(_ACBaseType):
     """ A composite attribute.
@@ -2418,13 +2035,6 @@ class CompositeAttribute(_ACBaseType):
         self.compositeLines: List[CompositeLineListItem] = compositeLines
         self.useWith: List[str] = useWith
 
-CompositeAttribute.get_classinfo().add_field('attributeId', AttributeId)
-CompositeAttribute.get_classinfo().add_field('name', str)
-CompositeAttribute.get_classinfo().add_field('totalThickness', float)
-CompositeAttribute.get_classinfo().add_field('compositeSkins', List[CompositeSkinListItem])
-CompositeAttribute.get_classinfo().add_field('compositeLines', List[CompositeLineListItem])
-CompositeAttribute.get_classinfo().add_field('useWith', List[str], listitem_validator(value_set(['Wall', 'Column', 'Beam', 'Window', 'Door', 'Object', 'Lamp', 'Slab', 'Roof', 'Mesh', 'Zone', 'CurtainWall', 'Shell', 'Skylight', 'Morph', 'Stair', 'Railing', 'Opening'])))
-
 
 class Pen(_ACBaseType):
     """ A pen attribute.
@@ -2446,12 +2056,6 @@ class Pen(_ACBaseType):
         self.weight: float = weight
         self.description: str = description
 
-Pen.get_classinfo().add_field('name', str, min_length(1))
-Pen.get_classinfo().add_field('index', int, maximum(255, False))
-Pen.get_classinfo().add_field('color', RGBColor)
-Pen.get_classinfo().add_field('weight', float)
-Pen.get_classinfo().add_field('description', str)
-
 
 class PenArrayItem(_ACBaseType):
     """ EMPTY STRING
@@ -2465,8 +2069,6 @@ class PenArrayItem(_ACBaseType):
     def __init__(self, pen: Pen):
         self.pen: Pen = pen
 
-PenArrayItem.get_classinfo().add_field('pen', Pen)
-
 
 class LineItem(_ACBaseType):
     """ A line item.
@@ -2494,15 +2096,6 @@ class LineItem(_ACBaseType):
         self.begAngle: float = begAngle
         self.endAngle: float = endAngle
 
-LineItem.get_classinfo().add_field('lineItemType', str, value_set(['IllegalItemType', 'SeparatorItemType', 'CenterDotItemType', 'CenterLineItemType', 'DotItemType', 'RightAngleItemType', 'ParallelItemType', 'LineItemType', 'CircItemType', 'ArcItemType']))
-LineItem.get_classinfo().add_field('centerOffset', float)
-LineItem.get_classinfo().add_field('length', float)
-LineItem.get_classinfo().add_field('begPosition', Point2D)
-LineItem.get_classinfo().add_field('endPosition', Point2D)
-LineItem.get_classinfo().add_field('radius', float)
-LineItem.get_classinfo().add_field('begAngle', float)
-LineItem.get_classinfo().add_field('endAngle', float)
-
 
 class ZoneCategoryAttribute(_ACBaseType):
     """ A zone category.
@@ -2528,14 +2121,6 @@ class ZoneCategoryAttribute(_ACBaseType):
         self.stampRevisionGuid: UUID = stampRevisionGuid
         self.color: RGBColor = color
 
-ZoneCategoryAttribute.get_classinfo().add_field('attributeId', AttributeId)
-ZoneCategoryAttribute.get_classinfo().add_field('name', str)
-ZoneCategoryAttribute.get_classinfo().add_field('categoryCode', str)
-ZoneCategoryAttribute.get_classinfo().add_field('stampName', str)
-ZoneCategoryAttribute.get_classinfo().add_field('stampMainGuid', UUID)
-ZoneCategoryAttribute.get_classinfo().add_field('stampRevisionGuid', UUID)
-ZoneCategoryAttribute.get_classinfo().add_field('color', RGBColor)
-
 
 class BuildingMaterialAttribute(_ACBaseType):
     """ A building material attribute
@@ -2561,14 +2146,6 @@ class BuildingMaterialAttribute(_ACBaseType):
         self.cutFillPenIndex: int = cutFillPenIndex
         self.cutSurfaceId: AttributeIdOrError = cutSurfaceId
 
-BuildingMaterialAttribute.get_classinfo().add_field('attributeId', AttributeId)
-BuildingMaterialAttribute.get_classinfo().add_field('name', str)
-BuildingMaterialAttribute.get_classinfo().add_field('id', str)
-BuildingMaterialAttribute.get_classinfo().add_field('connectionPriority', int)
-BuildingMaterialAttribute.get_classinfo().add_field('cutFillId', AttributeIdOrError)
-BuildingMaterialAttribute.get_classinfo().add_field('cutFillPenIndex', int, maximum(255, False))
-BuildingMaterialAttribute.get_classinfo().add_field('cutSurfaceId', AttributeIdOrError)
-
 
 class LayerCombinationAttributeOrError(_ACUnionType):
     """ A layer combination attribute or an error.
@@ -2604,9 +2181,6 @@ class ClassificationItemAvailability(_ACBaseType):
         self.classificationItemId: ClassificationItemId = classificationItemId
         self.availableProperties: List[PropertyIdArrayItem] = availableProperties
 
-ClassificationItemAvailability.get_classinfo().add_field('classificationItemId', ClassificationItemId)
-ClassificationItemAvailability.get_classinfo().add_field('availableProperties', List[PropertyIdArrayItem])
-
 
 class PropertyDefinitionAvailability(_ACBaseType):
     """ Contains the ids of classification items the given property definiton is available for.
@@ -2622,9 +2196,6 @@ class PropertyDefinitionAvailability(_ACBaseType):
         self.propertyId: PropertyId = propertyId
         self.availableClassifications: List[ClassificationItemIdArrayItem] = availableClassifications
 
-PropertyDefinitionAvailability.get_classinfo().add_field('propertyId', PropertyId)
-PropertyDefinitionAvailability.get_classinfo().add_field('availableClassifications', List[ClassificationItemIdArrayItem])
-
 
 class ClassificationIdOrError(_ACUnionType):
     """ A classification identifier or an error.
@@ -2660,9 +2231,6 @@ class ElementClassification(_ACBaseType):
         self.elementId: ElementId = elementId
         self.classificationId: ClassificationId = classificationId
 
-ElementClassification.get_classinfo().add_field('elementId', ElementId)
-ElementClassification.get_classinfo().add_field('classificationId', ClassificationId)
-
 
 class ClassificationItemOrError(_ACUnionType):
     """ A classification item or an error.
@@ -2882,11 +2450,6 @@ class BuiltInContainerNavigatorItem(_ACBaseType):
         self.name: str = name
         self.contentIds: List[NavigatorItemIdWrapper] = contentIds
 
-BuiltInContainerNavigatorItem.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-BuiltInContainerNavigatorItem.get_classinfo().add_field('prefix', str)
-BuiltInContainerNavigatorItem.get_classinfo().add_field('name', str)
-BuiltInContainerNavigatorItem.get_classinfo().add_field('contentIds', List[NavigatorItemIdWrapper])
-
 
 class PropertyIdOrError(_ACUnionType):
     """ A property identifier or an error.
@@ -2944,10 +2507,6 @@ class NormalSingleEnumPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalSingleEnumPropertyValue.get_classinfo().add_field('value', EnumValueId)
-NormalSingleEnumPropertyValue.get_classinfo().add_field('type', str, value_set(['singleEnum']))
-NormalSingleEnumPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class NormalMultiEnumPropertyValue(_ACBaseType):
     """ A multiple choice enumeration property value containing the IDs of the selected enum values in an array.
@@ -2965,10 +2524,6 @@ class NormalMultiEnumPropertyValue(_ACBaseType):
         self.type: str = type
         self.status: str = status
 
-NormalMultiEnumPropertyValue.get_classinfo().add_field('value', List[EnumValueIdWrapper])
-NormalMultiEnumPropertyValue.get_classinfo().add_field('type', str, value_set(['multiEnum']))
-NormalMultiEnumPropertyValue.get_classinfo().add_field('status', str, value_set(['normal']))
-
 
 class PropertyIdsOfElement(_ACBaseType):
     """ A list property identifiers of an owner element.
@@ -2984,9 +2539,6 @@ class PropertyIdsOfElement(_ACBaseType):
         self.elementId: ElementId = elementId
         self.propertyIds: List[PropertyIdArrayItem] = propertyIds
 
-PropertyIdsOfElement.get_classinfo().add_field('elementId', ElementId)
-PropertyIdsOfElement.get_classinfo().add_field('propertyIds', List[PropertyIdArrayItem])
-
 
 class TypeOfElementOrError(_ACUnionType):
     """ The type of an element or an error.
@@ -3080,8 +2632,6 @@ class SurfaceAttributeWrapper(_ACBaseType):
     def __init__(self, surfaceAttribute: SurfaceAttribute):
         self.surfaceAttribute: SurfaceAttribute = surfaceAttribute
 
-SurfaceAttributeWrapper.get_classinfo().add_field('surfaceAttribute', SurfaceAttribute)
-
 
 class CompositeAttributeWrapper(_ACBaseType):
     """ 
@@ -3095,8 +2645,6 @@ class CompositeAttributeWrapper(_ACBaseType):
     def __init__(self, compositeAttribute: CompositeAttribute):
         self.compositeAttribute: CompositeAttribute = compositeAttribute
 
-CompositeAttributeWrapper.get_classinfo().add_field('compositeAttribute', CompositeAttribute)
-
 
 class LineItemWrapper(_ACBaseType):
     """ 
@@ -3110,8 +2658,6 @@ class LineItemWrapper(_ACBaseType):
     def __init__(self, lineItem: LineItem):
         self.lineItem: LineItem = lineItem
 
-LineItemWrapper.get_classinfo().add_field('lineItem', LineItem)
-
 
 class ZoneCategoryAttributeWrapper(_ACBaseType):
     """ 
@@ -3125,8 +2671,6 @@ class ZoneCategoryAttributeWrapper(_ACBaseType):
     def __init__(self, zoneCategoryAttribute: ZoneCategoryAttribute):
         self.zoneCategoryAttribute: ZoneCategoryAttribute = zoneCategoryAttribute
 
-ZoneCategoryAttributeWrapper.get_classinfo().add_field('zoneCategoryAttribute', ZoneCategoryAttribute)
-
 
 class BuildingMaterialAttributeWrapper(_ACBaseType):
     """ 
@@ -3140,8 +2684,6 @@ class BuildingMaterialAttributeWrapper(_ACBaseType):
     def __init__(self, buildingMaterialAttribute: BuildingMaterialAttribute):
         self.buildingMaterialAttribute: BuildingMaterialAttribute = buildingMaterialAttribute
 
-BuildingMaterialAttributeWrapper.get_classinfo().add_field('buildingMaterialAttribute', BuildingMaterialAttribute)
-
 
 class ClassificationItemAvailabilityWrapper(_ACBaseType):
     """ 
@@ -3155,8 +2697,6 @@ class ClassificationItemAvailabilityWrapper(_ACBaseType):
     def __init__(self, classificationItemAvailability: ClassificationItemAvailability):
         self.classificationItemAvailability: ClassificationItemAvailability = classificationItemAvailability
 
-ClassificationItemAvailabilityWrapper.get_classinfo().add_field('classificationItemAvailability', ClassificationItemAvailability)
-
 
 class PropertyDefinitionAvailabilityWrapper(_ACBaseType):
     """ 
@@ -3170,8 +2710,6 @@ class PropertyDefinitionAvailabilityWrapper(_ACBaseType):
     def __init__(self, propertyDefinitionAvailability: PropertyDefinitionAvailability):
         self.propertyDefinitionAvailability: PropertyDefinitionAvailability = propertyDefinitionAvailability
 
-PropertyDefinitionAvailabilityWrapper.get_classinfo().add_field('propertyDefinitionAvailability', PropertyDefinitionAvailability)
-
 
 class ClassificationIdsOrErrorsWrapper(_ACBaseType):
     """ 
@@ -3185,8 +2723,6 @@ class ClassificationIdsOrErrorsWrapper(_ACBaseType):
     def __init__(self, classificationIds: List[ClassificationIdOrError]):
         self.classificationIds: List[ClassificationIdOrError] = classificationIds
 
-ClassificationIdsOrErrorsWrapper.get_classinfo().add_field('classificationIds', List[ClassificationIdOrError])
-
 
 class BuiltInContainerNavigatorItemWrapper(_ACBaseType):
     """ 
@@ -3200,8 +2736,6 @@ class BuiltInContainerNavigatorItemWrapper(_ACBaseType):
     def __init__(self, builtInContainerNavigatorItem: BuiltInContainerNavigatorItem):
         self.builtInContainerNavigatorItem: BuiltInContainerNavigatorItem = builtInContainerNavigatorItem
 
-BuiltInContainerNavigatorItemWrapper.get_classinfo().add_field('builtInContainerNavigatorItem', BuiltInContainerNavigatorItem)
-
 
 class PropertyIdsOfElementWrapper(_ACBaseType):
     """ 
@@ -3215,8 +2749,6 @@ class PropertyIdsOfElementWrapper(_ACBaseType):
     def __init__(self, propertyIdsOfElement: PropertyIdsOfElement):
         self.propertyIdsOfElement: PropertyIdsOfElement = propertyIdsOfElement
 
-PropertyIdsOfElementWrapper.get_classinfo().add_field('propertyIdsOfElement', PropertyIdsOfElement)
-
 
 class PenTableAttribute(_ACBaseType):
     """ A pen table attribute.
@@ -3234,10 +2766,6 @@ class PenTableAttribute(_ACBaseType):
         self.name: str = name
         self.pens: List[PenArrayItem] = pens
 
-PenTableAttribute.get_classinfo().add_field('attributeId', AttributeId)
-PenTableAttribute.get_classinfo().add_field('name', str)
-PenTableAttribute.get_classinfo().add_field('pens', List[PenArrayItem])
-
 
 class SurfaceAttributeOrError(_ACUnionType):
     """ A surface attribute or an error.
@@ -3325,15 +2853,6 @@ class LineAttribute(_ACBaseType):
         self.lineType: str = lineType
         self.lineItems: Optional[List[DashOrLineItem]] = lineItems
 
-LineAttribute.get_classinfo().add_field('attributeId', AttributeId)
-LineAttribute.get_classinfo().add_field('name', str)
-LineAttribute.get_classinfo().add_field('appearanceType', str, value_set(['ScaleWithPlan', 'ScaleIndependent']))
-LineAttribute.get_classinfo().add_field('displayScale', float)
-LineAttribute.get_classinfo().add_field('period', float)
-LineAttribute.get_classinfo().add_field('height', float)
-LineAttribute.get_classinfo().add_field('lineType', str, value_set(['SolidLine', 'DashedLine', 'SymbolLine']))
-LineAttribute.get_classinfo().add_field('lineItems', Optional[List[DashOrLineItem]])
-
 
 class ZoneCategoryAttributeOrError(_ACUnionType):
     """ A zone category attribute or an error.
@@ -3487,8 +3006,6 @@ class PenTableAttributeWrapper(_ACBaseType):
     def __init__(self, penTableAttribute: PenTableAttribute):
         self.penTableAttribute: PenTableAttribute = penTableAttribute
 
-PenTableAttributeWrapper.get_classinfo().add_field('penTableAttribute', PenTableAttribute)
-
 
 class LineAttributeWrapper(_ACBaseType):
     """ 
@@ -3502,8 +3019,6 @@ class LineAttributeWrapper(_ACBaseType):
     def __init__(self, lineAttribute: LineAttribute):
         self.lineAttribute: LineAttribute = lineAttribute
 
-LineAttributeWrapper.get_classinfo().add_field('lineAttribute', LineAttribute)
-
 
 class PenTableAttributeOrError(_ACUnionType):
     """ A pen table attribute or an error.
@@ -3579,14 +3094,8 @@ class ClassificationItemInTree(_ACBaseType):
         self.description: str = description
         self.children: Optional[List[ClassificationItemArrayItem]] = children
 
-ClassificationItemInTree.get_classinfo().add_field('classificationItemId', ClassificationItemId)
-ClassificationItemInTree.get_classinfo().add_field('id', str)
-ClassificationItemInTree.get_classinfo().add_field('name', str)
-ClassificationItemInTree.get_classinfo().add_field('description', str)
-ClassificationItemInTree.get_classinfo().add_field('children', Optional[List[ClassificationItemArrayItem]])
 
 ClassificationItemInTree_ = ClassificationItemInTree
-ClassificationItemArrayItem.get_classinfo().add_field('classificationItem', ClassificationItemInTree)
 
 
 class NavigatorItem_: pass
@@ -3625,15 +3134,8 @@ class NavigatorItem(_ACBaseType):
         self.sourceNavigatorItemId: Optional[NavigatorItemId] = sourceNavigatorItemId
         self.children: Optional[List[NavigatorItemArrayItem]] = children
 
-NavigatorItem.get_classinfo().add_field('navigatorItemId', NavigatorItemId)
-NavigatorItem.get_classinfo().add_field('prefix', str)
-NavigatorItem.get_classinfo().add_field('name', str)
-NavigatorItem.get_classinfo().add_field('type', str, value_set(['UndefinedItem', 'ProjectMapRootItem', 'StoryItem', 'SectionItem', 'ElevationItem', 'InteriorElevationItem', 'WorksheetItem', 'DetailItem', 'DocumentFrom3DItem', 'Perspective3DItem', 'Axonometry3DItem', 'CameraSetItem', 'CameraItem', 'ScheduleItem', 'ProjectIndexItem', 'TextListItem', 'GraphicListItem', 'InfoItem', 'HelpItem', 'FolderItem', 'LayoutBookRootItem', 'SubsetItem', 'LayoutItem', 'DrawingItem', 'MasterFolderItem', 'MasterLayoutItem']))
-NavigatorItem.get_classinfo().add_field('sourceNavigatorItemId', Optional[NavigatorItemId])
-NavigatorItem.get_classinfo().add_field('children', Optional[List[NavigatorItemArrayItem]])
 
 NavigatorItem_ = NavigatorItem
-NavigatorItemArrayItem.get_classinfo().add_field('navigatorItem', NavigatorItem)
 
 
 class NavigatorTree(_ACBaseType):
@@ -3648,8 +3150,6 @@ class NavigatorTree(_ACBaseType):
     def __init__(self, rootItem: NavigatorItem):
         self.rootItem: NavigatorItem = rootItem
 
-NavigatorTree.get_classinfo().add_field('rootItem', NavigatorItem)
-
 
 class PropertyValue_: pass
 class PropertyBasicDefaultValue(_ACBaseType):
@@ -3696,15 +3196,6 @@ class PropertyDefinition(_ACBaseType):
         self.possibleEnumValues: Optional[List[PossibleEnumValuesArrayItem]] = possibleEnumValues
         self.defaultValue: Optional[PropertyDefaultValue] = defaultValue
 
-PropertyDefinition.get_classinfo().add_field('group', PropertyGroup)
-PropertyDefinition.get_classinfo().add_field('name', str)
-PropertyDefinition.get_classinfo().add_field('description', str)
-PropertyDefinition.get_classinfo().add_field('isEditable', bool)
-PropertyDefinition.get_classinfo().add_field('type', str)
-PropertyDefinition.get_classinfo().add_field('propertyId', Optional[PropertyId])
-PropertyDefinition.get_classinfo().add_field('possibleEnumValues', Optional[List[PossibleEnumValuesArrayItem]])
-PropertyDefinition.get_classinfo().add_field('defaultValue', Optional[PropertyDefaultValue])
-
 
 class PropertyDefinitionWrapper(_ACBaseType):
     """ 
@@ -3718,8 +3209,6 @@ class PropertyDefinitionWrapper(_ACBaseType):
     def __init__(self, propertyDefinition: PropertyDefinition):
         self.propertyDefinition: PropertyDefinition = propertyDefinition
 
-PropertyDefinitionWrapper.get_classinfo().add_field('propertyDefinition', PropertyDefinition)
-
 
 class PropertyDefinitionOrError(_ACUnionType):
     """ A property definition or an error.
@@ -3779,10 +3268,6 @@ class ElementPropertyValue(_ACBaseType):
         self.propertyId: PropertyId = propertyId
         self.propertyValue: NormalOrUserUndefinedPropertyValue = propertyValue
 
-ElementPropertyValue.get_classinfo().add_field('elementId', ElementId)
-ElementPropertyValue.get_classinfo().add_field('propertyId', PropertyId)
-ElementPropertyValue.get_classinfo().add_field('propertyValue', NormalOrUserUndefinedPropertyValue)
-
 
 class PropertyValue(_ACUnionType):
     """ A normal, userUndefined, notAvailable or notEvaluated property value.
@@ -3806,7 +3291,6 @@ class PropertyValue(_ACUnionType):
         self.value: Union[float, int, str, bool, List[float], List[int], List[str], List[bool], EnumValueId, List[EnumValueIdWrapper], None] = value
 
 PropertyValue_ = PropertyValue
-PropertyBasicDefaultValue.get_classinfo().add_field('basicDefaultValue', PropertyValue)
 
 
 class PropertyValueWrapper(_ACBaseType):
@@ -3821,8 +3305,6 @@ class PropertyValueWrapper(_ACBaseType):
     def __init__(self, propertyValue: PropertyValue):
         self.propertyValue: PropertyValue = propertyValue
 
-PropertyValueWrapper.get_classinfo().add_field('propertyValue', PropertyValue)
-
 
 class PropertyValueOrErrorItem(_ACUnionType):
     """ A property value or an error
@@ -3856,8 +3338,6 @@ class PropertyValuesWrapper(_ACBaseType):
     def __init__(self, propertyValues: List[PropertyValueOrErrorItem]):
         self.propertyValues: List[PropertyValueOrErrorItem] = propertyValues
 
-PropertyValuesWrapper.get_classinfo().add_field('propertyValues', List[PropertyValueOrErrorItem])
-
 
 class PropertyValuesOrError(_ACUnionType):
     """ A list of property values or an error.
@@ -3879,206 +3359,214 @@ class PropertyValuesOrError(_ACUnionType):
         self.error: Optional[Error] = error
 
 
-class Types:
+class Types(metadata.LazyTypes):
     """ 
     """
-    AddOnCommandId=AddOnCommandId
-    AddOnCommandIdArrayItem=AddOnCommandIdArrayItem
-    AddOnCommandParameters=AddOnCommandParameters
-    AddOnCommandResponse=AddOnCommandResponse
-    AttributeId=AttributeId
-    AttributeFolderId=AttributeFolderId
-    AttributeIdWrapperItem=AttributeIdWrapperItem
-    AttributeFolder=AttributeFolder
-    AttributeFolderContent=AttributeFolderContent
-    AttributeHeader=AttributeHeader
-    LayerAttribute=LayerAttribute
-    FillAttribute=FillAttribute
-    ProfileModifier=ProfileModifier
-    ProfileModifierListItem=ProfileModifierListItem
-    ProfileAttribute=ProfileAttribute
-    Texture=Texture
-    DashItem=DashItem
-    LayerCombinationAttribute=LayerCombinationAttribute
-    ClassificationSystemId=ClassificationSystemId
-    ClassificationSystemIdArrayItem=ClassificationSystemIdArrayItem
-    ClassificationItemId=ClassificationItemId
-    ClassificationItemIdArrayItem=ClassificationItemIdArrayItem
-    ClassificationId=ClassificationId
-    ClassificationItemDetails=ClassificationItemDetails
-    ClassificationSystem=ClassificationSystem
-    Point2D=Point2D
-    NavigatorItemId=NavigatorItemId
-    PublisherSetId=PublisherSetId
-    OtherNavigatorTreeId=OtherNavigatorTreeId
-    NavigatorTreeId=NavigatorTreeId
-    GeneralNavigatorItemData=GeneralNavigatorItemData
-    NavigatorItemIdAndType=NavigatorItemIdAndType
-    DetailNavigatorItem=DetailNavigatorItem
-    Document3DNavigatorItem=Document3DNavigatorItem
-    ElevationNavigatorItem=ElevationNavigatorItem
-    InteriorElevationNavigatorItem=InteriorElevationNavigatorItem
-    SectionNavigatorItem=SectionNavigatorItem
-    StoryNavigatorItem=StoryNavigatorItem
-    WorksheetNavigatorItem=WorksheetNavigatorItem
-    UserDefinedPropertyUserId=UserDefinedPropertyUserId
-    BuiltInPropertyUserId=BuiltInPropertyUserId
-    PropertyUserId=PropertyUserId
-    PropertyId=PropertyId
-    PropertyIdArrayItem=PropertyIdArrayItem
-    PropertyGroupId=PropertyGroupId
-    PropertyGroupIdArrayItem=PropertyGroupIdArrayItem
-    PropertyGroup=PropertyGroup
-    NormalNumberPropertyValue=NormalNumberPropertyValue
-    NormalIntegerPropertyValue=NormalIntegerPropertyValue
-    NormalStringPropertyValue=NormalStringPropertyValue
-    NormalBooleanPropertyValue=NormalBooleanPropertyValue
-    NormalLengthPropertyValue=NormalLengthPropertyValue
-    NormalAreaPropertyValue=NormalAreaPropertyValue
-    NormalVolumePropertyValue=NormalVolumePropertyValue
-    NormalAnglePropertyValue=NormalAnglePropertyValue
-    NormalNumberListPropertyValue=NormalNumberListPropertyValue
-    NormalIntegerListPropertyValue=NormalIntegerListPropertyValue
-    NormalStringListPropertyValue=NormalStringListPropertyValue
-    NormalBooleanListPropertyValue=NormalBooleanListPropertyValue
-    NormalLengthListPropertyValue=NormalLengthListPropertyValue
-    NormalAreaListPropertyValue=NormalAreaListPropertyValue
-    NormalVolumeListPropertyValue=NormalVolumeListPropertyValue
-    NormalAngleListPropertyValue=NormalAngleListPropertyValue
-    UserUndefinedPropertyValue=UserUndefinedPropertyValue
-    NotAvailablePropertyValue=NotAvailablePropertyValue
-    NotEvaluatedPropertyValue=NotEvaluatedPropertyValue
-    DisplayValueEnumId=DisplayValueEnumId
-    NonLocalizedValueEnumId=NonLocalizedValueEnumId
-    EnumValueId=EnumValueId
-    PossibleEnumValue=PossibleEnumValue
-    PossibleEnumValuesArrayItem=PossibleEnumValuesArrayItem
-    Error=Error
-    ErrorItem=ErrorItem
-    SuccessfulExecutionResult=SuccessfulExecutionResult
-    FailedExecutionResult=FailedExecutionResult
-    ExecutionResult=ExecutionResult
-    ElementId=ElementId
-    ElementIdArrayItem=ElementIdArrayItem
-    TypeOfElement=TypeOfElement
-    ElementsWrapper=ElementsWrapper
-    ElementsOrError=ElementsOrError
-    Image=Image
-    FolderParameters=FolderParameters
-    BoundingBox2D=BoundingBox2D
-    BoundingBox3D=BoundingBox3D
-    RGBColor=RGBColor
-    Subset=Subset
-    LayoutParameters=LayoutParameters
-    ComponentId=ComponentId
-    ElementComponentId=ElementComponentId
-    ElementComponentIdArrayItem=ElementComponentIdArrayItem
-    ElementComponentsWrapper=ElementComponentsWrapper
-    ElementComponentsOrError=ElementComponentsOrError
-    LayerAttributeWrapper=LayerAttributeWrapper
-    FillAttributeWrapper=FillAttributeWrapper
-    ProfileAttributeWrapper=ProfileAttributeWrapper
-    DashItemWrapper=DashItemWrapper
-    LayerCombinationAttributeWrapper=LayerCombinationAttributeWrapper
-    ClassificationIdWrapper=ClassificationIdWrapper
-    ClassificationItemDetailsWrapper=ClassificationItemDetailsWrapper
-    ClassificationSystemWrapper=ClassificationSystemWrapper
-    NavigatorItemIdWrapper=NavigatorItemIdWrapper
-    NavigatorItemIdAndTypeWrapper=NavigatorItemIdAndTypeWrapper
-    DetailNavigatorItemWrapper=DetailNavigatorItemWrapper
-    Document3DNavigatorItemWrapper=Document3DNavigatorItemWrapper
-    ElevationNavigatorItemWrapper=ElevationNavigatorItemWrapper
-    InteriorElevationNavigatorItemWrapper=InteriorElevationNavigatorItemWrapper
-    SectionNavigatorItemWrapper=SectionNavigatorItemWrapper
-    StoryNavigatorItemWrapper=StoryNavigatorItemWrapper
-    WorksheetNavigatorItemWrapper=WorksheetNavigatorItemWrapper
-    PropertyGroupWrapper=PropertyGroupWrapper
-    EnumValueIdWrapper=EnumValueIdWrapper
-    TypeOfElementWrapper=TypeOfElementWrapper
-    ImageWrapper=ImageWrapper
-    BoundingBox2DWrapper=BoundingBox2DWrapper
-    BoundingBox3DWrapper=BoundingBox3DWrapper
-    AttributeIdOrError=AttributeIdOrError
-    LayerAttributeOrError=LayerAttributeOrError
-    FillAttributeOrError=FillAttributeOrError
-    SurfaceAttribute=SurfaceAttribute
-    ProfileAttributeOrError=ProfileAttributeOrError
-    CompositeLine=CompositeLine
-    CompositeLineListItem=CompositeLineListItem
-    CompositeSkin=CompositeSkin
-    CompositeSkinListItem=CompositeSkinListItem
-    CompositeAttribute=CompositeAttribute
-    Pen=Pen
-    PenArrayItem=PenArrayItem
-    LineItem=LineItem
-    ZoneCategoryAttribute=ZoneCategoryAttribute
-    BuildingMaterialAttribute=BuildingMaterialAttribute
-    LayerCombinationAttributeOrError=LayerCombinationAttributeOrError
-    ClassificationItemAvailability=ClassificationItemAvailability
-    PropertyDefinitionAvailability=PropertyDefinitionAvailability
-    ClassificationIdOrError=ClassificationIdOrError
-    ElementClassification=ElementClassification
-    ClassificationItemOrError=ClassificationItemOrError
-    ClassificationSystemOrError=ClassificationSystemOrError
-    NavigatorItemIdAndTypeOrError=NavigatorItemIdAndTypeOrError
-    DetailNavigatorItemOrError=DetailNavigatorItemOrError
-    Document3DNavigatorItemOrError=Document3DNavigatorItemOrError
-    ElevationNavigatorItemOrError=ElevationNavigatorItemOrError
-    InteriorElevationNavigatorItemOrError=InteriorElevationNavigatorItemOrError
-    SectionNavigatorItemOrError=SectionNavigatorItemOrError
-    StoryNavigatorItemOrError=StoryNavigatorItemOrError
-    WorksheetNavigatorItemOrError=WorksheetNavigatorItemOrError
-    BuiltInContainerNavigatorItem=BuiltInContainerNavigatorItem
-    PropertyIdOrError=PropertyIdOrError
-    PropertyGroupOrError=PropertyGroupOrError
-    NormalSingleEnumPropertyValue=NormalSingleEnumPropertyValue
-    NormalMultiEnumPropertyValue=NormalMultiEnumPropertyValue
-    PropertyIdsOfElement=PropertyIdsOfElement
-    TypeOfElementOrError=TypeOfElementOrError
-    ImageOrError=ImageOrError
-    BoundingBox2DOrError=BoundingBox2DOrError
-    BoundingBox3DOrError=BoundingBox3DOrError
-    SurfaceAttributeWrapper=SurfaceAttributeWrapper
-    CompositeAttributeWrapper=CompositeAttributeWrapper
-    LineItemWrapper=LineItemWrapper
-    ZoneCategoryAttributeWrapper=ZoneCategoryAttributeWrapper
-    BuildingMaterialAttributeWrapper=BuildingMaterialAttributeWrapper
-    ClassificationItemAvailabilityWrapper=ClassificationItemAvailabilityWrapper
-    PropertyDefinitionAvailabilityWrapper=PropertyDefinitionAvailabilityWrapper
-    ClassificationIdsOrErrorsWrapper=ClassificationIdsOrErrorsWrapper
-    BuiltInContainerNavigatorItemWrapper=BuiltInContainerNavigatorItemWrapper
-    PropertyIdsOfElementWrapper=PropertyIdsOfElementWrapper
-    PenTableAttribute=PenTableAttribute
-    SurfaceAttributeOrError=SurfaceAttributeOrError
-    CompositeAttributeOrError=CompositeAttributeOrError
-    DashOrLineItem=DashOrLineItem
-    LineAttribute=LineAttribute
-    ZoneCategoryAttributeOrError=ZoneCategoryAttributeOrError
-    BuildingMaterialAttributeOrError=BuildingMaterialAttributeOrError
-    ClassificationItemAvailabilityOrError=ClassificationItemAvailabilityOrError
-    PropertyDefinitionAvailabilityOrError=PropertyDefinitionAvailabilityOrError
-    ElementClassificationOrError=ElementClassificationOrError
-    BuiltInContainerNavigatorItemOrError=BuiltInContainerNavigatorItemOrError
-    PropertyIdsOfElementOrError=PropertyIdsOfElementOrError
-    PenTableAttributeWrapper=PenTableAttributeWrapper
-    LineAttributeWrapper=LineAttributeWrapper
-    PenTableAttributeOrError=PenTableAttributeOrError
-    LineAttributeOrError=LineAttributeOrError
-    ClassificationItemArrayItem=ClassificationItemArrayItem
-    ClassificationItemInTree=ClassificationItemInTree
-    NavigatorItemArrayItem=NavigatorItemArrayItem
-    NavigatorItem=NavigatorItem
-    NavigatorTree=NavigatorTree
-    PropertyBasicDefaultValue=PropertyBasicDefaultValue
-    PropertyDefaultValue=PropertyDefaultValue
-    PropertyDefinition=PropertyDefinition
-    PropertyDefinitionWrapper=PropertyDefinitionWrapper
-    PropertyDefinitionOrError=PropertyDefinitionOrError
-    NormalOrUserUndefinedPropertyValue=NormalOrUserUndefinedPropertyValue
-    ElementPropertyValue=ElementPropertyValue
-    PropertyValue=PropertyValue
-    PropertyValueWrapper=PropertyValueWrapper
-    PropertyValueOrErrorItem=PropertyValueOrErrorItem
-    PropertyValuesWrapper=PropertyValuesWrapper
-    PropertyValuesOrError=PropertyValuesOrError
-
+    _names = (
+        'AddOnCommandId',
+        'AddOnCommandIdArrayItem',
+        'AddOnCommandParameters',
+        'AddOnCommandResponse',
+        'AttributeId',
+        'AttributeFolderId',
+        'AttributeIdWrapperItem',
+        'AttributeFolder',
+        'AttributeFolderContent',
+        'AttributeHeader',
+        'LayerAttribute',
+        'FillAttribute',
+        'ProfileModifier',
+        'ProfileModifierListItem',
+        'ProfileAttribute',
+        'Texture',
+        'DashItem',
+        'LayerCombinationAttribute',
+        'ClassificationSystemId',
+        'ClassificationSystemIdArrayItem',
+        'ClassificationItemId',
+        'ClassificationItemIdArrayItem',
+        'ClassificationId',
+        'ClassificationItemDetails',
+        'ClassificationSystem',
+        'Point2D',
+        'NavigatorItemId',
+        'PublisherSetId',
+        'OtherNavigatorTreeId',
+        'NavigatorTreeId',
+        'GeneralNavigatorItemData',
+        'NavigatorItemIdAndType',
+        'DetailNavigatorItem',
+        'Document3DNavigatorItem',
+        'ElevationNavigatorItem',
+        'InteriorElevationNavigatorItem',
+        'SectionNavigatorItem',
+        'StoryNavigatorItem',
+        'WorksheetNavigatorItem',
+        'UserDefinedPropertyUserId',
+        'BuiltInPropertyUserId',
+        'PropertyUserId',
+        'PropertyId',
+        'PropertyIdArrayItem',
+        'PropertyGroupId',
+        'PropertyGroupIdArrayItem',
+        'PropertyGroup',
+        'NormalNumberPropertyValue',
+        'NormalIntegerPropertyValue',
+        'NormalStringPropertyValue',
+        'NormalBooleanPropertyValue',
+        'NormalLengthPropertyValue',
+        'NormalAreaPropertyValue',
+        'NormalVolumePropertyValue',
+        'NormalAnglePropertyValue',
+        'NormalNumberListPropertyValue',
+        'NormalIntegerListPropertyValue',
+        'NormalStringListPropertyValue',
+        'NormalBooleanListPropertyValue',
+        'NormalLengthListPropertyValue',
+        'NormalAreaListPropertyValue',
+        'NormalVolumeListPropertyValue',
+        'NormalAngleListPropertyValue',
+        'UserUndefinedPropertyValue',
+        'NotAvailablePropertyValue',
+        'NotEvaluatedPropertyValue',
+        'DisplayValueEnumId',
+        'NonLocalizedValueEnumId',
+        'EnumValueId',
+        'PossibleEnumValue',
+        'PossibleEnumValuesArrayItem',
+        'Error',
+        'ErrorItem',
+        'SuccessfulExecutionResult',
+        'FailedExecutionResult',
+        'ExecutionResult',
+        'ElementId',
+        'ElementIdArrayItem',
+        'TypeOfElement',
+        'ElementsWrapper',
+        'ElementsOrError',
+        'Image',
+        'FolderParameters',
+        'BoundingBox2D',
+        'BoundingBox3D',
+        'RGBColor',
+        'Subset',
+        'LayoutParameters',
+        'ComponentId',
+        'ElementComponentId',
+        'ElementComponentIdArrayItem',
+        'ElementComponentsWrapper',
+        'ElementComponentsOrError',
+        'LayerAttributeWrapper',
+        'FillAttributeWrapper',
+        'ProfileAttributeWrapper',
+        'DashItemWrapper',
+        'LayerCombinationAttributeWrapper',
+        'ClassificationIdWrapper',
+        'ClassificationItemDetailsWrapper',
+        'ClassificationSystemWrapper',
+        'NavigatorItemIdWrapper',
+        'NavigatorItemIdAndTypeWrapper',
+        'DetailNavigatorItemWrapper',
+        'Document3DNavigatorItemWrapper',
+        'ElevationNavigatorItemWrapper',
+        'InteriorElevationNavigatorItemWrapper',
+        'SectionNavigatorItemWrapper',
+        'StoryNavigatorItemWrapper',
+        'WorksheetNavigatorItemWrapper',
+        'PropertyGroupWrapper',
+        'EnumValueIdWrapper',
+        'TypeOfElementWrapper',
+        'ImageWrapper',
+        'BoundingBox2DWrapper',
+        'BoundingBox3DWrapper',
+        'AttributeIdOrError',
+        'LayerAttributeOrError',
+        'FillAttributeOrError',
+        'SurfaceAttribute',
+        'ProfileAttributeOrError',
+        'CompositeLine',
+        'CompositeLineListItem',
+        'CompositeSkin',
+        'CompositeSkinListItem',
+        'CompositeAttribute',
+        'Pen',
+        'PenArrayItem',
+        'LineItem',
+        'ZoneCategoryAttribute',
+        'BuildingMaterialAttribute',
+        'LayerCombinationAttributeOrError',
+        'ClassificationItemAvailability',
+        'PropertyDefinitionAvailability',
+        'ClassificationIdOrError',
+        'ElementClassification',
+        'ClassificationItemOrError',
+        'ClassificationSystemOrError',
+        'NavigatorItemIdAndTypeOrError',
+        'DetailNavigatorItemOrError',
+        'Document3DNavigatorItemOrError',
+        'ElevationNavigatorItemOrError',
+        'InteriorElevationNavigatorItemOrError',
+        'SectionNavigatorItemOrError',
+        'StoryNavigatorItemOrError',
+        'WorksheetNavigatorItemOrError',
+        'BuiltInContainerNavigatorItem',
+        'PropertyIdOrError',
+        'PropertyGroupOrError',
+        'NormalSingleEnumPropertyValue',
+        'NormalMultiEnumPropertyValue',
+        'PropertyIdsOfElement',
+        'TypeOfElementOrError',
+        'ImageOrError',
+        'BoundingBox2DOrError',
+        'BoundingBox3DOrError',
+        'SurfaceAttributeWrapper',
+        'CompositeAttributeWrapper',
+        'LineItemWrapper',
+        'ZoneCategoryAttributeWrapper',
+        'BuildingMaterialAttributeWrapper',
+        'ClassificationItemAvailabilityWrapper',
+        'PropertyDefinitionAvailabilityWrapper',
+        'ClassificationIdsOrErrorsWrapper',
+        'BuiltInContainerNavigatorItemWrapper',
+        'PropertyIdsOfElementWrapper',
+        'PenTableAttribute',
+        'SurfaceAttributeOrError',
+        'CompositeAttributeOrError',
+        'DashOrLineItem',
+        'LineAttribute',
+        'ZoneCategoryAttributeOrError',
+        'BuildingMaterialAttributeOrError',
+        'ClassificationItemAvailabilityOrError',
+        'PropertyDefinitionAvailabilityOrError',
+        'ElementClassificationOrError',
+        'BuiltInContainerNavigatorItemOrError',
+        'PropertyIdsOfElementOrError',
+        'PenTableAttributeWrapper',
+        'LineAttributeWrapper',
+        'PenTableAttributeOrError',
+        'LineAttributeOrError',
+        'ClassificationItemArrayItem',
+        'ClassificationItemInTree',
+        'NavigatorItemArrayItem',
+        'NavigatorItem',
+        'NavigatorTree',
+        'PropertyBasicDefaultValue',
+        'PropertyDefaultValue',
+        'PropertyDefinition',
+        'PropertyDefinitionWrapper',
+        'PropertyDefinitionOrError',
+        'NormalOrUserUndefinedPropertyValue',
+        'ElementPropertyValue',
+        'PropertyValue',
+        'PropertyValueWrapper',
+        'PropertyValueOrErrorItem',
+        'PropertyValuesWrapper',
+        'PropertyValuesOrError',
+    )
+
+
+metadata.install_classinfo(globals(), b3000classdata.TYPES)
+identifiers.install_identifiers(globals())
+identifiers.install_guid_identifiers(AttributeId, ClassificationItemId, ElementId, NavigatorItemId, PropertyId)
+builders.install_builders(globals())
+serializers.install_serializers(globals())
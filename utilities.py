@@ -1,25 +1,239 @@
-import os, sys, subprocess
-from typing import Optional, Union, Tuple, List, Callable, Any
+import os, sys, subprocess, threading, time
+from typing import Optional, Union, Tuple, List, Callable, Any, Dict, Iterable, Iterator
+from uuid import UUID
+from archicad import columnar
+from archicad.navigatorindex import NavigatorTreeIndex
+from archicad.spatialindex import SpatialIndex
 from archicad.releases.ac26.b3000types import *
 from archicad.releases.ac26.b3000commands import *
 
 
-def _find_in_tree(treeRootItem, itemattr, childrenattr, criterion) -> list:
-    result = []
-    if criterion(treeRootItem):
-        result.append(treeRootItem)
-    if treeRootItem.__getattribute__(childrenattr):
-        for node in treeRootItem.__getattribute__(childrenattr):
-            result.extend(_find_in_tree(node.__getattribute__(itemattr), itemattr, childrenattr, criterion))
-    return result
+def _iter_tree(treeRootItem, itemattr, childrenattr, criterion, prune=None) -> Iterator[Any]:
+    # depth-first with an explicit stack, so deep trees do not hit the recursion limit
+    stack = [treeRootItem]
+    while stack:
+        item = stack.pop()
+        if criterion(item):
+            yield item
+        if prune is not None and prune(item):
+            continue
+        children = getattr(item, childrenattr)
+        if children:
+            stack.extend(getattr(child, itemattr) for child in reversed(children))
+
+
+def _find_in_tree(treeRootItem, itemattr, childrenattr, criterion, prune=None) -> list:
+    return list(_iter_tree(treeRootItem, itemattr, childrenattr, criterion, prune))
+
+
+def _enum_value_id_key(enumValueId: EnumValueId) -> Tuple[str, str]:
+    if enumValueId.type == "displayValue":
+        return enumValueId.type, enumValueId.displayValue
+    return enumValueId.type, enumValueId.nonLocalizedValue
+
+
+def _spatial_index_items(elements: List[ElementIdArrayItem], boundingBoxes: Union[List[BoundingBox3DOrError], columnar.BoundingBoxArray]) -> List[Tuple[UUID, Optional[Tuple[float, ...]], ElementIdArrayItem]]:
+    if isinstance(boundingBoxes, columnar.BoundingBoxArray):
+        return [(element.elementId.guid, boundingBoxes[i], element) for i, element in enumerate(elements)]
+    items = []
+    for element, boundingBox in zip(elements, boundingBoxes):
+        box = getattr(boundingBox, "boundingBox3D", None)
+        items.append((element.elementId.guid, None if box is None else (box.xMin, box.yMin, box.zMin, box.xMax, box.yMax, box.zMax), element))
+    return items
+
+
+class PropertyDefinitionCache:
+    """ Caches the property definitions of a connection with a lookup table for their enumeration values.
+
+    Args:
+        accommands (:obj:`Commands`): The commands of the connection.
+        ttl (:obj:`float`, optional): The number of seconds after which a cached definition is fetched again. None means that the definitions never expire. Defaults to 300.
+    """
+    def __init__(self, accommands: Commands, ttl: Optional[float] = 300.0):
+        self.accommands = accommands
+        self.ttl = ttl
+        self._entries: Dict[UUID, Tuple[float, PropertyDefinition, Dict[Tuple[str, str], str]]] = {}
+        self._lock = threading.Lock()
+
+    def _is_valid(self, entry: Tuple[float, PropertyDefinition, Dict[Tuple[str, str], str]]) -> bool:
+        return self.ttl is None or time.monotonic() - entry[0] <= self.ttl
+
+    def _fetch(self, propertyIds: Iterable[PropertyId]) -> Dict[UUID, Tuple[float, PropertyDefinition, Dict[Tuple[str, str], str]]]:
+        """Returns the entries of the properties, fetching those which are not cached yet with a single command call."""
+        entries = {}
+        missing = {}
+        with self._lock:
+            for propertyId in propertyIds:
+                entry = self._entries.get(propertyId.guid)
+                if entry is not None and self._is_valid(entry):
+                    entries[propertyId.guid] = entry
+                else:
+                    missing[propertyId.guid] = propertyId
+        if not missing:
+            return entries
+        definitionsOrErrors = self.accommands.GetDetailsOfProperties(list(missing.values()))
+        now = time.monotonic()
+        fetched = {}
+        for propertyId, definitionOrError in zip(missing.values(), definitionsOrErrors):
+            if getattr(definitionOrError, "error", None) is not None:
+                raise ValueError(f"Failed to get the definition of property {propertyId.guid}: {definitionOrError.error.message}")
+            definition = definitionOrError.propertyDefinition
+            displayValues = {}
+            for possibleEnumValue in (definition.possibleEnumValues or []):
+                enumValue = possibleEnumValue.enumValue
+                displayValues[_enum_value_id_key(enumValue.enumValueId)] = enumValue.displayValue
+            for possibleEnumValue in (definition.possibleEnumValues or []):
+                enumValue = possibleEnumValue.enumValue
+                displayValues.setdefault(("displayValue", enumValue.displayValue), enumValue.displayValue)
+                if enumValue.nonLocalizedValue is not None:
+                    displayValues.setdefault(("nonLocalizedValue", enumValue.nonLocalizedValue), enumValue.displayValue)
+            fetched[propertyId.guid] = (now, definition, displayValues)
+        with self._lock:
+            self._entries.update(fetched)
+        entries.update(fetched)
+        return entries
+
+    def Prefetch(self, propertyIds: Iterable[PropertyId]) -> Dict[UUID, PropertyDefinition]:
+        """Fetches the definitions of those properties which are not cached yet with a single command call.
+
+        Returns:
+            :obj:`dict` of :obj:`PropertyDefinition`: The definitions of the given properties by their guid.
+                They are returned even if another thread invalidates the cache in the meantime.
+
+        Raises:
+            ValueError: When Archicad returns an error for a property.
+        """
+        return {guid: entry[1] for guid, entry in self._fetch(propertyIds).items()}
+
+    def _get_entry(self, propertyId: PropertyId) -> Tuple[float, PropertyDefinition, Dict[Tuple[str, str], str]]:
+        return self._fetch([propertyId])[propertyId.guid]
+
+    def GetPropertyDefinition(self, propertyId: PropertyId) -> PropertyDefinition:
+        """Returns the definition of the property. It is fetched from Archicad if it is not cached."""
+        return self._get_entry(propertyId)[1]
+
+    def GetEnumDisplayValue(self, propertyId: PropertyId, enumValueId: EnumValueId) -> str:
+        """Returns the display value of an enumeration value of the property.
+
+        An enumeration value missing from the cached definition makes the definition fetched again once.
+
+        Raises:
+            KeyError: When the property has no such enumeration value.
+        """
+        key = _enum_value_id_key(enumValueId)
+        displayValue = self._get_entry(propertyId)[2].get(key)
+        if displayValue is None:
+            self.Invalidate([propertyId])
+            displayValue = self._get_entry(propertyId)[2][key]
+        return displayValue
+
+    def Invalidate(self, propertyIds: Optional[Iterable[PropertyId]] = None):
+        """Removes the given properties from the cache, or every property if none is given."""
+        with self._lock:
+            if propertyIds is None:
+                self._entries.clear()
+            else:
+                for propertyId in propertyIds:
+                    self._entries.pop(propertyId.guid, None)
+
+
+class ClassificationSystemCache:
+    """ Caches the classification systems of a connection and the item trees of the systems with lookup tables by system name and item id.
+
+    Args:
+        accommands (:obj:`Commands`): The commands of the connection.
+        ttl (:obj:`float`, optional): The number of seconds after which the systems and the trees are fetched again. None means that they never expire. Defaults to 300.
+    """
+    def __init__(self, accommands: Commands, ttl: Optional[float] = 300.0):
+        self.accommands = accommands
+        self.ttl = ttl
+        self._systems: Optional[Tuple[float, List[ClassificationSystem], Dict[str, ClassificationSystemId]]] = None
+        self._trees: Dict[UUID, Tuple[float, List[ClassificationItemArrayItem], Dict[str, ClassificationItemInTree]]] = {}
+        self._lock = threading.Lock()
+
+    def _is_valid(self, fetched: float) -> bool:
+        return self.ttl is None or time.monotonic() - fetched <= self.ttl
+
+    def _get_systems(self) -> Tuple[float, List[ClassificationSystem], Dict[str, ClassificationSystemId]]:
+        systems = self._systems
+        if systems is None or not self._is_valid(systems[0]):
+            now = time.monotonic()
+            classificationSystems = self.accommands.GetAllClassificationSystems()
+            systemIds = {}
+            for system in classificationSystems:
+                systemIds.setdefault(system.name, system.classificationSystemId)
+            systems = (now, classificationSystems, systemIds)
+            with self._lock:
+                self._systems = systems
+        return systems
+
+    def _get_tree(self, classificationSystemId: ClassificationSystemId) -> Tuple[float, List[ClassificationItemArrayItem], Dict[str, ClassificationItemInTree]]:
+        tree = self._trees.get(classificationSystemId.guid)
+        if tree is None or not self._is_valid(tree[0]):
+            now = time.monotonic()
+            classificationItems = self.accommands.GetAllClassificationsInSystem(classificationSystemId)
+            items = {}
+            for root in classificationItems:
+                for item in _iter_tree(root.classificationItem, 'classificationItem', 'children', lambda item: True):
+                    items.setdefault(item.id, item)
+            tree = (now, classificationItems, items)
+            with self._lock:
+                self._trees[classificationSystemId.guid] = tree
+        return tree
+
+    def GetClassificationSystems(self) -> List[ClassificationSystem]:
+        """Returns the classification systems. They are fetched from Archicad if they are not cached."""
+        return self._get_systems()[1]
+
+    def GetClassificationSystemId(self, systemName: str) -> Optional[ClassificationSystemId]:
+        """Returns the identifier of the first classification system with the name, or None if there is no such system."""
+        return self._get_systems()[2].get(systemName)
+
+    def GetClassificationTree(self, classificationSystemId: ClassificationSystemId) -> List[ClassificationItemArrayItem]:
+        """Returns the tree of the classification items of the system. It is fetched from Archicad if it is not cached."""
+        return self._get_tree(classificationSystemId)[1]
+
+    def GetClassificationItem(self, classificationSystemId: ClassificationSystemId, itemId: str) -> Optional[ClassificationItemInTree]:
+        """Returns the first item of the system in depth-first order with the identifier specified by the user, or None if there is no such item."""
+        return self._get_tree(classificationSystemId)[2].get(itemId)
+
+    def Invalidate(self, classificationSystemIds: Optional[Iterable[ClassificationSystemId]] = None):
+        """Removes the trees of the given systems from the cache, or the systems and every tree if none is given."""
+        with self._lock:
+            if classificationSystemIds is None:
+                self._systems = None
+                self._trees.clear()
+            else:
+                for classificationSystemId in classificationSystemIds:
+                    self._trees.pop(classificationSystemId.guid, None)
+
+    def Refresh(self):
+        """Fetches the systems and the trees of the cached systems again."""
+        with self._lock:
+            systemGuids = list(self._trees)
+        self.Invalidate()
+        self._get_systems()
+        for systemGuid in systemGuids:
+            self._get_tree(ClassificationSystemId(systemGuid))
 
 
 class Utilities:
     """ Utility functions for the archicad module.
+
+    Attributes:
+        propertyDefinitionCache (:obj:`PropertyDefinitionCache`): The cache of the property definitions used to resolve enumeration values.
+        classificationSystemCache (:obj:`ClassificationSystemCache`, optional): The cache of the classification systems and their trees used to find classification items.
+            None unless ``cacheClassificationSystems`` is set, in which case the systems are fetched for every lookup.
+
+    Args:
+        cacheClassificationSystems (:obj:`bool`, optional): Whether the classification systems and their trees are cached. Defaults to False,
+            because a cached tree does not reflect the changes made in Archicad until it expires or it is invalidated.
     """
-    def __init__(self, actypes: Types, accommands: Commands):
+    def __init__(self, actypes: Types, accommands: Commands, cacheClassificationSystems: bool = False):
         self.actypes = actypes
         self.accommands = accommands
+        self.propertyDefinitionCache = PropertyDefinitionCache(accommands)
+        self.classificationSystemCache: Optional[ClassificationSystemCache] = ClassificationSystemCache(accommands) if cacheClassificationSystems else None
 
     @staticmethod
     def OpenFile(filepath: str):
@@ -31,50 +245,137 @@ class Utilities:
 
     @staticmethod
     def FindInNavigatorItemTree(treeRootItem: NavigatorItem,
-                                criterion: Callable[[NavigatorItem], bool]) -> List[NavigatorItem]:
+                                criterion: Callable[[NavigatorItem], bool],
+                                prune: Optional[Callable[[NavigatorItem], bool]] = None) -> List[NavigatorItem]:
         """Finds items in a navigator tree.
         
         Args:
             treeRootItem (:obj:`NavigatorItem`): The root item of the navigator tree.
             criterion (Callable[[NavigatorItem], bool]): The criterion function.
+            prune (Callable[[NavigatorItem], bool], optional): The descendants of the items fulfilling this function are skipped.
         
         Returns:
             :obj:`List[NavigatorItem]`: The list of navigator items, which fulfill the criterion function.
         """
-        return _find_in_tree(treeRootItem, 'navigatorItem', 'children', criterion)
+        return _find_in_tree(treeRootItem, 'navigatorItem', 'children', criterion, prune)
+
+    @staticmethod
+    def IterNavigatorItemTree(treeRootItem: NavigatorItem,
+                              criterion: Callable[[NavigatorItem], bool],
+                              prune: Optional[Callable[[NavigatorItem], bool]] = None) -> Iterator[NavigatorItem]:
+        """Yields the items of a navigator tree fulfilling the criterion function in depth-first order.
+
+        The tree is searched only as far as the items are consumed, so e.g. ``next()`` stops at the first match.
+
+        Args:
+            treeRootItem (:obj:`NavigatorItem`): The root item of the navigator tree.
+            criterion (Callable[[NavigatorItem], bool]): The criterion function.
+            prune (Callable[[NavigatorItem], bool], optional): The descendants of the items fulfilling this function are skipped.
+
+        Returns:
+            :obj:`Iterator[NavigatorItem]`: The navigator items, which fulfill the criterion function.
+        """
+        return _iter_tree(treeRootItem, 'navigatorItem', 'children', criterion, prune)
 
     @staticmethod
     def FindInClassificationItemTree(treeRootItem: ClassificationItemInTree,
-                                     criterion: Callable[[ClassificationItemInTree], bool]) -> List[ClassificationItemInTree]:
+                                     criterion: Callable[[ClassificationItemInTree], bool],
+                                     prune: Optional[Callable[[ClassificationItemInTree], bool]] = None) -> List[ClassificationItemInTree]:
         """Finds items in a navigator tree.
         
         Args:
             treeRootItem (:obj:`ClassificationItemInTree`): The root item of the classification tree.
             criterion (Callable[[ClassificationItemInTree], bool]): The criterion function.
+            prune (Callable[[ClassificationItemInTree], bool], optional): The descendants of the items fulfilling this function are skipped.
         
         Returns:
             :obj:`List[ClassificationItemInTree]`: The list of classification items, which fulfill the criterion function.
         """
-        return _find_in_tree(treeRootItem, 'classificationItem', 'children', criterion)
+        return _find_in_tree(treeRootItem, 'classificationItem', 'children', criterion, prune)
+
+    @staticmethod
+    def IterClassificationItemTree(treeRootItem: ClassificationItemInTree,
+                                   criterion: Callable[[ClassificationItemInTree], bool],
+                                   prune: Optional[Callable[[ClassificationItemInTree], bool]] = None) -> Iterator[ClassificationItemInTree]:
+        """Yields the items of a classification tree fulfilling the criterion function in depth-first order.
+
+        The tree is searched only as far as the items are consumed, so e.g. ``next()`` stops at the first match.
+
+        Args:
+            treeRootItem (:obj:`ClassificationItemInTree`): The root item of the classification tree.
+            criterion (Callable[[ClassificationItemInTree], bool]): The criterion function.
+            prune (Callable[[ClassificationItemInTree], bool], optional): The descendants of the items fulfilling this function are skipped.
+
+        Returns:
+            :obj:`Iterator[ClassificationItemInTree]`: The classification items, which fulfill the criterion function.
+        """
+        return _iter_tree(treeRootItem, 'classificationItem', 'children', criterion, prune)
 
 
     def FindClassificationSystem(self, systemName: str) -> Optional[ClassificationSystemId]:
-        """Finds the classification system."""
-        return next(system.classificationSystemId for system in
-                            self.accommands.GetAllClassificationSystems() if system.name == systemName)
+        """Finds the classification system. The systems are cached in :obj:`classificationSystemCache` if it is enabled."""
+        if self.classificationSystemCache is not None:
+            return self.classificationSystemCache.GetClassificationSystemId(systemName)
+        return next((system.classificationSystemId for system in self.accommands.GetAllClassificationSystems() if system.name == systemName), None)
 
 
     def FindClassificationItemInSystem(self, system_name: str, item_id: str) -> Optional[ClassificationItemInTree]:
-        """Finds the classification item in a system."""
-        classifications_tree = self.accommands.GetAllClassificationsInSystem(self.FindClassificationSystem(system_name))
-        for tree in classifications_tree:
-            classification_ids = Utilities.FindInClassificationItemTree(tree.classificationItem, lambda c: c.id == item_id)
-            assert len(classification_ids) <= 1
-            if classification_ids:
-                return classification_ids[0]
+        """Finds the classification item in a system. The systems and their trees are cached in :obj:`classificationSystemCache` if it is enabled."""
+        classificationSystemId = self.FindClassificationSystem(system_name)
+        if classificationSystemId is None:
+            return None
+        if self.classificationSystemCache is not None:
+            return self.classificationSystemCache.GetClassificationItem(classificationSystemId, item_id)
+        for tree in self.accommands.GetAllClassificationsInSystem(classificationSystemId):
+            item = next(Utilities.IterClassificationItemTree(tree.classificationItem, lambda c: c.id == item_id), None)
+            if item is not None:
+                return item
         return None
 
     
+    def BuildSpatialIndex(self, elements: List[ElementIdArrayItem], boundingBoxes: Optional[Union[List[BoundingBox3DOrError], columnar.BoundingBoxArray]] = None, cellSize: Optional[float] = None) -> SpatialIndex:
+        """Builds a spatial index over the 3D bounding boxes of the elements. The queries of the index return the :obj:`ElementIdArrayItem` objects.
+
+        Args:
+            elements (:obj:`List[ElementIdArrayItem]`): The elements to index.
+            boundingBoxes (:obj:`List[BoundingBox3DOrError]` or :obj:`columnar.BoundingBoxArray`, optional): The bounding boxes of the elements. They are fetched from Archicad if not given.
+            cellSize (:obj:`float`, optional): The edge length of the grid cells of the index. Defaults to the average size of the boxes.
+
+        Returns:
+            :obj:`SpatialIndex`: The index. Elements without a bounding box are left out.
+        """
+        if boundingBoxes is None:
+            boundingBoxes = self.accommands.Get3DBoundingBoxArray(elements)
+        index = SpatialIndex(cellSize)
+        index.build((key, box, element) for key, box, element in _spatial_index_items(elements, boundingBoxes) if box is not None)
+        return index
+
+    def RefreshSpatialIndex(self, index: SpatialIndex, elements: List[ElementIdArrayItem], boundingBoxes: Optional[Union[List[BoundingBox3DOrError], columnar.BoundingBoxArray]] = None):
+        """Updates the boxes of the changed elements in a spatial index built by :obj:`BuildSpatialIndex`.
+
+        Args:
+            index (:obj:`SpatialIndex`): The index to update.
+            elements (:obj:`List[ElementIdArrayItem]`): The changed elements. Elements without a bounding box, e.g. deleted ones, are removed from the index.
+            boundingBoxes (:obj:`List[BoundingBox3DOrError]` or :obj:`columnar.BoundingBoxArray`, optional): The new bounding boxes of the elements. They are fetched from Archicad if not given.
+        """
+        if boundingBoxes is None:
+            boundingBoxes = self.accommands.Get3DBoundingBoxArray(elements)
+        index.update(_spatial_index_items(elements, boundingBoxes))
+
+    def BuildNavigatorTreeIndex(self, navigatorTreeId: NavigatorTreeId, navigatorTree: Optional[NavigatorTree] = None) -> NavigatorTreeIndex:
+        """Builds an index over the items of a navigator tree for lookups by identifier, type, name and prefix and for traversal in constant time per step.
+
+        Args:
+            navigatorTreeId (:obj:`NavigatorTreeId`): The identifier of the navigator tree.
+            navigatorTree (:obj:`NavigatorTree`, optional): The tree to index. It is fetched from Archicad if not given.
+
+        Returns:
+            :obj:`NavigatorTreeIndex`: The index. It is not updated when the navigator changes.
+        """
+        if navigatorTree is None:
+            navigatorTree = self.accommands.GetNavigatorItemTree(navigatorTreeId)
+        return NavigatorTreeIndex(navigatorTree.rootItem)
+
     def GetBuiltInPropertyId(self, name: str) -> PropertyId:
         """Returns the PropertyId of the corresponding built-in property."""
         return self.accommands.GetPropertyIds([BuiltInPropertyUserId(name)])[0].propertyId
@@ -95,7 +396,7 @@ class Utilities:
         Returns:
             :obj:`str`: The display value of the enumeration property value.
         """
-        return next(p.enumValue.displayValue for p in self.accommands.GetDetailsOfProperties ([propertyId])[0].propertyDefinition.possibleEnumValues if p.enumValue.enumValueId.to_dict() == enumValueId.to_dict())
+        return self.propertyDefinitionCache.GetEnumDisplayValue(propertyId, enumValueId)
 
 
     def GetValueFromPropertyValue(self, propertyId: PropertyId, propertyValue: PropertyValue) -> Any:
@@ -119,21 +420,34 @@ class Utilities:
             return propertyValue.status # "userUndefined" / "notEvaluated" / "notAvailable"
 
 
-    def GetPropertyValuesDictionary(self, elements: List[ElementId], propertyIds: List[PropertyId]) -> Dict[ElementId, Dict[PropertyId, Any]]:
+    def GetPropertyValuesDictionary(self, elements: List[ElementId], propertyIds: List[PropertyId], chunkSize: Optional[int] = None) -> Dict[ElementId, Dict[PropertyId, Any]]:
         """Returns the values of the given elements' given properties.
-        
+
+        The values are fetched in chunks of elements, then the definitions of the enumeration properties among them are fetched with a single command call, and finally the values are decoded locally.
+
         Args:
             elements (:obj:`List[ElementId]`): The identifier of the property.
             propertyIds (:obj:`List[PropertyId]`): The property value.
-        
+            chunkSize (:obj:`int`, optional): The number of elements whose values are requested at once. Defaults to ``chunkSize`` of the commands or 1000.
+
         Returns:
             :obj:`Dict[ElementId, Dict[PropertyId, Any]]`: A dictionary for the property values with two key-levels: the first key is the elementId, the second key is the propertyId.
         """
-        propertyValuesForElements = dict(zip(elements, self.accommands.GetPropertyValuesOfElements(elements, propertyIds)))
+        propertyValuesForElements = list(zip(elements, self.accommands.IterPropertyValuesOfElements(elements, propertyIds, chunkSize)))
+
+        enumPropertyIds = set()
+        for _, propertyValuesForElement in propertyValuesForElements:
+            for propertyId, propertyValue in zip(propertyIds, propertyValuesForElement.propertyValues):
+                if propertyValue.propertyValue.status == "normal" and propertyValue.propertyValue.type in ("singleEnum", "multiEnum"):
+                    enumPropertyIds.add(propertyId)
+            if len(enumPropertyIds) == len(propertyIds):
+                break
+        self.propertyDefinitionCache.Prefetch(enumPropertyIds)
+
         propertyValuesDictionary = {}
-        for element, propertyValuesForElement in propertyValuesForElements.items():
+        for element, propertyValuesForElement in propertyValuesForElements:
             propertyValuesDictionary[element] = {}
-            for propertyId, propertyValue in dict(zip(propertyIds, propertyValuesForElement.propertyValues)).items():
+            for propertyId, propertyValue in zip(propertyIds, propertyValuesForElement.propertyValues):
                 if propertyValue.propertyValue.status != "notAvailable":
                     propertyValuesDictionary[element][propertyId] = self.GetValueFromPropertyValue(propertyId, propertyValue.propertyValue)
         return propertyValuesDictionary